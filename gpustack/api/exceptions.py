@@ -27,6 +27,7 @@ class HTTPException(Exception):
         details: Optional[Dict[str, Any]] = None,
         *,
         log_level: int = logging.ERROR,
+        headers: Optional[Dict[str, str]] = None,
     ):
         self.status_code = status_code
         self.reason = reason
@@ -40,6 +41,8 @@ class HTTPException(Exception):
         # for an expected, self-healing condition can lower this so a polling
         # client cannot turn a normal wait into a flood of fault records.
         self.log_level = log_level
+        # Response headers, e.g. Retry-After on a 429.
+        self.headers = headers
 
 
 class OpenAIAPIException(HTTPException):
@@ -60,11 +63,12 @@ def http_exception_factory(
         details=None,
         *,
         log_level=logging.ERROR,
+        headers=None,
     ):
         if is_openai_exception:
             self.__class__.__bases__ = (OpenAIAPIException,)
         super(self.__class__, self).__init__(
-            status_code, reason, message, details, log_level=log_level
+            status_code, reason, message, details, log_level=log_level, headers=headers
         )
 
     return type(
@@ -106,6 +110,9 @@ ServiceUnavailableException = http_exception_factory(
 GatewayTimeoutException = http_exception_factory(
     status.HTTP_504_GATEWAY_TIMEOUT, "GatewayTimeout", "Gateway timeout"
 )
+TooManyRequestsException = http_exception_factory(
+    status.HTTP_429_TOO_MANY_REQUESTS, "TooManyRequests", "Too many requests"
+)
 
 
 async def async_raise_if_response_error(response: httpx.Response):  # noqa: C901
@@ -249,6 +256,7 @@ def register_handlers(app: FastAPI):
                 message=exc.message,
                 details=getattr(exc, "details", None),
             ).model_dump(),
+            headers=exc.headers,
         )
 
     @app.exception_handler(OpenAIAPIException)
@@ -265,6 +273,7 @@ def register_handlers(app: FastAPI):
                     "type": exc.reason,
                 }
             },
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
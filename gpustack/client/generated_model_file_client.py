@@ -27,6 +27,9 @@ class ModelFileClient:
         self._cache_lock = threading.Lock()
         self._watch_started = False
         self._initial_sync_logged = False
+        # Position of the last event applied to the cache; sent as ``since``
+        # so a reconnect can resume instead of reloading the snapshot.
+        self._resource_version: Optional[str] = None
 
     def list(
         self, params: Dict[str, Any] = None, use_cache: bool = True
@@ -161,6 +164,28 @@ class ModelFileClient:
         except Exception as e:
             logger.error(f"Failed to update model-files cache from event: {e}")
 
+    def _start_cache_session(self, resumed: bool):
+        """Make the cache authoritative for a freshly connected stream.
+
+        A stream that resumed the previous one keeps the cache and receives
+        only the events it missed. Any other starts from the server's
+        snapshot, so stale entries from a prior session are dropped: items
+        deleted while we were disconnected won't get a DELETED event
+        (already gone from DB) and would otherwise persist in the cache
+        forever. The old resource version goes with them.
+        """
+        if not self._enable_cache:
+            return
+        with self._cache_lock:
+            if not resumed:
+                self._cache.clear()
+                self._resource_version = None
+                self._initial_sync_logged = False
+            first_start = not self._watch_started
+            self._watch_started = True
+        if first_start:
+            logger.debug(f"model-files cache watch started")
+
     def watch(
         self,
         callback: Optional[Callable[[Event], None]] = None,
@@ -198,6 +223,11 @@ class ModelFileClient:
         if params is None:
             params = {}
         params["watch"] = "true"
+        # Ask for resource versions. With one from an earlier stream the
+        # server replays only the events missed since, if it still can.
+        resuming = self._enable_cache and self._resource_version is not None
+        if self._enable_cache:
+            params["since"] = self._resource_version or ""
 
         if stop_condition is None:
             stop_condition = lambda event: False
@@ -211,23 +241,13 @@ class ModelFileClient:
             ) as response:
                 await async_raise_if_response_error(response)
 
-                # Connection is up. The server's replay_existing=True snapshot
-                # that follows is authoritative, so drop any stale entries
-                # from a prior session — items deleted while we were
-                # disconnected won't get a DELETED event (already gone from
-                # DB) and would otherwise persist in the cache forever.
-                # Flip _watch_started here (not before connect) so that a
-                # failed connect doesn't leave list()/get() reading an empty
-                # cache while believing it's authoritative.
-                first_start = False
-                if self._enable_cache:
-                    with self._cache_lock:
-                        self._cache.clear()
-                        self._initial_sync_logged = False
-                        first_start = not self._watch_started
-                        self._watch_started = True
-                    if first_start:
-                        logger.debug(f"model-files cache watch started")
+                # Connection is up. Flip _watch_started here (not before
+                # connect) so that a failed connect doesn't leave list()/get()
+                # reading an empty cache while believing it's authoritative.
+                # A resuming stream waits for the server's first frame to
+                # learn whether it kept its place.
+                if not resuming:
+                    self._start_cache_session(resumed=False)
 
                 lines = response.aiter_lines()
                 while True:
@@ -237,6 +257,20 @@ class ModelFileClient:
                             event_data = json.loads(line)
                             event = Event(**event_data)
 
+                            if resuming:
+                                # The first frame is a BOOKMARK saying whether
+                                # the server could resume; a server that
+                                # doesn't know ``since`` sends a snapshot.
+                                resuming = False
+                                self._start_cache_session(
+                                    resumed=event.type == EventType.BOOKMARK
+                                    and event.data["resumed"]
+                                )
+                            if self._enable_cache and event.resource_version:
+                                self._resource_version = event.resource_version
+                            if event.type == EventType.BOOKMARK:
+                                continue
+
                             # Update cache if enabled
                             if self._enable_cache:
                                 await self._update_cache_from_event(event)
@@ -290,14 +324,16 @@ class ModelFileClient:
         finally:
             # When awatch is no longer running the cache is not authoritative
             # — flip _watch_started=False so list()/get() fall back to direct
-            # API calls until the next successful (re)connect. Done under
-            # the lock together with the clear so concurrent readers can't
+            # API calls until the next successful (re)connect. The entries
+            # are kept only while a resource version can resume them; the
+            # clear is done under the lock so concurrent readers can't
             # observe (_watch_started=True, cache=empty).
             if self._enable_cache:
                 with self._cache_lock:
                     if self._watch_started:
                         self._watch_started = False
-                        self._cache.clear()
+                        if self._resource_version is None:
+                            self._cache.clear()
 
     def get(self, id: int, use_cache: bool = True) -> ModelFilePublic:
         """
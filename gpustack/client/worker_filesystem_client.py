@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
-from typing import Dict
+import weakref
+from typing import Dict, Optional
 
 import aiohttp
 from gpustack.schemas.filesystem import FileExistsResponse
@@ -13,17 +15,34 @@ logger = logging.getLogger(__name__)
 
 _TIMEOUT = 15
 _GGUF_PARSE_TIMEOUT = 90
+# Below the worker API's own keep-alive timeout (uvicorn's default of 5s), so
+# an idle connection is dropped here before the worker closes it under us.
+_KEEPALIVE_TIMEOUT = 4
+
+# The shared client of each event loop; sessions cannot cross loops.
+_pooled = weakref.WeakKeyDictionary()
 
 
 class WorkerFilesystemClient:
     """Client for interacting with worker filesystem APIs."""
 
-    def __init__(self):
-        """Initialize the client and create HTTP clients."""
-        self._connector = aiohttp.TCPConnector(
-            limit=envs.TCP_CONNECTOR_LIMIT,
-            force_close=True,
-        )
+    def __init__(self, keepalive_timeout: Optional[float] = None):
+        """Initialize the client and create HTTP clients.
+
+        Connections are closed after each request unless ``keepalive_timeout``
+        is given, in which case idle ones are kept that long for reuse.
+        """
+        if keepalive_timeout is None:
+            self._connector = aiohttp.TCPConnector(
+                limit=envs.TCP_CONNECTOR_LIMIT,
+                force_close=True,
+            )
+        else:
+            self._connector = aiohttp.TCPConnector(
+                limit=envs.TCP_CONNECTOR_LIMIT,
+                keepalive_timeout=keepalive_timeout,
+            )
+        self._shared = False
         self._http_client = aiohttp.ClientSession(
             connector=self._connector, trust_env=True
         )
@@ -34,8 +53,9 @@ class WorkerFilesystemClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close all HTTP clients."""
-        await self.close()
+        """Context manager exit - close all HTTP clients, unless pooled."""
+        if not self._shared:
+            await self.close()
 
     async def close(self):
         """Close all HTTP clients and connector."""
@@ -174,3 +194,27 @@ class WorkerFilesystemClient:
         # Parse JSON output
         output_str = response_data.get("output", "{}")
         return json.loads(output_str)
+
+
+def pooled_worker_filesystem_client() -> WorkerFilesystemClient:
+    """The event loop's shared client, keeping connections to workers alive.
+
+    Probes of the same workers follow each other closely while a model is
+    scheduled; reusing a connection per worker saves a TCP handshake each.
+    Leaving ``async with`` does not close it, see
+    :func:`close_pooled_worker_filesystem_client`.
+    """
+    loop = asyncio.get_running_loop()
+    client = _pooled.get(loop)
+    if client is None:
+        client = WorkerFilesystemClient(keepalive_timeout=_KEEPALIVE_TIMEOUT)
+        client._shared = True
+        _pooled[loop] = client
+    return client
+
+
+async def close_pooled_worker_filesystem_client():
+    """Close the running event loop's shared client, if it has one."""
+    client = _pooled.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
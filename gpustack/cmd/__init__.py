@@ -1,4 +1,16 @@
-from .start import setup_start_cmd
-from .reload_config import setup_reload_config_cmd
+import importlib
 
 __all__ = ["setup_start_cmd", "setup_reload_config_cmd"]
+
+_LAZY = {
+    "setup_start_cmd": ".start",
+    "setup_reload_config_cmd": ".reload_config",
+}
+
+
+def __getattr__(name):
+    # Imported on first use, so that importing one command module does not
+    # import every other one (and the server and worker behind `start`).
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
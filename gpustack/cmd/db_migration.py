@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from gpustack.cmd.start import get_gpustack_env
+from gpustack.utils.envs import get_gpustack_env
 from gpustack import envs
 
 logger = logging.getLogger(__name__)
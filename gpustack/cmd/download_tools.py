@@ -2,7 +2,7 @@ import argparse
 import logging
 import sys
 
-from gpustack.cmd.start import get_gpustack_env
+from gpustack.utils.envs import get_gpustack_env
 from gpustack.logging import setup_logging
 from gpustack.worker.tools_manager import ToolsManager
 
@@ -11,7 +11,7 @@ from gpustack.cmd.local_auth import (
     mint_admin_jwt,
     read_local_jwt_secret,
 )
-from gpustack.cmd.start import get_gpustack_env
+from gpustack.utils.envs import get_gpustack_env
 from gpustack.config.config import Config
 from gpustack.schemas.users import UserUpdate
 from gpustack.security import generate_secure_password
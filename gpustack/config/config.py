@@ -123,6 +123,9 @@ class Config(WorkerConfig, BaseSettings):
         ssl_keyfile: Path to the SSL key file.
         ssl_certfile: Path to the SSL certificate file.
         database_url: URL of the database.
+        analytics_database_url: URL of an optional read-only database (typically
+            a replica) for usage reports, exports and dashboard aggregates. Falls
+            back to the primary database when unset, unreachable or too stale.
         disable_worker: (Deprecated) Disable embedded worker.
         enable_worker: Enable embedded worker.
         bootstrap_password: Password for the bootstrap admin user.
@@ -184,6 +187,7 @@ class Config(WorkerConfig, BaseSettings):
     proxy_port: Optional[int] = 30079
     database_port: Optional[int] = 5432
     database_url: Optional[str] = None
+    analytics_database_url: Optional[str] = None
     disable_worker: Optional[bool] = None  # Deprecated
     enable_worker: bool = False
     bootstrap_password: Optional[str] = None
@@ -457,6 +461,9 @@ class Config(WorkerConfig, BaseSettings):
         if self.database_url is not None:
             self.check_database_url()
 
+        if self.analytics_database_url is not None:
+            self.check_database_url(self.analytics_database_url)
+
         return self
 
     def get_grafana_url(self) -> Optional[str]:
@@ -754,13 +761,14 @@ class Config(WorkerConfig, BaseSettings):
             f"postgresql://root@127.0.0.1:{self.database_port}/gpustack?sslmode=disable"
         )
 
-    def check_database_url(self):
-        if self.database_url is None:
+    def check_database_url(self, database_url: Optional[str] = None):
+        database_url = database_url or self.database_url
+        if database_url is None:
             return
 
-        if not self.database_url.startswith(
-            "postgresql://"
-        ) and not self.database_url.startswith("mysql://"):
+        if not database_url.startswith("postgresql://") and not database_url.startswith(
+            "mysql://"
+        ):
             raise Exception(
                 "Unsupported database scheme. Supported databases are postgresql, and mysql."
             )
@@ -22,12 +22,75 @@ DB_POOL_TIMEOUT = int(os.getenv("GPUSTACK_DB_POOL_TIMEOUT", 30))
 DB_IDLE_IN_TRANSACTION_SESSION_TIMEOUT_SECONDS = int(
     os.getenv("GPUSTACK_DB_IDLE_IN_TRANSACTION_SESSION_TIMEOUT_SECONDS", 8 * 3600)
 )
+# Pool for the optional analytics engine (``--analytics-database-url``), which
+# serves the usage / resource-usage breakdowns, their exports and the dashboard
+# aggregates. Sized separately on purpose: the point of the second engine is
+# that a wide export can exhaust THIS pool and queue, while heartbeats and
+# status ingest keep drawing from ``DB_POOL_SIZE``. Unused when no analytics
+# URL is configured.
+DB_ANALYTICS_POOL_SIZE = int(os.getenv("GPUSTACK_DB_ANALYTICS_POOL_SIZE", 10))
+DB_ANALYTICS_MAX_OVERFLOW = int(os.getenv("GPUSTACK_DB_ANALYTICS_MAX_OVERFLOW", 5))
+DB_ANALYTICS_POOL_TIMEOUT = int(os.getenv("GPUSTACK_DB_ANALYTICS_POOL_TIMEOUT", 60))
+# How far behind the primary the analytics database may be before reporting
+# falls back to the primary. Usage is rolled up per day and flushed every few
+# seconds, so a replica a minute behind draws the same charts; one that has
+# stopped replaying would silently report yesterday. 0 never falls back on lag
+# (a replica that cannot be reached still falls back).
+DB_ANALYTICS_MAX_STALENESS_SECONDS = int(
+    os.getenv("GPUSTACK_DB_ANALYTICS_MAX_STALENESS_SECONDS", 300)
+)
 
 # Proxy configuration
 PROXY_TIMEOUT = int(os.getenv("GPUSTACK_PROXY_TIMEOUT_SECONDS", 1800))
 PROXY_UPSTREAM_IDLE_TIMEOUT = int(
     os.getenv("GPUSTACK_PROXY_UPSTREAM_IDLE_TIMEOUT_SECONDS", 3)
 )
+# Idle keep-alive connections from the worker to its model instances are
+# closed after this long, below the engines' own keep-alive timeouts.
+PROXY_UPSTREAM_KEEPALIVE_TIMEOUT = float(
+    os.getenv("GPUSTACK_PROXY_UPSTREAM_KEEPALIVE_TIMEOUT_SECONDS", 4)
+)
+# How the server's OpenAI-compatible proxy spreads a model's requests over its
+# running instances. "round_robin" rotates through them. "affinity" sends
+# requests with the same affinity key to the same instance, so multi-turn chats
+# and shared prompts land where the engine's prefix cache is warm; requests
+# without a key are rotated.
+PROXY_LOAD_BALANCING = os.getenv("GPUSTACK_PROXY_LOAD_BALANCING", "round_robin").lower()
+# Affinity keys, tried in order: "header:<name>" (a request header, e.g. a
+# session id), "user" (the caller) and "prefix" (the start of the prompt).
+PROXY_AFFINITY_KEYS = [
+    key.strip()
+    for key in os.getenv(
+        "GPUSTACK_PROXY_AFFINITY_KEYS", "header:x-session-id,prefix"
+    ).split(",")
+    if key.strip()
+]
+# Characters of the prompt the "prefix" key covers. Roughly the shared part of
+# prompts worth keeping together, such as a system prompt.
+PROXY_AFFINITY_PREFIX_CHARS = int(
+    os.getenv("GPUSTACK_PROXY_AFFINITY_PREFIX_CHARS", 1024)
+)
+# An instance takes keys until it serves this many times the average number of
+# in-flight requests; further requests for its keys spill to the next instance.
+PROXY_AFFINITY_LOAD_FACTOR = max(
+    1.0, float(os.getenv("GPUSTACK_PROXY_AFFINITY_LOAD_FACTOR", 1.25))
+)
+# Requests the server's OpenAI-compatible proxy sends to one model, and to one
+# of its instances, at a time; 0 is unlimited. Further requests wait in a
+# per-model queue where tenants and API keys take turns.
+PROXY_MODEL_MAX_CONCURRENCY = int(os.getenv("GPUSTACK_PROXY_MODEL_MAX_CONCURRENCY", 0))
+PROXY_INSTANCE_MAX_CONCURRENCY = int(
+    os.getenv("GPUSTACK_PROXY_INSTANCE_MAX_CONCURRENCY", 0)
+)
+# Requests that may wait for a model, and for how long, before the proxy turns
+# them away with 429 and a Retry-After header.
+PROXY_QUEUE_SIZE = int(os.getenv("GPUSTACK_PROXY_QUEUE_SIZE", 100))
+PROXY_QUEUE_TIMEOUT = float(os.getenv("GPUSTACK_PROXY_QUEUE_TIMEOUT_SECONDS", 30))
+
+# Parallel websockets a worker in tunnel proxy mode opens to the server. Tunnel
+# sessions are striped over them, so bulk transfers to a worker behind NAT are
+# not capped by a single TCP stream on high-latency links.
+TUNNEL_CHANNELS = int(os.getenv("GPUSTACK_TUNNEL_CHANNELS", 1))
 
 # HTTP client TCP connector configuration
 TCP_CONNECTOR_LIMIT = int(os.getenv("GPUSTACK_TCP_CONNECTOR_LIMIT", 1000))
@@ -158,6 +221,18 @@ GATEWAY_AUTH_MAX_CR_BYTES = int(
     os.getenv("GPUSTACK_GATEWAY_AUTH_MAX_CR_BYTES", 1_100_000)
 )
 
+# How many ext-auth CRs the key tables are spread over, each under its own
+# GATEWAY_AUTH_MAX_CR_BYTES budget. A key lives in the shard its access key (or
+# ref id) hashes to, so creating or revoking one rewrites that shard alone.
+#
+# Each shard past the first is a full ext-auth filter on every inference route,
+# and the bundled plugin only ever consults its own tables: a key another shard
+# holds would still go to the server there. So values above 1 are only honoured
+# with a plugin build set through gateway_plugin.gpustack-ext-auth.url, which
+# each shard tells its place so it can pass such keys on; with the bundled one
+# the server logs an error and keeps a single CR.
+GATEWAY_AUTH_KEY_SHARDS = max(1, int(os.getenv("GPUSTACK_GATEWAY_AUTH_KEY_SHARDS", 1)))
+
 # Server Cache
 SERVER_CACHE_TTL_SECONDS = int(os.getenv("GPUSTACK_SERVER_CACHE_TTL_SECONDS", 600))
 SERVER_CACHE_LOCKS_MAX_SIZE = int(
@@ -168,6 +243,30 @@ SERVER_CACHE_LOCKS_MAX_SIZE = int(
 EVENT_BUS_SUBSCRIBER_QUEUE_SIZE = int(
     os.getenv("GPUSTACK_EVENT_BUS_SUBSCRIBER_QUEUE_SIZE", 1024)
 )
+# Events kept per topic so a reconnecting watch (``since=<version>``) is sent
+# only what it missed. 0 disables resuming; every reconnect replays a snapshot.
+EVENT_BUS_EVENT_LOG_SIZE = int(os.getenv("GPUSTACK_EVENT_BUS_EVENT_LOG_SIZE", 2048))
+
+# The metrics exporter follows changes to clusters, workers, models and
+# instances as they happen; it reloads them all from the database this often
+# only to catch anything missed.
+METRICS_EXPORTER_RESYNC_INTERVAL = max(
+    3, int(os.getenv("GPUSTACK_METRICS_EXPORTER_RESYNC_INTERVAL_SECONDS", 300))
+)
+
+# Server process layout. "single" runs every service in the API process.
+# "multi" runs the leader-only background services (scheduler, controllers,
+# collectors, archivers) in supervised child processes, so a slow one cannot
+# stall API requests; they exchange events with the API process through a
+# loopback relay. Ignored when a plugin provides a distributed coordinator.
+# The API itself still runs in one uvicorn worker process in either mode;
+# several API worker processes are not supported yet.
+SERVER_PROCESS_MODE = os.getenv("GPUSTACK_SERVER_PROCESS_MODE", "single").lower()
+# A background services process not heard from for this long is restarted, as
+# is one that exits. Clamped to a few heartbeats.
+SERVER_BACKGROUND_PROCESS_TIMEOUT = max(
+    15, int(os.getenv("GPUSTACK_SERVER_BACKGROUND_PROCESS_TIMEOUT", 60))
+)  # in seconds
 
 # Worker configuration
 WORKER_HEARTBEAT_INTERVAL = int(
@@ -186,12 +285,21 @@ WORKER_ORPHAN_BENCHMARK_WORKLOAD_CLEANUP_GRACE_PERIOD = int(
     os.getenv("GPUSTACK_WORKER_ORPHAN_BENCHMARK_WORKLOAD_CLEANUP_GRACE_PERIOD", 300)
 )  # 5 minutes in seconds
 # Worker unreachable check mode: auto, enabled, disabled
-# - auto: automatically disable check when worker count > 50 (default)
+# - auto: same as enabled (default); kept for existing configurations
 # - enabled: always perform unreachable check
 # - disabled: never perform unreachable check
 WORKER_UNREACHABLE_CHECK_MODE = os.getenv(
     "GPUSTACK_WORKER_UNREACHABLE_CHECK_MODE", "auto"
 ).lower()
+# Reachability probes the server runs at once. Fleets larger than the shard
+# size are probed a shard per sync interval, so each worker is checked every
+# ceil(workers / shard size) intervals.
+WORKER_REACHABILITY_PROBE_CONCURRENCY = int(
+    os.getenv("GPUSTACK_WORKER_REACHABILITY_PROBE_CONCURRENCY", 32)
+)
+WORKER_REACHABILITY_PROBE_SHARD_SIZE = int(
+    os.getenv("GPUSTACK_WORKER_REACHABILITY_PROBE_SHARD_SIZE", 250)
+)
 
 # Opt-in (default off): drop a runner image's bundled cuda-compat and use the host
 # driver so consumer GPUs can run images built for a newer CUDA minor (same major).
@@ -246,6 +354,15 @@ MODEL_INSTANCE_RESCHEDULE_GRACE_PERIOD = int(
 MODEL_INSTANCE_HEALTH_CHECK_INTERVAL = int(
     os.getenv("GPUSTACK_MODEL_INSTANCE_HEALTH_CHECK_INTERVAL", 3)
 )
+# Inference health checks (opted into per model) in flight at once on a
+# worker. A check that hangs holds its slot for its model's timeout, so this is
+# how many hung engines it takes before the others' checks start to queue.
+INFERENCE_HEALTH_CHECK_CONCURRENCY = int(
+    os.getenv("GPUSTACK_INFERENCE_HEALTH_CHECK_CONCURRENCY", 8)
+)
+# Each check is scheduled up to this fraction of its interval late, at random,
+# so instances that became eligible together do not stay in lockstep. Internal.
+INFERENCE_HEALTH_CHECK_JITTER = 0.1
 # Period, in seconds, for forcing an authoritative (uncached) DB reconciliation
 # of locally-tracked model instances in the worker state sync. 0 disables it,
 # leaving the sync purely cache-backed. It exists only as a backstop for a
@@ -273,12 +390,37 @@ WORKER_STATUS_COLLECTION_LOG_SLOW_SECONDS = float(
     os.getenv("GPUSTACK_WORKER_STATUS_COLLECTION_LOG_SLOW_SECONDS", 180)
 )
 
+# Large model files are downloaded as concurrent HTTP range requests of this
+# many bytes each; files smaller than two chunks are downloaded in one stream.
+MODEL_DOWNLOAD_CHUNK_SIZE = int(
+    os.getenv("GPUSTACK_MODEL_DOWNLOAD_CHUNK_SIZE", 64 * 1024 * 1024)
+)
+MODEL_DOWNLOAD_CHUNK_CONCURRENCY = int(
+    os.getenv("GPUSTACK_MODEL_DOWNLOAD_CHUNK_CONCURRENCY", 8)
+)
+
 # Model evaluation cache configuration
 MODEL_EVALUATION_CACHE_MAX_SIZE = int(
     os.getenv("GPUSTACK_MODEL_EVALUATION_CACHE_MAX_SIZE", 1000)
 )
 MODEL_EVALUATION_CACHE_TTL = int(os.getenv("GPUSTACK_MODEL_EVALUATION_CACHE_TTL", 3600))
 
+# Estimate local GGUF language models in process from their headers instead of
+# running gguf-parser. Off by default: the compute buffers are approximated,
+# and only architectures checked against gguf-parser output are covered (the
+# rest are always left to gguf-parser).
+GGUF_ESTIMATE_IN_PROCESS = os.getenv(
+    "GPUSTACK_GGUF_ESTIMATE_IN_PROCESS", "false"
+).lower() in ["true", "1"]
+
+# Probes of LOCAL_PATH model files on workers ask this many workers at first,
+# and one more each time none has answered by this percentile of the latency
+# of past probes of the same kind (or one fails).
+WORKER_PROBE_INITIAL_FANOUT = int(os.getenv("GPUSTACK_WORKER_PROBE_INITIAL_FANOUT", 2))
+WORKER_PROBE_HEDGE_PERCENTILE = float(
+    os.getenv("GPUSTACK_WORKER_PROBE_HEDGE_PERCENTILE", 0.95)
+)
+
 # Scheduler configuration (server-side)
 SCHEDULER_SCALE_UP_PLACEMENT_MAX_SCORE = float(
     os.getenv("GPUSTACK_SCHEDULER_SCALE_UP_PLACEMENT_MAX_SCORE", 100)
@@ -313,6 +455,13 @@ GATEWAY_MIRROR_INGRESS_NAME = os.getenv(
     "GPUSTACK_GATEWAY_MIRROR_INGRESS_NAME", "gpustack"
 )
 
+# Most decimal places of the traffic percentages written to a model route's
+# gateway destinations. Higress only accepts whole percentages in
+# higress.io/destination, so keep 0 unless the gateway takes decimals.
+GATEWAY_WEIGHT_MAX_DECIMALS = max(
+    0, int(os.getenv("GPUSTACK_GATEWAY_WEIGHT_MAX_DECIMALS", 0))
+)
+
 # Heuristics for partial-stream usage estimation.
 # Used by metrics_collector when a gateway report arrives with completed=false
 # (client disconnect, upstream cancel) and token fields are blank or partial.
@@ -405,6 +554,23 @@ METERED_USAGE_ARCHIVE_BATCH_SIZE = int(
     os.getenv("GPUSTACK_METERED_USAGE_ARCHIVE_BATCH_SIZE", 5000)
 )
 
+# Weekly / monthly tiers over ``model_usages`` (``model_usage_weekly`` /
+# ``model_usage_monthly``). The usage flush keeps them current; usage
+# breakdowns read fully covered weeks / months from them instead of scanning
+# every daily row. Disabling only stops the READ side — the tiers keep being
+# maintained, so turning it back on needs no rebuild.
+USAGE_TIERS_ENABLED = os.getenv("GPUSTACK_USAGE_TIERS_ENABLED", "true").lower() in (
+    "true",
+    "1",
+)
+# Leader-only verification of the tiers against ``model_usages``: runs once on
+# startup and then on this cron (UTC), rebuilding any week / month that
+# drifted within the last ``USAGE_TIERS_VERIFY_MONTHS`` calendar months (older
+# periods no longer receive writes). ``gpustack check-usage-tiers`` checks any
+# range on demand.
+USAGE_TIERS_VERIFY_CRON = os.getenv("GPUSTACK_USAGE_TIERS_VERIFY_CRON", "45 3 * * *")
+USAGE_TIERS_VERIFY_MONTHS = int(os.getenv("GPUSTACK_USAGE_TIERS_VERIFY_MONTHS", 2))
+
 # metered_usage collector tick — periodic safety net that flushes accumulated
 # seconds for long-running metered resources that haven't had a lifecycle
 # event since the last tick.
@@ -461,6 +627,18 @@ USAGE_EXPORT_MAX_ROWS = int(os.getenv("GPUSTACK_USAGE_EXPORT_MAX_ROWS", 100000))
 # Tunable alongside the hard limit, so a deployment that raises one doesn't
 # keep warning at 10k about exports it happily does at 200k.
 USAGE_EXPORT_SOFT_ROWS = int(os.getenv("GPUSTACK_USAGE_EXPORT_SOFT_ROWS", 10000))
+# Background export jobs (``/breakdown/export/jobs``) write the file to
+# ``<data_dir>/exports`` instead of holding a request open, so they are bounded
+# by these rather than by USAGE_EXPORT_MAX_ROWS. Each running job holds two
+# database connections (the row cursor and the name lookups) for as long as it
+# runs, which is what the concurrency caps; jobs past it wait their turn.
+USAGE_EXPORT_JOB_CONCURRENCY = int(
+    os.getenv("GPUSTACK_USAGE_EXPORT_JOB_CONCURRENCY", 2)
+)
+# How long a finished export file stays downloadable before it is deleted.
+USAGE_EXPORT_JOB_TTL_SECONDS = int(
+    os.getenv("GPUSTACK_USAGE_EXPORT_JOB_TTL_SECONDS", 24 * 60 * 60)
+)
 
 # The rest are internal guards, deliberately NOT environment-tunable. They
 # bound what a hand-crafted request can make the server do; no deployment has
@@ -488,6 +666,18 @@ USAGE_EXPORT_STREAM_CHUNK_ROWS = 1000
 USAGE_EXPORT_MAX_SPLIT_MEMBERS = 10
 # xlsx cannot hold more than this per worksheet — a format limit, not ours.
 XLSX_MAX_ROWS_PER_SHEET = 1048576
+# Rows per columnar batch in Parquet / Arrow exports: the unit the rows are
+# transposed, encoded and written in (one Parquet row group, one Arrow record
+# batch). Peak memory is about one batch of rows plus its encoded columns;
+# larger batches compress a little better and cost proportionally more RAM.
+USAGE_EXPORT_COLUMNAR_BATCH_ROWS = 10000
+# Unfinished export jobs one user may have at a time. Queued jobs cost
+# nothing until they run, but each is a promise of a full aggregate later, so
+# a client resubmitting in a loop must not be able to pile them up.
+USAGE_EXPORT_JOB_MAX_ACTIVE_PER_USER = 3
+# How often expired export files are swept. Only bounds how long a file
+# outlives its TTL; the download endpoint refuses expired jobs on its own.
+USAGE_EXPORT_JOB_GC_INTERVAL_SECONDS = 300
 
 # Scheduled scaling (tidal) reconcile cadence. The loop is level-triggered — it
 # recomputes the count each pass from (now, windows, baseline) — so this bounds
@@ -1,5 +1,8 @@
 import asyncio
+from collections import defaultdict
 import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 from prometheus_client.registry import Collector
 from prometheus_client.core import (
@@ -7,13 +10,16 @@ from prometheus_client.core import (
     InfoMetricFamily,
 )
 import uvicorn
+from gpustack import envs
 from gpustack.config.config import Config
 from gpustack.exporter.bus_metrics import BusMetricsCollector
+from gpustack.exporter.proxy_metrics import ProxyMetricsCollector
 from gpustack.logging import setup_logging
 from gpustack.schemas.config import ModelInstanceProxyModeEnum
 from gpustack.schemas.clusters import Cluster
-from gpustack.schemas.models import CategoryEnum, Model
+from gpustack.schemas.models import CategoryEnum, Model, ModelInstance
 from gpustack.schemas.workers import Worker, WorkerStateEnum
+from gpustack.server.bus import Event, EventType
 from gpustack.server.db import async_session
 from gpustack.server.deps import SessionDep
 from gpustack.utils.name import metric_name
@@ -29,184 +35,332 @@ logger = logging.getLogger(__name__)
 label_name_pattern = r'^[a-zA-Z_:][a-zA-Z0-9_:]*$'
 
 
+# Resources the metrics are built from.
+_RESOURCES = (Cluster, Worker, Model, ModelInstance)
+# How often the loop checks whether a resync is due.
+_REFRESH_INTERVAL = 3
+
+_CLUSTER_LABELS = ["cluster_id", "cluster_name"]
+_WORKER_LABELS = _CLUSTER_LABELS + ["worker_id", "worker_name"]
+_MODEL_LABELS = _CLUSTER_LABELS + ["model_id", "model_name"]
+_MODEL_INSTANCE_LABELS = _WORKER_LABELS + [
+    "model_id",
+    "model_name",
+    "model_instance_name",
+]
+
+# name -> (family, documentation, labels); info metrics name their labels per
+# sample, as the worker labels vary.
+_METRICS = {
+    "cluster": (InfoMetricFamily, "Cluster information", None),
+    "cluster_status": (
+        GaugeMetricFamily,
+        "Cluster status",
+        _CLUSTER_LABELS + ["state"],
+    ),
+    "worker": (InfoMetricFamily, "Worker information", None),
+    "worker_status": (GaugeMetricFamily, "Worker status", _WORKER_LABELS + ["state"]),
+    "model": (InfoMetricFamily, "Model information", None),
+    "model_desired_instances": (
+        GaugeMetricFamily,
+        "Desired instances of the model",
+        _MODEL_LABELS,
+    ),
+    "model_running_instances": (
+        GaugeMetricFamily,
+        "Running instances of the model",
+        _MODEL_LABELS,
+    ),
+    "model_instance_status": (
+        GaugeMetricFamily,
+        "Model instance status",
+        _MODEL_INSTANCE_LABELS + ["state"],
+    ),
+    "model_instance_restart_count": (
+        GaugeMetricFamily,
+        "Model instance restart count",
+        _MODEL_INSTANCE_LABELS,
+    ),
+    "model_instance_latest_restart_time": (
+        GaugeMetricFamily,
+        "Model instance latest restart time as Unix timestamp seconds",
+        _MODEL_INSTANCE_LABELS,
+    ),
+}
+
+# A row's key in the series and dependents maps.
+_Key = Tuple[type, Any]
+# One sample: the metric it belongs to and the arguments of ``add_metric``.
+_Sample = Tuple[str, tuple]
+
+
 class MetricExporter(Collector):
+    """Serve cluster, worker, model and instance metrics.
+
+    The rows behind the metrics are kept in memory and updated from bus
+    events, together with the samples each row contributes. An event
+    replaces the samples of its own row only (and of the rows labelled with
+    its name: a cluster's workers and models, a model's instances), so a
+    worker heartbeat costs one worker's samples rather than a rebuild of the
+    fleet. A full reload from the database every
+    ``GPUSTACK_METRICS_EXPORTER_RESYNC_INTERVAL_SECONDS`` covers any missed
+    event.
+    """
 
     def __init__(self, cfg: Config):
-        self._cache_metrics = []
         self._port = cfg.metrics_port
+        self._rows: Dict[type, Dict[Any, Any]] = {cls: {} for cls in _RESOURCES}
+        self._series: Dict[_Key, List[_Sample]] = {}
+        # Rows whose labels include the name of the keyed row.
+        self._dependents: Dict[_Key, Set[_Key]] = defaultdict(set)
+        # Events received while a resync loads its snapshot, applied on top
+        # of it so the snapshot cannot roll them back.
+        self._resync_events: Optional[List[Tuple[type, Event]]] = None
+        self._resync_requested = True
 
     def collect(self):
-        for metric in self._cache_metrics:
-            yield metric
+        families = {
+            name: (
+                family(metric_name(name), documentation)
+                if labels is None
+                else family(metric_name(name), documentation, labels=labels)
+            )
+            for name, (family, documentation, labels) in _METRICS.items()
+        }
+        # Scrapes run on a server thread while events land on the loop; the
+        # copy is taken in one step, and a row's samples are replaced, never
+        # changed in place.
+        for samples in list(self._series.values()):
+            for name, args in samples:
+                families[name].add_metric(*args)
+        yield from families.values()
 
     async def generate_metrics_cache(self):
+        watchers = [asyncio.create_task(self._watch(cls)) for cls in _RESOURCES]
+        last_resync = 0.0
+        try:
+            while True:
+                try:
+                    if (
+                        self._resync_requested
+                        or time.monotonic() - last_resync
+                        >= envs.METRICS_EXPORTER_RESYNC_INTERVAL
+                    ):
+                        async with async_session() as session:
+                            await self._collect_metrics(session)
+                        last_resync = time.monotonic()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # A transient DB error here (e.g. a pool-exhaustion timeout)
+                    # must not escape the loop -- an unhandled exception
+                    # propagates through the server's asyncio.gather and takes
+                    # the whole process down. Keep the last series, log, and
+                    # retry next tick.
+                    logger.exception("Failed to refresh metrics cache")
+                await asyncio.sleep(_REFRESH_INTERVAL)
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+
+    async def _watch(self, cls: type):
         while True:
             try:
-                async with async_session() as session:
-                    self._cache_metrics = await self._collect_metrics(session)
+                async for event in cls.subscribe(
+                    source="metric_exporter", replay_existing=False
+                ):
+                    self._on_event(cls, event)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                # A transient DB error here (e.g. a pool-exhaustion timeout)
-                # must not escape the loop -- an unhandled exception propagates
-                # through the server's asyncio.gather and takes the whole
-                # process down. Keep the last cache, log, and retry next tick.
-                logger.exception("Failed to refresh metrics cache")
-            await asyncio.sleep(3)
+                logger.exception(f"Failed to watch {cls.__name__} for metrics")
+            # Events may have been missed while not subscribed.
+            self._resync_requested = True
+            await asyncio.sleep(_REFRESH_INTERVAL)
+
+    def _on_event(self, cls: type, event: Event):
+        if event.type not in (EventType.CREATED, EventType.UPDATED, EventType.DELETED):
+            return
+        if self._resync_events is not None:
+            self._resync_events.append((cls, event))
+        self._apply_event(cls, event)
+
+    def _apply_event(self, cls: type, event: Event):
+        """Apply ``event`` to the rows, and replace the samples it changes."""
+        old = self._rows[cls].get(event.id)
+        if not self._store_event(self._rows, cls, event):
+            return
+        key = (cls, event.id)
+        if old is not None:
+            self._dependents[self._parent_key(cls, old)].discard(key)
+        new = self._rows[cls].get(event.id)
+        if new is not None:
+            self._dependents[self._parent_key(cls, new)].add(key)
+        self._refresh(key)
+
+    def _store_event(
+        self, rows: Dict[type, Dict[Any, Any]], cls: type, event: Event
+    ) -> bool:
+        if event.type == EventType.DELETED:
+            rows[cls].pop(event.id, None)
+        elif isinstance(event.data, cls):
+            rows[cls][event.id] = event.data
+        else:
+            # An event relayed without its row (it could not be loaded).
+            self._resync_requested = True
+            return False
+        return True
+
+    @staticmethod
+    def _parent_key(cls: type, row) -> Optional[_Key]:
+        if cls is ModelInstance:
+            return (Model, row.model_id)
+        if cls in (Worker, Model):
+            return (Cluster, row.cluster_id)
+        return None
+
+    def _refresh(self, key: _Key):
+        """Recompute the samples of ``key`` and of the rows labelled by it."""
+        cls, row_id = key
+        row = self._rows[cls].get(row_id)
+        samples = self._row_series(cls, row) if row is not None else None
+        if samples:
+            self._series[key] = samples
+        else:
+            self._series.pop(key, None)
+        for dependent in list(self._dependents.get(key, ())):
+            self._refresh(dependent)
 
     async def _collect_metrics(self, session: AsyncSession):
-        cluster_labels = ["cluster_id", "cluster_name"]
-        worker_labels = cluster_labels + ["worker_id", "worker_name"]
-        model_labels = cluster_labels + ["model_id", "model_name"]
-        model_instance_labels = worker_labels + [
-            "model_id",
-            "model_name",
-            "model_instance_name",
+        """Reload every row from the database and rebuild the series."""
+        self._resync_events = []
+        try:
+            clusters = await Cluster.all(
+                session,
+                options=[
+                    selectinload(Cluster.cluster_workers),
+                    selectinload(Cluster.cluster_models).selectinload(Model.instances),
+                ],
+            )
+            rows: Dict[type, Dict[Any, Any]] = {cls: {} for cls in _RESOURCES}
+            for cluster in clusters:
+                rows[Cluster][cluster.id] = cluster
+                for worker in cluster.cluster_workers:
+                    rows[Worker][worker.id] = worker
+                for model in cluster.cluster_models:
+                    rows[Model][model.id] = model
+                    for mi in model.instances:
+                        rows[ModelInstance][mi.id] = mi
+            for cls, event in self._resync_events:
+                self._store_event(rows, cls, event)
+        finally:
+            self._resync_events = None
+
+        self._rows = rows
+        self._rebuild_series()
+        self._resync_requested = False
+
+    def _rebuild_series(self):
+        self._dependents = defaultdict(set)
+        for cls, rows in self._rows.items():
+            for row_id, row in rows.items():
+                parent = self._parent_key(cls, row)
+                if parent is not None:
+                    self._dependents[parent].add((cls, row_id))
+        series = {}
+        for cls, rows in self._rows.items():
+            for row_id, row in rows.items():
+                samples = self._row_series(cls, row)
+                if samples:
+                    series[(cls, row_id)] = samples
+        self._series = series
+
+    def _row_series(self, cls: type, row) -> Optional[List[_Sample]]:
+        """The samples ``row`` contributes, or None while a row it is labelled
+        by is missing."""
+        if cls is Cluster:
+            return self._cluster_series(row)
+        if cls is ModelInstance:
+            model = self._rows[Model].get(row.model_id)
+            cluster = model and self._rows[Cluster].get(model.cluster_id)
+            if cluster is None:
+                return None
+            return self._model_instance_series(cluster, model, row)
+        cluster = self._rows[Cluster].get(row.cluster_id)
+        if cluster is None:
+            return None
+        if cls is Worker:
+            return self._worker_series(cluster, row)
+        return self._model_series(cluster, row)
+
+    @staticmethod
+    def _cluster_series(cluster: Cluster) -> List[_Sample]:
+        return [
+            (
+                "cluster",
+                (
+                    _CLUSTER_LABELS + ["provider"],
+                    {
+                        "cluster_id": str(cluster.id),
+                        "cluster_name": cluster.name,
+                        "provider": str(cluster.provider),
+                    },
+                ),
+            ),
+            ("cluster_status", ([str(cluster.id), cluster.name, cluster.state], 1)),
         ]
 
-        # cluster metrics
-        cluster_info = InfoMetricFamily(metric_name("cluster"), "Cluster information")
-        cluster_status = GaugeMetricFamily(
-            metric_name("cluster_status"),
-            "Cluster status",
-            labels=cluster_labels + ["state"],
-        )
-
-        # worker metrics
-        worker_info = InfoMetricFamily(metric_name("worker"), "Worker information")
-        worker_status = GaugeMetricFamily(
-            metric_name("worker_status"),
-            "Worker status",
-            labels=worker_labels + ["state"],
-        )
-
-        # model metrics
-        model_info = InfoMetricFamily(metric_name("model"), "Model information")
-        model_desired_instances = GaugeMetricFamily(
-            metric_name("model_desired_instances"),
-            "Desired instances of the model",
-            labels=model_labels,
-        )
-        model_running_instances = GaugeMetricFamily(
-            metric_name("model_running_instances"),
-            "Running instances of the model",
-            labels=model_labels,
-        )
-        model_instance_status = GaugeMetricFamily(
-            metric_name("model_instance_status"),
-            "Model instance status",
-            labels=model_instance_labels + ["state"],
-        )
-        model_instance_restart_count = GaugeMetricFamily(
-            metric_name("model_instance_restart_count"),
-            "Model instance restart count",
-            labels=model_instance_labels,
-        )
-        model_instance_latest_restart_time = GaugeMetricFamily(
-            metric_name("model_instance_latest_restart_time"),
-            "Model instance latest restart time as Unix timestamp seconds",
-            labels=model_instance_labels,
-        )
-
-        metrics = [
-            cluster_info,
-            cluster_status,
-            worker_info,
-            worker_status,
-            model_info,
-            model_desired_instances,
-            model_running_instances,
-            model_instance_status,
-            model_instance_restart_count,
-            model_instance_latest_restart_time,
+    @staticmethod
+    def _worker_series(cluster: Cluster, worker: Worker) -> List[_Sample]:
+        worker_dynamic_label_keys = []
+        worker_info_metric_values = {
+            "cluster_id": str(cluster.id),
+            "cluster_name": cluster.name,
+            "worker_id": str(worker.id),
+            "worker_name": worker.name,
+        }
+        for k, v in (worker.labels or {}).items():
+            if not re.match(label_name_pattern, k):
+                continue
+            worker_dynamic_label_keys.append(k)
+            worker_info_metric_values[k] = v
+
+        worker_label_values = [
+            str(cluster.id),
+            cluster.name,
+            str(worker.id),
+            worker.name,
+            worker.state,
         ]
-
-        # cluster metrics
-        cluster_id_to_name = {}
-        model_id_to_name = {}
-        model_id_to_cluster_id = {}
-        clusters = await Cluster.all(
-            session,
-            options=[
-                selectinload(Cluster.cluster_workers),
-                selectinload(Cluster.cluster_models).selectinload(Model.instances),
-            ],
-        )
-
-        for cluster in clusters:
-            cluster_id_to_name[str(cluster.id)] = cluster.name
-            cluster_label_values = [str(cluster.id), cluster.name]
-
-            cluster_info.add_metric(
-                cluster_labels + ["provider"],
-                {
-                    "cluster_id": str(cluster.id),
-                    "cluster_name": cluster.name,
-                    "provider": str(cluster.provider),
-                },
-            )
-
-            cluster_status.add_metric(
-                cluster_label_values + [cluster.state],
-                1,
-            )
-
-            # worker metrics
-            workers = cluster.cluster_workers
-            for worker in workers:
-                worker_label_values = cluster_label_values + [
-                    str(worker.id),
-                    worker.name,
-                    worker.state,
-                ]
-
-                worker_dynamic_label_keys = []
-                worker_info_metric_values = {
-                    "cluster_id": str(cluster.id),
-                    "cluster_name": cluster.name,
-                    "worker_id": str(worker.id),
-                    "worker_name": worker.name,
-                }
-                for k, v in (worker.labels or {}).items():
-                    if not re.match(label_name_pattern, k):
-                        continue
-                    worker_dynamic_label_keys.append(k)
-                    worker_info_metric_values[k] = v
-
-                worker_info.add_metric(
-                    worker_labels + worker_dynamic_label_keys,
+        return [
+            (
+                "worker",
+                (
+                    _WORKER_LABELS + worker_dynamic_label_keys,
                     worker_info_metric_values,
-                )
-
-                worker_status.add_metric(
-                    worker_label_values,
-                    1,
-                )
+                ),
+            ),
+            ("worker_status", (worker_label_values, 1)),
+        ]
 
-            # model metrics
-            models = cluster.cluster_models
-            for model in models:
-                model_id_to_name[str(model.id)] = model.name
-                model_id_to_cluster_id[str(model.id)] = str(cluster.id)
-
-                model_label_values = cluster_label_values + [
-                    str(model.id),
-                    model.name,
-                ]
-
-                # NOTE: Model.categories is a list, but Prometheus labels are
-                # scalar. GPUStack currently treats the first entry as the
-                # primary category for metrics, so secondary categories are not
-                # exposed in gpustack:model_info. This keeps one model_info
-                # series per model for model_id joins.
-                category = (
-                    model.categories[0]
-                    if model.categories
-                    else CategoryEnum.UNKNOWN.value
-                )
+    @staticmethod
+    def _model_series(cluster: Cluster, model: Model) -> List[_Sample]:
+        model_label_values = [str(cluster.id), cluster.name, str(model.id), model.name]
+
+        # NOTE: Model.categories is a list, but Prometheus labels are
+        # scalar. GPUStack currently treats the first entry as the
+        # primary category for metrics, so secondary categories are not
+        # exposed in gpustack:model_info. This keeps one model_info
+        # series per model for model_id joins.
+        category = (
+            model.categories[0] if model.categories else CategoryEnum.UNKNOWN.value
+        )
 
-                model_info.add_metric(
-                    model_labels
+        return [
+            (
+                "model",
+                (
+                    _MODEL_LABELS
                     + [
                         "runtime",
                         "runtime_version",
@@ -225,54 +379,47 @@ class MetricExporter(Collector):
                         "source_key": model.model_source_key,
                         "category": category,
                     },
-                )
-
-                model_desired_instances.add_metric(
-                    model_label_values,
-                    model.replicas,
-                )
-
-                model_running_instances.add_metric(
-                    model_label_values,
-                    model.ready_replicas,
-                )
-
-                # instance metrics
-                instances = model.instances
-                for mi in instances:
-                    worker_id = str(mi.worker_id) if mi.worker_id else "unknown"
-                    worker_name = mi.worker_name if mi.worker_name else "unknown"
-                    mi_label_values = cluster_label_values + [
-                        worker_id,
-                        worker_name,
-                        str(model.id),
-                        model.name,
-                        mi.name,
-                    ]
-                    model_instance_status.add_metric(
-                        mi_label_values + [mi.state],
-                        1,
-                    )
-                    model_instance_restart_count.add_metric(
-                        mi_label_values,
-                        mi.restart_count or 0,
-                    )
-                    model_instance_latest_restart_time.add_metric(
-                        mi_label_values,
-                        (
-                            mi.last_restart_time.timestamp()
-                            if mi.last_restart_time
-                            else 0
-                        ),
-                    )
+                ),
+            ),
+            ("model_desired_instances", (model_label_values, model.replicas)),
+            ("model_running_instances", (model_label_values, model.ready_replicas)),
+        ]
 
-        # return all metrics
-        return metrics
+    @staticmethod
+    def _model_instance_series(
+        cluster: Cluster, model: Model, mi: ModelInstance
+    ) -> List[_Sample]:
+        worker_id = str(mi.worker_id) if mi.worker_id else "unknown"
+        worker_name = mi.worker_name if mi.worker_name else "unknown"
+        mi_label_values = [
+            str(cluster.id),
+            cluster.name,
+            worker_id,
+            worker_name,
+            str(model.id),
+            model.name,
+            mi.name,
+        ]
+        return [
+            ("model_instance_status", (mi_label_values + [mi.state], 1)),
+            ("model_instance_restart_count", (mi_label_values, mi.restart_count or 0)),
+            (
+                "model_instance_latest_restart_time",
+                (
+                    mi_label_values,
+                    (mi.last_restart_time.timestamp() if mi.last_restart_time else 0),
+                ),
+            ),
+        ]
 
     async def start(self):
         try:
             REGISTRY.register(self)
             REGISTRY.register(BusMetricsCollector())
+            # Imported here so importing the exporter does not load the routes.
+            from gpustack.routes.openai import load_balancer
+
+            REGISTRY.register(ProxyMetricsCollector(load_balancer))
 
             # Start FastAPI server
             app = FastAPI(
@@ -0,0 +1,63 @@
+"""Prometheus metrics for the proxy's admission control, pulled at scrape time."""
+
+from typing import Iterator
+
+from prometheus_client.registry import Collector
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    Metric,
+    SummaryMetricFamily,
+)
+
+from gpustack.http_proxy.load_balancer import LoadBalancer
+from gpustack.utils.name import metric_name
+
+
+class ProxyMetricsCollector(Collector):
+    """Expose the OpenAI-compatible proxy's per-model queues.
+
+    Series are labelled by model name, and only cover models the proxy has
+    served since the server started.
+    """
+
+    def __init__(self, load_balancer: LoadBalancer):
+        self._load_balancer = load_balancer
+
+    def collect(self) -> Iterator[Metric]:
+        in_flight = GaugeMetricFamily(
+            metric_name("proxy_requests_in_flight"),
+            "Requests the proxy is serving per model.",
+            labels=["model"],
+        )
+        queue_depth = GaugeMetricFamily(
+            metric_name("proxy_queue_depth"),
+            "Requests waiting for a model at its concurrency limit.",
+            labels=["model"],
+        )
+        queue_wait = SummaryMetricFamily(
+            metric_name("proxy_queue_wait_seconds"),
+            "Time admitted requests waited for a model at its concurrency limit.",
+            labels=["model"],
+        )
+        rejected = CounterMetricFamily(
+            metric_name("proxy_requests_rejected"),
+            "Requests turned away with 429 per model. Reasons: queue_full, timeout.",
+            labels=["model", "reason"],
+        )
+
+        for stats in self._load_balancer.stats():
+            in_flight.add_metric([stats.model_name], stats.in_flight)
+            queue_depth.add_metric([stats.model_name], stats.queue_depth)
+            queue_wait.add_metric(
+                [stats.model_name],
+                count_value=stats.waited,
+                sum_value=stats.wait_seconds,
+            )
+            for reason, count in list(stats.rejected.items()):
+                rejected.add_metric([stats.model_name, reason], count)
+
+        yield in_flight
+        yield queue_depth
+        yield queue_wait
+        yield rejected
@@ -15,11 +15,12 @@ coordinator via the ``coordinator`` attribute.
 import logging
 from typing import Any, Coroutine, Generator, List, Optional, TYPE_CHECKING, Tuple
 
-from fastapi import FastAPI
-
-from gpustack.config.config import Config
-
 if TYPE_CHECKING:
+    # Only annotations need these; `gpustack version` imports this module
+    # and should not load FastAPI and every schema behind Config.
+    from fastapi import FastAPI
+
+    from gpustack.config.config import Config
     from gpustack.server.coordinator import Coordinator
 
 logger = logging.getLogger(__name__)
@@ -88,7 +89,7 @@ class Plugin:
     # Optional distributed-mode coordinator; the server starts/stops it.
     coordinator: Optional["Coordinator"] = None
 
-    def __init__(self, app: FastAPI, cfg: Config) -> None:
+    def __init__(self, app: "FastAPI", cfg: "Config") -> None:
         pass
 
     def async_tasks(self) -> List[Coroutine[Any, Any, Any]]:
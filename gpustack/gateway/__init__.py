@@ -51,6 +51,7 @@ from gpustack.gateway.ext_auth import (
     ext_auth_init_spec_diff,
     ext_auth_resource_name,
     ext_auth_spec,
+    validate_ext_auth_key_shards,
 )
 from gpustack.gateway.plugins import plugin_entry, plugin_spec_overrides
 
@@ -819,6 +820,8 @@ def initialize_gateway(cfg: Config, timeout: int = 60, interval: int = 5):
         GatewayModeEnum.incluster,
     ]:
         validate_ai_statistics_plugin_content_types(cfg=cfg)
+        if cfg.server_role() != Config.ServerRole.WORKER:
+            validate_ext_auth_key_shards(cfg=cfg)
         plugin_list: List[Tuple[str, WasmPluginSpec]] = [
             ext_auth_plugin(cfg=cfg),
             ai_statistics_plugin(cfg=cfg),
@@ -50,6 +50,10 @@ ext_auth_resource_name = "gpustack-llm-ext-auth"
 
 ext_auth_plugin_name = "gpustack-ext-auth"
 
+# Name prefix of the key table shards past the first; see
+# :func:`ext_auth_shard_resource_name`.
+ext_auth_shard_resource_prefix = f"{ext_auth_resource_name}-shard-"
+
 # Access-policy value the plugin understands. Lower-case on purpose: it mirrors
 # ``AccessPolicyEnum.PUBLIC``'s wire value, which is what the reconciler
 # compares against.
@@ -155,6 +159,27 @@ class ExtAuthOverride(BaseModel):
     status_on_error: int = Field(default=403, ge=400, le=599)
 
 
+def validate_ext_auth_key_shards(cfg: Config):
+    """Refuse ``GPUSTACK_GATEWAY_AUTH_KEY_SHARDS`` above 1 with the bundled
+    plugin.
+
+    Every shard is an ext-auth filter on each inference route, and the bundled
+    plugin sends a key missing from its own table to the server, so N shards
+    would cost every request N-1 server round-trips. Only a build set through
+    ``gateway_plugin.<name>.url`` that passes on keys held by other shards can
+    run more than one.
+    """
+    shards = envs.GATEWAY_AUTH_KEY_SHARDS
+    entry = plugin_entry(ext_auth_plugin_name, cfg)
+    if shards > 1 and (entry is None or not entry.url):
+        raise ValueError(
+            f"GPUSTACK_GATEWAY_AUTH_KEY_SHARDS={shards} requires "
+            f"gateway_plugin.{ext_auth_plugin_name}.url to point at an ext-auth "
+            "plugin build that passes on keys held by other shards; the bundled "
+            "plugin supports a single shard."
+        )
+
+
 def ext_auth_override(cfg: Config) -> ExtAuthOverride:
     """The operator's settings for this plugin, or the defaults.
 
@@ -260,15 +285,29 @@ def public_route_match_rules(
     ]
 
 
+def local_auth_shard_config(shard: Tuple[int, int]) -> Dict[str, Any]:
+    """Which key table shard, of how many, a CR carries.
+
+    Lets a plugin build pass on a credential whose access key (or ref id)
+    hashes to another shard instead of asking the server about it: the shard
+    is the first 8 bytes of its blake2b digest, big-endian, modulo ``count``.
+    A key found in the CR's own tables is its to verify whatever it hashes to,
+    since a full shard's surplus is placed in the next one with room.
+    """
+    index, count = shard
+    return {"index": index, "count": count, "hash": "blake2b-64"}
+
+
 def ext_auth_default_config(
     cfg: Config,
     registry: McpBridgeRegistry,
     keys: Optional[Dict[str, Any]] = None,
     refs: Optional[Dict[str, Any]] = None,
     public_route_ingresses: Optional[List[List[str]]] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> Dict[str, Any]:
     override = ext_auth_override(cfg)
-    return {
+    config: Dict[str, Any] = {
         # The gate, checked before anything else below is allowed to apply.
         "route_match_regexes": route_match_regexes(cfg),
         "local_auth": {
@@ -398,6 +437,9 @@ def ext_auth_default_config(
         # PUBLIC routes never reach this: they do not call the server at all.
         "failure_mode_allow_authenticated": override.failure_mode_allow_authenticated,
     }
+    if shard is not None:
+        config["local_auth"]["shard"] = local_auth_shard_config(shard)
+    return config
 
 
 def ext_auth_spec(
@@ -406,6 +448,7 @@ def ext_auth_spec(
     keys: Optional[Dict[str, Any]] = None,
     refs: Optional[Dict[str, Any]] = None,
     public_route_ingresses: Optional[List[List[str]]] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> WasmPluginSpec:
     return WasmPluginSpec(
         defaultConfig=ext_auth_default_config(
@@ -414,6 +457,7 @@ def ext_auth_spec(
             keys=keys,
             refs=refs,
             public_route_ingresses=public_route_ingresses,
+            shard=shard,
         ),
         matchRules=public_route_match_rules(public_route_ingresses),
         defaultConfigDisable=False,
@@ -441,6 +485,18 @@ def ext_auth_spec(
     )
 
 
+def ext_auth_shard_resource_name(shard: int) -> str:
+    """K8s resource name of key table shard ``shard``.
+
+    Shard 0 is :data:`ext_auth_resource_name` itself, so a deployment running a
+    single shard keeps exactly the one CR it always had, and moving between
+    shard counts never leaves the inference routes without that filter.
+    """
+    if shard == 0:
+        return ext_auth_resource_name
+    return f"{ext_auth_shard_resource_prefix}{shard}"
+
+
 def _rule_access_policy(rule: Any) -> Any:
     """The access policy on a match rule, whichever shape it arrived in.
 
@@ -509,6 +565,10 @@ def ext_auth_init_spec_diff(
     local_auth = dict(default_config.get("local_auth") or {})
     local_auth["keys"] = keys
     local_auth["refs"] = refs
+    # The shard marker goes with the tables it describes.
+    live_local_auth = (current_spec.defaultConfig or {}).get("local_auth")
+    if isinstance(live_local_auth, dict) and "shard" in live_local_auth:
+        local_auth["shard"] = live_local_auth["shard"]
     default_config["local_auth"] = local_auth
     return expected_spec.model_copy(
         update={"defaultConfig": default_config, "matchRules": public_rules}
@@ -522,6 +582,7 @@ def ext_auth_reconcile_spec_diff(
     public_route_ingresses: List[List[str]],
     cfg: Config,
     registry: McpBridgeRegistry,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> WasmPluginSpec:
     """Reconciler diff: replace the database-owned parts, keep the base.
 
@@ -559,6 +620,7 @@ def ext_auth_reconcile_spec_diff(
             keys=keys,
             refs=refs,
             public_route_ingresses=public_route_ingresses,
+            shard=shard,
         )
     default_config = dict(current_spec.defaultConfig or {})
     # Anything unrecognizable is treated as absent, as in _database_owned_parts:
@@ -569,6 +631,14 @@ def ext_auth_reconcile_spec_diff(
     local_auth = dict(live_local_auth) if isinstance(live_local_auth, dict) else {}
     local_auth["keys"] = keys
     local_auth["refs"] = refs
+    if shard is not None:
+        local_auth["shard"] = local_auth_shard_config(shard)
+    else:
+        local_auth.pop("shard", None)
+    if shard is not None:
+        local_auth["shard"] = local_auth_shard_config(shard)
+    else:
+        local_auth.pop("shard", None)
     default_config["local_auth"] = local_auth
     # Rewritten alongside the rules even though it is part of the static base:
     # the two have to agree, and a CR whose gate went missing would carry
@@ -578,3 +648,34 @@ def ext_auth_reconcile_spec_diff(
     current_spec.defaultConfig = default_config
     current_spec.matchRules = public_route_match_rules(public_route_ingresses)
     return current_spec
+
+
+def ext_auth_shard_spec_diff(
+    current_spec: Optional[WasmPluginSpec],
+    keys: Dict[str, Any],
+    refs: Dict[str, Any],
+    public_route_ingresses: List[List[str]],
+    cfg: Config,
+    registry: McpBridgeRegistry,
+    shard: Optional[Tuple[int, int]] = None,
+) -> WasmPluginSpec:
+    """Reconciler diff for a key table shard past the first: render it whole.
+
+    Unlike the first shard these CRs are not written at startup, so nothing
+    else refreshes their static base. Rendering everything from ``cfg`` on each
+    write keeps the endpoint, the signing key and the module URL of every shard
+    in step with the first one after an upgrade, and nothing on them is owned
+    by anyone but the reconciler.
+
+    They carry the same PUBLIC rules as the first shard: each shard is a filter
+    of its own on every inference route, and one that did not know a route was
+    PUBLIC would send its callers to the server for authorization.
+    """
+    return ext_auth_spec(
+        cfg=cfg,
+        registry=registry,
+        keys=keys,
+        refs=refs,
+        public_route_ingresses=public_route_ingresses,
+        shard=shard,
+    )
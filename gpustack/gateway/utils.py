@@ -3,6 +3,7 @@ import hashlib
 import logging
 import copy
 import math
+from decimal import Decimal
 from urllib.parse import urlparse
 from dataclasses import dataclass, field as dataclass_field
 from functools import partial
@@ -61,7 +62,7 @@ from gpustack.schemas.clusters import Cluster
 from gpustack.utils.network import is_ipaddress
 from kubernetes_asyncio import client as k8s_client
 from kubernetes_asyncio.client import ApiException, V1IngressTLS
-from gpustack.envs import GATEWAY_MIRROR_INGRESS_NAME
+from gpustack.envs import GATEWAY_MIRROR_INGRESS_NAME, GATEWAY_WEIGHT_MAX_DECIMALS
 from gpustack.api.exceptions import NotFoundException
 from gpustack.websocket_proxy.message import ServerInfo, RegisteredClientInfo
 
@@ -96,8 +97,10 @@ gpustack_original_path_header = "x-gpustack-original-path"
 gpustack_fallback_path_header = "x-gpustack-fallback-path"
 
 # Type alias for destination tuples
-# Each tuple contains (weight: int, model_name: str, registry: McpBridgeRegistry)
-DestinationTupleList = List[Tuple[int, str, McpBridgeRegistry]]
+# Each tuple contains (weight, model_name: str, registry: McpBridgeRegistry).
+# The weight is an instance count until the destinations are flattened into
+# traffic percentages, which are whole unless GATEWAY_WEIGHT_MAX_DECIMALS is set.
+DestinationTupleList = List[Tuple[Union[int, Decimal], str, McpBridgeRegistry]]
 
 
 @dataclass
@@ -827,6 +830,11 @@ def mcp_ingress_equal(
     return True
 
 
+# Seats the smallest share of traffic should span before another decimal place
+# is considered unnecessary; see weight_decimals.
+_MIN_SHARE_SEATS = 10
+
+
 def scale_weight(weight_instance_pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
     """
     Scale weights based on the least common multiple of counts to maintain proportionality.
@@ -842,39 +850,130 @@ def scale_weight(weight_instance_pairs: List[Tuple[int, int]]) -> List[Tuple[int
     return scaled
 
 
+def _instance_weights(
+    weight_instance_pairs: List[Tuple[int, int]],
+    max_weight: Optional[int] = 0,
+) -> List[int]:
+    """The effective weight of each instance, in the order of the pairs."""
+    weights = []
+    for weight, instance_count in scale_weight(weight_instance_pairs):
+        weights.extend([max(weight, max_weight)] * instance_count)
+    return weights
+
+
+def _largest_remainder(weights: List[int], total: int) -> List[int]:
+    """Split ``total`` seats in proportion to ``weights``, summing to ``total``."""
+    total_weight = sum(weights)
+    if total_weight == 0:
+        return []
+    # Integer arithmetic, so that equal shares always tie on the remainder.
+    quotas = [divmod(weight * total, total_weight) for weight in weights]
+    seats = [floor for floor, _ in quotas]
+
+    remaining_seats = total - sum(seats)
+    by_remainder = sorted(range(len(quotas)), key=lambda i: -quotas[i][1])
+    for i in by_remainder[:remaining_seats]:
+        seats[i] += 1
+    return seats
+
+
 def hamilton_calculate_weight(
     weight_instance_pairs: List[Tuple[int, int]],
     max_weight: Optional[int] = 0,
+    total: int = 100,
 ) -> List[int]:
     """
-    hamilton_calculate_weight to allocate percentage based on weight and instance count.
-    The total should be 100.
+    hamilton_calculate_weight to allocate ``total`` seats based on weight and
+    instance count. The default of 100 allocates percentages.
 
     :param weight_instance_pairs: weight and instance count pairs
     :type weight_instance_pairs: List[Tuple[int, int]]
-    :return: list of percentage for instance
+    :return: list of seats for instance
     :rtype: List[int]
     """
-    weight_instance_pairs = scale_weight(weight_instance_pairs)
-    instances_info = []
-    for weight, instance_count in weight_instance_pairs:
-        for _ in range(instance_count):
-            instances_info.append({'weight': weight, 'group_weight': weight})
-    total_weight = sum(max(info['weight'], max_weight) for info in instances_info)
-    if total_weight == 0:
-        return []
-    for info in instances_info:
-        weight = max(info['weight'], max_weight)
-        info['exact_quota'] = weight * 100 / total_weight
-        info['floor_quota'] = int(info['exact_quota'])
-        info['remainder'] = info['exact_quota'] - info['floor_quota']
-
-    total_floor = sum(info['floor_quota'] for info in instances_info)
-    remaining_seats = 100 - total_floor
-    sorted_instances = sorted(instances_info, key=lambda x: -x['remainder'])
-    for i in range(remaining_seats):
-        sorted_instances[i]['floor_quota'] += 1
-    return [info['floor_quota'] for info in instances_info]
+    return _largest_remainder(
+        _instance_weights(weight_instance_pairs, max_weight), total
+    )
+
+
+def _destination_weights(
+    weight_instance_pairs: List[Tuple[int, int]],
+    destination_sizes: Optional[List[int]] = None,
+    max_weight: Optional[int] = 0,
+) -> List[int]:
+    """
+    The exact integer weight of each destination: the summed weights of the
+    ``destination_sizes`` consecutive instances it serves, in the order of the
+    pairs. Without sizes, each instance is a destination of its own.
+    """
+    weights = _instance_weights(weight_instance_pairs, max_weight)
+    if destination_sizes is None:
+        return weights
+    destination_weights = []
+    index = 0
+    for size in destination_sizes:
+        destination_weights.append(sum(weights[index : index + size]))
+        index += size
+    return destination_weights
+
+
+def _decimals_for(weights: List[int], max_decimals: int) -> int:
+    positive = [weight for weight in weights if weight > 0]
+    if not positive:
+        return 0
+    smallest, total_weight = min(positive), sum(positive)
+    decimals = 0
+    while (
+        decimals < max_decimals
+        and smallest * 100 * 10**decimals < _MIN_SHARE_SEATS * total_weight
+    ):
+        decimals += 1
+    return decimals
+
+
+def weight_decimals(
+    weight_instance_pairs: List[Tuple[int, int]],
+    max_weight: Optional[int] = 0,
+    max_decimals: Optional[int] = None,
+    destination_sizes: Optional[List[int]] = None,
+) -> int:
+    """
+    Decimal places the traffic percentages of these destinations need.
+
+    Each decimal place is added only while the smallest share would span
+    fewer than ``_MIN_SHARE_SEATS`` seats, which bounds its rounding error to
+    a tenth of the share, and never past ``max_decimals``. Higress only
+    accepts whole percentages in ``higress.io/destination``, so the default
+    cap, ``GATEWAY_WEIGHT_MAX_DECIMALS``, is 0.
+    """
+    if max_decimals is None:
+        max_decimals = GATEWAY_WEIGHT_MAX_DECIMALS
+    return _decimals_for(
+        _destination_weights(weight_instance_pairs, destination_sizes, max_weight),
+        max_decimals,
+    )
+
+
+def traffic_percentages(
+    weight_instance_pairs: List[Tuple[int, int]],
+    max_weight: Optional[int] = 0,
+    max_decimals: Optional[int] = None,
+    destination_sizes: Optional[List[int]] = None,
+) -> List[Decimal]:
+    """
+    Percentage of traffic for each destination, summing to exactly 100.
+
+    Destinations are apportioned once, from the exact integer weights of the
+    instances behind them, so a destination serving many instances is off by
+    less than one percent rather than by one per instance. Percentages are
+    whole unless :func:`weight_decimals` allows and needs decimal places.
+    """
+    weights = _destination_weights(weight_instance_pairs, destination_sizes, max_weight)
+    if max_decimals is None:
+        max_decimals = GATEWAY_WEIGHT_MAX_DECIMALS
+    decimals = _decimals_for(weights, max_decimals)
+    seats = _largest_remainder(weights, 100 * 10**decimals)
+    return [Decimal(seat).scaleb(-decimals) for seat in seats]
 
 
 def model_instances_registry_list(
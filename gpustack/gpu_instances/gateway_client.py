@@ -57,6 +57,10 @@ def set_gateway_unix_path(path: str) -> None:
     _unix_path = path
 
 
+def get_gateway_unix_path() -> Optional[str]:
+    return _unix_path
+
+
 def is_gateway_configured() -> bool:
     """Whether the operator's worker gateway socket path is known.
 
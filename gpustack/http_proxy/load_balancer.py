@@ -1,17 +1,307 @@
-from typing import List
+import asyncio
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Deque, Dict, List, Optional
 
 from gpustack.http_proxy.strategies import LoadBalancingStrategy, RoundRobinStrategy
 from gpustack.schemas.models import ModelInstance
 
+# Seconds without requests after which an idle model's admission state is
+# dropped, so models that are gone do not keep an entry forever.
+STATS_IDLE_SECONDS = 600
+
+
+class AdmissionRejected(Exception):
+    """A request found its model saturated and could not wait for a slot.
+
+    ``reason`` is ``queue_full`` or ``timeout``; ``retry_after`` is a hint in
+    seconds for the client.
+    """
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Request rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Waiter:
+    instances: List[ModelInstance]
+    tenant: str
+    client: str
+    future: asyncio.Future
+
+
+class _FairQueue:
+    """Requests waiting for one model, served fairly.
+
+    Tenants take turns, and so do the clients (API keys or users) of a
+    tenant, so neither a busy tenant nor one busy key of it can starve the
+    others. Each client's own requests are served in arrival order.
+    """
+
+    def __init__(self):
+        self._tenants: "OrderedDict[str, OrderedDict[str, Deque[_Waiter]]]" = (
+            OrderedDict()
+        )
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, waiter: _Waiter):
+        clients = self._tenants.setdefault(waiter.tenant, OrderedDict())
+        clients.setdefault(waiter.client, deque()).append(waiter)
+        self.size += 1
+
+    def peek(self) -> _Waiter:
+        clients = next(iter(self._tenants.values()))
+        return next(iter(clients.values()))[0]
+
+    def pop(self) -> _Waiter:
+        tenant, clients = next(iter(self._tenants.items()))
+        client, waiters = next(iter(clients.items()))
+        waiter = waiters.popleft()
+        # Served ones go to the back of their round.
+        if waiters:
+            clients.move_to_end(client)
+        else:
+            del clients[client]
+        if clients:
+            self._tenants.move_to_end(tenant)
+        else:
+            del self._tenants[tenant]
+        self.size -= 1
+        return waiter
+
+    def remove(self, waiter: _Waiter):
+        clients = self._tenants.get(waiter.tenant, {})
+        waiters = clients.get(waiter.client)
+        if not waiters or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del clients[waiter.client]
+        if not clients:
+            del self._tenants[waiter.tenant]
+        self.size -= 1
+
+
+@dataclass
+class ModelAdmissionStats:
+    """Admission counters of one model, for the metrics exporter."""
+
+    model_name: str
+    in_flight: int = 0
+    queue_depth: int = 0
+    waited: int = 0
+    wait_seconds: float = 0.0
+    rejected: Counter = field(default_factory=Counter)
+
 
 class LoadBalancer:
-    def __init__(self, strategy: LoadBalancingStrategy = None):
+    """Pick instances for proxied requests, within concurrency limits.
+
+    With ``model_max_concurrency`` or ``instance_max_concurrency`` set (0 is
+    unlimited), a request that finds its model saturated waits in a bounded
+    per-model queue for a slot to free up, and is rejected with
+    :class:`AdmissionRejected` when the queue is full or it waited
+    ``queue_timeout`` seconds. Freed slots go to waiting requests before new
+    ones, in the fair order of :class:`_FairQueue`.
+
+    The state of a model with nothing in flight or queued is dropped once it
+    has had no requests for ``stats_idle_seconds``, restarting its counters.
+    """
+
+    def __init__(
+        self,
+        strategy: LoadBalancingStrategy = None,
+        model_max_concurrency: int = 0,
+        instance_max_concurrency: int = 0,
+        queue_size: int = 0,
+        queue_timeout: float = 30,
+        stats_idle_seconds: float = STATS_IDLE_SECONDS,
+    ):
         if strategy is None:
             strategy = RoundRobinStrategy()
         self._strategy = strategy
+        self._model_max_concurrency = model_max_concurrency
+        self._instance_max_concurrency = instance_max_concurrency
+        self._queue_size = queue_size
+        self._queue_timeout = queue_timeout
+        # Requests being served, by instance id and by model id.
+        self._in_flight: Counter = Counter()
+        self._model_in_flight: Counter = Counter()
+        # Slots handed to woken waiters that have not taken them yet.
+        self._reserved: Counter = Counter()
+        self._queues: Dict[int, _FairQueue] = {}
+        self._stats: Dict[int, ModelAdmissionStats] = {}
+        # Moving average of queue waits, the basis of the Retry-After hint.
+        self._average_wait: Dict[int, float] = {}
+        self._stats_idle_seconds = stats_idle_seconds
+        self._last_request: Dict[int, float] = {}
+        self._next_sweep = 0.0
 
     def set_strategy(self, strategy: LoadBalancingStrategy):
         self._strategy = strategy
 
-    async def get_instance(self, instances: List[ModelInstance]) -> ModelInstance:
-        return await self._strategy.select_instance(instances)
+    async def get_instance(
+        self,
+        instances: List[ModelInstance],
+        key: Optional[str] = None,
+        tenant: str = "",
+        client: str = "",
+    ) -> ModelInstance:
+        """Pick an instance for a request, counting it in flight there until
+        :meth:`release`.
+
+        ``tenant`` and ``client`` identify who sent the request, for fair
+        queueing when the model is saturated.
+        """
+        if len(instances) == 0:
+            raise Exception("No instances available")
+        model_id = instances[0].model_id
+        now = time.monotonic()
+        self._evict_idle(now)
+        self._last_request[model_id] = now
+        self._model_stats(instances[0])
+        if self._queues.get(model_id) or self._free_slots(model_id, instances) <= 0:
+            await self._wait(model_id, instances, tenant, client)
+        return await self._select(model_id, instances, key)
+
+    def release(self, instance: ModelInstance):
+        self._in_flight[instance.id] -= 1
+        if self._in_flight[instance.id] <= 0:
+            del self._in_flight[instance.id]
+        self._model_in_flight[instance.model_id] -= 1
+        if self._model_in_flight[instance.model_id] <= 0:
+            del self._model_in_flight[instance.model_id]
+        self._dispatch(instance.model_id)
+
+    def stats(self) -> List[ModelAdmissionStats]:
+        """Current admission counters, one entry per model seen recently."""
+        self._evict_idle(time.monotonic())
+        for model_id, stats in list(self._stats.items()):
+            stats.in_flight = self._model_in_flight.get(model_id, 0)
+            queue = self._queues.get(model_id)
+            stats.queue_depth = len(queue) if queue else 0
+        return list(self._stats.values())
+
+    def _model_stats(self, instance: ModelInstance) -> ModelAdmissionStats:
+        stats = self._stats.get(instance.model_id)
+        if stats is None:
+            stats = self._stats[instance.model_id] = ModelAdmissionStats(
+                model_name=instance.model_name
+            )
+        return stats
+
+    def _evict_idle(self, now: float):
+        """Drop the state of models idle for ``stats_idle_seconds``, at most
+        once per that interval."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self._stats_idle_seconds
+        for model_id, last_request in list(self._last_request.items()):
+            if (
+                now - last_request < self._stats_idle_seconds
+                or self._model_in_flight.get(model_id)
+                or self._reserved.get(model_id)
+                or self._queues.get(model_id)
+            ):
+                continue
+            del self._last_request[model_id]
+            self._stats.pop(model_id, None)
+            self._queues.pop(model_id, None)
+            self._reserved.pop(model_id, None)
+            self._average_wait.pop(model_id, None)
+
+    def _free_slots(self, model_id: int, instances: List[ModelInstance]) -> float:
+        free = math.inf
+        if self._instance_max_concurrency > 0:
+            free = sum(
+                max(0, self._instance_max_concurrency - self._in_flight[i.id])
+                for i in instances
+            )
+        if self._model_max_concurrency > 0:
+            free = min(
+                free, self._model_max_concurrency - self._model_in_flight[model_id]
+            )
+        return free - self._reserved[model_id]
+
+    async def _select(
+        self, model_id: int, instances: List[ModelInstance], key: Optional[str]
+    ) -> ModelInstance:
+        if self._instance_max_concurrency > 0:
+            # Only narrow the list when some instance is full, so strategies
+            # keep their per-list state (iterators, hash rings) otherwise.
+            eligible = [
+                i
+                for i in instances
+                if self._in_flight[i.id] < self._instance_max_concurrency
+            ]
+            if eligible and len(eligible) < len(instances):
+                instances = eligible
+        instance = await self._strategy.select_instance(instances, key, self._in_flight)
+        self._in_flight[instance.id] += 1
+        self._model_in_flight[model_id] += 1
+        return instance
+
+    async def _wait(
+        self,
+        model_id: int,
+        instances: List[ModelInstance],
+        tenant: str,
+        client: str,
+    ):
+        stats = self._stats[model_id]
+        queue = self._queues.setdefault(model_id, _FairQueue())
+        if len(queue) >= self._queue_size:
+            stats.rejected["queue_full"] += 1
+            raise AdmissionRejected("queue_full", self._retry_after(model_id))
+
+        waiter = _Waiter(
+            instances, tenant, client, asyncio.get_running_loop().create_future()
+        )
+        queue.push(waiter)
+        started = time.monotonic()
+        try:
+            await asyncio.wait({waiter.future}, timeout=self._queue_timeout)
+        except BaseException:
+            self._abandon(model_id, waiter)
+            raise
+        if not waiter.future.done():
+            self._abandon(model_id, waiter)
+            stats.rejected["timeout"] += 1
+            raise AdmissionRejected("timeout", self._retry_after(model_id))
+
+        # The slot reserved for us by _dispatch is ours to take now.
+        self._reserved[model_id] -= 1
+        waited = time.monotonic() - started
+        stats.waited += 1
+        stats.wait_seconds += waited
+        average = self._average_wait.get(model_id, waited)
+        self._average_wait[model_id] = 0.8 * average + 0.2 * waited
+
+    def _abandon(self, model_id: int, waiter: _Waiter):
+        """Take a waiter that gave up out of the queue, or pass on the slot
+        it was woken for."""
+        if waiter.future.done():
+            self._reserved[model_id] -= 1
+            self._dispatch(model_id)
+        else:
+            waiter.future.cancel()
+            self._queues[model_id].remove(waiter)
+
+    def _dispatch(self, model_id: int):
+        """Wake waiting requests of a model while it has free slots."""
+        queue = self._queues.get(model_id)
+        while queue and self._free_slots(model_id, queue.peek().instances) > 0:
+            waiter = queue.pop()
+            self._reserved[model_id] += 1
+            waiter.future.set_result(None)
+
+    def _retry_after(self, model_id: int) -> int:
+        average = self._average_wait.get(model_id, 1)
+        return max(1, min(math.ceil(average), math.ceil(self._queue_timeout)))
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+import bisect
+import hashlib
 import logging
-from typing import Dict, List
+import math
+from typing import Dict, List, Optional, Tuple
 import itertools
 
 from gpustack.schemas.models import ModelInstance
@@ -11,7 +14,18 @@ logger = logging.getLogger(__name__)
 class LoadBalancingStrategy(ABC):
 
     @abstractmethod
-    async def select_instance(self, instances: List[ModelInstance]) -> ModelInstance:
+    async def select_instance(
+        self,
+        instances: List[ModelInstance],
+        key: Optional[str] = None,
+        in_flight: Optional[Dict[int, int]] = None,
+    ) -> ModelInstance:
+        """Pick one of ``instances``, all of one model.
+
+        ``key`` identifies requests that should share an instance, and
+        ``in_flight`` counts the requests each instance id is serving; a
+        strategy may ignore either.
+        """
         pass
 
 
@@ -20,7 +34,12 @@ class RoundRobinStrategy(LoadBalancingStrategy):
         self._iterators: Dict[int, itertools.cycle] = {}
         self._instance_lists: Dict[int, List[ModelInstance]] = {}
 
-    async def select_instance(self, instances: List[ModelInstance]) -> ModelInstance:
+    async def select_instance(
+        self,
+        instances: List[ModelInstance],
+        key: Optional[str] = None,
+        in_flight: Optional[Dict[int, int]] = None,
+    ) -> ModelInstance:
         if len(instances) == 0:
             raise Exception("No instances available")
         model_id = instances[0].model_id
@@ -33,3 +52,98 @@ class RoundRobinStrategy(LoadBalancingStrategy):
             self._instance_lists[model_id] = instances
 
         return next(self._iterators[model_id])
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+class _Ring:
+    """Hash ring of one model's instances, each at ``replicas`` points."""
+
+    def __init__(self, instance_ids: Tuple[int, ...], replicas: int):
+        self.instance_ids = instance_ids
+        points = sorted(
+            (_hash(f"{instance_id}#{replica}"), instance_id)
+            for instance_id in instance_ids
+            for replica in range(replicas)
+        )
+        self.hashes = [point for point, _ in points]
+        self.owners = [instance_id for _, instance_id in points]
+
+    def walk(self, key: str):
+        """Instance ids in ring order from ``key``, each once."""
+        start = bisect.bisect(self.hashes, _hash(key))
+        seen = set()
+        for offset in range(len(self.owners)):
+            instance_id = self.owners[(start + offset) % len(self.owners)]
+            if instance_id not in seen:
+                seen.add(instance_id)
+                yield instance_id
+                if len(seen) == len(self.instance_ids):
+                    return
+
+
+class ConsistentHashStrategy(LoadBalancingStrategy):
+    """Send requests with the same key to the same instance.
+
+    Keys are placed on a hash ring of the running instances (consistent
+    hashing with bounded loads): a key goes to the first instance clockwise
+    from it that serves fewer than ``load_factor`` times the average number
+    of in-flight requests, so a hot key spills over to its next instance
+    instead of overloading one. An instance leaving the ring moves only its
+    own keys. Requests without a key are left to ``fallback``.
+    """
+
+    def __init__(
+        self,
+        load_factor: float = 1.25,
+        replicas: int = 64,
+        fallback: Optional[LoadBalancingStrategy] = None,
+    ):
+        self._load_factor = max(1.0, load_factor)
+        self._replicas = replicas
+        self._fallback = fallback or RoundRobinStrategy()
+        self._rings: Dict[int, _Ring] = {}
+
+    def _ring(self, instances: List[ModelInstance]) -> _Ring:
+        model_id = instances[0].model_id
+        instance_ids = tuple(sorted(instance.id for instance in instances))
+        ring = self._rings.get(model_id)
+        if ring is None or ring.instance_ids != instance_ids:
+            logger.debug(f"Building hash ring for model {model_id}")
+            ring = self._rings[model_id] = _Ring(instance_ids, self._replicas)
+        return ring
+
+    async def select_instance(
+        self,
+        instances: List[ModelInstance],
+        key: Optional[str] = None,
+        in_flight: Optional[Dict[int, int]] = None,
+    ) -> ModelInstance:
+        if len(instances) == 0:
+            raise Exception("No instances available")
+        if key is None:
+            return await self._fallback.select_instance(instances, key, in_flight)
+
+        in_flight = in_flight or {}
+        by_id = {instance.id: instance for instance in instances}
+        total = sum(in_flight.get(instance_id, 0) for instance_id in by_id)
+        capacity = math.ceil(self._load_factor * (total + 1) / len(by_id))
+        # Loads sum to less than len(by_id) * capacity, so some instance is
+        # always below it.
+        for instance_id in self._ring(instances).walk(key):
+            if in_flight.get(instance_id, 0) < capacity:
+                return by_id[instance_id]
+        raise Exception("No instances available")
+
+
+def strategy_for(mode: str, load_factor: float = 1.25) -> LoadBalancingStrategy:
+    """The strategy of a ``GPUSTACK_PROXY_LOAD_BALANCING`` mode."""
+    if mode == "affinity":
+        return ConsistentHashStrategy(load_factor=load_factor)
+    if mode != "round_robin":
+        logger.warning(f"Unknown load balancing mode {mode}, using round_robin")
+    return RoundRobinStrategy()
@@ -1,14 +1,52 @@
 import argparse
+import importlib
+import sys
 from multiprocessing import freeze_support
+from typing import List, Optional
 
-from gpustack.cmd import setup_start_cmd
-from gpustack.cmd.db_migration import setup_migrate_cmd
-from gpustack.cmd.download_tools import setup_download_tools_cmd
-from gpustack.cmd.images import setup_images_cmd
-from gpustack.cmd.reset_admin_password import setup_reset_admin_password_cmd
-from gpustack.cmd.version import setup_version_cmd
-from gpustack.cmd.reload_config import setup_reload_config_cmd
-from gpustack.cmd.prerun import setup_prerun_cmd
+# Sub-commands, with the module and function that set them up. Only the
+# module of the sub-command being run is imported: the server and worker
+# behind `start` take seconds to import, which `gpustack version` or a
+# `gpustack reload-config` in a script should not pay.
+_SUBCOMMANDS = [
+    (["start"], "gpustack.cmd.start", "setup_start_cmd"),
+    (["reload-config"], "gpustack.cmd.reload_config", "setup_reload_config_cmd"),
+    (["download-tools"], "gpustack.cmd.download_tools", "setup_download_tools_cmd"),
+    (["migrate"], "gpustack.cmd.db_migration", "setup_migrate_cmd"),
+    (
+        ["check-usage-tiers"],
+        "gpustack.cmd.check_usage_tiers",
+        "setup_check_usage_tiers_cmd",
+    ),
+    (
+        ["list-images", "save-images", "copy-images", "load-images"],
+        "gpustack.cmd.images",
+        "setup_images_cmd",
+    ),
+    (["prerun"], "gpustack.cmd.prerun", "setup_prerun_cmd"),
+    (
+        ["reset-admin-password"],
+        "gpustack.cmd.reset_admin_password",
+        "setup_reset_admin_password_cmd",
+    ),
+    (["version"], "gpustack.cmd.version", "setup_version_cmd"),
+]
+
+
+def setup_subcommands(
+    subparsers: argparse._SubParsersAction, argv: Optional[List[str]] = None
+):
+    """Set up the sub-command named in ``argv``, or all of them if it names
+    none (e.g. ``--help``) or an unknown one, so that argparse can list them.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    # The top-level parser has no options besides --help, so the first
+    # positional argument is the sub-command.
+    requested = next((arg for arg in argv if not arg.startswith("-")), None)
+    selected = [entry for entry in _SUBCOMMANDS if requested in entry[0]]
+    for _, module_name, setup_name in selected or _SUBCOMMANDS:
+        setup = getattr(importlib.import_module(module_name), setup_name)
+        setup(subparsers)
 
 
 def main():
@@ -25,14 +63,7 @@ def main():
         metavar='{start,reload-config,list-images,save-images,copy-images,load-images,reset-admin-password,version}',
     )
 
-    setup_start_cmd(subparsers)
-    setup_reload_config_cmd(subparsers)
-    setup_download_tools_cmd(subparsers)
-    setup_migrate_cmd(subparsers)
-    setup_images_cmd(subparsers)
-    setup_prerun_cmd(subparsers)
-    setup_reset_admin_password_cmd(subparsers)
-    setup_version_cmd(subparsers)
+    setup_subcommands(subparsers)
 
     args = parser.parse_args()
     if hasattr(args, "func"):
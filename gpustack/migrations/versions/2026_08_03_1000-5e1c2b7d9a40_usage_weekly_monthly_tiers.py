@@ -0,0 +1,193 @@
+"""usage weekly / monthly tiers
+
+Revision ID: 5e1c2b7d9a40
+Revises: 367a3982fcde
+Create Date: 2026-08-03 10:00:00.000000
+
+Creates ``model_usage_weekly`` and ``model_usage_monthly``: ``model_usages``
+summed per ISO week (Monday start) and per calendar month, one row per distinct
+non-counter column set, with ``date`` holding the last active day of the
+period. Usage breakdowns read fully covered periods from them instead of every
+daily row.
+
+Each row also carries ``key_hash``, a digest of its key columns, and
+``(period_start, key_hash)`` is unique so the flush can upsert. A unique index
+over the key columns themselves would not do: they are nullable, and NULLs
+never collide in a unique index.
+
+Both tables are backfilled here, in the same upgrade that creates them: the
+read path trusts a tier as soon as it exists, so a tier that is still being
+filled in by a background job would under-report every range it covers. The
+backfill is one ``SELECT ... GROUP BY`` per table, bucketed with the same
+expressions the breakdown uses for week / month buckets, whose rows are
+inserted in batches with their digests. Only PostgreSQL and MySQL are
+backfilled — the only databases the server runs on, and the only ones the
+read path uses the tiers for.
+
+Both tables are FK-less for the same reason ``model_usages`` is: a usage row is
+an attribution record that must outlive the entities it references.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+from gpustack.migrations.utils import table_exists
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1c2b7d9a40'
+down_revision: Union[str, None] = '367a3982fcde'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+# ``model_usages.operation`` is the ``operationenum`` type created by the
+# initial revision (and extended since); PostgreSQL must reuse it, not
+# re-create it.
+_OPERATION_VALUES = (
+    'COMPLETION',
+    'CHAT_COMPLETION',
+    'EMBEDDING',
+    'RERANK',
+    'IMAGE_GENERATION',
+    'AUDIO_SPEECH',
+    'AUDIO_TRANSCRIPTION',
+)
+_OPERATION_TYPE = sa.Enum(*_OPERATION_VALUES, name='operationenum').with_variant(
+    postgresql.ENUM(*_OPERATION_VALUES, name='operationenum', create_type=False),
+    'postgresql',
+)
+
+_KEY_COLUMNS = [
+    'user_id',
+    'user_name',
+    'model_id',
+    'model_name',
+    'model_route_id',
+    'model_route_name',
+    'provider_id',
+    'provider_name',
+    'provider_type',
+    'cluster_name',
+    'api_key_id',
+    'api_key_name',
+    'access_key',
+    'api_key_is_custom',
+    'owner_principal_id',
+    'consumer_principal_id',
+    'consumer_name',
+    'consumer_principal_kind',
+    'operation',
+]
+_COUNTER_COLUMNS = [
+    'prompt_token_count',
+    'completion_token_count',
+    'prompt_cached_token_count',
+    'request_count',
+]
+
+_BACKFILL_BATCH_ROWS = 500
+
+# table -> {dialect: period start expression over ``date``}
+_TIERS = {
+    'model_usage_weekly': {
+        'postgresql': "CAST(date_trunc('week', date) AS DATE)",
+        'mysql': "SUBDATE(date, WEEKDAY(date))",
+    },
+    'model_usage_monthly': {
+        'postgresql': "CAST(date_trunc('month', date) AS DATE)",
+        'mysql': "SUBDATE(date, DAYOFMONTH(date) - 1)",
+    },
+}
+
+
+def _tier_columns() -> List[sa.Column]:
+    auto_string = sqlmodel.sql.sqltypes.AutoString
+    return [
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('user_name', auto_string(), nullable=True),
+        sa.Column('model_id', sa.Integer(), nullable=True),
+        sa.Column('model_name', auto_string(), nullable=False),
+        sa.Column('model_route_id', sa.Integer(), nullable=True),
+        sa.Column('model_route_name', auto_string(), nullable=True),
+        sa.Column('provider_id', sa.Integer(), nullable=True),
+        sa.Column('provider_name', auto_string(), nullable=True),
+        sa.Column('provider_type', auto_string(), nullable=True),
+        sa.Column('cluster_name', auto_string(), nullable=True),
+        sa.Column('api_key_id', sa.Integer(), nullable=True),
+        sa.Column('api_key_name', auto_string(), nullable=True),
+        sa.Column('access_key', auto_string(), nullable=True),
+        sa.Column('api_key_is_custom', sa.Boolean(), nullable=True),
+        sa.Column('owner_principal_id', sa.Integer(), nullable=True),
+        sa.Column('consumer_principal_id', sa.Integer(), nullable=True),
+        sa.Column('consumer_name', auto_string(), nullable=True),
+        sa.Column('consumer_principal_kind', auto_string(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('prompt_token_count', sa.BigInteger(), nullable=False),
+        sa.Column('completion_token_count', sa.BigInteger(), nullable=False),
+        sa.Column('prompt_cached_token_count', sa.BigInteger(), nullable=False),
+        sa.Column('request_count', sa.BigInteger(), nullable=False),
+        sa.Column('operation', _OPERATION_TYPE, nullable=True),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('key_hash', sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    ]
+
+
+def _key_hash(row: Dict[str, Any]) -> str:
+    """``usage_tiers.tier_key_hash`` over a raw row: enums already come back as
+    names, and booleans are hashed as 0 / 1 either way."""
+    parts = [
+        int(row[name]) if isinstance(row[name], bool) else row[name]
+        for name in _KEY_COLUMNS
+    ]
+    return hashlib.sha256(json.dumps(parts, separators=(",", ":")).encode()).hexdigest()
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table_name, period_sql in _TIERS.items():
+        if table_exists(table_name):
+            continue
+        table = op.create_table(
+            table_name,
+            *_tier_columns(),
+            sa.UniqueConstraint(
+                'period_start', 'key_hash', name=f'uq_{table_name}_period_key'
+            ),
+        )
+        op.create_index(
+            f'ix_{table_name}_period_start', table_name, ['period_start'], unique=False
+        )
+        if dialect not in period_sql:
+            logger.info(f"Skipping {table_name} backfill on {dialect}.")
+            continue
+        keys = ', '.join(_KEY_COLUMNS)
+        sums = ', '.join(f'SUM({c}) AS {c}' for c in _COUNTER_COLUMNS)
+        result = op.get_bind().execute(
+            sa.text(
+                f"SELECT {period_sql[dialect]} AS period_start, {keys}, "
+                f"MAX(date) AS date, {sums} "
+                f"FROM model_usages GROUP BY {period_sql[dialect]}, {keys}"
+            )
+        )
+        while True:
+            rows = result.mappings().fetchmany(_BACKFILL_BATCH_ROWS)
+            if not rows:
+                break
+            op.bulk_insert(table, [{**row, 'key_hash': _key_hash(row)} for row in rows])
+
+
+def downgrade() -> None:
+    for table_name in _TIERS:
+        if not table_exists(table_name):
+            continue
+        op.drop_index(f'ix_{table_name}_period_start', table_name=table_name)
+        op.drop_table(table_name)
@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 from datetime import datetime, timedelta, timezone
 import importlib
 import json
@@ -12,6 +13,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Set,
     Union,
     Tuple,
 )
@@ -792,6 +794,7 @@ class ActiveRecordMixin:
         options: Optional[List] = None,
         event_types: Optional[Iterable[EventType]] = None,
         replay_existing: bool = True,
+        since: Optional[str] = None,
     ) -> AsyncGenerator[Event, None]:
         """Subscribe to bus events for this model.
 
@@ -799,6 +802,13 @@ class ActiveRecordMixin:
         whitelists pre-enqueue, so filtered events don't take queue slots.
         ``replay_existing=False`` skips the initial CREATED snapshot for
         consumers that bootstrap themselves.
+
+        ``since`` opts into resource versions. The stream opens with a
+        BOOKMARK whose data says whether it ``resumed``: if the bus still
+        holds every event after ``since``, only those are replayed in place
+        of the snapshot. Either way a second BOOKMARK carrying the current
+        version follows the replay, and every later event carries its own.
+        An empty ``since`` asks for the snapshot.
         """
         topic = cls.__name__.lower()
         subscriber = event_bus.subscribe(topic, source=source, event_types=event_types)
@@ -809,17 +819,45 @@ class ActiveRecordMixin:
             id(subscriber),
         )
 
-        if replay_existing:
-            include_created = event_types is None or EventType.CREATED in event_types
-            if include_created:
-                initial_items = await cls.cached_all(options=options)
-                for item in initial_items:
-                    yield Event(type=EventType.CREATED, data=item)
-
-        heartbeat_interval = timedelta(seconds=15)
-        last_event_time = datetime.now(timezone.utc)
+        # No await since subscribing, so events up to ``position`` are the
+        # log's (or the snapshot's) and everything after it reaches the
+        # subscriber.
+        position = event_bus.position(topic)
+        missed = None
+        if since is not None:
+            missed = event_bus.events_since(topic, since)
 
+        # Everything from here on yields, so the subscriber is released in
+        # ``finally`` even when the consumer goes away mid-replay.
         try:
+            if since is not None:
+                yield Event(
+                    type=EventType.BOOKMARK,
+                    data={"resumed": missed is not None},
+                    resource_version=since if missed is not None else None,
+                )
+
+            if missed is not None:
+                for event in missed:
+                    if subscriber.should_enqueue(event):
+                        yield event
+            elif replay_existing:
+                include_created = (
+                    event_types is None or EventType.CREATED in event_types
+                )
+                if include_created:
+                    initial_items = await cls.cached_all(options=options)
+                    for item in initial_items:
+                        yield Event(type=EventType.CREATED, data=item)
+
+            if since is not None:
+                yield Event(
+                    type=EventType.BOOKMARK, data=None, resource_version=position
+                )
+
+            heartbeat_interval = timedelta(seconds=15)
+            last_event_time = datetime.now(timezone.utc)
+
             while True:
                 try:
                     event = await asyncio.wait_for(
@@ -844,6 +882,8 @@ class ActiveRecordMixin:
         filter_func: Optional[Callable[[Any], bool]] = None,
         options: Optional[List] = None,
         event_transform: Optional[Callable[[Event], Awaitable[None]]] = None,
+        scope_func: Optional[Callable[[Any], bool]] = None,
+        since: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
         """Stream events matching the given criteria as JSON strings.
 
@@ -858,37 +898,46 @@ class ActiveRecordMixin:
                 subscribe payload — used e.g. by /v2/workers to inject
                 allocated computed from current ModelInstance bindings so
                 the watch stream matches the REST response.
+            scope_func: Optional membership predicate for a scoped stream.
+                Unlike ``filter_func`` it is stateful per stream: a row that
+                stops matching after it was sent is emitted once more as
+                DELETED, so the client drops it from its cache instead of
+                keeping the last in-scope copy forever.
+            since: Resource version to resume from, see :meth:`subscribe`.
+                When given, frames carry ``resource_version`` and the
+                stream's BOOKMARKs are sent through.
         """
+        # IDs this stream has sent under scope_func and not yet retracted.
+        in_scope: Set[Any] = set()
+        # Set while replaying a resumed stream's missed events: the client
+        # holds rows from its previous stream that this one never sent.
+        replaying = False
         try:
-            async for event in cls.subscribe(source="streaming", options=options):
+            async for event in cls.subscribe(
+                source="streaming", options=options, since=since
+            ):
                 if event.type == EventType.HEARTBEAT:
                     yield "\n\n"
                     continue
 
-                if not cls._match_fields(event, fields):
+                if event.type == EventType.BOOKMARK:
+                    replaying = await cls._track_bookmark(
+                        event, scope_func, in_scope, replaying, options
+                    )
+                    yield cls._format_event(event)
                     continue
 
-                if not cls._match_fuzzy_fields(event, fuzzy_fields):
+                if not cls._match_event(event, fields, fuzzy_fields, filter_func):
                     continue
 
-                if filter_func and not filter_func(event.data):
-                    continue
+                if scope_func is not None:
+                    event = cls._scope_event(event, scope_func, in_scope, replaying)
+                    if event is None:
+                        continue
 
-                public_event = Event(
-                    type=event.type,
-                    data=cls._convert_to_public_class(event.data),
-                    changed_fields=event.changed_fields,
-                    id=event.id,
+                formatted = await cls._format_public_event(
+                    event, event_transform, with_resource_version=since is not None
                 )
-                if event_transform is not None:
-                    try:
-                        await event_transform(public_event)
-                    except Exception as e:
-                        logger.error(
-                            f"event_transform failed for {cls.__name__} "
-                            f"event {event.id}: {e}"
-                        )
-                formatted = cls._format_event(public_event)
                 if formatted is not None:
                     yield formatted
         except asyncio.CancelledError:
@@ -897,6 +946,115 @@ class ActiveRecordMixin:
         except Exception as e:
             logger.error(f"Error in streaming {cls.__name__}: {e}")
 
+    @classmethod
+    async def _track_bookmark(
+        cls,
+        event: Event,
+        scope_func: Optional[Callable[[Any], bool]],
+        in_scope: Set[Any],
+        replaying: bool,
+        options: Optional[List],
+    ) -> bool:
+        """Follow a BOOKMARK through a scoped stream; returns ``replaying``.
+
+        A bookmark that resumes a stream starts the replay of its missed
+        events, and the plain one after it ends the replay.
+        """
+        resumed = isinstance(event.data, dict) and event.data["resumed"]
+        if resumed and scope_func is not None:
+            # Whatever is in scope now the client holds too, or is about to
+            # get from the replay.
+            in_scope.update(
+                item.id
+                for item in await cls.cached_all(options=options)
+                if scope_func(item)
+            )
+            return True
+        if event.data is None:
+            return False
+        return replaying
+
+    @classmethod
+    def _match_event(
+        cls,
+        event: Event,
+        fields: Optional[dict],
+        fuzzy_fields: Optional[dict],
+        filter_func: Optional[Callable[[Any], bool]],
+    ) -> bool:
+        """Whether an event passes a stream's field and filter criteria."""
+        if not cls._match_fields(event, fields):
+            return False
+        if not cls._match_fuzzy_fields(event, fuzzy_fields):
+            return False
+        return not filter_func or filter_func(event.data)
+
+    @classmethod
+    async def _format_public_event(
+        cls,
+        event: Event,
+        event_transform: Optional[Callable[[Event], Awaitable[None]]],
+        with_resource_version: bool,
+    ) -> Optional[str]:
+        """Serialize an event as its public class, through ``event_transform``."""
+        public_event = Event(
+            type=event.type,
+            data=cls._convert_to_public_class(event.data),
+            changed_fields=event.changed_fields,
+            id=event.id,
+            resource_version=(
+                event.resource_version if with_resource_version else None
+            ),
+        )
+        if event_transform is not None:
+            try:
+                await event_transform(public_event)
+            except Exception as e:
+                logger.error(
+                    f"event_transform failed for {cls.__name__} "
+                    f"event {event.id}: {e}"
+                )
+        return cls._format_event(public_event)
+
+    @staticmethod
+    def _scope_event(
+        event: Event,
+        scope_func: Callable[[Any], bool],
+        in_scope: Set[Any],
+        replaying: bool = False,
+    ) -> Optional[Event]:
+        """Resolve the event a scoped stream sends, or None to drop it.
+
+        ``in_scope`` is updated in place. While ``replaying``, the client may
+        hold rows this stream never sent, so an out-of-scope change to any
+        row is sent as an ID-only DELETED.
+        """
+        data = event.data
+        item_id = event.id
+        if item_id is None:
+            item_id = (
+                data.get("id") if isinstance(data, dict) else getattr(data, "id", None)
+            )
+        id_only = isinstance(data, dict)
+        matches = not id_only and scope_func(data)
+
+        if matches and event.type != EventType.DELETED:
+            in_scope.add(item_id)
+            return event
+
+        was_sent = item_id in in_scope
+        in_scope.discard(item_id)
+        if matches or (was_sent and event.type == EventType.DELETED):
+            return event
+        if was_sent:
+            # Moved out of scope, e.g. rescheduled to another worker.
+            return dataclasses.replace(event, type=EventType.DELETED)
+        if replaying:
+            return dataclasses.replace(
+                event, type=EventType.DELETED, data={"id": item_id}, id=item_id
+            )
+        return None
+
     @classmethod
     def _match_fields(cls, event: Any, fields: Optional[dict]) -> bool:
         """Match fields using AND condition.
@@ -955,4 +1113,9 @@ class ActiveRecordMixin:
             and set(event.data.keys()) == {"id"}
         ):
             return None
-        return json.dumps(jsonable_encoder(event), separators=(",", ":")) + "\n\n"
+        payload = jsonable_encoder(event)
+        # Only streams opened with ``since`` carry versions; leave the key out
+        # otherwise so older clients' Event(**frame) keeps working.
+        if payload.get("resource_version") is None:
+            payload.pop("resource_version", None)
+        return json.dumps(payload, separators=(",", ":")) + "\n\n"
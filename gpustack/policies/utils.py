@@ -4,7 +4,7 @@ import os
 from typing import Any, Callable, Dict, List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
-from gpustack.client.worker_filesystem_client import WorkerFilesystemClient
+from gpustack.client.worker_filesystem_client import pooled_worker_filesystem_client
 from gpustack.policies.base import (
     Allocatable,
     Allocated,
@@ -22,6 +22,7 @@ from gpustack.schemas.workers import Worker, GPUDevicesStatus, GPUDeviceStatus
 from pydantic import BaseModel
 
 from gpustack.server.services import ModelFileService
+from gpustack.utils.hedge import hedged_first
 from gpustack.utils.hub import get_model_weight_size, get_diffusion_model_weight_size
 from gpustack.utils.lora_model_source import (
     lora_entry_to_model_source,
@@ -680,29 +681,28 @@ async def get_local_model_weight_size(
     async def try_get_size_from_worker(worker: Worker) -> Optional[int]:
         """Try to get model weight size from a single worker."""
         try:
-            async with WorkerFilesystemClient() as fs_client:
-                size = await fs_client.get_model_weight_size(worker, local_path)
-                if isinstance(size, int):
-                    logger.info(
-                        f"Successfully got model weight size from worker {worker.id}: {size} bytes"
-                    )
-                    return size
-                return None
+            size = await pooled_worker_filesystem_client().get_model_weight_size(
+                worker, local_path
+            )
+            if isinstance(size, int):
+                logger.info(
+                    f"Successfully got model weight size from worker {worker.id}: {size} bytes"
+                )
+                return size
+            return None
         except Exception as e:
             logger.debug(
                 f"Failed to get model weight size from worker {worker.id}: {e}"
             )
             return None
 
-    # Concurrently try all workers and return the first successful result
-    logger.info(f"Broadcasting model weight size request to {len(workers)} workers")
-    tasks = [try_get_size_from_worker(worker) for worker in workers]
-
-    # Use as_completed to get results as they finish
-    for completed_task in asyncio.as_completed(tasks):
-        result = await completed_task
-        if result is not None:
-            return result
+    # Ask a few workers, more only if they are slow or fail
+    logger.info(f"Sending model weight size request to up to {len(workers)} workers")
+    result = await hedged_first(
+        workers, try_get_size_from_worker, kind="get_model_weight_size"
+    )
+    if result is not None:
+        return result.value
 
 
 def group_worker_gpu_by_memory(
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from typing import List, Tuple
 
-from gpustack.client.worker_filesystem_client import WorkerFilesystemClient
+from gpustack.client.worker_filesystem_client import pooled_worker_filesystem_client
 from gpustack.policies.base import WorkerFilter
 from gpustack.schemas.models import Model, SourceEnum
 from gpustack.schemas.workers import Worker
@@ -36,26 +37,25 @@ class LocalPathFilter(WorkerFilter):
         ):
             return workers, []
 
-        candidates = []
-        invalid_workers = []
+        filesystem_client = pooled_worker_filesystem_client()
 
-        # Validate local path existence on each worker
-        async with WorkerFilesystemClient() as filesystem_client:
-            for worker in workers:
-                try:
-                    exists_response = await filesystem_client.path_exists(
-                        worker, self._model.local_path
-                    )
-                    if exists_response.exists:
-                        candidates.append(worker)
-                    else:
-                        invalid_workers.append(worker.name)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to check path {self._model.local_path} "
-                        f"on worker {worker.name}: {e}"
-                    )
-                    invalid_workers.append(worker.name)
+        async def path_exists(worker: Worker) -> bool:
+            try:
+                exists_response = await filesystem_client.path_exists(
+                    worker, self._model.local_path
+                )
+                return exists_response.exists
+            except Exception as e:
+                logger.warning(
+                    f"Failed to check path {self._model.local_path} "
+                    f"on worker {worker.name}: {e}"
+                )
+                return False
+
+        # Validate local path existence on all workers at once
+        exists = await asyncio.gather(*(path_exists(worker) for worker in workers))
+        candidates = [w for w, ok in zip(workers, exists) if ok]
+        invalid_workers = [w.name for w, ok in zip(workers, exists) if not ok]
 
         messages = []
         if invalid_workers:
@@ -142,6 +142,7 @@ async def get_api_keys(
                 fuzzy_fields=fuzzy_fields,
                 filter_func=lambda api_key: not _is_hidden_api_key(api_key),
                 options=[selectinload(ApiKey.user)],
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -219,6 +219,7 @@ async def _get_benchmarks(
                 and _fuzzy_contains(profile, data.profile)
                 and _fuzzy_contains(model_name, data.model_name)
                 and _load_type_match(data),
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -50,7 +50,11 @@ async def list(
 
     if params.watch:
         return StreamingResponse(
-            CloudCredential.streaming(fields=fields, fuzzy_fields=fuzzy_fields),
+            CloudCredential.streaming(
+                fields=fields,
+                fuzzy_fields=fuzzy_fields,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
@@ -224,6 +224,7 @@ async def get_clusters(
                 fuzzy_fields=fuzzy_fields,
                 options=CLUSTER_LOAD_OPTIONS,
                 filter_func=lambda c: visibility_check(c) and _matches_gpu_filter(c),
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -25,7 +25,7 @@ from gpustack.schemas.models import Model, ModelInstance
 from gpustack.schemas.principals import OrgRole
 from gpustack.schemas.system_load import SystemLoad
 from gpustack.schemas.users import User
-from gpustack.server.deps import SessionDep, TenantContextDep
+from gpustack.server.deps import AnalyticsSessionDep, TenantContextDep
 from gpustack.schemas import Worker, Cluster
 from gpustack.schemas.model_provider import ModelProvider
 from gpustack.server.system_load import compute_system_load
@@ -58,7 +58,7 @@ def _resolve_dashboard_scope(ctx) -> Optional[int]:
 
 @router.get("")
 async def dashboard(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     ctx: TenantContextDep,
     cluster_id: Optional[int] = None,
 ):
@@ -663,7 +663,7 @@ def get_models_by_provider_id(
 
 @router.get("/usage")
 async def usage(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     ctx: TenantContextDep,
     start_date: Optional[date] = Query(
         None,
@@ -703,7 +703,7 @@ async def usage(
 
 @router.get("/usage/stats")
 async def usage_stats(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     ctx: TenantContextDep,
     start_date: Optional[date] = Query(
         None,
@@ -96,6 +96,7 @@ async def get_gpus(
                 fields=fields,
                 filter_func=_gpu_visible,
                 event_transform=_inject_allocated_into_event,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
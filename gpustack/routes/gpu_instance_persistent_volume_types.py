@@ -89,6 +89,7 @@ async def get_gpu_instance_persistent_volume_types(
                 fields={},
                 fuzzy_fields=fuzzy_fields,
                 filter_func=filter_func,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -67,6 +67,7 @@ async def get_gpu_instance_persistent_volumes(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 event_transform=_inject_attachments_into_event,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
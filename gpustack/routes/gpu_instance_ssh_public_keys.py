@@ -55,6 +55,7 @@ async def get_gpu_instance_ssh_public_keys(
             GPUInstanceSSHPublicKey.streaming(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
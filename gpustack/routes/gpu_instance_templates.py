@@ -74,6 +74,7 @@ async def get_gpu_instance_templates(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 filter_func=filter_func,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
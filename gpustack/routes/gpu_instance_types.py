@@ -230,6 +230,7 @@ async def get_gpu_instance_types(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 filter_func=_make_instance_type_visibility_filter(allowed_ids),
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -105,6 +105,7 @@ async def get_gpu_instances(
             GPUInstance.streaming(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -793,7 +793,11 @@ async def get_inference_backends(  # noqa: C901
             )
 
         return StreamingResponse(
-            InferenceBackend.streaming(fields=fields, filter_func=_visible),
+            InferenceBackend.streaming(
+                fields=fields,
+                filter_func=_visible,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
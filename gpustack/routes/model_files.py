@@ -104,8 +104,15 @@ async def get_model_files(
             if search
             else visible
         )
+        # Scope by worker rather than match it as a field, so an ID-only
+        # DELETED still reaches the worker that was sent the file.
+        scope_func = (lambda data: data.worker_id == worker_id) if worker_id else None
         return StreamingResponse(
-            ModelFile.streaming(fields=fields, filter_func=filter_func),
+            ModelFile.streaming(
+                filter_func=filter_func,
+                scope_func=scope_func,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
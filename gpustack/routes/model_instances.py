@@ -102,6 +102,7 @@ async def get_model_instances(
     cluster_id: Optional[int] = None,
     state: Optional[str] = None,
     search: Optional[str] = None,
+    assigned_worker_id: Optional[int] = None,
 ):
     fields = {}
     search = search.strip() if search else None
@@ -137,11 +138,23 @@ async def get_model_instances(
             if cluster_scoped_system(ctx)
             else None
         )
+        # A worker only serves the instances it runs, as main or as a
+        # distributed subordinate. Scoping here keeps every other worker's
+        # updates from being serialized and pushed to it just to be dropped.
+        # List calls ignore it; their callers filter with
+        # get_deployment_metadata themselves.
+        scope_func = (
+            (lambda data: data.get_deployment_metadata(assigned_worker_id) is not None)
+            if assigned_worker_id
+            else None
+        )
         return StreamingResponse(
             ModelInstance.streaming(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 filter_func=filter_func,
+                scope_func=scope_func,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -65,7 +65,11 @@ async def get_model_providers(
 
     if params.watch:
         return StreamingResponse(
-            ModelProvider.streaming(fields=fields, fuzzy_fields=fuzzy_fields),
+            ModelProvider.streaming(
+                fields=fields,
+                fuzzy_fields=fuzzy_fields,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
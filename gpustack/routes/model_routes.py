@@ -361,6 +361,7 @@ async def _get_model_routes(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 filter_func=_stream_filter,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -1130,7 +1131,11 @@ async def get_model_route_targets(
 
     if params.watch:
         return StreamingResponse(
-            ModelRouteTarget.streaming(fields=fields, fuzzy_fields=fuzzy_fields),
+            ModelRouteTarget.streaming(
+                fields=fields,
+                fuzzy_fields=fuzzy_fields,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
@@ -153,6 +153,7 @@ async def get_models(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 filter_func=_make_model_watch_filter(ctx, categories, state),
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -290,7 +291,7 @@ async def get_model_instances(ctx: TenantContextDep, id: int, params: ListParams
             assert_resource_visible(ctx, model, not_found_message="Model not found")
         fields = {"model_id": id}
         return StreamingResponse(
-            ModelInstance.streaming(fields=fields),
+            ModelInstance.streaming(fields=fields, since=params.since),
             media_type="text/event-stream",
         )
 
@@ -2,7 +2,8 @@ import json
 import re
 import random
 import asyncio
-from typing import AsyncGenerator, List, Optional, Tuple, Union, Dict
+import weakref
+from typing import AsyncGenerator, Callable, List, Optional, Tuple, Union, Dict
 import aiohttp
 import logging
 
@@ -21,12 +22,14 @@ from gpustack.api.exceptions import (
     OpenAIAPIErrorResponse,
     ServiceUnavailableException,
     GatewayTimeoutException,
+    TooManyRequestsException,
 )
 from gpustack.api.responses import StreamingResponseWithStatusCode
 from gpustack import envs
-from gpustack.http_proxy.load_balancer import LoadBalancer
+from gpustack.http_proxy.load_balancer import AdmissionRejected, LoadBalancer
+from gpustack.http_proxy.strategies import strategy_for
 from gpustack.routes.model_common import build_category_conditions
-from gpustack.schemas.models import Model
+from gpustack.schemas.models import Model, ModelInstance
 from gpustack.schemas.model_routes import (
     ModelRoute,
     MyModel,
@@ -58,7 +61,13 @@ from gpustack.gateway.utils import (
 
 logger = logging.getLogger(__name__)
 
-load_balancer = LoadBalancer()
+load_balancer = LoadBalancer(
+    strategy_for(envs.PROXY_LOAD_BALANCING, envs.PROXY_AFFINITY_LOAD_FACTOR),
+    model_max_concurrency=envs.PROXY_MODEL_MAX_CONCURRENCY,
+    instance_max_concurrency=envs.PROXY_INSTANCE_MAX_CONCURRENCY,
+    queue_size=envs.PROXY_QUEUE_SIZE,
+    queue_timeout=envs.PROXY_QUEUE_TIMEOUT,
+)
 
 
 # Endpoints served by a dedicated server router (e.g. rerank.router), so the
@@ -192,7 +201,8 @@ async def proxy_request_by_model(
 
     Uses an inline session instead of SessionDep so the session is released
     after the initial lookups, preventing long-lived streaming inference
-    responses from holding a database connection.
+    responses, and requests queued for a saturated model, from holding a
+    database connection.
     """
     endpoint = re.sub(r"^/(v1|v1-openai)/", "", request.url.path)
     model_name, stream, body_json, form_data = await parse_request_body(request)
@@ -251,15 +261,25 @@ async def proxy_request_by_model(
 
         mutate_request(request, model_name, body_json, form_data)
 
-        instance = await get_running_instance(
+        running_instances = await get_running_instances(
             session, model.id, target.overridden_model_name
         )
-        worker: Worker = await WorkerService(session).get_by_id(instance.worker_id)
-        if not worker:
-            raise InternalServerErrorException(
-                message=f"Worker with ID {instance.worker_id} not found",
-                is_openai_exception=True,
-            )
+
+    instance = await acquire_instance(
+        request, user, running_instances, affinity_key(request, user, body_json)
+    )
+    try:
+        async with async_session() as session:
+            worker: Worker = await WorkerService(session).get_by_id(instance.worker_id)
+    except BaseException:
+        load_balancer.release(instance)
+        raise
+    if not worker:
+        load_balancer.release(instance)
+        raise InternalServerErrorException(
+            message=f"Worker with ID {instance.worker_id} not found",
+            is_openai_exception=True,
+        )
     extra_headers = {
         router_header_key: f"{model_instance_prefix(instance)}.static",
     }
@@ -277,18 +297,21 @@ async def proxy_request_by_model(
             add_stream_options=stream,
         )
         if stream:
-            return StreamingResponseWithStatusCode(
-                _stream_response(
-                    worker,
-                    request.method,
-                    path,
-                    headers,
-                    data,
-                    request.app.state.http_client,
-                    request.app.state.http_client_no_proxy,
-                ),
-                media_type="text/event-stream",
+            body = _stream_response(
+                worker,
+                request.method,
+                path,
+                headers,
+                data,
+                request.app.state.http_client,
+                request.app.state.http_client_no_proxy,
+                on_close=lambda: release_instance(),
             )
+            # The stream releases the instance once it ends, or once it is
+            # garbage collected if the client left before it started.
+            release_instance = weakref.finalize(body, load_balancer.release, instance)
+            instance = None
+            return StreamingResponseWithStatusCode(body, media_type="text/event-stream")
         else:
             resp, body = await request_to_worker(
                 worker=worker,
@@ -321,6 +344,68 @@ async def proxy_request_by_model(
             message=error_message,
             is_openai_exception=True,
         )
+    finally:
+        if instance is not None:
+            load_balancer.release(instance)
+
+
+def affinity_key(request: Request, user, body_json: Optional[dict]) -> Optional[str]:
+    """The first of ``GPUSTACK_PROXY_AFFINITY_KEYS`` the request has, when the
+    proxy balances by affinity."""
+    if envs.PROXY_LOAD_BALANCING != "affinity":
+        return None
+    for source in envs.PROXY_AFFINITY_KEYS:
+        if source.startswith("header:"):
+            value = request.headers.get(source[len("header:") :])
+            if value:
+                return f"{source}={value}"
+        elif source == "user":
+            return f"user={user.id}"
+        elif source == "prefix" and body_json:
+            prefix = prompt_prefix(body_json, envs.PROXY_AFFINITY_PREFIX_CHARS)
+            if prefix:
+                return f"prefix={prefix}"
+    return None
+
+
+def prompt_prefix(body_json: dict, chars: int) -> str:
+    """The first ``chars`` characters of the request's prompt: its messages
+    (role and content) for chat, else its prompt or input."""
+    parts = []
+    size = 0
+
+    def add(text: str) -> bool:
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        return size >= chars
+
+    messages = body_json.get("messages")
+    if isinstance(messages, list):
+        for message in messages:
+            if not isinstance(message, dict):
+                continue
+            if add(f"{message.get('role')}:"):
+                break
+            content = message.get("content")
+            contents = content if isinstance(content, list) else [content]
+            if any(add(_content_text(c)) for c in contents):
+                break
+    else:
+        prompt = body_json.get("prompt", body_json.get("input"))
+        add(_content_text(prompt))
+    return "".join(parts)[:chars]
+
+
+def _content_text(content) -> str:
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, dict) and isinstance(content.get("text"), str):
+        return content["text"]
+    # Images, token ids and the like: hashed as they are sent.
+    return json.dumps(content, sort_keys=True)
 
 
 async def parse_request_body(request: Request):
@@ -428,9 +513,11 @@ async def _stream_response(
     data: Optional[Union[bytes, aiohttp.FormData]],
     proxy_client: aiohttp.ClientSession,
     no_proxy_client: aiohttp.ClientSession,
+    on_close: Optional[Callable[[], None]] = None,
 ) -> AsyncGenerator[Tuple[Union[bytes, str], Dict[str, str], int], None]:
     """
     Stream response from worker. Yields (chunk, headers, status) tuples.
+    ``on_close`` is called once the stream ends, however it does.
     """
     yielded_any = False
     try:
@@ -470,6 +557,9 @@ async def _stream_response(
         yield _error_chunk(
             error_response, yielded_any
         ), {}, status.HTTP_500_INTERNAL_SERVER_ERROR
+    finally:
+        if on_close is not None:
+            on_close()
 
 
 def _error_chunk(error_response: OpenAIAPIErrorResponse, mid_stream: bool) -> str:
@@ -495,15 +585,15 @@ def filter_headers(headers):
     }
 
 
-async def get_running_instance(
+async def get_running_instances(
     session: AsyncSession,
     model_id: int,
     overridden_model_name: Optional[str] = None,
-):
-    """Pick a RUNNING instance, narrowing by ``mounted_loras`` when a
-    LoRA ``overridden_model_name`` is given. The filter is needed
+) -> List[ModelInstance]:
+    """The RUNNING instances of a model, narrowed by ``mounted_loras`` when
+    a LoRA ``overridden_model_name`` is given. The filter is needed
     because ``mounted_loras`` is a one-shot snapshot taken at STARTING
-    and never hot-reloaded
+    and never hot-reloaded.
     """
     running_instances = await ModelInstanceService(session).get_running_instances(
         model_id
@@ -528,7 +618,39 @@ async def get_running_instance(
                 ),
                 is_openai_exception=True,
             )
-    return await load_balancer.get_instance(running_instances)
+    return running_instances
+
+
+async def acquire_instance(
+    request: Request,
+    user,
+    running_instances: List[ModelInstance],
+    key: Optional[str] = None,
+) -> ModelInstance:
+    """Pick one of ``running_instances`` for the request, waiting for a slot
+    if the model is at its concurrency limit. The instance counts the
+    request as in flight until ``load_balancer.release``.
+    """
+    api_key = getattr(request.state, "api_key", None)
+    if api_key is not None:
+        tenant = f"principal:{api_key.owner_principal_id or user.id}"
+        client = f"api_key:{api_key.id}"
+    else:
+        tenant = f"principal:{user.id}"
+        client = f"user:{user.id}"
+    try:
+        return await load_balancer.get_instance(
+            running_instances, key, tenant=tenant, client=client
+        )
+    except AdmissionRejected as e:
+        raise TooManyRequestsException(
+            message=(
+                "The model is at capacity. Please retry your request after "
+                f"{e.retry_after} seconds."
+            ),
+            is_openai_exception=True,
+            headers={"Retry-After": str(e.retry_after)},
+        )
 
 
 def mutate_request(
@@ -58,7 +58,11 @@ async def get_organizations(
 
     if params.watch:
         return StreamingResponse(
-            Principal.streaming(fields=fields, fuzzy_fields=fuzzy_fields),
+            Principal.streaming(
+                fields=fields,
+                fuzzy_fields=fuzzy_fields,
+                since=params.since,
+            ),
             media_type="text/event-stream",
         )
 
@@ -27,6 +27,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -78,8 +79,8 @@ from gpustack.schemas.usage import (
     USAGE_SCOPE_SELF,
 )
 from gpustack.schemas.resource_events import ResourceEvent
-from gpustack.server.db import async_session
-from gpustack.server.deps import CurrentUserDep, SessionDep, TenantContextDep
+from gpustack.server.db import analytics_session
+from gpustack.server.deps import AnalyticsSessionDep, CurrentUserDep, TenantContextDep
 from gpustack.utils.export_delivery import (
     ExportSheetPlan,
     export_response,
@@ -476,8 +477,9 @@ class ExportEnrichmentCache:
     Cached, the cost scales with distinct entities instead of with rows — the
     same shape the token export's ``_IdentityCache`` has.
 
-    Scoped to one export, so "does this volume still exist" is answered once
-    per run — consistent with the single query snapshot the rows come from.
+    Scoped to one export (or one JSON breakdown, which goes through the same
+    batches), so "does this volume still exist" is answered once per run —
+    consistent with the single query snapshot the rows come from.
     """
 
     def __init__(self):
@@ -1491,6 +1493,110 @@ def _rows_to_items(
     return items
 
 
+@contextlib.asynccontextmanager
+async def _streamed_partitions(session, statement):
+    """``statement``'s rows off a server-side cursor, a batch at a time.
+
+    The cursor is closed on the way out, whether the batches ran out or the
+    consumer stopped early: left open, it holds a connection for as long as
+    the pool takes to notice.
+    """
+    result = await session.stream(statement)
+    try:
+        yield result.partitions(envs.USAGE_EXPORT_STREAM_CHUNK_ROWS)
+    finally:
+        await result.close()
+
+
+async def _buffered_partitions(session, statement) -> AsyncIterator[Sequence[Any]]:
+    """``statement``'s rows as one batch, with nothing left open afterwards."""
+    rows = (await session.exec(statement)).all()
+    if rows:
+        yield rows
+
+
+@contextlib.asynccontextmanager
+async def _enrichment_session(dims: List[str]):
+    """A connection for name lookups next to an open cursor, if any are needed.
+
+    The cursor's own connection cannot be asked anything else while it is
+    open, so enrichment borrows one — once for the whole stream, not once per
+    batch. A date-only breakdown references no entity and borrows nothing.
+    """
+    if not dims:
+        yield None
+        return
+    async with analytics_session() as enrich_session:
+        yield enrich_session
+
+
+async def _breakdown_item_batches(
+    partitions: AsyncIterator[Sequence[Any]],
+    *,
+    query: ResourceBreakdownQuery,
+    request: ResourceBreakdownRequest,
+    enrich_session,
+    cache: ExportEnrichmentCache,
+    timer: ExportStageTimer,
+) -> AsyncIterator[List[dict]]:
+    """Breakdown items, built and enriched one batch of rows at a time.
+
+    The one pipeline behind the JSON breakdown and the export, so a row means
+    the same thing on the page and in the file. Memory is one batch of rows
+    plus whatever the cache has resolved, which scales with distinct entities
+    rather than with rows.
+    """
+    # Resolve the rollup tz once (not per row): the DST-correct tz for
+    # instants, plus the fixed-offset tz that labels the SQL-shifted buckets.
+    aware_tz = resolve_rollup_tz()
+    fixed_tz = rollup_fixed_tz()
+    # Resolve display fields for the secondary dimension regardless of whether
+    # a date axis is present — a grouped trend (["date", <dim>]) needs them too,
+    # else e.g. instance_type series carry the raw flavor slug instead of the
+    # pretty product name in the chart legend (#5700). ``granularity`` only
+    # changes the time bucket, never the group_by tokens, so this is granularity
+    # agnostic (hour/day/week/month all share the ["date", <dim>] shape).
+    dims = [g for g in request.group_by if g != "date"]
+    # Same window the rows were aggregated over. Without it ``_attach_shapes``
+    # would describe each instance's WHOLE history while its metrics cover the
+    # selected range — segment hours that do not add up to the row.
+    window = _rollup_day_window(request.start_date, request.end_date)
+    batches = 0
+    while True:
+        # Driven by hand rather than ``async for`` so the wait on the cursor
+        # can be charged separately — and the FIRST wait charged separately
+        # again. A GROUP BY ... ORDER BY cannot hand back one row before it has
+        # produced and sorted them all, so the whole cost of the aggregate
+        # lands on that first fetch; every later one is just transferring an
+        # already-computed result. Two numbers that behave completely
+        # differently, and summing them hides the only one worth optimizing.
+        with timer.stage("aggregate" if batches == 0 else "fetch"):
+            partition = await anext(partitions, None)
+        if partition is None:
+            return
+        batches += 1
+        with timer.stage("build"):
+            items = _rows_to_items(
+                partition,
+                request=request,
+                metric_keys=query.metric_keys,
+                carries_creator=query.carries_creator,
+                aware_tz=aware_tz,
+                fixed_tz=fixed_tz,
+            )
+        if dims and enrich_session is not None:
+            with timer.stage("enrich"):
+                await _enrich_items(
+                    enrich_session,
+                    dims[0],
+                    items,
+                    window=window,
+                    cache=cache,
+                    bucketed="date" in request.group_by,
+                )
+        yield items
+
+
 async def _run_breakdown(
     session,
     *,
@@ -1512,9 +1618,6 @@ async def _run_breakdown(
         join_instances=join_instances,
         join_volumes=join_volumes,
     )
-    metric_keys = query.metric_keys
-    carries_creator = query.carries_creator
-    grouped = query.items_statement
     summary_row = (await session.exec(query.summary_statement)).first()
     total = (await session.exec(query.count_statement)).first() or 0
 
@@ -1534,47 +1637,64 @@ async def _run_breakdown(
     # ActiveRecordMixin.page_query): the trend chart needs every bucket, so an
     # order-by-metric page would drop low-usage (often most recent) buckets and
     # leave gaps. Replaces the old ``perPage=10000`` workaround on the client.
-    items_stmt = grouped
+    items_stmt = query.items_statement
+    expected = total
     if request.page > 0:
-        items_stmt = items_stmt.offset((request.page - 1) * request.perPage).limit(
-            request.perPage
-        )
-    rows = (await session.exec(items_stmt)).all()
+        offset = (request.page - 1) * request.perPage
+        items_stmt = items_stmt.offset(offset).limit(request.perPage)
+        expected = max(0, min(request.perPage, total - offset))
 
-    def metrics_of(row) -> Dict[str, Any]:
-        return _metrics_of(row, metric_keys)
-
-    # Resolve the rollup tz once per request (not per row): the DST-correct tz
-    # for instants, plus the fixed-offset tz that labels the SQL-shifted buckets.
-    aware_tz = resolve_rollup_tz()
-    fixed_tz = rollup_fixed_tz()
-    items = _rows_to_items(
-        rows,
-        request=request,
-        metric_keys=metric_keys,
-        carries_creator=carries_creator,
-        aware_tz=aware_tz,
-        fixed_tz=fixed_tz,
-    )
-
-    # Resolve display fields for the secondary dimension regardless of whether
-    # a date axis is present — a grouped trend (["date", <dim>]) needs them too,
-    # else e.g. instance_type series carry the raw flavor slug instead of the
-    # pretty product name in the chart legend (#5700). ``granularity`` only
-    # changes the time bucket, never the group_by tokens, so this is granularity
-    # agnostic (hour/day/week/month all share the ["date", <dim>] shape).
     dims = [g for g in request.group_by if g != "date"]
-    if dims:
-        await _enrich_items(
-            session,
-            dims[0],
-            items,
-            _rollup_day_window(request.start_date, request.end_date),
-            bucketed="date" in request.group_by,
+    cache = ExportEnrichmentCache()
+    timer = ExportStageTimer()
+    items: List[dict] = []
+    if expected <= envs.USAGE_EXPORT_STREAM_CHUNK_ROWS:
+        # One batch — the usual page. Fetched whole, the request's session is
+        # free again by the time enrichment needs it, so no second connection.
+        async with contextlib.aclosing(
+            _breakdown_item_batches(
+                _buffered_partitions(session, items_stmt),
+                query=query,
+                request=request,
+                enrich_session=session,
+                cache=cache,
+                timer=timer,
+            )
+        ) as batches:
+            async for batch in batches:
+                items.extend(batch)
+    else:
+        # A whole trend series or a very large page: off the cursor in batches,
+        # like the export, so the raw rows never all sit in memory at once
+        # next to the items built from them.
+        async with _enrichment_session(dims) as enrich_session:
+            async with _streamed_partitions(session, items_stmt) as partitions:
+                async with contextlib.aclosing(
+                    _breakdown_item_batches(
+                        partitions,
+                        query=query,
+                        request=request,
+                        enrich_session=enrich_session,
+                        cache=cache,
+                        timer=timer,
+                    )
+                ) as batches:
+                    async for batch in batches:
+                        items.extend(batch)
+        logger.debug(
+            "resource breakdown streamed: group_by=%s rows=%d entities=%d %s",
+            ",".join(request.group_by),
+            len(items),
+            len(cache.entity_exists),
+            timer.summary(),
         )
 
     return {
-        "summary": metrics_of(summary_row) if summary_row is not None else {},
+        "summary": (
+            _metrics_of(summary_row, query.metric_keys)
+            if summary_row is not None
+            else {}
+        ),
         "group_by": request.group_by,
         "pagination": Pagination(
             page=request.page,
@@ -1606,7 +1726,7 @@ _STORAGE_METRIC_KEYS = ["gb_days", "gb_hours"]
 
 @router.post("/resource/breakdown")
 async def resource_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceBreakdownRequest,
@@ -1623,7 +1743,7 @@ async def resource_breakdown(
 
 @router.post("/gpu-instances/breakdown")
 async def gpu_instances_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceBreakdownRequest,
@@ -1653,7 +1773,7 @@ async def gpu_instances_breakdown(
 
 @router.post("/storage/breakdown")
 async def storage_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceBreakdownRequest,
@@ -1799,20 +1919,7 @@ async def _stream_resource_export_rows(
     session of its own for the length of the stream. Memory stays bounded by
     the batch size instead of the result set.
     """
-    aware_tz = resolve_rollup_tz()
-    fixed_tz = rollup_fixed_tz()
     dims = [g for g in request.group_by if g != "date"]
-    window = _rollup_day_window(request.start_date, request.end_date)
-
-    @contextlib.asynccontextmanager
-    async def _enricher():
-        """One extra connection for the whole stream, not one per batch."""
-        if not dims:
-            yield None
-            return
-        async with async_session() as enrich_session:
-            yield enrich_session
-
     # One cache for the whole stream. Without it every batch re-resolves the
     # same entities — see ``ExportEnrichmentCache``.
     cache = ExportEnrichmentCache()
@@ -1820,69 +1927,38 @@ async def _stream_resource_export_rows(
     rows_out = 0
     batches = 0
 
-    async with _enricher() as enrich_session:
-        result = await session.stream(query.items_statement)
-        try:
-            partitions = result.partitions(envs.USAGE_EXPORT_STREAM_CHUNK_ROWS)
-            while True:
-                # Driven by hand rather than ``async for`` so the wait on the
-                # cursor can be charged separately — and the FIRST wait charged
-                # separately again. A GROUP BY ... ORDER BY cannot hand back one
-                # row before it has produced and sorted them all, so the whole
-                # cost of the aggregate lands on that first fetch; every later
-                # one is just transferring an already-computed result. Two
-                # numbers that behave completely differently, and summing them
-                # hides the only one worth optimizing.
-                with timer.stage("aggregate" if batches == 0 else "fetch"):
-                    partition = await anext(partitions, None)
-                if partition is None:
-                    break
-                batches += 1
-                with timer.stage("build"):
-                    items = _rows_to_items(
-                        partition,
-                        request=request,
-                        metric_keys=query.metric_keys,
-                        carries_creator=query.carries_creator,
-                        aware_tz=aware_tz,
-                        fixed_tz=fixed_tz,
+    async with (
+        _enrichment_session(dims) as enrich_session,
+        _streamed_partitions(session, query.items_statement) as partitions,
+        contextlib.aclosing(
+            _breakdown_item_batches(
+                partitions,
+                query=query,
+                request=request,
+                enrich_session=enrich_session,
+                cache=cache,
+                timer=timer,
+            )
+        ) as item_batches,
+    ):
+        async for items in item_batches:
+            batches += 1
+            with timer.stage("build"):
+                batch_rows = [
+                    resource_export_row(
+                        item,
+                        request.group_by,
+                        query.metric_keys,
+                        granularity=request.granularity,
+                        carries_organization=query.carries_organization,
                     )
-                if enrich_session is not None:
-                    with timer.stage("enrich"):
-                        # Same window the rows were aggregated over. Without it
-                        # ``_attach_shapes`` would describe each instance's WHOLE
-                        # history while its metrics cover the selected range —
-                        # segment hours that do not add up to the row.
-                        await _enrich_items(
-                            enrich_session,
-                            dims[0],
-                            items,
-                            window=window,
-                            cache=cache,
-                            bucketed="date" in request.group_by,
-                        )
-                with timer.stage("build"):
-                    batch_rows = [
-                        resource_export_row(
-                            item,
-                            request.group_by,
-                            query.metric_keys,
-                            granularity=request.granularity,
-                            carries_organization=query.carries_organization,
-                        )
-                        for item in items
-                    ]
-                # Built first, then yielded, so formatting time is attributed
-                # to ``build`` instead of disappearing into the suspension at
-                # yield.
-                for row in batch_rows:
-                    rows_out += 1
-                    yield row
-        finally:
-            # Reached on the normal end of the stream and on an abandoned
-            # download alike: the cursor is server-side, so leaving it open
-            # holds a connection for as long as the pool takes to notice.
-            await result.close()
+                    for item in items
+                ]
+            # Built first, then yielded, so formatting time is attributed to
+            # ``build`` instead of disappearing into the suspension at yield.
+            for row in batch_rows:
+                rows_out += 1
+                yield row
 
     # A slow export is otherwise invisible: the request logs one 200 and the
     # duration of the whole download, with no way to tell an expensive
@@ -1986,6 +2062,7 @@ async def _resource_export_response(
                 prefix=prefix,
                 context=context,
                 limit=envs.USAGE_EXPORT_MAX_ROWS,
+                export_format=request.format,
             )
         sheet, total = over_limit
         members = sum(export_split_plan(totals, envs.USAGE_EXPORT_MAX_ROWS).values())
@@ -2078,7 +2155,7 @@ _STORAGE_EXPORT_KWARGS = dict(
 
 @router.post("/gpu-instances/breakdown/export")
 async def export_gpu_instances_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceExportRequest,
@@ -2093,7 +2170,7 @@ async def export_gpu_instances_breakdown(
     response_model=UsageExportEstimateResponse,
 )
 async def estimate_gpu_instances_breakdown_export(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceExportRequest,
@@ -2105,7 +2182,7 @@ async def estimate_gpu_instances_breakdown_export(
 
 @router.post("/storage/breakdown/export")
 async def export_storage_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceExportRequest,
@@ -2120,7 +2197,7 @@ async def export_storage_breakdown(
     response_model=UsageExportEstimateResponse,
 )
 async def estimate_storage_breakdown_export(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: ResourceExportRequest,
@@ -2132,7 +2209,7 @@ async def estimate_storage_breakdown_export(
 
 @router.get("/summary")
 async def usage_summary(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     start_date: date,
@@ -2257,7 +2334,7 @@ def _phase_message_of(spec_snapshot) -> Optional[str]:
 
 @router.get("/resource-events")
 async def resource_events(  # noqa: C901
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     start_date: Optional[date] = None,
@@ -2400,7 +2477,7 @@ async def _creator_name_snapshots(session, ids: Set[int]) -> Dict[int, str]:
 
 @router.get("/resource/meta")
 async def resource_meta(  # noqa: C901
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     scope: str = USAGE_SCOPE_ALL,
@@ -5,9 +5,10 @@ import logging
 import time
 from datetime import date, datetime
 from math import ceil
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from fastapi import APIRouter
+from fastapi.responses import FileResponse
 from sqlalchemy import Date, Select, and_, asc, cast, desc
 from sqlmodel import func, or_, select
 
@@ -54,6 +55,7 @@ from gpustack.schemas.usage import (
     UsageBreakdownRequest,
     UsageBreakdownResponse,
     UsageExportEstimateResponse,
+    UsageExportJobPublic,
     UsageExportRequest,
     UsageExportSheetEstimate,
     UsageFilterItem,
@@ -67,10 +69,18 @@ from gpustack.schemas.usage import (
     UsageSummary,
 )
 from gpustack.schemas.common import Pagination
-from gpustack.server.db import async_session
-from gpustack.server.deps import CurrentUserDep, SessionDep, TenantContextDep
+from gpustack.server.db import analytics_session
+from gpustack.server.deps import (
+    AnalyticsSessionDep,
+    CurrentUserDep,
+    ExportJobsDep,
+    TenantContextDep,
+)
+from gpustack.server.export_jobs import ExportJob
+from gpustack.server.usage_tiers import adapt_to_source, tier_source_for_range
 from gpustack.utils.export_delivery import (
     ExportSheetPlan,
+    export_artifact,
     export_response,
     split_export_response,
     trailer_context,
@@ -868,7 +878,7 @@ async def _get_user_group_filter_options(session) -> List[UsageFilterOption]:
 
 @router.get("/meta", response_model=UsageMetaResponse, response_model_exclude_none=True)
 async def get_usage_meta(  # noqa: C901
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     scope: str = USAGE_SCOPE_ALL,
@@ -1263,10 +1273,29 @@ async def _build_breakdown_statement(
         date_sort_expr,
         grouped_by_date=USAGE_GROUP_BY_DATE in request.group_by,
     )
+    items_statement = grouped_statement.order_by(*sort_exprs)
+
+    # Fully covered weeks / months are read from their pre-summed tier and only
+    # the partial edges from the daily rows. The statements above are built
+    # against ``model_usages`` regardless and rewritten onto the union here, so
+    # the filters, scope and grouping stay defined in exactly one place.
+    tier_source = tier_source_for_range(
+        session,
+        request.start_date,
+        request.end_date,
+        granularity if USAGE_GROUP_BY_DATE in request.group_by else None,
+    )
+    if tier_source is not None:
+        source = tier_source.selectable()
+        scoped_statement = adapt_to_source(scoped_statement, source)
+        summary_statement = adapt_to_source(summary_statement, source)
+        items_statement = adapt_to_source(items_statement, source)
+        count_statement = adapt_to_source(count_statement, source)
+
     return BreakdownQuery(
         scoped_statement=scoped_statement,
         summary_statement=summary_statement,
-        items_statement=grouped_statement.order_by(*sort_exprs),
+        items_statement=items_statement,
         count_statement=count_statement,
         granularity=granularity,
         effective_scope=effective_scope,
@@ -1378,7 +1407,7 @@ async def _stream_export_rows(
         if not needs_enrichment:
             yield None
             return
-        async with async_session() as enrich_session:
+        async with analytics_session() as enrich_session:
             yield enrich_session
 
     async with _enricher() as enrich_session:
@@ -1443,6 +1472,35 @@ async def _stream_export_rows(
     )
 
 
+def _export_sheet_plans(
+    session,
+    sheets: List[tuple],
+    totals: Dict[str, int],
+    *,
+    track: Optional[Callable] = None,
+) -> List[ExportSheetPlan]:
+    """What each resolved sheet writes, its rows streamed on ``session``.
+
+    ``track`` wraps each sheet's row factory; a background job passes one that
+    counts the rows as they go by.
+    """
+    plans = []
+    for sheet, query, _ in sheets:
+        rows = partial(_stream_export_rows, session, query, sheet.group_by)
+        plans.append(
+            ExportSheetPlan(
+                key=sheet.key,
+                name=sheet.name,
+                columns=build_export_columns(
+                    sheet.group_by, query.carries_organization
+                ),
+                total=totals[sheet.key],
+                rows=track(rows) if track is not None else rows,
+            )
+        )
+    return plans
+
+
 async def _resolve_export_sheets(
     session,
     user: User,
@@ -1497,7 +1555,7 @@ async def _resolve_export_sheets(
     response_model=UsageExportEstimateResponse,
 )
 async def estimate_usage_breakdown_export(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: UsageExportRequest,
@@ -1545,7 +1603,7 @@ async def estimate_usage_breakdown_export(
 
 @router.post("/breakdown/export")
 async def export_usage_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: UsageExportRequest,
@@ -1581,18 +1639,7 @@ async def export_usage_breakdown(
 
     def plans() -> List[ExportSheetPlan]:
         """What each sheet writes — resolved only once a file will be written."""
-        return [
-            ExportSheetPlan(
-                key=sheet.key,
-                name=sheet.name,
-                columns=build_export_columns(
-                    sheet.group_by, query.carries_organization
-                ),
-                total=totals[sheet.key],
-                rows=partial(_stream_export_rows, session, query, sheet.group_by),
-            )
-            for sheet, query, _ in sheets
-        ]
+        return _export_sheet_plans(session, sheets, totals)
 
     context = trailer_context(sheets[0][1].effective_scope, ctx.current_principal_id)
 
@@ -1608,6 +1655,7 @@ async def export_usage_breakdown(
                 prefix=EXPORT_FILE_PREFIX,
                 context=context,
                 limit=envs.USAGE_EXPORT_MAX_ROWS,
+                export_format=request.format,
             )
         sheet, sheet_total = over_limit
         members = sum(export_split_plan(totals, envs.USAGE_EXPORT_MAX_ROWS).values())
@@ -1630,13 +1678,102 @@ async def export_usage_breakdown(
     )
 
 
+def _export_job_source(sheets: List[tuple], request: UsageExportRequest, context: str):
+    """What a background job runs once it has a slot.
+
+    The sheets were resolved — and the caller's access checked — when the job
+    was submitted, so a refusal is an error on the POST, not a failed job. The
+    counting and streaming happen here, on sessions of the job's own: the
+    request that submitted it is long gone by then.
+
+    No ``USAGE_EXPORT_MAX_ROWS``: that limit exists because the direct export
+    holds a request open, which a job does not. A sheet too large for xlsx
+    still falls back to CSV, the same as the direct export.
+    """
+
+    @contextlib.asynccontextmanager
+    async def source(job: ExportJob):
+        async with analytics_session() as session:
+            totals = {
+                sheet.key: _row_count_value(
+                    await _get_first_row(session, query.count_statement)
+                )
+                for sheet, query, _ in sheets
+            }
+            job.rows_total = sum(totals.values())
+            job.format = effective_export_format(request.format, totals.values())
+            yield export_artifact(
+                _export_sheet_plans(session, sheets, totals, track=job.counted),
+                request=request,
+                prefix=EXPORT_FILE_PREFIX,
+                export_format=job.format,
+                context=context,
+            )
+
+    return source
+
+
+@router.post(
+    "/breakdown/export/jobs",
+    response_model=UsageExportJobPublic,
+    status_code=202,
+)
+async def create_usage_breakdown_export_job(
+    session: AnalyticsSessionDep,
+    user: CurrentUserDep,
+    ctx: TenantContextDep,
+    jobs: ExportJobsDep,
+    request: UsageExportRequest,
+):
+    """Queue an export to be written to a file on the server.
+
+    For exports too large — or too slow — to hold a request open for. Poll the
+    job until it is ``completed``, then download it; the download supports
+    Range requests, so a dropped connection resumes rather than restarts.
+    """
+    sheets = await _resolve_export_sheets(
+        session, user, ctx, request, tolerate_forbidden=False
+    )
+    context = trailer_context(sheets[0][1].effective_scope, ctx.current_principal_id)
+    job = jobs.submit(
+        user.id, request.format, _export_job_source(sheets, request, context)
+    )
+    return job.to_public(jobs.ttl_seconds)
+
+
+@router.get("/breakdown/export/jobs/{job_id}", response_model=UsageExportJobPublic)
+async def get_usage_breakdown_export_job(
+    user: CurrentUserDep, jobs: ExportJobsDep, job_id: str
+):
+    return jobs.get(job_id, user.id).to_public(jobs.ttl_seconds)
+
+
+@router.get("/breakdown/export/jobs/{job_id}/download")
+async def download_usage_breakdown_export_job(
+    user: CurrentUserDep, jobs: ExportJobsDep, job_id: str
+):
+    job = jobs.get(job_id, user.id)
+    # FileResponse answers Range / If-Range itself, with 206 and 416 as due.
+    return FileResponse(
+        jobs.completed_path(job), media_type=job.media_type, filename=job.filename
+    )
+
+
+@router.delete("/breakdown/export/jobs/{job_id}", status_code=204)
+async def delete_usage_breakdown_export_job(
+    user: CurrentUserDep, jobs: ExportJobsDep, job_id: str
+):
+    """Cancel a job that is still running, or delete a finished one's file."""
+    await jobs.cancel(job_id, user.id)
+
+
 @router.post(
     "/breakdown",
     response_model=UsageBreakdownResponse,
     response_model_exclude_none=True,
 )
 async def get_usage_breakdown(
-    session: SessionDep,
+    session: AnalyticsSessionDep,
     user: CurrentUserDep,
     ctx: TenantContextDep,
     request: UsageBreakdownRequest,
@@ -84,7 +84,7 @@ async def get_users(
 
     if params.watch:
         return StreamingResponse(
-            User.streaming(fuzzy_fields=fuzzy_fields),
+            User.streaming(fuzzy_fields=fuzzy_fields, since=params.since),
             media_type="text/event-stream",
         )
 
@@ -21,6 +21,7 @@ from gpustack.scheduler.calculator import (
     _gguf_parser_env,
     GPUOffloadEnum,
     calculate_local_model_weight_size,
+    estimate_in_process,
 )
 
 
@@ -253,7 +254,7 @@ async def get_model_weight_size(
 @router.post("/files/parse-gguf", response_model=GGUFParseResponse)
 async def parse_gguf_file(http_request: Request, body: GGUFParseRequest):
     """
-    Parse a GGUF file using gguf-parser binary on the worker.
+    Parse a GGUF file on the worker, in process or with the gguf-parser binary.
 
     Security:
     - Uses os.path.realpath to resolve symlinks and prevent directory traversal
@@ -297,7 +298,15 @@ async def parse_gguf_file(http_request: Request, body: GGUFParseRequest):
         if worker_cfg is not None:
             kwargs["cache_dir"] = worker_cfg.cache_dir
 
-        # 5. Reuse _gguf_parser_command to build command
+        # 5. Language models are estimated from their header, without a parser
+        claim = await asyncio.to_thread(
+            estimate_in_process, model, offload_enum, **kwargs
+        )
+        if claim is not None:
+            logger.debug(f"GGUF estimated in process for {model.local_path}")
+            return GGUFParseResponse(success=True, output=claim.to_json())
+
+        # Reuse _gguf_parser_command to build command
         command = await _gguf_parser_command(model, offload_enum, **kwargs)
         env = _gguf_parser_env(model)
 
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import aiohttp
+from dataclasses import asdict
 from typing import Callable, List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse, JSONResponse
@@ -15,6 +16,7 @@ from gpustack.api.exceptions import (
 )
 from gpustack import envs
 from gpustack.utils.network import use_proxy_env_for_url
+from gpustack.worker.upstream_pool import UpstreamPool, UpstreamStats
 from gpustack.gateway.utils import get_instance_id_from_header, router_header_key
 
 router = APIRouter(dependencies=[Depends(worker_auth)])
@@ -55,6 +57,60 @@ def _filter_response_headers(resp_headers) -> List[Tuple[str, str]]:
     ]
 
 
+# Request headers that describe the client's connection, not the request, and
+# must not reach the engine over a pooled connection: a client's
+# "Connection: close" would otherwise end a keep-alive connection to it.
+_EXCLUDED_REQUEST_HEADERS = frozenset(
+    {
+        "host",
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+# Bodies up to this size are read before forwarding, so a request whose
+# connection fails before it is written can be sent again. Larger and chunked
+# bodies are streamed through as they arrive.
+_BUFFERED_BODY_LIMIT = 64 * 1024
+
+# Methods the proxy sends again after the upstream connection drops mid-request
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _filter_request_headers(req_headers) -> List[Tuple[str, str]]:
+    # Starlette already lower-cases header names.
+    return [
+        (k, v) for k, v in req_headers.items() if k not in _EXCLUDED_REQUEST_HEADERS
+    ]
+
+
+async def _request_body(request: Request) -> Tuple[object, bool]:
+    """Return the body to forward, and whether it can be sent twice."""
+    if request.headers.get("transfer-encoding", "").lower() == "chunked":
+        return request.stream(), False
+    content_length = request.headers.get("content-length")
+    if content_length is None or not content_length.isdigit():
+        return None, True
+    if int(content_length) <= _BUFFERED_BODY_LIMIT:
+        return await request.body(), True
+    return request.stream(), False
+
+
+@router.get("/proxy-stats")
+async def proxy_stats(request: Request):
+    """In-flight requests and latency per instance port, for routing."""
+    pool: Optional[UpstreamPool] = getattr(request.app.state, "upstream_pool", None)
+    if pool is None:
+        return []
+    return [asdict(load) for load in pool.stats.snapshot()]
+
+
 @router.api_route(
     "/proxy/{path:path}",
     methods=["GET", "POST", "OPTIONS", "HEAD"],
@@ -70,6 +126,20 @@ async def proxy(path: str, request: Request):  # noqa: C901
             detail="Missing target port; ensure the request includes the routing header",
         )
 
+    target_instance_id = getattr(request.state, "x_target_instance_id", None)
+    pool: Optional[UpstreamPool] = getattr(request.app.state, "upstream_pool", None)
+    stats: Optional[UpstreamStats] = pool.stats if pool else None
+    port = int(target_service_port)
+    finished = False
+
+    def finish(failed: bool = False):
+        # Called from the response stream and its background task, whichever
+        # runs: a client that disconnects may skip the background task.
+        nonlocal finished
+        if stats is not None and not finished:
+            finished = True
+            stats.end(port, failed)
+
     try:
         logger.debug(
             f"Proxying request to worker at port {target_service_port} for path: {path}"
@@ -77,53 +147,91 @@ async def proxy(path: str, request: Request):  # noqa: C901
         url = f"http://{worker_ip_getter()}:{target_service_port}/{path}"
         if request.url.query:
             url = f"{url}?{request.url.query}"
-        headers = dict(request.headers)
-        headers.pop("host", None)
-        headers.pop("transfer-encoding", None)
-        if headers.get("transfer-encoding", "").lower() == "chunked":
+        headers = _filter_request_headers(request.headers)
+        content, replayable = await _request_body(request)
 
-            async def body_generator():
-                async for chunk in request.stream():
+        async def stream_response(resp):
+            # Forward whatever has arrived as one chunk: a token event goes
+            # out as soon as it lands, and a large body in buffer-sized
+            # pieces rather than one ASGI send per KiB.
+            completed = False
+            try:
+                async for chunk in resp.content.iter_any():
                     yield chunk
+                completed = True
+            finally:
+                finish(upstream_failed or not completed)
 
-            content = body_generator()
+        use_proxy_env = use_proxy_env_for_url(url)
+        http_client: aiohttp.ClientSession
+        if pool is not None:
+            http_client = pool.session_with_proxy_env if use_proxy_env else pool.session
+        elif use_proxy_env:
+            http_client = request.app.state.http_client
         else:
-            content = await request.body()
+            http_client = request.app.state.http_client_no_proxy
+        timeout = aiohttp.ClientTimeout(total=envs.PROXY_TIMEOUT)
 
-        async def stream_response(resp):
-            async for chunk in resp.content.iter_chunked(1024):
-                yield chunk
+        async def send():
+            return await http_client.request(
+                method=request.method,
+                url=url,
+                headers=headers,
+                data=content,
+                timeout=timeout,
+            )
 
-        use_proxy_env = use_proxy_env_for_url(url)
-        http_client: aiohttp.ClientSession = (
-            request.app.state.http_client
-            if use_proxy_env
-            else request.app.state.http_client_no_proxy
-        )
-        timeout = aiohttp.ClientTimeout(total=envs.PROXY_TIMEOUT)
-        resp = await http_client.request(
-            method=request.method,
-            url=url,
-            headers=headers,
-            data=content,
-            timeout=timeout,
-        )
+        if stats is not None:
+            instance_id = int(target_instance_id) if target_instance_id else None
+            started = stats.begin(port, instance_id)
+        try:
+            try:
+                resp = await send()
+            except aiohttp.ClientConnectorError:
+                # Connecting failed, so nothing was written: any method can go
+                # again.
+                if pool is None or not replayable:
+                    raise
+                resp = await send()
+            except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError):
+                # The engine may have closed an idle pooled connection as we
+                # reused it, but the request may also have reached it before
+                # the connection dropped. Only a method that is safe to run
+                # twice is sent again; an inference POST is not.
+                if (
+                    pool is None
+                    or not replayable
+                    or request.method not in _IDEMPOTENT_METHODS
+                ):
+                    raise
+                resp = await send()
+        except BaseException:
+            finish(failed=True)
+            raise
+        if stats is not None:
+            stats.responded(port, started)
+        upstream_failed = resp.status >= 500
 
         # Heuristic: treat a non-error HTTP status as a successful inference
         # signal so the active health-check loop can skip this instance.
         # For streaming responses the status is available before body
         # transfer, so a mid-stream failure will still be counted — this is
         # acceptable as a best-effort optimisation.
-        target_instance_id = getattr(request.state, "x_target_instance_id", None)
         if resp.status < 400 and target_instance_id:
             record_fn = getattr(request.app.state, "record_successful_inference", None)
             if record_fn:
                 record_fn(int(target_instance_id))
 
+        def close_response():
+            # A response read to the end has already gone back to the pool;
+            # closing one abandoned midway discards its connection.
+            resp.close()
+            finish(upstream_failed)
+
         response = StreamingResponse(
             stream_response(resp),
             status_code=resp.status,
-            background=BackgroundTask(resp.close),
+            background=BackgroundTask(close_response),
         )
         # Use append (not the headers= constructor kwarg) so duplicate header
         # names like Set-Cookie survive instead of being overwritten by
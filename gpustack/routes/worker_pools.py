@@ -52,6 +52,7 @@ async def list(
                 fields=fields,
                 fuzzy_fields=fuzzy_fields,
                 options=WORKER_POOL_LOAD_OPTIONS,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
@@ -231,6 +231,7 @@ async def get_workers(
                 fuzzy_fields=fuzzy_fields,
                 filter_func=visible,
                 event_transform=_inject_allocated_into_event,
+                since=params.since,
             ),
             media_type="text/event-stream",
         )
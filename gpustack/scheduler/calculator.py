@@ -11,7 +11,8 @@ import time
 from typing import List, Optional, Dict, Tuple, Any
 from dataclasses_json import dataclass_json
 
-from gpustack.client.worker_filesystem_client import WorkerFilesystemClient
+from gpustack import envs
+from gpustack.client.worker_filesystem_client import pooled_worker_filesystem_client
 from gpustack.config.config import get_global_config
 from gpustack.policies.worker_filters.gpu_matching_filter import GPUMatchingFilter
 from gpustack.policies.worker_filters.label_matching_filter import LabelMatchingFilter
@@ -27,6 +28,7 @@ from gpustack.schemas.models import (
 from gpustack.schemas.workers import Worker
 from gpustack.utils.compat_importlib import pkg_resources
 from gpustack.utils.convert import parse_duration, safe_int
+from gpustack.utils.hedge import hedged_first
 from gpustack.utils.hub import (
     filter_filename,
     list_repo,
@@ -636,26 +638,25 @@ async def _try_parse_on_workers(
     async def try_parse_on_worker(worker: Worker) -> Optional[ModelResourceClaim]:
         """Try to parse GGUF on a single worker."""
         try:
-            async with WorkerFilesystemClient() as fs_client:
-                output_dict = await fs_client.parse_gguf(
-                    worker,
-                    model,
-                    offload=offload_str,
-                    **parse_kwargs,
-                )
-                claim = GGUFParserOutput.from_dict(output_dict)
-                if offload == GPUOffloadEnum.Disable:
-                    clear_vram_claim(claim)
+            output_dict = await pooled_worker_filesystem_client().parse_gguf(
+                worker,
+                model,
+                offload=offload_str,
+                **parse_kwargs,
+            )
+            claim = GGUFParserOutput.from_dict(output_dict)
+            if offload == GPUOffloadEnum.Disable:
+                clear_vram_claim(claim)
 
-                logger.info(
-                    f"Successfully parsed GGUF on worker {worker.name} "
-                    f"for model {model.name}"
-                )
-                return ModelResourceClaim(
-                    model=model,
-                    resource_claim_estimate=claim.estimate,
-                    resource_architecture=claim.architecture,
-                )
+            logger.info(
+                f"Successfully parsed GGUF on worker {worker.name} "
+                f"for model {model.name}"
+            )
+            return ModelResourceClaim(
+                model=model,
+                resource_claim_estimate=claim.estimate,
+                resource_architecture=claim.architecture,
+            )
         except Exception as e:
             error_msg = str(e)
             logger.info(
@@ -665,14 +666,11 @@ async def _try_parse_on_workers(
             worker_errors[worker.name] = error_msg
             return None
 
-    # Concurrently try all workers and return the first successful result
-    tasks = [try_parse_on_worker(worker) for worker in workers]
-
-    # Use as_completed to get results as they finish
-    for completed_task in asyncio.as_completed(tasks):
-        result = await completed_task
-        if result:
-            return result
+    # Ask a few workers, more only if they are slow or fail; the losers are
+    # cancelled once one succeeds.
+    result = await hedged_first(workers, try_parse_on_worker, kind="parse_gguf")
+    if result is not None:
+        return result.value
 
     error_items = list(worker_errors.items())
     shown_errors = "; \n".join(f"{name}: {err}" for name, err in error_items[:3])
@@ -893,16 +891,15 @@ async def read_local_path_file_from_workers(  # noqa: C901
     async def try_read_from_worker(worker: Worker) -> Optional[Dict[str, Any]]:
         """Try to read file from a single worker."""
         try:
-            async with WorkerFilesystemClient() as filesystem_client:
-                logger.info(f"Trying to read {file_path} from worker {worker.name}")
-                content = await filesystem_client.read_model_config(worker, fp)
-                if content:
-                    logger.info(
-                        f"Successfully read {file_path} from worker {worker.name}"
-                    )
-                    return content
-                worker_errors[worker.name] = "file not found or empty"
-                return None
+            logger.info(f"Trying to read {file_path} from worker {worker.name}")
+            content = await pooled_worker_filesystem_client().read_model_config(
+                worker, fp
+            )
+            if content:
+                logger.info(f"Successfully read {file_path} from worker {worker.name}")
+                return content
+            worker_errors[worker.name] = "file not found or empty"
+            return None
         except Exception as e:
             error_msg = str(e)
             logger.info(
@@ -956,23 +953,14 @@ async def read_local_path_file_from_workers(  # noqa: C901
         )
 
     logger.info(
-        f"Broadcasting {file_path} read request to {len(filtered_workers)} filtered workers "
+        f"Sending {file_path} read request to {len(filtered_workers)} filtered workers "
         f"(reduced from {len(workers)} total workers)"
     )
-    tasks = [
-        asyncio.create_task(try_read_from_worker(worker)) for worker in filtered_workers
-    ]
-    try:
-        for completed_task in asyncio.as_completed(tasks):
-            result = await completed_task
-            if result:
-                return result
-    finally:
-        pending = [t for t in tasks if not t.done()]
-        for t in pending:
-            t.cancel()
-        if pending:
-            await asyncio.gather(*pending, return_exceptions=True)
+    result = await hedged_first(
+        filtered_workers, try_read_from_worker, kind="read_model_config"
+    )
+    if result is not None:
+        return result.value
 
     error_items = list(worker_errors.items())
     shown_errors = ";\n".join(f"{name}: {err}" for name, err in error_items[:3])
@@ -1123,6 +1111,20 @@ async def calculate_gguf_model_resource_claim(
             resource_architecture=a,
         )
 
+    start_time = time.time()
+    claim = await asyncio.to_thread(estimate_in_process, model, offload, **kwargs)
+    if claim is not None:
+        logger.trace(
+            f"Estimated model {model.name} in process, "
+            f"latency: {time.time() - start_time:.3f}, "
+            f"{claim.estimate.items[-1].to_log_string()}"
+        )
+        return ModelResourceClaim(
+            model=model,
+            resource_claim_estimate=claim.estimate,
+            resource_architecture=claim.architecture,
+        )
+
     command = await _gguf_parser_command(model, offload, **kwargs)
     env = _gguf_parser_env(model)
     try:
@@ -1184,6 +1186,37 @@ async def calculate_gguf_model_resource_claim(
         )
 
 
+def estimate_in_process(
+    model: Model, offload: GPUOffloadEnum = GPUOffloadEnum.Full, **kwargs
+) -> Optional[GGUFParserOutput]:
+    """
+    Estimate the model from its GGUF header without running gguf-parser.
+    Returns None if the model needs gguf-parser, or in-process estimates are
+    disabled.
+    """
+    if not envs.GGUF_ESTIMATE_IN_PROCESS:
+        return None
+
+    from gpustack.scheduler.gguf_estimator import estimate_gguf_model
+
+    try:
+        claim = estimate_gguf_model(
+            model,
+            offload,
+            tensor_split=kwargs.get("tensor_split"),
+            rpc=kwargs.get("rpc"),
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to estimate model {model.name} in process, "
+            f"falling back to gguf-parser: {e}"
+        )
+        return None
+    if claim is not None and offload == GPUOffloadEnum.Disable:
+        clear_vram_claim(claim)
+    return claim
+
+
 def clear_vram_claim(claim: GGUFParserOutput):
     for item in claim.estimate.items:
         # gguf-parser provides vram claim when offloadLayers is 0 due to current llama.cpp behavior, but llama-box won't allocate such vram.
@@ -12,7 +12,7 @@ from cachetools import TTLCache
 from aiolimiter import AsyncLimiter
 
 from gpustack.api.exceptions import HTTPException
-from gpustack.client.worker_filesystem_client import WorkerFilesystemClient
+from gpustack.client.worker_filesystem_client import pooled_worker_filesystem_client
 from gpustack.config.config import Config
 from gpustack.policies.base import ModelInstanceScheduleCandidate
 from gpustack import envs
@@ -352,7 +352,7 @@ async def evaluate_model_metadata(
             if not path_exists_on_server:
                 # Try to check if path exists on any worker
                 try:
-                    async with WorkerFilesystemClient() as filesystem_client:
+                    async with pooled_worker_filesystem_client() as filesystem_client:
                         selector = WorkerSelector(filesystem_client)
 
                         found_worker = await selector.find_worker_with_path(
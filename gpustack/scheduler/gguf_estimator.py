@@ -0,0 +1,379 @@
+"""In-process memory estimate of GGUF language models.
+
+``calculate_gguf_model_resource_claim`` used to start gguf-parser for every
+estimate, paying a fork and exec and a full JSON document each time while the
+scheduler tries one device split after another. For local GGUF files of
+transformer language models the estimate is made here instead, from the
+header read by :func:`gpustack.utils.gguf.read_gguf_header`, in the shape
+gguf-parser outputs.
+
+Weights and KV cache are placed per layer the way llama.cpp places them, and
+so agree with gguf-parser. The compute buffers are sized from the largest
+intermediate tensors of one micro-batch, which errs on the high side of
+gguf-parser's graph-based figures.
+
+Only the architectures in ``_PARITY_ARCHITECTURES`` are estimated, those the
+tests check against recorded gguf-parser output. Anything else (other
+architectures, remote files, projectors, sliding-window attention, tensor
+overrides) returns None and is left to gguf-parser.
+"""
+
+import bisect
+import logging
+import os
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
+
+from gpustack.scheduler.calculator import (
+    Architecture,
+    Estimate,
+    GGUFParserCommandMutableParameters,
+    GGUFParserOutput,
+    GPUOffloadEnum,
+    LayerMemoryEstimate,
+    MemoryEstimate,
+)
+from gpustack.schemas.models import Model, SourceEnum
+from gpustack.utils.file import get_sharded_file_paths
+from gpustack.utils.gguf import GGML_TYPE_SIZES, GGUFHeader, read_gguf_header
+
+logger = logging.getLogger(__name__)
+
+_MIB = 1024 * 1024
+
+# ggml_tensor_overhead(): the bookkeeping llama.cpp allocates per tensor.
+_TENSOR_OVERHEAD = 368
+
+# KV cache types accepted by --cache-type-k/v, as ggml types.
+_CACHE_TYPES = {
+    "f32": 0,
+    "f16": 1,
+    "bf16": 30,
+    "q8_0": 8,
+    "q4_0": 2,
+    "q4_1": 3,
+    "iq4_nl": 20,
+    "q5_0": 6,
+    "q5_1": 7,
+}
+
+# Tensors that stay in host memory whatever is offloaded.
+_INPUT_TENSORS = (
+    "token_embd.",
+    "token_embd_norm.",
+    "token_types.",
+    "position_embd.",
+)
+
+# llama_pooling_type
+_POOLING_RANK = 4
+
+# Architectures whose estimates are checked against recorded gguf-parser
+# output. Others may place tensors or size caches differently (and may not be
+# distributable over RPC), so they are left to gguf-parser.
+_PARITY_ARCHITECTURES = ("llama", "qwen2")
+
+
+def _layer_value(value, layer: int, default: int = 0) -> int:
+    """A hyperparameter that is either one value or one per layer."""
+    if isinstance(value, list):
+        return value[layer] if layer < len(value) else default
+    return value if value is not None else default
+
+
+def _max_value(value, default: int = 0) -> int:
+    if isinstance(value, list):
+        return max(value, default=default)
+    return value if value is not None else default
+
+
+def _cache_type_bytes(name: Optional[str]) -> float:
+    ggml_type = _CACHE_TYPES.get((name or "f16").lower())
+    if ggml_type is None:
+        raise ValueError(f"Unsupported cache type {name}")
+    block_size, type_size = GGML_TYPE_SIZES[ggml_type]
+    return type_size / block_size
+
+
+def _parse_footprint(value: str) -> tuple:
+    ram, _, vram = (value or "").partition(",")
+    return int(float(ram or 0) * _MIB), int(float(vram or 0) * _MIB)
+
+
+def _supported(model: Model, params: GGUFParserCommandMutableParameters) -> bool:
+    return (
+        model.source == SourceEnum.LOCAL_PATH
+        and bool(model.local_path)
+        and os.path.isfile(model.local_path)
+        and not params.override_tensor
+    )
+
+
+def _read_model(path: str) -> GGUFHeader:
+    """The header of the model at ``path``, with the tensors of all shards."""
+    shards = get_sharded_file_paths(path)
+    header = read_gguf_header(shards[0])
+    if len(shards) == 1:
+        return header
+    tensors = list(header.tensors)
+    for shard in shards[1:]:
+        tensors.extend(read_gguf_header(shard).tensors)
+    return GGUFHeader(version=header.version, metadata=header.metadata, tensors=tensors)
+
+
+class _LanguageModel:
+    """The hyperparameters of a transformer language model that size it."""
+
+    def __init__(self, header: GGUFHeader):
+        md = header.metadata
+        arch = header.architecture
+        self.arch = arch
+
+        def get(key, default=None):
+            return md.get(f"{arch}.{key}", default)
+
+        self.n_layer = get("block_count")
+        self.n_embd = get("embedding_length")
+        self.n_head = get("attention.head_count")
+        self.n_ctx_train = get("context_length")
+        n_head_max = _max_value(self.n_head, 1) or 1
+        self.n_head_kv = get("attention.head_count_kv", self.n_head)
+        self.n_embd_head_k = get(
+            "attention.key_length", (self.n_embd or 0) // n_head_max
+        )
+        self.n_embd_head_v = get(
+            "attention.value_length", (self.n_embd or 0) // n_head_max
+        )
+        self.n_ff = get("feed_forward_length", 0)
+        self.n_expert_ff = get("expert_feed_forward_length", 0)
+        self.n_expert_used = get("expert_used_count", 0)
+        self.pooling_type = get("pooling_type")
+        self.causal = get("attention.causal", True)
+        self.recurrent = any(
+            key.startswith((f"{arch}.ssm.", f"{arch}.wkv.", f"{arch}.rwkv"))
+            for key in md
+        )
+        self.latent_attention = f"{arch}.attention.kv_lora_rank" in md
+        self.sliding_window = f"{arch}.attention.sliding_window" in md
+
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.layer_bytes: Dict[int, int] = {}
+        token_embd_bytes = 0
+        has_output = False
+        self.n_vocab = 0
+        for tensor in header.tensors:
+            nbytes = tensor.nbytes
+            if tensor.name.startswith("blk."):
+                layer = int(tensor.name.split(".", 2)[1])
+                self.layer_bytes[layer] = self.layer_bytes.get(layer, 0) + nbytes
+            elif tensor.name.startswith(_INPUT_TENSORS):
+                self.input_bytes += nbytes
+                if tensor.name == "token_embd.weight":
+                    token_embd_bytes = nbytes
+                    self.n_vocab = tensor.dims[-1]
+            else:
+                self.output_bytes += nbytes
+                if tensor.name == "output.weight":
+                    has_output = True
+                    self.n_vocab = tensor.dims[-1]
+        self.n_tensors = len(header.tensors)
+        if not has_output and not self.embedding_only:
+            # Tied embeddings: llama.cpp copies token_embd to the output device.
+            self.output_bytes += token_embd_bytes
+
+    @property
+    def valid(self) -> bool:
+        return (
+            self.arch in _PARITY_ARCHITECTURES
+            and bool(self.n_layer)
+            and bool(self.n_embd)
+            and bool(self.n_head)
+            and not self.recurrent
+            and not self.latent_attention
+            and not self.sliding_window
+        )
+
+    @property
+    def embedding_only(self) -> bool:
+        return self.pooling_type is not None or not self.causal
+
+    @property
+    def reranking(self) -> bool:
+        return self.pooling_type == _POOLING_RANK
+
+
+class _Estimator:
+    def __init__(
+        self,
+        lm: _LanguageModel,
+        params: GGUFParserCommandMutableParameters,
+        tensor_split: Optional[Sequence[float]],
+    ):
+        self.lm = lm
+        self.params = params
+
+        n_ctx = params.ctx_size if params.ctx_size and params.ctx_size > 0 else 0
+        if lm.n_ctx_train and (not n_ctx or n_ctx > lm.n_ctx_train):
+            n_ctx = lm.n_ctx_train
+        self.n_ctx = n_ctx
+        n_batch = params.batch_size or 2048
+        self.n_batch = n_batch
+        self.n_ubatch = min(params.ubatch_size or 512, n_batch)
+        self.ram_footprint, self.vram_footprint = _parse_footprint(
+            params.platform_footprint
+        )
+
+        split = [float(v) for v in tensor_split] if tensor_split else [1.0]
+        total = sum(split) or 1.0
+        # Cumulative share of each device, as llama.cpp's tensor_split.
+        self.splits = [v / total for v in accumulate(split)]
+
+        k_bytes = _cache_type_bytes(params.cache_type_k)
+        v_bytes = _cache_type_bytes(params.cache_type_v)
+        self.kv_bytes: Dict[int, int] = {}
+        for layer in range(lm.n_layer):
+            if lm.embedding_only:
+                self.kv_bytes[layer] = 0
+                continue
+            n_head_kv = _layer_value(lm.n_head_kv, layer)
+            self.kv_bytes[layer] = int(
+                n_ctx
+                * n_head_kv
+                * (lm.n_embd_head_k * k_bytes + lm.n_embd_head_v * v_bytes)
+            )
+
+    def _compute_bytes(self) -> int:
+        """Peak compute buffer of a device running the model's layers."""
+        lm = self.lm
+        n_ubatch = self.n_ubatch
+        n_head = _max_value(lm.n_head)
+        if self.params.flash_attention:
+            attention = n_ubatch * (self.n_ctx * 2 + n_head * lm.n_embd_head_v * 4)
+        else:
+            # The f32 attention scores of every head over the whole context.
+            attention = n_ubatch * self.n_ctx * n_head * 4
+        n_ff = max(
+            _max_value(lm.n_ff), _max_value(lm.n_expert_ff) * (lm.n_expert_used or 1)
+        )
+        ffn = n_ubatch * n_ff * 4 * 2
+        logits = 0 if lm.embedding_only else n_ubatch * lm.n_vocab * 4
+        return max(attention, ffn, logits) + 3 * n_ubatch * lm.n_embd * 4
+
+    def _host_compute_bytes(self) -> int:
+        lm = self.lm
+        n_out = lm.n_embd if lm.embedding_only else lm.n_vocab
+        return self.n_ubatch * (lm.n_embd + n_out) * 4
+
+    def _device_of(self, position: float) -> int:
+        device = bisect.bisect_right(self.splits, position)
+        return min(device, len(self.splits) - 1)
+
+    def item(self, n_gpu_layers: int) -> MemoryEstimate:
+        lm = self.lm
+        n_layer = lm.n_layer
+        n_devices = len(self.splits)
+        n_gpu_layers = max(0, min(n_gpu_layers, n_layer + 1))
+        gpu_start = max(n_layer - n_gpu_layers, 0)
+        act_gpu_layers = min(n_gpu_layers, n_layer + 1)
+
+        device_layers = [0] * n_devices
+        device_bytes = [0] * n_devices
+        ram_bytes = lm.input_bytes
+        no_kv_offload = bool(self.params.no_kv_offload)
+        for layer in range(n_layer):
+            weights = lm.layer_bytes.get(layer, 0)
+            kv = self.kv_bytes[layer]
+            if layer < gpu_start:
+                ram_bytes += weights + kv
+                continue
+            device = self._device_of((layer - gpu_start) / act_gpu_layers)
+            device_layers[device] += 1
+            device_bytes[device] += weights
+            if no_kv_offload:
+                ram_bytes += kv
+            else:
+                device_bytes[device] += kv
+
+        output_offloaded = n_gpu_layers > n_layer
+        if output_offloaded:
+            device = self._device_of((n_layer - gpu_start) / act_gpu_layers)
+            device_bytes[device] += lm.output_bytes
+        else:
+            ram_bytes += lm.output_bytes
+
+        output_buffer = (
+            (lm.n_embd if lm.embedding_only else lm.n_vocab)
+            * 4
+            * max(self.params.parallel_size or 1, 1)
+        )
+        ram_uma = (
+            ram_bytes
+            + self._host_compute_bytes()
+            + output_buffer
+            + lm.n_tensors * _TENSOR_OVERHEAD
+        )
+        compute = self._compute_bytes()
+        return MemoryEstimate(
+            offloadLayers=n_gpu_layers,
+            fullOffloaded=output_offloaded,
+            ram=LayerMemoryEstimate(
+                uma=ram_uma,
+                nonuma=ram_uma + self.ram_footprint,
+                handleLayers=gpu_start,
+            ),
+            vrams=[
+                LayerMemoryEstimate(
+                    uma=device_bytes[d],
+                    nonuma=device_bytes[d] + self.vram_footprint + compute,
+                    handleLayers=device_layers[d],
+                )
+                for d in range(n_devices)
+            ],
+        )
+
+
+def estimate_gguf_model(
+    model: Model,
+    offload: GPUOffloadEnum = GPUOffloadEnum.Full,
+    tensor_split: Optional[Sequence[float]] = None,
+    rpc: Optional[List[str]] = None,
+) -> Optional[GGUFParserOutput]:
+    """Estimate the memory of ``model`` as gguf-parser would.
+
+    Returns None if the model is not one estimated here; gguf-parser should
+    be asked instead. RPC servers take their places in ``tensor_split`` like
+    local devices, so ``rpc`` only has to be accepted.
+    """
+    params = GGUFParserCommandMutableParameters(backend_version=model.backend_version)
+    params.from_args(model.backend_parameters)
+    if not _supported(model, params):
+        return None
+
+    header = _read_model(model.local_path)
+    if header.metadata.get("general.type", "model") != "model":
+        return None
+    lm = _LanguageModel(header)
+    if not lm.valid:
+        return None
+
+    estimator = _Estimator(lm, params, tensor_split)
+    full = lm.n_layer + 1
+    if offload == GPUOffloadEnum.Full:
+        items = [estimator.item(full)]
+    elif offload == GPUOffloadEnum.Disable:
+        items = [estimator.item(0)]
+    else:
+        items = [estimator.item(n) for n in range(full + 1)]
+
+    return GGUFParserOutput(
+        estimate=Estimate(
+            items=items,
+            architecture=lm.arch,
+            embeddingOnly=lm.embedding_only,
+            reranking=lm.reranking,
+            distributable=True,
+            contextSize=estimator.n_ctx,
+        ),
+        architecture=Architecture(type="model", architecture=lm.arch),
+    )
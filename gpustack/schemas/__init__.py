@@ -69,7 +69,11 @@ from gpustack.schemas.user_passwords import (  # noqa: F401  table registration
 )
 from gpustack.schemas.api_keys import ApiKey, ApiKeyCreate, ApiKeyPublic, ApiKeysPublic
 from gpustack.schemas.system_load import SystemLoad
-from gpustack.schemas.model_usage import ModelUsage
+from gpustack.schemas.model_usage import (  # noqa: F401  table registration
+    ModelUsage,
+    ModelUsageMonthly,
+    ModelUsageWeekly,
+)
 from gpustack.schemas.model_usage_details import (
     ModelUsageDetails,
     ModelUsageDetailsArchive,
@@ -251,6 +255,8 @@ __all__ = [
     "MemoryInfo",
     "SystemLoad",
     "ModelUsage",
+    "ModelUsageWeekly",
+    "ModelUsageMonthly",
     "MeteredUsage",
     "MeteredUsageArchive",
     "ResourceEvent",
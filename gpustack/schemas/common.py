@@ -32,6 +32,10 @@ class ListParams(BaseModel):
     # FIXME It uses camelCase but most APIs use snake_case. We might want to migrate to snake_case later.
     perPage: int = Query(default=100)
     watch: bool = Query(default=False)
+    since: Optional[str] = Query(
+        default=None,
+        description="With watch, the resource version to resume from. Frames then carry resource_version; an empty value starts from a snapshot.",
+    )
     sort_by: Optional[str] = Query(
         default=None,
         description="Sorting in the format: field1,-field2,field3. A leading '-' indicates descending order.",
@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Optional
 
 from pydantic import ConfigDict
-from sqlalchemy import BigInteger, Column, Integer
+from sqlalchemy import BigInteger, Integer, String, UniqueConstraint
 from sqlmodel import Field, SQLModel
 from gpustack.mixins.active_record import ActiveRecordMixin
 
@@ -18,8 +18,13 @@ class OperationEnum(str, Enum):
     AUDIO_TRANSCRIPTION = "audit_transcription"
 
 
-class ModelUsage(SQLModel, ActiveRecordMixin, table=True):
-    __tablename__ = 'model_usages'
+class ModelUsageBase(SQLModel):
+    """The columns ``model_usages`` shares with its weekly / monthly tiers.
+
+    ``sa_type`` rather than ``sa_column``: a ``Column`` object belongs to one
+    table, and these fields are inherited by three.
+    """
+
     id: Optional[int] = Field(default=None, primary_key=True)
     # FK-less on purpose — the whole table mirrors ``model_usage_details`` /
     # ``metered_usage``: a usage row is an attribution / audit record that must
@@ -28,30 +33,28 @@ class ModelUsage(SQLModel, ActiveRecordMixin, table=True):
     # raw ids preserves attribution, and the read path resolves "does this still
     # exist?" live (marking gone entities ``(Deleted)``). The ``*_name`` columns
     # hold display snapshots alongside for when an id no longer resolves.
-    user_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    user_id: Optional[int] = Field(default=None, sa_type=Integer)
     user_name: Optional[str] = Field(default=None)
-    model_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    model_id: Optional[int] = Field(default=None, sa_type=Integer)
     model_name: str = Field(default=...)
-    model_route_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    model_route_id: Optional[int] = Field(default=None, sa_type=Integer)
     model_route_name: Optional[str] = Field(default=None)
-    provider_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    provider_id: Optional[int] = Field(default=None, sa_type=Integer)
     provider_name: Optional[str] = Field(default=None)
     provider_type: Optional[str] = Field(default=None)
     cluster_name: Optional[str] = Field(default=None)
-    api_key_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    api_key_id: Optional[int] = Field(default=None, sa_type=Integer)
     api_key_name: Optional[str] = Field(default=None)
     access_key: Optional[str] = Field(default=None)
     api_key_is_custom: Optional[bool] = Field(default=None)
     # Tenant scope. Denormalized from the api_key/model used for the request.
     # This is the model/deployment owner principal.
     # NULL = global (admin acting in "All" mode). FK-less — see ``user_id``.
-    owner_principal_id: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    owner_principal_id: Optional[int] = Field(default=None, sa_type=Integer)
     # Consumer tenant scope, denormalized from the API key used for the request.
     # This can differ from owner_principal_id when one Org calls another Org's
     # shared models. FK-less — see ``user_id``.
-    consumer_principal_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer)
-    )
+    consumer_principal_id: Optional[int] = Field(default=None, sa_type=Integer)
     # Display-name + kind snapshot of the consumer principal, captured at
     # ingest so the Organization breakdown keeps showing the real name / can
     # tag personal (USER-kind) rows even after the principal is hard-deleted —
@@ -62,18 +65,69 @@ class ModelUsage(SQLModel, ActiveRecordMixin, table=True):
     consumer_name: Optional[str] = Field(default=None)
     consumer_principal_kind: Optional[str] = Field(default=None)
     date: date
-    prompt_token_count: int = Field(
-        default=..., sa_column=Column(BigInteger, nullable=False)
-    )
-    completion_token_count: int = Field(
-        default=..., sa_column=Column(BigInteger, nullable=False)
-    )
+    prompt_token_count: int = Field(default=..., sa_type=BigInteger, nullable=False)
+    completion_token_count: int = Field(default=..., sa_type=BigInteger, nullable=False)
     prompt_cached_token_count: int = Field(
-        default=0, sa_column=Column(BigInteger, nullable=False, default=0)
-    )
-    request_count: int = Field(
-        default=..., sa_column=Column(BigInteger, nullable=False)
+        default=0,
+        sa_type=BigInteger,
+        nullable=False,
+        sa_column_kwargs={"default": 0},
     )
+    request_count: int = Field(default=..., sa_type=BigInteger, nullable=False)
     operation: Optional[OperationEnum] = Field(default=None)
 
     model_config = ConfigDict(protected_namespaces=())
+
+
+class ModelUsage(ModelUsageBase, ActiveRecordMixin, table=True):
+    __tablename__ = 'model_usages'
+
+
+class ModelUsageTierBase(ModelUsageBase):
+    """
+    ``model_usages`` pre-aggregated to one period per row.
+
+    One row per distinct ``model_usages`` column set within a period: every
+    column a breakdown can group, filter or count DISTINCT on is kept as is,
+    so any breakdown computed over these rows equals the same breakdown over
+    the daily rows it replaces. Only the counters are summed, and ``date``
+    keeps the LAST day of the period that row saw traffic — which is both what
+    Last Active reports and, by construction, a day inside ``period_start``'s
+    period, so re-bucketing it lands where the daily rows would.
+
+    ``key_hash`` digests those key columns (see ``usage_tiers.tier_key_hash``)
+    so that ``(period_start, key_hash)`` can be unique: the key columns are
+    nullable, and a unique index over them would treat NULLs as distinct. It
+    is what the flush upserts on.
+
+    Maintained by the usage flush in the same transaction as the daily row
+    and re-derived from ``model_usages`` by ``UsageTierMaintainer``; never
+    written by anything else. Plain ``SQLModel`` rather than
+    ``ActiveRecordMixin``: nothing watches these rows, and a bus event per
+    flushed increment would be pure overhead.
+    """
+
+    period_start: date = Field(index=True)
+    key_hash: str = Field(sa_type=String(64), nullable=False)
+
+
+class ModelUsageWeekly(ModelUsageTierBase, table=True):
+    """``model_usages`` summed per ISO week (Monday start)."""
+
+    __tablename__ = 'model_usage_weekly'
+    __table_args__ = (
+        UniqueConstraint(
+            "period_start", "key_hash", name="uq_model_usage_weekly_period_key"
+        ),
+    )
+
+
+class ModelUsageMonthly(ModelUsageTierBase, table=True):
+    """``model_usages`` summed per calendar month; ``period_start`` is the first."""
+
+    __tablename__ = 'model_usage_monthly'
+    __table_args__ = (
+        UniqueConstraint(
+            "period_start", "key_hash", name="uq_model_usage_monthly_period_key"
+        ),
+    )
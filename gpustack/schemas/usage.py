@@ -1,4 +1,4 @@
-from datetime import date as Date
+from datetime import date as Date, datetime
 from typing import List, Optional
 
 from pydantic import (
@@ -11,6 +11,7 @@ from pydantic import (
 
 from gpustack.api.exceptions import InvalidException
 from gpustack.schemas.common import Pagination
+from gpustack.utils.tabular_export import columnar_export_available
 
 USAGE_METRIC_INPUT_TOKENS = "input_tokens"
 USAGE_METRIC_OUTPUT_TOKENS = "output_tokens"
@@ -314,7 +315,17 @@ class UsageBreakdownResponse(BaseModel):
 
 USAGE_EXPORT_FORMAT_CSV = "csv"
 USAGE_EXPORT_FORMAT_XLSX = "xlsx"
-USAGE_EXPORT_FORMATS = {USAGE_EXPORT_FORMAT_CSV, USAGE_EXPORT_FORMAT_XLSX}
+# Columnar formats for BI tools and dataframes. Need the optional ``pyarrow``.
+USAGE_EXPORT_FORMAT_PARQUET = "parquet"
+USAGE_EXPORT_FORMAT_ARROW = "arrow"
+USAGE_EXPORT_COLUMNAR_FORMATS = {USAGE_EXPORT_FORMAT_PARQUET, USAGE_EXPORT_FORMAT_ARROW}
+# Formats written as the rows arrive — everything but xlsx.
+USAGE_EXPORT_STREAMING_FORMATS = {
+    USAGE_EXPORT_FORMAT_CSV,
+} | USAGE_EXPORT_COLUMNAR_FORMATS
+USAGE_EXPORT_FORMATS = {
+    USAGE_EXPORT_FORMAT_XLSX,
+} | USAGE_EXPORT_STREAMING_FORMATS
 
 USAGE_EXPORT_SPLIT_AUTO = "auto"
 USAGE_EXPORT_SPLITS = {USAGE_EXPORT_SPLIT_AUTO}
@@ -403,6 +414,13 @@ class UsageExportShape(BaseModel):
                 f"Unsupported format: {value}. "
                 f"Expected one of: {', '.join(sorted(USAGE_EXPORT_FORMATS))}"
             )
+        # Refused here rather than when the writer starts: by then the
+        # response status is committed and the error could only truncate it.
+        if value in USAGE_EXPORT_COLUMNAR_FORMATS and not columnar_export_available():
+            raise ValueError(
+                f"The {value} format needs the pyarrow package, which is not "
+                "installed on this server. Install the gpustack[export] extra."
+            )
         return value
 
     @field_validator("split")
@@ -579,3 +597,31 @@ class UsageExportEstimateResponse(BaseModel):
     # click cannot contradict the behaviour after it.
     exceeds_soft_limit: bool = False
     exceeds_hard_limit: bool = False
+
+
+USAGE_EXPORT_JOB_PENDING = "pending"
+USAGE_EXPORT_JOB_RUNNING = "running"
+USAGE_EXPORT_JOB_COMPLETED = "completed"
+USAGE_EXPORT_JOB_FAILED = "failed"
+USAGE_EXPORT_JOB_FINISHED_STATES = {USAGE_EXPORT_JOB_COMPLETED, USAGE_EXPORT_JOB_FAILED}
+
+
+class UsageExportJobPublic(BaseModel):
+    """A background export, as the client polls it.
+
+    ``rows_total`` is unknown (``None``) until the job has counted its sheets;
+    after that ``rows_written / rows_total`` is the progress bar. The file can
+    be downloaded once ``state`` is ``completed`` and until ``expires_at``.
+    """
+
+    id: str
+    state: str
+    format: str
+    filename: Optional[str] = None
+    rows_total: Optional[int] = None
+    rows_written: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
@@ -1,21 +1,27 @@
 from functools import partial
+import os
 from contextlib import asynccontextmanager
 import logging
 from pathlib import Path
 import aiohttp
 from fastapi import FastAPI
 from fastapi_cdn_host import patch_docs
+from starlette.datastructures import State
 
 from gpustack import __version__
 from fastapi.middleware.cors import CORSMiddleware
 from gpustack.api import exceptions, middlewares
 from gpustack.api.auth import BearerTokenAuthenticator
+from gpustack.client.worker_filesystem_client import (
+    close_pooled_worker_filesystem_client,
+)
 from gpustack.config.config import Config
 from gpustack import envs
 from gpustack.routes import ui
 from gpustack.routes.routes import api_router
 from gpustack.utils.forwarded import ForwardedHostPortMiddleware
 from gpustack.security import JWTManager
+from gpustack.server.export_jobs import ExportJobManager
 from gpustack.gateway.utils import worker_websocket_connect_callback
 from gpustack.websocket_proxy.message_server import MessageServerHandler
 from gpustack.extension import Plugin, iter_plugin_classes
@@ -27,17 +33,10 @@ def create_app(cfg: Config) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         app.state.server_config = cfg
-        connector = aiohttp.TCPConnector(
-            limit=envs.TCP_CONNECTOR_LIMIT,
-            force_close=True,
-        )
-        app.state.http_client = aiohttp.ClientSession(
-            connector=connector, trust_env=True
-        )
-        app.state.http_client_no_proxy = aiohttp.ClientSession(connector=connector)
+        open_http_clients(app.state)
         yield
-        await app.state.http_client.close()
-        await app.state.http_client_no_proxy.close()
+        await close_http_clients(app.state)
+        await close_pooled_worker_filesystem_client()
 
     app = FastAPI(
         title="GPUStack",
@@ -76,6 +75,7 @@ def create_app(cfg: Config) -> FastAPI:
 
     app.state.jwt_manager = JWTManager(cfg.jwt_secret_key)
     app.state.websocket_authenticator = BearerTokenAuthenticator()
+    app.state.export_jobs = ExportJobManager(os.path.join(cfg.data_dir, "exports"))
     app.state.message_server_handler = MessageServerHandler(
         listen_address=cfg.get_proxy_listen_address(cfg.get_advertise_address()),
         listen_port=cfg.api_port,
@@ -91,6 +91,21 @@ def create_app(cfg: Config) -> FastAPI:
     return app
 
 
+def open_http_clients(state: State):
+    """Set the shared ``http_client`` and ``http_client_no_proxy`` on ``state``."""
+    connector = aiohttp.TCPConnector(
+        limit=envs.TCP_CONNECTOR_LIMIT,
+        force_close=True,
+    )
+    state.http_client = aiohttp.ClientSession(connector=connector, trust_env=True)
+    state.http_client_no_proxy = aiohttp.ClientSession(connector=connector)
+
+
+async def close_http_clients(state: State):
+    await state.http_client.close()
+    await state.http_client_no_proxy.close()
+
+
 def _load_extension_plugins(app: FastAPI, cfg: Config):
     """Load extension plugins registered via entry points.
 
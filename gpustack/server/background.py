@@ -0,0 +1,151 @@
+"""Supervised child processes for the leader-only background services.
+
+With ``GPUSTACK_SERVER_PROCESS_MODE=multi`` the API process keeps serving
+requests and runs each group of background services (see
+``BACKGROUND_SERVICE_GROUPS`` in ``gpustack.server.server``) in a child process
+of its own, connected to it through a ``ProcessCoordinator`` relay.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from typing import Callable, Optional
+
+from gpustack import envs
+from gpustack.config.config import Config
+from gpustack.server.coordinator.process import ProcessCoordinator, RelayAddress
+
+logger = logging.getLogger(__name__)
+
+# Time a new process has to connect to the relay; it imports the server first.
+_STARTUP_GRACE = 120
+# How often the supervisor checks on its process.
+_CHECK_INTERVAL = 2
+# Restart delays: doubled after every restart of a process that did not stay up
+# for _STABLE_AFTER seconds, and reset once one does.
+_MIN_BACKOFF = 1
+_MAX_BACKOFF = 60
+_STABLE_AFTER = 300
+
+
+def run_background_services(
+    cfg: Config,
+    group: str,
+    address: RelayAddress,
+    operator_unix_path: Optional[str] = None,
+):
+    """Entry point of a background services process."""
+    from gpustack.config.config import set_global_config
+    from gpustack.logging import setup_logging
+    from gpustack.server.server import Server
+
+    setup_logging(cfg.debug)
+    set_global_config(cfg)
+    server = Server(config=cfg, worker_process=None)
+    try:
+        asyncio.run(
+            server.start_background_services(group, address, operator_unix_path)
+        )
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+class BackgroundServicesProcess:
+    """Runs one group of background services in a child process, and keeps it
+    running.
+
+    The process is restarted when it exits, or when the relay has not heard
+    from it for ``GPUSTACK_SERVER_BACKGROUND_PROCESS_TIMEOUT`` seconds: its
+    heartbeat runs on its event loop, so a process stuck in a synchronous call
+    misses it. The old process is always gone before the new one starts, so
+    the group's services never run twice.
+    """
+
+    def __init__(
+        self,
+        cfg: Config,
+        group: str,
+        coordinator: ProcessCoordinator,
+        operator_unix_path: Optional[str] = None,
+        target: Callable = run_background_services,
+    ):
+        self._cfg = cfg
+        self._group = group
+        self._coordinator = coordinator
+        self._operator_unix_path = operator_unix_path
+        self._target = target
+        self._process: Optional[multiprocessing.Process] = None
+        self._started_at = 0.0
+        self.restarts = 0
+
+    @property
+    def name(self) -> str:
+        return f"background-{self._group}"
+
+    def _start(self):
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=self._target,
+            args=(
+                self._cfg,
+                self._group,
+                self._coordinator.address,
+                self._operator_unix_path,
+            ),
+            name=self.name,
+            daemon=True,
+        )
+        self._process.start()
+        self._started_at = time.monotonic()
+        logger.info(f"Started {self.name} process (pid {self._process.pid}).")
+
+    async def _stop(self):
+        process = self._process
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+            await asyncio.to_thread(process.join, 5)
+            if process.is_alive():
+                process.kill()
+        await asyncio.to_thread(process.join)
+        self._process = None
+
+    def _unhealthy_reason(self) -> Optional[str]:
+        if not self._process.is_alive():
+            return f"exited with code {self._process.exitcode}"
+
+        now = time.monotonic()
+        last_seen = self._coordinator.last_seen(self._group)
+        if last_seen is None or last_seen < self._started_at:
+            if now - self._started_at > _STARTUP_GRACE:
+                return f"did not connect within {_STARTUP_GRACE}s"
+            return None
+        silent = now - last_seen
+        if silent > envs.SERVER_BACKGROUND_PROCESS_TIMEOUT:
+            return f"has not been heard from for {silent:.0f}s"
+        return None
+
+    async def run(self):
+        backoff = _MIN_BACKOFF
+        self._start()
+        try:
+            while True:
+                await asyncio.sleep(_CHECK_INTERVAL)
+                reason = self._unhealthy_reason()
+                if reason is None:
+                    continue
+
+                if time.monotonic() - self._started_at > _STABLE_AFTER:
+                    backoff = _MIN_BACKOFF
+                logger.error(
+                    f"{self.name} process {reason}, restarting it in {backoff}s."
+                )
+                await self._stop()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+                self.restarts += 1
+                self._start()
+        finally:
+            await self._stop()
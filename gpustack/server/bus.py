@@ -1,9 +1,12 @@
 import asyncio
+import dataclasses
 import logging
+import secrets
+from collections import deque
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
-from gpustack.envs import EVENT_BUS_SUBSCRIBER_QUEUE_SIZE
+from gpustack.envs import EVENT_BUS_EVENT_LOG_SIZE, EVENT_BUS_SUBSCRIBER_QUEUE_SIZE
 
 # Re-export from coordinator.base for backward compatibility
 from gpustack.server.coordinator.base import Event, EventType
@@ -36,6 +39,7 @@ __all__ = [
     'Event',
     'EventType',
     'EventCountKind',
+    'EventLog',
     'Subscriber',
     'EventBus',
     'event_bus',
@@ -50,6 +54,33 @@ def event_decoder(obj):
     return obj
 
 
+class EventLog:
+    """Bounded history of the events routed on one topic.
+
+    Each routed event gets the next sequence number. A watch that knows the
+    last sequence it saw can be sent just the events after it, as long as
+    they are still retained.
+    """
+
+    def __init__(self, size: int):
+        self._entries: Deque[Tuple[int, Event]] = deque(maxlen=size)
+        self.last_seq = 0
+
+    def append(self, event: Event) -> int:
+        self.last_seq += 1
+        self._entries.append((self.last_seq, event))
+        return self.last_seq
+
+    def since(self, seq: int) -> Optional[List[Event]]:
+        """Events after ``seq``, or None if some of them were truncated."""
+        if seq > self.last_seq:
+            return None
+        oldest = self._entries[0][0] if self._entries else self.last_seq + 1
+        if seq < oldest - 1:
+            return None
+        return [event for entry_seq, event in self._entries if entry_seq > seq]
+
+
 class Subscriber:
     """A bus subscriber owning its own bounded queue.
 
@@ -159,7 +190,16 @@ class Subscriber:
         event = await self.queue.get()
         if event.type == EventType.UPDATED and event.id is not None:
             async with self.lock:
-                return self.latest_by_key.pop(event.id, event)
+                latest = self.latest_by_key.pop(event.id, event)
+            if latest is not event and event.resource_version is not None:
+                # The coalesced event is delivered in the queued one's slot,
+                # so it carries the queued one's version. Resuming from it
+                # replays the events queued in between instead of skipping
+                # them.
+                latest = dataclasses.replace(
+                    latest, resource_version=event.resource_version
+                )
+            return latest
 
         return event
 
@@ -224,6 +264,10 @@ class EventBus:
         # ``(topic, source, kind, event_type)`` — a bounded label space, so
         # this dict cannot grow without limit.
         self.retired_event_counts: Dict[Tuple[str, str, str, str], int] = {}
+        # Identifies this process's event logs. A resource version minted by
+        # another server, or before a restart, never resumes here.
+        self.epoch = secrets.token_hex(4)
+        self.event_logs: Dict[str, EventLog] = {}
 
     def _spawn(self, coro) -> asyncio.Task:
         """``asyncio.create_task`` plus retain-and-discard bookkeeping."""
@@ -431,10 +475,52 @@ class EventBus:
         pending enqueue tasks on slow consumers. UPDATED is naturally
         bounded by ``latest_by_key`` coalescing.
         """
+        self._record(event, topic)
         if topic in self.subscribers:
             for subscriber in self.subscribers[topic]:
                 self._spawn(subscriber.enqueue(event))
 
+    def _record(self, event: Event, topic: str):
+        """Append the event to the topic's log and stamp its version."""
+        if EVENT_BUS_EVENT_LOG_SIZE <= 0:
+            return
+        log = self.event_logs.get(topic)
+        if log is None:
+            log = self.event_logs[topic] = EventLog(EVENT_BUS_EVENT_LOG_SIZE)
+        event.resource_version = self._format_version(log.append(event))
+
+    def _format_version(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def parse_version(self, resource_version: Optional[str]) -> Optional[int]:
+        """The sequence number of a version minted by this bus, else None."""
+        epoch, _, seq = (resource_version or "").partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def position(self, topic: str) -> str:
+        """The version of the last event routed on ``topic``."""
+        log = self.event_logs.get(topic)
+        return self._format_version(log.last_seq if log else 0)
+
+    def events_since(
+        self, topic: str, resource_version: Optional[str]
+    ) -> Optional[List[Event]]:
+        """Events routed on ``topic`` after ``resource_version``.
+
+        None means the caller can't resume: the version is empty, was minted
+        by another server or before a restart, or its successors have already
+        been truncated from the log.
+        """
+        seq = self.parse_version(resource_version)
+        if seq is None or EVENT_BUS_EVENT_LOG_SIZE <= 0:
+            return None
+        log = self.event_logs.get(topic)
+        if log is None:
+            return [] if seq == 0 else None
+        return log.since(seq)
+
     def unsubscribe(self, topic: str, subscriber: Subscriber):
         """Unsubscribe from a topic.
 
@@ -6,7 +6,6 @@ from urllib.parse import urlparse
 from pathlib import Path
 from fastapi import APIRouter
 import requests
-import yaml
 
 from gpustack.schemas.model_sets import (
     Catalog,
@@ -15,7 +14,7 @@ from gpustack.schemas.model_sets import (
     ModelSetPublic,
     ModelSpec,
 )
-from gpustack.utils import file
+from gpustack.utils import file, yaml_loader
 from gpustack.utils.compat_importlib import pkg_resources
 
 logger = logging.getLogger(__name__)
@@ -58,10 +57,10 @@ def init_model_catalog(model_catalog_file: Optional[str] = None):
         if parsed_url.scheme in ("http", "https"):
             response = requests.get(model_catalog_file)
             response.raise_for_status()
-            raw_data = yaml.safe_load(response.text)
+            raw_data = yaml_loader.safe_load(response.text)
         else:
             with open(model_catalog_file, "r") as f:
-                raw_data = yaml.safe_load(f)
+                raw_data = yaml_loader.safe_load(f)
 
         global model_catalog
         model_catalog = Catalog(**raw_data)
@@ -1,8 +1,9 @@
+import hashlib
 import logging
+import os
 import random
 import string
 import asyncio
-import yaml
 from importlib.resources import files
 from functools import partial
 from typing import Any, Dict, Iterable, List, Tuple, Optional, Set
@@ -93,7 +94,8 @@ from gpustack.schemas.users import (
 from gpustack.server.bus import Event, EventType, event_bus
 from gpustack.server.cache import delete_cache_by_key
 from gpustack.utils.model_source import get_draft_model_source
-from gpustack import envs
+from gpustack.utils import yaml_loader
+from gpustack import __version__, envs
 from gpustack.server.db import async_session
 from gpustack.server.services import (
     ModelFileService,
@@ -1100,18 +1102,26 @@ def flatten_destinations(
     weight_to_count: List[Tuple[int, int, mcp_handler.DestinationTupleList]],
     max_weight: Optional[int] = 0,
 ) -> mcp_handler.DestinationTupleList:
-    persentage_list = mcp_handler.hamilton_calculate_weight(
+    registry_list = [
+        (model_name, registry)
+        for _, _, registry_list_part in weight_to_count
+        for _, model_name, registry in registry_list_part
+    ]
+    # One percentage per registry, apportioned from the exact weights of its
+    # instances, so the annotation stays whole percentages summing to 100.
+    persentage_list = mcp_handler.traffic_percentages(
         [(weight, count) for weight, count, _ in weight_to_count],
         max_weight=max_weight,
+        destination_sizes=[
+            count
+            for _, _, registry_list_part in weight_to_count
+            for count, _, _ in registry_list_part
+        ],
     )
     flatten_registry_list: mcp_handler.DestinationTupleList = []
-    index = 0
-    for _, _, registry_list_part in weight_to_count:
-        for count, model_name, registry in registry_list_part:
-            total_percentage = sum(persentage_list[index : index + count])
-            index += count
-            if total_percentage != 0:
-                flatten_registry_list.append((total_percentage, model_name, registry))
+    for percentage, (model_name, registry) in zip(persentage_list, registry_list):
+        if percentage != 0:
+            flatten_registry_list.append((percentage, model_name, registry))
     return flatten_registry_list
 
 
@@ -1535,6 +1545,13 @@ class InferenceBackendController:
     Inference backend controller initializes built-in and community backends in the database.
     """
 
+    def __init__(self, cfg: Config):
+        # Digest of the community backends last loaded into the database by
+        # this server, so that an unchanged file is not upserted again.
+        self._community_digest_file = os.path.join(
+            cfg.data_dir, "community-inference-backends.sha256"
+        )
+
     async def start(self):
         async with async_session() as session:
             # Initialize built-in backends
@@ -1600,7 +1617,9 @@ class InferenceBackendController:
                 )
                 return
 
-            yaml_data = yaml.safe_load(yaml_file.read_text())
+            content = yaml_file.read_bytes()
+            digest = hashlib.sha256(__version__.encode() + content).hexdigest()
+            yaml_data = yaml_loader.safe_load(content)
 
             if not yaml_data:
                 logger.debug(
@@ -1615,12 +1634,11 @@ class InferenceBackendController:
                 return
 
             # Collect backend names from YAML
-            yaml_backend_names = set()
-            for backend_config in yaml_data:
-                backend_name = backend_config.get("backend_name")
-                if backend_name:
-                    yaml_backend_names.add(backend_name)
-                await self._upsert_community_backend(session, backend_config)
+            yaml_backend_names = {
+                backend_config.get("backend_name")
+                for backend_config in yaml_data
+                if backend_config.get("backend_name")
+            }
 
             # Query all community backends from database. Only Platform
             # rows are owned by the catalog yaml; Org-private community
@@ -1633,6 +1651,19 @@ class InferenceBackendController:
                 and backend.owner_principal_id is None
             ]
 
+            # Unchanged since the last load, and every row still there (the
+            # database may have been replaced under the same data dir).
+            if self._read_community_digest() == digest and yaml_backend_names == {
+                backend.backend_name for backend in db_community_backends
+            }:
+                logger.debug(
+                    "community-inference-backends.yaml unchanged, skipping community backend initialization"
+                )
+                return
+
+            for backend_config in yaml_data:
+                await self._upsert_community_backend(session, backend_config)
+
             # Delete community backends that are no longer in YAML
             for backend in db_community_backends:
                 if backend.backend_name in yaml_backend_names:
@@ -1671,6 +1702,7 @@ class InferenceBackendController:
                         f"(no longer in community-inference-backends.yaml)"
                     )
 
+            self._write_community_digest(digest)
             logger.debug(
                 "Community backends initialized from community-inference-backends.yaml"
             )
@@ -1683,6 +1715,20 @@ class InferenceBackendController:
         except Exception as e:
             logger.error(f"Failed to initialize community backends: {e}")
 
+    def _read_community_digest(self) -> Optional[str]:
+        try:
+            with open(self._community_digest_file, "r") as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _write_community_digest(self, digest: str):
+        try:
+            with open(self._community_digest_file, "w") as f:
+                f.write(digest)
+        except OSError as e:
+            logger.warning(f"Failed to record community backends digest: {e}")
+
     async def _upsert_community_backend(self, session: AsyncSession, config: dict):
         """Create or update a community backend from YAML configuration."""
         backend_name = config.get("backend_name")
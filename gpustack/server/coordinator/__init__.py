@@ -19,10 +19,12 @@ Usage:
 
 from gpustack.server.coordinator.base import Coordinator, Event, EventType
 from gpustack.server.coordinator.local import LocalCoordinator
+from gpustack.server.coordinator.process import ProcessCoordinator
 
 __all__ = [
     'Coordinator',
     'Event',
     'EventType',
     'LocalCoordinator',
+    'ProcessCoordinator',
 ]
@@ -21,6 +21,9 @@ class EventType(Enum):
     DELETED = 3
     UNKNOWN = 4
     HEARTBEAT = 5
+    # Marks a watch stream's position; only sent to streams opened with
+    # ``since``. See ``ActiveRecordMixin.subscribe``.
+    BOOKMARK = 6
 
     def __str__(self):
         return self.name
@@ -32,6 +35,9 @@ class Event:
     data: Any
     changed_fields: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
     id: Optional[Any] = None
+    # Position in this server's per-topic event log, stamped when the event
+    # is routed. Opaque to clients, which echo it back as ``since``.
+    resource_version: Optional[str] = None
 
     def __post_init__(self):
         if isinstance(self.type, int):
@@ -0,0 +1,202 @@
+"""
+Process Coordinator - Multi-Process Single-Node Implementation.
+
+Used when one server runs its leader-only background services in child
+processes (``GPUSTACK_SERVER_PROCESS_MODE=multi``). The API process hosts a
+relay on a loopback socket, and every background services process connects to
+it. Events cross the relay in their ID-only ``Event.to_dict()`` form, exactly
+as they cross instances with a distributed coordinator, so the receiving
+``EventBus`` fetches the rows from the shared database.
+
+Leadership is fixed by role: the background processes run the leader-only
+services and the API process never does.
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from gpustack.server.coordinator.base import Coordinator, Event
+
+logger = logging.getLogger(__name__)
+
+# How often a background process tells the relay it is alive.
+HEARTBEAT_INTERVAL = 5
+
+# A peer that lets this much pile up unread is stuck; it is dropped rather
+# than letting the API process buffer events for it without bound.
+_MAX_BUFFERED_BYTES = 16 * 1024 * 1024
+
+# Address of a relay: host, port and the token peers present to it.
+RelayAddress = Tuple[str, int, str]
+
+
+class ProcessCoordinator(Coordinator):
+    """
+    Coordinator for the processes of one server.
+
+    Created with no ``address`` it is the relay, in the API process; created
+    with the relay's ``address`` it is a peer named ``name``, in a background
+    services process.
+    """
+
+    def __init__(
+        self,
+        config: Any = None,
+        address: Optional[RelayAddress] = None,
+        name: str = "",
+        **kwargs,
+    ):
+        super().__init__(config, **kwargs)
+        self._address = address
+        self._name = name
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._relay_address: Optional[RelayAddress] = None
+        # Relay side: connected peers and when each was last heard from.
+        self._peers: Dict[str, asyncio.StreamWriter] = {}
+        self._last_seen: Dict[str, float] = {}
+        # Peer side: the connection to the relay.
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._disconnected = asyncio.Event()
+        self._tasks = set()
+
+    @property
+    def is_relay(self) -> bool:
+        return self._address is None
+
+    @property
+    def address(self) -> Optional[RelayAddress]:
+        """Address background processes connect to, once the relay started."""
+        return self._relay_address if self.is_relay else self._address
+
+    async def start(self):
+        if self.is_relay:
+            token = secrets.token_hex(16)
+            self._server = await asyncio.start_server(
+                lambda r, w: self._serve_peer(r, w, token), "127.0.0.1", 0
+            )
+            port = self._server.sockets[0].getsockname()[1]
+            self._relay_address = ("127.0.0.1", port, token)
+            logger.debug(f"Process coordinator relay listening on port {port}")
+            return
+
+        host, port, token = self._address
+        reader, self._writer = await asyncio.open_connection(host, port)
+        self._send(self._writer, {"hello": self._name, "token": token})
+        self._is_leader = True
+        self._spawn(self._read_relay(reader))
+        self._spawn(self._heartbeat())
+        logger.debug(f"Process coordinator connected to relay as {self._name}")
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+        for writer in [self._writer, *self._peers.values()]:
+            if writer is not None:
+                writer.close()
+        self._peers.clear()
+        self._disconnected.set()
+
+    # Leader Election - fixed by role
+    async def acquire_leadership(self, ttl: int) -> bool:
+        return self._is_leader
+
+    async def renew_leadership(self, ttl: int) -> bool:
+        return self._is_leader
+
+    async def release_leadership(self):
+        self._is_leader = False
+
+    # Pub/Sub
+    async def publish(self, channel: str, event: Event):
+        """Notify local subscribers, then every other process of this server."""
+        self._notify_local_subscribers(channel, event)
+        message = {"channel": channel, "event": event.to_dict()}
+        if self.is_relay:
+            for name in list(self._peers):
+                self._forward(name, message)
+        elif self._writer is not None:
+            self._send(self._writer, message)
+
+    def last_seen(self, name: str) -> Optional[float]:
+        """Monotonic time the relay last heard from peer ``name``."""
+        return self._last_seen.get(name)
+
+    async def wait_disconnected(self):
+        """Return once a peer has lost its connection to the relay."""
+        await self._disconnected.wait()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, message: Dict):
+        writer.write(json.dumps(message, default=str).encode() + b"\n")
+
+    def _forward(self, name: str, message: Dict):
+        writer = self._peers.get(name)
+        if writer is None:
+            return
+        if writer.transport.get_write_buffer_size() > _MAX_BUFFERED_BYTES:
+            logger.error(f"Process {name} stopped reading events, dropping it")
+            writer.close()
+            self._peers.pop(name, None)
+            return
+        self._send(writer, message)
+
+    def _receive(self, message: Dict):
+        event = Event.from_dict(message["event"])
+        self._notify_local_subscribers(message["channel"], event)
+
+    async def _serve_peer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, token: str
+    ):
+        name = None
+        try:
+            hello = json.loads(await reader.readline() or "{}")
+            if not secrets.compare_digest(str(hello.get("token", "")), token):
+                logger.warning("Rejected a process coordinator peer: bad token")
+                return
+            name = str(hello.get("hello"))
+            self._peers[name] = writer
+            self._last_seen[name] = time.monotonic()
+            logger.debug(f"Process {name} connected to the coordinator relay")
+
+            while line := await reader.readline():
+                self._last_seen[name] = time.monotonic()
+                message = json.loads(line)
+                if "channel" not in message:
+                    continue
+                self._receive(message)
+                for other in list(self._peers):
+                    if other != name:
+                        self._forward(other, message)
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Process {name} coordinator connection failed: {e}")
+        finally:
+            if name is not None and self._peers.get(name) is writer:
+                del self._peers[name]
+                logger.debug(f"Process {name} disconnected from the relay")
+            writer.close()
+
+    async def _read_relay(self, reader: asyncio.StreamReader):
+        try:
+            while line := await reader.readline():
+                self._receive(json.loads(line))
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Coordinator relay connection failed: {e}")
+        finally:
+            self._disconnected.set()
+
+    async def _heartbeat(self):
+        while not self._writer.is_closing():
+            self._send(self._writer, {"heartbeat": time.time()})
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
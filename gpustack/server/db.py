@@ -1,7 +1,41 @@
+import asyncio
+import logging
+import time
+from typing import Annotated, Optional
+
+from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from gpustack import envs
+
+logger = logging.getLogger(__name__)
+
 engine = None
 
+# Optional read-only engine for reporting (usage / resource-usage breakdowns,
+# their exports, dashboard aggregates). ``None`` unless the server was started
+# with ``--analytics-database-url``; everything routed here falls back to
+# ``engine`` whenever this is unset, unreachable or lagging too far.
+analytics_engine = None
+
+# How long one replication-lag verdict is trusted. Internal, not tunable: it
+# only bounds how quickly a replica that fell behind (or caught up) is noticed,
+# and checking per request would put a round trip in front of every report.
+ANALYTICS_LAG_CHECK_INTERVAL_SECONDS = 10
+
+_POSTGRES_LAG_SQL = text(
+    # An idle primary writes nothing, so the last replayed transaction ages
+    # even on a replica that is fully caught up. Received == replayed means
+    # there is nothing left to apply, which is lag 0 whatever the timestamp.
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
 
 async def get_session():
     """
@@ -25,3 +59,122 @@ def async_session() -> AsyncSession:
         raise RuntimeError("Database not initialized. Call init_database() first.")
 
     return AsyncSession(engine, expire_on_commit=False)
+
+
+class _AnalyticsRouter:
+    """Decides, per request, whether reporting may run on the analytics engine.
+
+    The verdict is cached for :data:`ANALYTICS_LAG_CHECK_INTERVAL_SECONDS` and
+    refreshed by at most one caller at a time, so a burst of dashboard loads
+    costs one lag probe rather than one each. Anything that goes wrong while
+    probing counts as "not usable": a report served from the primary is slower,
+    a report that fails is useless.
+    """
+
+    def __init__(self):
+        self._usable = False
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def reset(self):
+        self._usable = False
+        self._checked_at = None
+
+    async def usable(self, replica: AsyncEngine) -> bool:
+        if not self._stale():
+            return self._usable
+        async with self._lock:
+            if self._stale():
+                usable = await self._probe(replica)
+                if usable != self._usable:
+                    logger.info(
+                        "Analytics queries now served by the %s database.",
+                        "analytics" if usable else "primary",
+                    )
+                self._usable = usable
+                self._checked_at = time.monotonic()
+        return self._usable
+
+    @property
+    def last_verdict(self) -> bool:
+        """The cached answer, without probing even if it has expired."""
+        return self._usable
+
+    def _stale(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at
+            >= ANALYTICS_LAG_CHECK_INTERVAL_SECONDS
+        )
+
+    async def _probe(self, replica: AsyncEngine) -> bool:
+        try:
+            lag = await replication_lag_seconds(replica)
+        except Exception as e:
+            logger.warning(f"Analytics database unavailable, using primary: {e}")
+            return False
+        tolerance = envs.DB_ANALYTICS_MAX_STALENESS_SECONDS
+        if lag is None or (tolerance > 0 and lag > tolerance):
+            logger.warning(
+                "Analytics database is %s, using primary.",
+                (
+                    "not replicating"
+                    if lag is None
+                    else f"{lag:.0f}s behind (tolerance {tolerance}s)"
+                ),
+            )
+            return False
+        return True
+
+
+_analytics_router = _AnalyticsRouter()
+
+
+async def replication_lag_seconds(replica: AsyncEngine) -> Optional[float]:
+    """How far ``replica`` trails its primary, ``None`` if it has stopped.
+
+    A database that is not a replica at all reports 0 — pointing the analytics
+    URL at the primary itself (or at a dialect without replication status) is
+    a legitimate way to get a second, separately sized pool.
+    """
+    dialect = replica.dialect.name
+    async with replica.connect() as conn:
+        if dialect == "postgresql":
+            lag = (await conn.execute(_POSTGRES_LAG_SQL)).scalar()
+            return float(lag or 0)
+        if dialect == "mysql":
+            row = (await conn.execute(text("SHOW REPLICA STATUS"))).mappings().first()
+            if row is None:
+                return 0.0
+            lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+            return None if lag is None else float(lag)
+    return 0.0
+
+
+async def get_analytics_session(
+    primary: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Session dependency for read-only reporting endpoints.
+
+    Depends on :func:`get_session` so that without an analytics engine the
+    request gets exactly the session it always had. That costs nothing when
+    the replica is used instead: an ``AsyncSession`` only checks a connection
+    out on its first statement, and ``primary`` never runs one.
+    """
+    if analytics_engine is None or not await _analytics_router.usable(analytics_engine):
+        yield primary
+        return
+    async with AsyncSession(analytics_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def analytics_session() -> AsyncSession:
+    """:func:`async_session` for code that runs alongside an analytics query.
+
+    Follows whatever the router last decided without probing, so a stream
+    that is already running on the replica resolves names there too instead
+    of mixing two snapshots mid-file.
+    """
+    if analytics_engine is not None and _analytics_router.last_verdict:
+        return AsyncSession(analytics_engine, expire_on_commit=False)
+    return async_session()
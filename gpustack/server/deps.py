@@ -8,12 +8,16 @@ from gpustack.api.tenant import (
     get_tenant_context,
     require_platform_admin,
 )
-from gpustack.server.db import get_session
+from gpustack.server.db import get_analytics_session, get_session
+from gpustack.server.export_jobs import ExportJobManager, get_export_jobs
 from gpustack.schemas.common import ListParams
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+# Read-only reporting endpoints; see ``get_analytics_session``.
+AnalyticsSessionDep = Annotated[AsyncSession, Depends(get_analytics_session)]
 ListParamsDep = Annotated[ListParams, Depends(ListParams)]
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
 CurrentAdminUserDep = Annotated[User, Depends(get_admin_user)]
 TenantContextDep = Annotated[TenantContext, Depends(get_tenant_context)]
 PlatformAdminDep = Annotated[TenantContext, Depends(require_platform_admin)]
+ExportJobsDep = Annotated[ExportJobManager, Depends(get_export_jobs)]
@@ -0,0 +1,286 @@
+"""Background export jobs: a usage export written to disk, not down a request.
+
+``/breakdown/export`` streams straight into the response, which is why it has
+limits at all: the request, the row cursor and a second connection for name
+lookups are all held for as long as the client takes to read the file, and a
+dropped connection throws the whole aggregate away. A job runs the same
+:class:`~gpustack.utils.export_delivery.ExportArtifact` into a file under
+``<data_dir>/exports`` instead, so:
+
+* at most ``USAGE_EXPORT_JOB_CONCURRENCY`` exports hold connections at once,
+  however many are submitted — the rest wait for a slot, holding nothing;
+* memory is what the streaming writers already bound it to, whatever the row
+  count;
+* the finished file is served with HTTP Range support, so an interrupted
+  download resumes instead of restarting the export.
+
+The registry is in memory and per process. A job is polled and downloaded from
+the server that accepted it; a restart forgets unfinished jobs, and the files
+they left behind are swept by age like any other expired export.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import secrets
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+)
+
+import aiofiles
+import aiofiles.os
+from fastapi import Request
+
+from gpustack import envs
+from gpustack.api.exceptions import HTTPException, InvalidException, NotFoundException
+from gpustack.schemas.usage import (
+    USAGE_EXPORT_JOB_COMPLETED,
+    USAGE_EXPORT_JOB_FAILED,
+    USAGE_EXPORT_JOB_FINISHED_STATES,
+    USAGE_EXPORT_JOB_PENDING,
+    USAGE_EXPORT_JOB_RUNNING,
+    UsageExportJobPublic,
+)
+from gpustack.utils.export_delivery import ExportArtifact
+
+logger = logging.getLogger(__name__)
+
+_PARTIAL_SUFFIX = ".part"
+
+
+@dataclass
+class ExportJob:
+    id: str
+    owner_id: int
+    format: str
+    created_at: datetime
+    state: str = USAGE_EXPORT_JOB_PENDING
+    filename: Optional[str] = None
+    media_type: Optional[str] = None
+    rows_total: Optional[int] = None
+    rows_written: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+    finished_at: Optional[datetime] = None
+    path: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def expires_at(self, ttl_seconds: int) -> Optional[datetime]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at + timedelta(seconds=ttl_seconds)
+
+    def counted(
+        self, rows: Callable[[], AsyncIterator[Sequence[Any]]]
+    ) -> Callable[[], AsyncIterator[Sequence[Any]]]:
+        """Wrap a plan's row factory so every row it yields moves the progress."""
+
+        async def _rows():
+            source = rows()
+            async with contextlib.aclosing(source):
+                async for row in source:
+                    self.rows_written += 1
+                    yield row
+
+        return _rows
+
+    def to_public(self, ttl_seconds: int) -> UsageExportJobPublic:
+        return UsageExportJobPublic(
+            id=self.id,
+            state=self.state,
+            format=self.format,
+            filename=self.filename,
+            rows_total=self.rows_total,
+            rows_written=self.rows_written,
+            bytes_written=self.bytes_written,
+            error=self.error,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            expires_at=self.expires_at(ttl_seconds),
+        )
+
+
+# Opened once the job has a slot: whatever it needs (sessions, counts) lives
+# inside the context, so nothing is held while the job waits in line.
+ArtifactSource = Callable[[ExportJob], AsyncContextManager[ExportArtifact]]
+
+
+class ExportJobManager:
+    def __init__(
+        self,
+        directory: str,
+        *,
+        concurrency: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        self._directory = directory
+        self._slots = asyncio.Semaphore(
+            max(1, concurrency or envs.USAGE_EXPORT_JOB_CONCURRENCY)
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else envs.USAGE_EXPORT_JOB_TTL_SECONDS
+        )
+        self._jobs: Dict[str, ExportJob] = {}
+
+    def submit(
+        self, owner_id: int, export_format: str, source: ArtifactSource
+    ) -> ExportJob:
+        active = sum(
+            1
+            for job in self._jobs.values()
+            if job.owner_id == owner_id
+            and job.state not in USAGE_EXPORT_JOB_FINISHED_STATES
+        )
+        if active >= envs.USAGE_EXPORT_JOB_MAX_ACTIVE_PER_USER:
+            raise InvalidException(
+                message=(
+                    f"Too many unfinished exports ({active}, limit "
+                    f"{envs.USAGE_EXPORT_JOB_MAX_ACTIVE_PER_USER}). Wait for one "
+                    "to finish or cancel it."
+                ),
+                details={
+                    "kind": "export_jobs_too_many",
+                    "total": active,
+                    "limit": envs.USAGE_EXPORT_JOB_MAX_ACTIVE_PER_USER,
+                },
+            )
+        job = ExportJob(
+            id=secrets.token_hex(16),
+            owner_id=owner_id,
+            format=export_format,
+            created_at=datetime.now(timezone.utc),
+        )
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, source))
+        return job
+
+    def get(self, job_id: str, owner_id: int) -> ExportJob:
+        """The caller's job. Someone else's is reported exactly like a missing one."""
+        job = self._jobs.get(job_id)
+        if job is None or job.owner_id != owner_id or self._expired(job, time.time()):
+            raise NotFoundException(message=f"Export job {job_id} not found")
+        return job
+
+    def completed_path(self, job: ExportJob) -> str:
+        if job.state != USAGE_EXPORT_JOB_COMPLETED or job.path is None:
+            raise InvalidException(
+                message=f"Export job {job.id} is {job.state}, not completed."
+            )
+        return job.path
+
+    async def cancel(self, job_id: str, owner_id: int) -> None:
+        """Stop a job if it is still running and delete whatever it wrote."""
+        job = self.get(job_id, owner_id)
+        await self._discard(job)
+
+    async def _discard(self, job: ExportJob) -> None:
+        self._jobs.pop(job.id, None)
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await job.task
+        if job.path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(job.path)
+
+    async def _run(self, job: ExportJob, source: ArtifactSource) -> None:
+        async with self._slots:
+            job.state = USAGE_EXPORT_JOB_RUNNING
+            await aiofiles.os.makedirs(self._directory, exist_ok=True)
+            partial_path = os.path.join(self._directory, job.id + _PARTIAL_SUFFIX)
+            started = time.monotonic()
+            try:
+                async with source(job) as artifact:
+                    job.filename = artifact.filename
+                    job.media_type = artifact.media_type
+                    # Through a worker thread: a synchronous write of a large
+                    # export's chunks would stall every request on the loop.
+                    async with aiofiles.open(partial_path, "wb") as f:
+                        async for chunk in artifact.chunks:
+                            await f.write(chunk)
+                            job.bytes_written += len(chunk)
+                path = os.path.join(self._directory, job.id)
+                await aiofiles.os.replace(partial_path, path)
+                job.path = path
+                job.state = USAGE_EXPORT_JOB_COMPLETED
+            except asyncio.CancelledError:
+                with contextlib.suppress(FileNotFoundError):
+                    await aiofiles.os.remove(partial_path)
+                raise
+            except Exception as e:
+                with contextlib.suppress(FileNotFoundError):
+                    await aiofiles.os.remove(partial_path)
+                job.state = USAGE_EXPORT_JOB_FAILED
+                # An HTTP error carries a message meant for the user (a sheet
+                # the caller may no longer read, say); anything else is ours.
+                if isinstance(e, HTTPException):
+                    job.error = e.message
+                else:
+                    job.error = "Export failed; see the server log for details."
+                    logger.exception(f"Usage export job {job.id} failed")
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+
+        logger.info(
+            "usage export job %s %s: rows=%d bytes=%d elapsed=%.1fs",
+            job.id,
+            job.state,
+            job.rows_written,
+            job.bytes_written,
+            time.monotonic() - started,
+        )
+
+    def _expired(self, job: ExportJob, now: float) -> bool:
+        expires_at = job.expires_at(self.ttl_seconds)
+        return expires_at is not None and expires_at.timestamp() <= now
+
+    async def collect_expired(self, now: Optional[float] = None) -> int:
+        """Forget expired jobs and delete every export file older than the TTL.
+
+        Files are swept by age rather than through the registry so that ones
+        left behind by a previous process (or a job cut short by a restart,
+        its ``.part`` included) go too.
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        for job in [j for j in self._jobs.values() if self._expired(j, now)]:
+            await self._discard(job)
+            removed += 1
+
+        live = {job.id for job in self._jobs.values()}
+        with contextlib.suppress(FileNotFoundError):
+            for entry in os.scandir(self._directory):
+                job_id = entry.name.removesuffix(_PARTIAL_SUFFIX)
+                if job_id in live or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime + self.ttl_seconds <= now:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(entry.path)
+                    removed += 1
+        return removed
+
+    async def start(self) -> None:
+        while True:
+            try:
+                removed = await self.collect_expired()
+                if removed:
+                    logger.debug(f"Removed {removed} expired usage export(s).")
+            except Exception as e:
+                logger.error(f"Usage export cleanup failed: {e}")
+            await asyncio.sleep(envs.USAGE_EXPORT_JOB_GC_INTERVAL_SECONDS)
+
+
+def get_export_jobs(request: Request) -> ExportJobManager:
+    return request.app.state.export_jobs
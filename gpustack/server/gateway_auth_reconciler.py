@@ -39,9 +39,18 @@ Expiry needs neither: ``exp`` travels in the entry itself and the plugin
 compares it against its own clock, so a key expiring changes nothing here. It
 is only dropped from the tables on the next pass, to stop dead rows from
 spending the entry budget.
+
+Past one CR's budget the tables are split by hash across
+``GATEWAY_AUTH_KEY_SHARDS`` CRs, given a plugin build that can tell a key held
+by another shard from an unknown one (see ``key_shard_count``). The
+recomputation stays whole -- sharding is applied to its output, never to what
+it reads -- and only the write is narrowed: a pass rewrites the shards whose
+content moved, so one revocation costs one CR write however many keys the
+deployment has.
 """
 
 import asyncio
+import hashlib
 import logging
 from datetime import datetime, timezone
 from functools import partial
@@ -60,9 +69,14 @@ from gpustack.gateway.client.extensions_higress_io_v1_api import (
 )
 from gpustack.gateway.client.networking_higress_io_v1_api import McpBridgeRegistry
 from gpustack.gateway.ext_auth import (
+    ext_auth_plugin_name,
     ext_auth_reconcile_spec_diff,
-    ext_auth_resource_name,
+    ext_auth_shard_resource_name,
+    ext_auth_shard_resource_prefix,
+    ext_auth_shard_spec_diff,
 )
+from gpustack.gateway.labels_annotations import managed_labels
+from gpustack.gateway.plugins import plugin_entry
 from gpustack.gateway.utils import ensure_wasm_plugin, route_ingress_names_for_plugins
 from gpustack.schemas.api_keys import ApiKey
 from gpustack.schemas.config import GatewayModeEnum
@@ -363,6 +377,92 @@ async def build_local_auth_tables(
     return keys, refs
 
 
+def key_shard(table_key: str, shards: int) -> int:
+    """The shard a ``keys`` or ``refs`` entry belongs in.
+
+    A hash of the entry's own table key, so where a key lives depends on
+    nothing but itself: adding or revoking one moves no other key, and only the
+    shard holding it has anything to rewrite. blake2b rather than ``hash()``,
+    which is salted per process and would reshuffle every shard on a restart.
+    """
+    digest = hashlib.blake2b(table_key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def key_shard_count(cfg: Config) -> int:
+    """``GATEWAY_AUTH_KEY_SHARDS``, or 1 with the bundled ext-auth plugin.
+
+    Every shard is an ext-auth filter of its own on each inference route, and
+    the bundled plugin sends a credential missing from its tables to the
+    server. N shards would then cost every request N-1 server round-trips,
+    far more auth traffic than the single CR they split. More than one is only
+    honoured with a plugin build set through ``gateway_plugin.<name>.url``,
+    which each shard tells its place (``local_auth.shard``) so it can pass on
+    keys hashed to another. Gateway initialization refuses the setting without
+    one (``validate_ext_auth_key_shards``); the fallback here covers a process
+    that did not initialize the gateway.
+    """
+    shards = envs.GATEWAY_AUTH_KEY_SHARDS
+    entry = plugin_entry(ext_auth_plugin_name, cfg)
+    if shards > 1 and (entry is None or not entry.url):
+        logger.error(
+            f"GPUSTACK_GATEWAY_AUTH_KEY_SHARDS={shards} needs an ext-auth plugin "
+            f"build that passes on keys held by other shards, set through "
+            f"gateway_plugin.{ext_auth_plugin_name}.url. The bundled plugin "
+            "would send each of them to the server; using a single shard."
+        )
+        return 1
+    return shards
+
+
+def shard_local_auth_tables(
+    keys: Dict[str, Any],
+    refs: Dict[str, Any],
+    shards: int,
+    max_entries: int,
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """``(keys, refs)`` split into ``shards`` tables of at most ``max_entries``.
+
+    The hash spreads entries evenly but not exactly, so a shard can come out
+    over the per-CR budget while the others have room. Its surplus goes to the
+    next shard that has room, and is logged: dropping it would send keys to
+    the server on every request while the budget as a whole still had room for
+    them. Entries arrive in id order, so the newest are the ones moved, and a
+    new key never displaces an older one. Only an entry past the budget of
+    every shard is left out, which ``build_local_auth_tables`` already rules
+    out by capping the total.
+    """
+    tables: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [
+        ({}, {}) for _ in range(shards)
+    ]
+    moved = dropped = 0
+    for index, source in enumerate((keys, refs)):
+        for table_key, entry in source.items():
+            home = key_shard(table_key, shards)
+            for step in range(shards):
+                shard = tables[(home + step) % shards]
+                if len(shard[0]) + len(shard[1]) < max_entries:
+                    shard[index][table_key] = entry
+                    moved += step > 0
+                    break
+            else:
+                dropped += 1
+    if moved:
+        logger.warning(
+            f"Gateway auth: {moved} API keys hashed into ext-auth shards at "
+            f"their {max_entries} entry budget and went to the next shard with "
+            "room. Raise GPUSTACK_GATEWAY_AUTH_KEY_SHARDS to give every key "
+            "room in its own shard."
+        )
+    if dropped:
+        logger.warning(
+            f"Gateway auth: {dropped} API keys found every ext-auth shard at its "
+            f"{max_entries} entry budget and are left out. They still "
+            "authenticate, via the server on every request."
+        )
+    return tables
+
+
 async def build_public_route_ids(session: AsyncSession) -> List[int]:
     """Ids of every PUBLIC route, which is the whole input to the rules.
 
@@ -435,13 +535,14 @@ def _is_public_policy(policy: Any) -> bool:
 
 
 class GatewayAuthReconciler:
-    """Writes the key tables and PUBLIC rules into the ext-auth CR."""
+    """Writes the key tables and PUBLIC rules into the ext-auth CRs."""
 
     def __init__(self, cfg: Config):
         self._config = cfg
         self._disabled = cfg.gateway_mode == GatewayModeEnum.disabled
         self._interval = envs.GATEWAY_AUTH_RECONCILE_INTERVAL_SECONDS
         self._budget = envs.GATEWAY_AUTH_MAX_CR_BYTES
+        self._shards = key_shard_count(cfg)
         self._flush_now = asyncio.Event()
         self._extensions_api: Optional[ExtensionsHigressIoV1Api] = None
         self._registry: Optional[McpBridgeRegistry] = None
@@ -462,6 +563,12 @@ class GatewayAuthReconciler:
         self._applied_state: Optional[
             Tuple[Dict[str, Any], Dict[str, Any], List[int]]
         ] = None
+        # The same again per shard, ``(keys, refs, public route ids)`` as last
+        # written to that shard's CR, which is what lets a pass skip the ones
+        # it would not change.
+        self._applied_shards: Dict[
+            int, Tuple[Dict[str, Any], Dict[str, Any], List[int]]
+        ] = {}
 
     async def start(self):
         if self._disabled:
@@ -596,22 +703,31 @@ class GatewayAuthReconciler:
 
     async def _flush_loop(self):
         while True:
+            periodic = False
             try:
                 await asyncio.wait_for(self._flush_now.wait(), timeout=self._interval)
             except asyncio.TimeoutError:
-                pass
+                periodic = True
             # Cleared before the work, not after: anything that arrives while
             # this pass runs sets it again and gets its own pass, instead of
             # being swallowed by a pass that had already read the database.
             self._flush_now.clear()
             try:
-                await self.reconcile()
+                await self.reconcile(full=periodic)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 logger.exception(f"Failed to reconcile gateway auth config: {e}")
 
-    async def reconcile(self):
+    async def reconcile(self, full: bool = True):
+        """One pass: recompute everything, write the shards that moved.
+
+        ``full`` also writes the shards that did not, through the usual
+        compare-and-skip. An event-driven pass can trust what it last wrote,
+        but the periodic one is what heals a CR edited or deleted by hand, and
+        what removes shards left over from a larger ``GATEWAY_AUTH_KEY_SHARDS``
+        -- which may still carry keys revoked since.
+        """
         async with async_session() as session:
             # Routes first: they decide how much of the shared budget is left
             # for keys.
@@ -626,29 +742,71 @@ class GatewayAuthReconciler:
                     "budget). They keep authorizing via the server per request."
                 )
                 public_route_ids = public_route_ids[:route_count]
-            keys, refs = await build_local_auth_tables(session, max_entries=max_entries)
+            # Every shard carries every PUBLIC rule, so the budget each one has
+            # left for keys is the same and the total scales with the count.
+            keys, refs = await build_local_auth_tables(
+                session, max_entries=max_entries * self._shards
+            )
         ingresses = public_route_ingresses(public_route_ids, self._config)
+        if self._shards == 1:
+            tables = [(keys, refs)]
+        else:
+            tables = shard_local_auth_tables(keys, refs, self._shards, max_entries)
+        remove_stale = full or not self._applied_shards
+
+        written = 0
+        failure: Optional[Exception] = None
+        for shard, (shard_keys, shard_refs) in enumerate(tables):
+            state = (shard_keys, shard_refs, public_route_ids)
+            if not full and self._applied_shards.get(shard) == state:
+                continue
+            # The first shard is the CR startup writes the static base of;
+            # the others belong to this reconciler outright.
+            spec_diff = (
+                ext_auth_reconcile_spec_diff if shard == 0 else ext_auth_shard_spec_diff
+            )
+            # ``ensure_wasm_plugin`` compares the rendered spec and skips the
+            # write when nothing moved, so an unchanged recomputation costs no
+            # CR write, no resourceVersion bump and no xDS push. That is what
+            # makes a seconds-level full recompute affordable.
+            try:
+                await ensure_wasm_plugin(
+                    api=self._extensions_api,
+                    name=ext_auth_shard_resource_name(shard),
+                    namespace=self._config.gateway_namespace,
+                    spec_diff=partial(
+                        spec_diff,
+                        keys=shard_keys,
+                        refs=shard_refs,
+                        shard=(shard, self._shards) if self._shards > 1 else None,
+                        public_route_ingresses=ingresses,
+                        cfg=self._config,
+                        # Only used to rebuild a CR that has gone missing, but
+                        # it has to be passed in: this module can import the
+                        # gateway package, ext_auth cannot import back into it.
+                        registry=self._registry,
+                    ),
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The other shards are still written: a revocation that landed
+                # in one of them should not wait on a CR it has nothing to do
+                # with.
+                failure = failure or e
+                self._applied_shards.pop(shard, None)
+                continue
+            self._applied_shards[shard] = state
+            written += 1
+        if remove_stale:
+            await self._remove_stale_shards()
+        if failure is not None:
+            # Some CRs may carry the new rules and some the old, so the set the
+            # event filter trusts no longer describes all of them. None makes
+            # it rule nothing out until a pass lands in full.
+            self._applied_public_route_ids = None
+            raise failure
 
-        # ``ensure_wasm_plugin`` compares the rendered spec and skips the write
-        # when nothing moved, so an unchanged recomputation costs no CR write,
-        # no resourceVersion bump and no xDS push. That is what makes a
-        # seconds-level full recompute affordable.
-        await ensure_wasm_plugin(
-            api=self._extensions_api,
-            name=ext_auth_resource_name,
-            namespace=self._config.gateway_namespace,
-            spec_diff=partial(
-                ext_auth_reconcile_spec_diff,
-                keys=keys,
-                refs=refs,
-                public_route_ingresses=ingresses,
-                cfg=self._config,
-                # Only used to rebuild a CR that has gone missing, but it has
-                # to be passed in: this module can import the gateway package,
-                # ext_auth cannot import back into it.
-                registry=self._registry,
-            ),
-        )
         # After the apply, never before: the event filter reads this as "what
         # the CR holds". A failed write leaves the old rules in place, and
         # recording the new set anyway would make the filter discard the very
@@ -663,7 +821,39 @@ class GatewayAuthReconciler:
         if (keys, refs, public_route_ids) != self._applied_state:
             logger.debug(
                 f"Gateway auth: {len(keys)} locally verifiable keys, "
-                f"{len(refs)} refs, {len(public_route_ids)} public routes."
+                f"{len(refs)} refs, {len(public_route_ids)} public routes; "
+                f"{written} of {self._shards} shards written."
             )
         self._applied_state = (keys, refs, public_route_ids)
         self._applied_public_route_ids = set(public_route_ids)
+
+    async def _remove_stale_shards(self):
+        """Delete shard CRs numbered past the current shard count.
+
+        They are left behind when ``GATEWAY_AUTH_KEY_SHARDS`` is lowered, and
+        nothing recomputes them any more, so a key revoked after the change
+        would keep authenticating through one. Failing here is logged rather
+        than raised: the tables themselves are already written, and the next
+        periodic pass tries again.
+        """
+        try:
+            plugins = await self._extensions_api.list_wasmplugins(
+                namespace=self._config.gateway_namespace,
+                label_selector=",".join(f"{k}={v}" for k, v in managed_labels.items()),
+            )
+            for item in plugins.get("items") or []:
+                name = (item.get("metadata") or {}).get("name") or ""
+                if not name.startswith(ext_auth_shard_resource_prefix):
+                    continue
+                suffix = name[len(ext_auth_shard_resource_prefix) :]
+                if not suffix.isdigit() or int(suffix) < self._shards:
+                    continue
+                await self._extensions_api.delete_wasmplugin(
+                    namespace=self._config.gateway_namespace, name=name
+                )
+                self._applied_shards.pop(int(suffix), None)
+                logger.info(f"Deleted stale gateway auth shard {name}.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Failed to remove stale gateway auth shards: {e}")
@@ -72,7 +72,32 @@ async def init_db(db_url: str):
     await create_db_and_tables(db.engine)
 
 
-async def init_db_engine(db_url: str):
+async def init_analytics_db(db_url: str):
+    """Open the read-only engine reporting queries are routed to.
+
+    No DDL and no metadata listeners: the schema belongs to the primary and
+    arrives here by replication. Only the query counter is attached, so
+    reporting load still shows up in the same place as everything else.
+    """
+    if db.analytics_engine is None:
+        db.analytics_engine = await init_db_engine(
+            db_url,
+            pool_size=envs.DB_ANALYTICS_POOL_SIZE,
+            max_overflow=envs.DB_ANALYTICS_MAX_OVERFLOW,
+            pool_timeout=envs.DB_ANALYTICS_POOL_TIMEOUT,
+        )
+        event.listen(
+            db.analytics_engine.sync_engine, "after_cursor_execute", count_query
+        )
+
+
+async def init_db_engine(
+    db_url: str,
+    *,
+    pool_size: int = envs.DB_POOL_SIZE,
+    max_overflow: int = envs.DB_MAX_OVERFLOW,
+    pool_timeout: int = envs.DB_POOL_TIMEOUT,
+):
     connect_args = {}
     if db_url.startswith("postgresql://"):
         # Probe once to see whether we're talking to openGauss — it presents
@@ -110,9 +135,9 @@ async def init_db_engine(db_url: str):
     engine = create_async_engine(
         db_url,
         echo=envs.DB_ECHO,
-        pool_size=envs.DB_POOL_SIZE,
-        max_overflow=envs.DB_MAX_OVERFLOW,
-        pool_timeout=envs.DB_POOL_TIMEOUT,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
         pool_pre_ping=True,
         connect_args=connect_args,
     )
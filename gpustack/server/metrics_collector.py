@@ -21,6 +21,7 @@ from gpustack.schemas.principals import (
     PrincipalType,
 )
 from gpustack.server.db import async_session
+from gpustack.server.usage_tiers import add_to_tiers
 from gpustack.utils.rollup_tz import resolve_rollup_tz
 from gpustack.utils.usage_snapshots import build_model_usage_snapshot
 
@@ -363,7 +364,8 @@ async def create_or_update_model_usage(
         },
     )
     if current_usage is None:
-        await metric.save(session=session, auto_commit=auto_commit)
+        await metric.save(session=session, auto_commit=False)
+        await add_to_tiers(session, metric, metric)
     else:
         current_usage.prompt_token_count += metric.prompt_token_count
         current_usage.completion_token_count += metric.completion_token_count
@@ -376,7 +378,10 @@ async def create_or_update_model_usage(
         # than wiping a still-meaningful audit label.
         if metric.model_route_name is not None:
             current_usage.model_route_name = metric.model_route_name
-        await current_usage.save(session=session, auto_commit=auto_commit)
+        await current_usage.save(session=session, auto_commit=False)
+        await add_to_tiers(session, current_usage, metric)
+    if auto_commit:
+        await session.commit()
 
 
 def _validate_usage_metric(
@@ -7,10 +7,12 @@ import subprocess
 import tempfile
 import threading
 import importlib.util
+from typing import Optional
 import aiohttp
 
 import uvicorn
 from fastapi import FastAPI
+from starlette.datastructures import State
 import logging
 import secrets
 import tenacity
@@ -44,7 +46,7 @@ from gpustack.security import (
     new_secret_key_digest,
     API_KEY_PREFIX,
 )
-from gpustack.server.app import create_app
+from gpustack.server.app import close_http_clients, create_app, open_http_clients
 from gpustack.server.passwords import set_password
 from gpustack.server.services import provision_bootstrap_admin_orgs
 from gpustack.config.config import Config
@@ -76,7 +78,7 @@ from gpustack.server.lora_model_routes import (
     create_lora_model_routes,
 )
 from gpustack.utils.lora_model_source import normalized_lora_list
-from gpustack.server.init_db import init_db, get_query_count
+from gpustack.server.init_db import init_analytics_db, init_db, get_query_count
 from gpustack.scheduler.scheduler import Scheduler
 from gpustack.server.system_load import SystemLoadCollector
 from gpustack.server.update_check import UpdateChecker
@@ -88,6 +90,7 @@ from gpustack.server.resource_usage_collector import ResourceUsageCollector
 from gpustack.server.storage_usage_collector import StorageUsageCollector
 from gpustack import envs
 from gpustack.server.usage_archiver import TableArchiver
+from gpustack.server.usage_tiers import UsageTierMaintainer
 from gpustack.schemas.metered_usage import MeteredUsage, MeteredUsageArchive
 from gpustack.schemas.resource_events import ResourceEvent, ResourceEventArchive
 from gpustack.server.worker_instance_cleaner import WorkerInstanceCleaner
@@ -117,7 +120,9 @@ from gpustack.envs import (
     GATEWAY_PORT_CHECK_RETRY_COUNT,
     DEFAULT_CLUSTER_KUBERNETES,
 )
-from gpustack.server.coordinator import LocalCoordinator
+from gpustack.server.background import BackgroundServicesProcess
+from gpustack.server.coordinator import LocalCoordinator, ProcessCoordinator
+from gpustack.server.coordinator.process import RelayAddress
 from gpustack.server.coordinator.cache import preload_cache
 from gpustack.server.coordinator.models import get_model_for_topic
 from gpustack.server import bus
@@ -140,6 +145,28 @@ from gpustack.gpu_instances.settings import (
 
 logger = logging.getLogger(__name__)
 
+# Leader-only services, grouped by the process that runs them when the server
+# runs in the multi-process layout (``GPUSTACK_SERVER_PROCESS_MODE=multi``).
+# Values name the ``Server`` methods that start them.
+BACKGROUND_SERVICE_GROUPS = {
+    # Reconcile what the API writes: scheduling, controllers, worker states.
+    "controllers": (
+        "_start_scheduler",
+        "_start_controllers",
+        "_start_worker_instance_cleaner",
+        "_start_worker_syncer",
+        "_start_scaling_scheduler",
+        "_start_gpustack_operator_settings",
+    ),
+    # Batch work over the usage and metering tables.
+    "collectors": (
+        "_start_system_load_collector",
+        "_start_usage_details_archiver",
+        "_start_usage_tier_maintainer",
+        "_start_resource_usage",
+    ),
+}
+
 
 class _ExternalSubprocess:
     """Adapter that exposes a ``subprocess.Popen`` as a ``multiprocessing.Process``-like
@@ -249,6 +276,10 @@ class Server:
         # Coordination components
         self._coordinator = None
         self._leader_election_task = None
+        # ``app.state`` in the API process; the HTTP clients the worker syncer
+        # uses live here.
+        self._state = None
+        self._background_processes = []
 
     @property
     def all_processes(self):
@@ -286,6 +317,7 @@ class Server:
         # may attach a distributed-mode coordinator to the plugin instance.
         app = create_app(self._config)
         self._app = app
+        self._state = app.state
 
         # Initialize coordinator from plugin instances (LocalCoordinator if
         # none supplied). Must run before the event bus goes online so any
@@ -309,6 +341,7 @@ class Server:
         self._start_gateway_metrics_flusher()
         self._start_metrics_exporter()
         self._start_query_count_logger()
+        self._start_export_job_cleaner(app)
         self._start_default_registry_checker()
         self._start_proxy_servers(app)
         self._start_extension_plugins(app)
@@ -382,6 +415,8 @@ class Server:
         self._setup_data_dir(self._config.data_dir)
 
         await init_db(self._config.get_database_url())
+        if self._config.analytics_database_url:
+            await init_analytics_db(self._config.analytics_database_url)
 
         async with async_session() as session:
             await self._init_data(session)
@@ -389,67 +424,61 @@ class Server:
         logger.debug("Data initialization completed.")
 
     def _start_scheduler(self):
-        """Start the scheduler and return the task."""
         scheduler = Scheduler(self._config)
-        task = asyncio.create_task(scheduler.start())
+        self._create_async_task(scheduler.start())
         logger.debug("Scheduler started.")
-        return task
 
     def _start_controllers(self):
-        """Start all controllers and return the list of tasks."""
-        tasks = []
-
         model_provider_controller = ModelProviderController(self._config)
-        tasks.append(asyncio.create_task(model_provider_controller.start()))
+        self._create_async_task(model_provider_controller.start())
 
         model_route_target_controller = ModelRouteTargetController(self._config)
-        tasks.append(asyncio.create_task(model_route_target_controller.start()))
+        self._create_async_task(model_route_target_controller.start())
 
         model_route_controller = ModelRouteController(self._config)
-        tasks.append(asyncio.create_task(model_route_controller.start()))
+        self._create_async_task(model_route_controller.start())
 
         model_controller = ModelController(self._config)
-        tasks.append(asyncio.create_task(model_controller.start()))
+        self._create_async_task(model_controller.start())
 
         model_instance_controller = ModelInstanceController(self._config)
-        tasks.append(asyncio.create_task(model_instance_controller.start()))
+        self._create_async_task(model_instance_controller.start())
 
         worker_controller = WorkerController(self._config)
-        tasks.append(asyncio.create_task(worker_controller.start()))
+        self._create_async_task(worker_controller.start())
 
         model_file_controller = ModelFileController()
-        tasks.append(asyncio.create_task(model_file_controller.start()))
+        self._create_async_task(model_file_controller.start())
 
         cluster_controller = ClusterController(self._config)
-        tasks.append(asyncio.create_task(cluster_controller.start()))
+        self._create_async_task(cluster_controller.start())
 
         worker_pool_controller = WorkerPoolController()
-        tasks.append(asyncio.create_task(worker_pool_controller.start()))
+        self._create_async_task(worker_pool_controller.start())
 
-        inference_backend_controller = InferenceBackendController()
-        tasks.append(asyncio.create_task(inference_backend_controller.start()))
+        inference_backend_controller = InferenceBackendController(self._config)
+        self._create_async_task(inference_backend_controller.start())
 
         gpu_instance_controller = GPUInstanceController(self._config)
-        tasks.append(asyncio.create_task(gpu_instance_controller.start()))
+        self._create_async_task(gpu_instance_controller.start())
 
         gpu_instance_pv_controller = GPUInstancePersistentVolumeController(self._config)
-        tasks.append(asyncio.create_task(gpu_instance_pv_controller.start()))
+        self._create_async_task(gpu_instance_pv_controller.start())
 
         gpu_instance_pvt_controller = GPUInstancePersistentVolumeTypeController(
             self._config
         )
-        tasks.append(asyncio.create_task(gpu_instance_pvt_controller.start()))
+        self._create_async_task(gpu_instance_pvt_controller.start())
 
         gpu_instance_type_controller = GPUInstanceTypeController(self._config)
-        tasks.append(asyncio.create_task(gpu_instance_type_controller.start()))
+        self._create_async_task(gpu_instance_type_controller.start())
 
         # Publishes the key tables the gateway authenticates against. Runs
         # regardless of proxy mode, but no-ops when the gateway is disabled.
         gateway_auth_reconciler = GatewayAuthReconciler(self._config)
-        tasks.append(asyncio.create_task(gateway_auth_reconciler.start()))
+        self._create_async_task(gateway_auth_reconciler.start())
 
         logger.debug("Controllers started.")
-        return tasks
 
     def _start_system_load_collector(self):
         collector = SystemLoadCollector()
@@ -457,10 +486,11 @@ class Server:
 
         logger.debug("System load collector started.")
 
-    def _start_worker_syncer(self, app: FastAPI):
+    def _start_worker_syncer(self):
+        state = self._state
         worker_syncer = WorkerSyncer(
-            lambda: getattr(app.state, "http_client", None),
-            lambda: getattr(app.state, "http_client_no_proxy", None),
+            lambda: getattr(state, "http_client", None),
+            lambda: getattr(state, "http_client_no_proxy", None),
         )
         self._create_async_task(worker_syncer.start())
 
@@ -538,6 +568,27 @@ class Server:
 
         logger.debug("Usage details archiver started.")
 
+    def _start_usage_tier_maintainer(self):
+        # Only an invalid cron can fail construction. Without the maintainer
+        # the tiers are still written by every flush; what is lost is the
+        # nightly repair of periods that drifted (e.g. a mid-week route
+        # rename), so log it and keep the other leader tasks running.
+        try:
+            maintainer = UsageTierMaintainer(
+                cron=envs.USAGE_TIERS_VERIFY_CRON,
+                months=envs.USAGE_TIERS_VERIFY_MONTHS,
+            )
+        except Exception:
+            logger.critical(
+                "Usage tier maintainer failed to initialize — weekly / monthly "
+                "usage tiers will not be re-verified until this is resolved.",
+                exc_info=True,
+            )
+            return
+        self._create_async_task(maintainer.start())
+
+        logger.debug("Usage tier maintainer started.")
+
     def _start_resource_usage(self):
         """Start the resource-metering pipeline: event logger → collectors →
         events archiver. Leader-only — the logger writes one resource_events row
@@ -731,6 +782,12 @@ class Server:
         self._create_async_task(exporter.generate_metrics_cache())
         self._create_async_task(exporter.start())
 
+    def _start_export_job_cleaner(self, app: FastAPI):
+        # Per instance: every server keeps its own jobs and files.
+        self._create_async_task(app.state.export_jobs.start())
+
+        logger.debug("Usage export job cleaner started.")
+
     def _start_query_count_logger(self):
         """Start a background task to log query count periodically."""
 
@@ -1239,20 +1296,38 @@ class Server:
         Plugins attach a ``Coordinator`` to ``self.coordinator`` inside
         their ``__init__(app, cfg)``. We scan ``app.state.extension_plugins``
         after ``create_app`` has run and take the first non-None one. If
-        no plugin supplies one, we fall back to ``LocalCoordinator``.
+        no plugin supplies one, we fall back to ``LocalCoordinator``, or to
+        the relay of a ``ProcessCoordinator`` in the multi-process layout.
         """
+        multi_process = envs.SERVER_PROCESS_MODE == "multi"
         coordinator = None
         for plugin in getattr(app.state, "extension_plugins", []):
             candidate = getattr(plugin, "coordinator", None)
             if candidate is not None:
                 coordinator = candidate
                 logger.info(f"Coordinator provided by plugin: {type(plugin).__name__}")
+                if multi_process:
+                    # Leadership is elected across instances by the plugin's
+                    # coordinator, which lives in this process.
+                    logger.warning(
+                        "GPUSTACK_SERVER_PROCESS_MODE=multi is ignored with a "
+                        "distributed coordinator; background services run in "
+                        "the server process."
+                    )
                 break
 
-        if coordinator is None:
+        if coordinator is None and multi_process:
+            coordinator = ProcessCoordinator(self._config)
+            logger.info("Running background services in child processes")
+        elif coordinator is None:
             coordinator = LocalCoordinator(self._config)
             logger.debug("Using LocalCoordinator")
 
+        await self._start_coordinator(coordinator)
+
+        await self._prepare_jwt_secret_key()
+
+    async def _start_coordinator(self, coordinator):
         self._coordinator = coordinator
         await self._coordinator.start()
 
@@ -1261,8 +1336,6 @@ class Server:
         await bus.event_bus.start()
         cache_module.set_coordinator(coordinator)
 
-        await self._prepare_jwt_secret_key()
-
     async def _preload_change_detector_cache(self):
         if isinstance(self._coordinator, LocalCoordinator):
             return
@@ -1311,7 +1384,7 @@ class Server:
         if self._config._jwt_secret_key_user_provided:
             return
 
-        if isinstance(self._coordinator, LocalCoordinator):
+        if isinstance(self._coordinator, (LocalCoordinator, ProcessCoordinator)):
             return
 
         if not is_inside_kubernetes():
@@ -1330,6 +1403,14 @@ class Server:
             self._start_leader_tasks()
             return
 
+        if isinstance(self._coordinator, ProcessCoordinator):
+            # Multi-process mode: the background services run in supervised
+            # child processes; the update checker only warms this process's
+            # cache for the update API.
+            self._start_update_checker()
+            self._start_background_processes()
+            return
+
         # Distributed mode: start leader election loop
         logger.info("Starting leader election loop...")
         self._leader_election_task = asyncio.create_task(self._leader_election_loop())
@@ -1384,33 +1465,73 @@ class Server:
         Note: If leadership is lost, the process exits directly (os._exit),
         so we don't need to track and cancel these tasks.
         """
-        # Scheduler
-        self._start_scheduler()
-
-        # Controllers
-        self._start_controllers()
-
-        # System Load Collector
-        self._start_system_load_collector()
-
-        # Update Checker
         self._start_update_checker()
+        for group in BACKGROUND_SERVICE_GROUPS:
+            self._start_background_services(group)
+
+    def _start_background_services(self, group: str):
+        for start in BACKGROUND_SERVICE_GROUPS[group]:
+            getattr(self, start)()
+
+    def _start_background_processes(self):
+        for group in BACKGROUND_SERVICE_GROUPS:
+            process = BackgroundServicesProcess(
+                self._config,
+                group,
+                self._coordinator,
+                operator_unix_path=gateway_client.get_gateway_unix_path(),
+            )
+            self._background_processes.append(process)
+            self._create_async_task(process.run())
+
+    async def start_background_services(
+        self,
+        group: str,
+        address: RelayAddress,
+        operator_unix_path: Optional[str] = None,
+    ):
+        """Run the background services of ``group``, in a child process of the
+        server started by ``BackgroundServicesProcess``.
+
+        The API process has already migrated and seeded the database; this
+        only binds what the services read at runtime, then talks to it through
+        the coordinator relay at ``address``. When that connection is lost the
+        server is gone or has given up on this process, so it exits at once,
+        like a leader that lost its lease.
+        """
+        add_signal_handlers_in_loop()
 
-        # Worker Instance Cleaner
-        self._start_worker_instance_cleaner()
-
-        # Usage Details Archiver (move aged rows to archive table)
-        self._start_usage_details_archiver()
-
-        # Resource usage metering (event logger → collectors → archiver)
-        self._start_resource_usage()
+        await init_db(self._config.get_database_url())
+        if self._config.analytics_database_url:
+            await init_analytics_db(self._config.analytics_database_url)
+        async with async_session() as session:
+            await self._init_platform_principal_id(session)
+            await self._init_authenticated_principal_id(session)
+        init_model_catalog(self._config.model_catalog_file)
+        if operator_unix_path:
+            gateway_client.set_gateway_unix_path(operator_unix_path)
 
-        # Worker Syncer (checks worker reachability and updates states)
-        self._start_worker_syncer(self._app)
+        coordinator = ProcessCoordinator(self._config, address=address, name=group)
+        await self._start_coordinator(coordinator)
+        await self._preload_change_detector_cache()
 
-        # Scaling Scheduler (drives model replicas on a cron timetable)
-        self._start_scaling_scheduler()
+        self._state = State()
+        open_http_clients(self._state)
+        self._start_background_services(group)
+        logger.info(f"Background services {group} started.")
 
-        # Operator Settings (converges the operator settings GPU Service
-        # clusters are configured with)
-        self._start_gpustack_operator_settings()
+        services = asyncio.gather(*self._async_tasks)
+        disconnected = asyncio.ensure_future(coordinator.wait_disconnected())
+        try:
+            await asyncio.wait(
+                [services, disconnected], return_when=asyncio.FIRST_COMPLETED
+            )
+            if services.done():
+                # Raise whatever stopped the services; should they all have
+                # returned, stay until the server goes.
+                services.result()
+                await disconnected
+            logger.error(f"Background services {group} lost the server, exiting.")
+            os._exit(1)
+        finally:
+            await close_http_clients(self._state)
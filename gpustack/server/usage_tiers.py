@@ -0,0 +1,421 @@
+"""Weekly / monthly tiers over ``model_usages``.
+
+``model_usages`` holds one row per (key, day), so a year-long breakdown scans
+365 days of rows per key. ``model_usage_weekly`` / ``model_usage_monthly`` hold
+the same rows summed per week / month — every non-counter column preserved, so
+a breakdown over them is the same breakdown, just over ~7x / ~30x fewer rows.
+
+Three pieces keep the tiers honest:
+
+- **Write path.** :func:`add_to_tiers` upserts each flushed increment into
+  both tiers inside the usage flush's own transaction, so a committed daily
+  row is never missing from its week / month. The upsert rides on a unique
+  ``(period_start, key_hash)``, so two overlapping flushes cannot both insert
+  the same tier row.
+- **Read path.** :func:`tier_source_for_range` serves the fully covered periods
+  of a requested range from a tier and only the partial edges from the daily
+  rows; :func:`adapt_to_source` rewrites a breakdown statement onto that union.
+- **Repair.** :func:`rebuild_period` re-derives one period from the daily rows,
+  and :class:`UsageTierMaintainer` (leader-only, archiver-style cron) verifies
+  the most recent periods and rebuilds any that drifted — a mid-period route
+  rename, or a daily row written by a server that predates the tiers.
+  ``gpustack check-usage-tiers`` does the same over any range, on demand.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import (
+    Date,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.sql.util import ClauseAdapter
+
+from gpustack import envs
+from gpustack.schemas.model_usage import (
+    ModelUsage,
+    ModelUsageMonthly,
+    ModelUsageWeekly,
+)
+from gpustack.schemas.usage import (
+    USAGE_GRANULARITY_DAY,
+    USAGE_GRANULARITY_MONTH,
+    USAGE_GRANULARITY_WEEK,
+)
+from gpustack.server.db import async_session
+
+logger = logging.getLogger(__name__)
+
+COUNTER_COLUMNS = (
+    "prompt_token_count",
+    "completion_token_count",
+    "prompt_cached_token_count",
+    "request_count",
+)
+
+# Everything a breakdown can group, filter or COUNT(DISTINCT ...) on. ``date``
+# is not a key: within a tier row it is the last active day of the period.
+KEY_COLUMNS = tuple(
+    c.name
+    for c in ModelUsage.__table__.columns
+    if c.name not in ("id", "date") and c.name not in COUNTER_COLUMNS
+)
+
+# The column set shared by ``model_usages`` and both tiers, in one order —
+# what the read-path union selects from either side.
+SOURCE_COLUMNS = KEY_COLUMNS + ("date",) + COUNTER_COLUMNS
+
+# Dialects whose tiers are backfilled by the schema migration and whose
+# breakdowns bucket by week / month at all (see ``_date_bucket_expression``).
+TIER_DIALECTS = ("postgresql", "mysql")
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _next_week(period_start: date) -> date:
+    return period_start + timedelta(days=7)
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(period_start: date) -> date:
+    if period_start.month == 12:
+        return period_start.replace(year=period_start.year + 1, month=1)
+    return period_start.replace(month=period_start.month + 1)
+
+
+@dataclass(frozen=True)
+class UsageTier:
+    granularity: str
+    model: type
+    period_start: Callable[[date], date]
+    next_period: Callable[[date], date]
+
+    @property
+    def table(self):
+        return self.model.__table__
+
+    def period_end(self, period_start: date) -> date:
+        """Last day (inclusive) of the period starting at ``period_start``."""
+        return self.next_period(period_start) - timedelta(days=1)
+
+    def periods(self, start: date, end: date) -> List[date]:
+        """Start of every period that overlaps ``[start, end]``."""
+        result = []
+        current = self.period_start(start)
+        while current <= end:
+            result.append(current)
+            current = self.next_period(current)
+        return result
+
+
+WEEKLY_TIER = UsageTier(
+    USAGE_GRANULARITY_WEEK, ModelUsageWeekly, _week_start, _next_week
+)
+MONTHLY_TIER = UsageTier(
+    USAGE_GRANULARITY_MONTH, ModelUsageMonthly, _month_start, _next_month
+)
+# Coarsest first: when nothing forces a granularity, fewer rows wins.
+TIERS = (MONTHLY_TIER, WEEKLY_TIER)
+
+
+# Rows per INSERT when a period is rebuilt, well under every dialect's limit
+# on bound parameters.
+_REBUILD_BATCH_ROWS = 500
+
+
+def tier_key_hash(values: Mapping[str, Any]) -> str:
+    """Digest of a tier row's key columns, NULLs included.
+
+    Enums hash by name and booleans as 0 / 1, which is also how a raw query
+    returns them on every dialect -- the schema migration's backfill computes
+    the same digest from one.
+    """
+    parts = []
+    for name in KEY_COLUMNS:
+        value = values[name]
+        if isinstance(value, Enum):
+            value = value.name
+        elif isinstance(value, bool):
+            value = int(value)
+        parts.append(value)
+    return hashlib.sha256(json.dumps(parts, separators=(",", ":")).encode()).hexdigest()
+
+
+def _upsert(dialect: str, table, row: Dict[str, Any]):
+    """``INSERT`` of one tier row that adds its counters onto an existing one."""
+    if dialect == "mysql":
+        statement = mysql.insert(table).values(**row)
+        new = statement.inserted
+    else:
+        statement = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+        statement = statement.values(**row)
+        new = statement.excluded
+    updates = {name: table.c[name] + new[name] for name in COUNTER_COLUMNS}
+    # Flushes can arrive out of order across days (a late batch for yesterday
+    # after today's); keep the latest.
+    updates["date"] = case((table.c.date < new.date, new.date), else_=table.c.date)
+    if dialect == "mysql":
+        return statement.on_duplicate_key_update(**updates)
+    return statement.on_conflict_do_update(
+        index_elements=["period_start", "key_hash"], set_=updates
+    )
+
+
+async def add_to_tiers(session, usage: ModelUsage, increment: ModelUsage):
+    """Fold one flushed increment into every tier, without committing.
+
+    ``usage`` is the daily row as it stands after the increment was applied —
+    its columns are the tier row's key — and ``increment`` carries the counts
+    that were just added to it. Runs in the caller's transaction so the daily
+    row and its tiers commit (or roll back) together.
+    """
+    values = {name: getattr(usage, name) for name in KEY_COLUMNS}
+    key_hash = tier_key_hash(values)
+    dialect = session.get_bind().dialect.name
+    for tier in TIERS:
+        await session.exec(
+            _upsert(
+                dialect,
+                tier.table,
+                {
+                    "period_start": tier.period_start(usage.date),
+                    "key_hash": key_hash,
+                    "date": usage.date,
+                    **values,
+                    **{name: getattr(increment, name) or 0 for name in COUNTER_COLUMNS},
+                },
+            )
+        )
+
+
+def _daily_aggregate(tier: UsageTier, period_start: date) -> Select:
+    """The tier rows of one period, computed from ``model_usages``."""
+    raw = ModelUsage.__table__
+    return (
+        select(
+            literal(period_start, Date).label("period_start"),
+            *[raw.c[name] for name in KEY_COLUMNS],
+            func.max(raw.c.date).label("date"),
+            *[func.sum(raw.c[name]).label(name) for name in COUNTER_COLUMNS],
+        )
+        .where(raw.c.date >= period_start)
+        .where(raw.c.date <= tier.period_end(period_start))
+        .group_by(*[raw.c[name] for name in KEY_COLUMNS])
+    )
+
+
+async def rebuild_period(session, tier: UsageTier, period_start: date):
+    """Replace one period of ``tier`` with what ``model_usages`` says, uncommitted.
+
+    The rows go through Python rather than ``INSERT ... SELECT`` because each
+    needs its ``key_hash``, which no SQL expression computes on every dialect.
+    """
+    rows = [
+        {**row._mapping, "key_hash": tier_key_hash(row._mapping)}
+        for row in await session.exec(_daily_aggregate(tier, period_start))
+    ]
+    await session.exec(
+        delete(tier.table).where(tier.table.c.period_start == period_start)
+    )
+    for i in range(0, len(rows), _REBUILD_BATCH_ROWS):
+        await session.exec(insert(tier.table).values(rows[i : i + _REBUILD_BATCH_ROWS]))
+
+
+def _row_fingerprint(row) -> Tuple:
+    mapping = row._mapping
+    return tuple(mapping[name] for name in KEY_COLUMNS) + (
+        mapping["date"],
+        *(int(mapping[name] or 0) for name in COUNTER_COLUMNS),
+    )
+
+
+async def period_matches(session, tier: UsageTier, period_start: date) -> bool:
+    """Whether one period of ``tier`` equals its re-derivation, row for row."""
+    expected = await session.exec(_daily_aggregate(tier, period_start))
+    actual = await session.exec(
+        select(*[tier.table.c[name] for name in SOURCE_COLUMNS]).where(
+            tier.table.c.period_start == period_start
+        )
+    )
+    return sorted(map(_row_fingerprint, expected), key=repr) == sorted(
+        map(_row_fingerprint, actual), key=repr
+    )
+
+
+async def verify_tiers(
+    session, start: date, end: date, *, repair: bool = False
+) -> List[Tuple[str, date]]:
+    """Check every period overlapping ``[start, end]``; return the ones that drifted.
+
+    With ``repair`` the drifted periods are rebuilt and committed one at a
+    time, so a long range does not hold one huge transaction open.
+    """
+    drifted = []
+    for tier in TIERS:
+        for period_start in tier.periods(start, end):
+            if await period_matches(session, tier, period_start):
+                continue
+            drifted.append((tier.granularity, period_start))
+            if repair:
+                await rebuild_period(session, tier, period_start)
+                await session.commit()
+    return drifted
+
+
+@dataclass
+class TierSource:
+    """Where one breakdown range reads from: a tier plus daily edges."""
+
+    tier: UsageTier
+    # ``[first, last)`` period starts served from the tier.
+    first_period: date
+    end_period: date
+    # Inclusive daily ranges outside the covered periods.
+    edges: List[Tuple[date, date]]
+
+    def selectable(self):
+        raw = ModelUsage.__table__
+        tier = self.tier.table
+        parts = [
+            select(*[raw.c[name] for name in SOURCE_COLUMNS])
+            .where(raw.c.date >= edge_start)
+            .where(raw.c.date <= edge_end)
+            for edge_start, edge_end in self.edges
+        ]
+        parts.append(
+            select(*[tier.c[name] for name in SOURCE_COLUMNS])
+            .where(tier.c.period_start >= self.first_period)
+            .where(tier.c.period_start < self.end_period)
+        )
+        return union_all(*parts).subquery("usage_source")
+
+
+def _covered_source(tier: UsageTier, start: date, end: date) -> Optional[TierSource]:
+    first = tier.period_start(start)
+    if first < start:
+        first = tier.next_period(first)
+    end_period = tier.period_start(end + timedelta(days=1))
+    if first >= end_period:
+        return None
+    edges = []
+    if start < first:
+        edges.append((start, first - timedelta(days=1)))
+    if end_period <= end:
+        edges.append((end_period, end))
+    return TierSource(tier, first, end_period, edges)
+
+
+def tier_source_for_range(
+    session, start: date, end: date, bucket_granularity: Optional[str]
+) -> Optional[TierSource]:
+    """Pick the tier that can answer ``[start, end]``, or ``None`` for daily rows.
+
+    ``bucket_granularity`` is the date bucket the breakdown groups by, or
+    ``None`` when it does not group by date. A tier's rows only carry their
+    period's last active day, so a date-grouped breakdown can use the tier of
+    its own granularity and no other: a monthly row cannot be split into
+    weeks, and a daily bucket cannot be rebuilt from either.
+    """
+    if not envs.USAGE_TIERS_ENABLED:
+        return None
+    if session.get_bind().dialect.name not in TIER_DIALECTS:
+        return None
+    if bucket_granularity == USAGE_GRANULARITY_DAY:
+        return None
+    for tier in TIERS:
+        if bucket_granularity is not None and tier.granularity != bucket_granularity:
+            continue
+        source = _covered_source(tier, start, end)
+        if source is not None:
+            return source
+    return None
+
+
+def adapt_to_source(statement, source):
+    """Rewrite ``statement`` to read ``source`` wherever it reads ``model_usages``."""
+    if statement is None:
+        return None
+    return ClauseAdapter(source, adapt_on_names=True).traverse(statement)
+
+
+class UsageTierMaintainer:
+    """Leader-only loop that re-verifies the most recent tier periods.
+
+    Same lifecycle as ``TableArchiver``: one pass on startup, then on the
+    configured cron (UTC). Each pass checks the weeks and months of the last
+    ``USAGE_TIERS_VERIFY_MONTHS`` calendar months — the periods the flush still
+    writes to, and so the only ones that can drift — and rebuilds whichever no
+    longer match ``model_usages``.
+    """
+
+    def __init__(self, *, cron: str, months: int) -> None:
+        try:
+            self._trigger = CronTrigger.from_crontab(cron, timezone=timezone.utc)
+        except Exception as e:
+            raise ValueError(
+                f"Invalid usage tier verify cron (value={cron!r}): {e}"
+            ) from e
+        self._months = max(1, months)
+
+    async def start(self) -> None:
+        try:
+            await self.verify_once()
+        except Exception as e:
+            logger.error(f"Initial usage tier verification failed: {e}")
+
+        while True:
+            sleep_seconds = self._seconds_until_next_fire()
+            if sleep_seconds is None:
+                logger.error(
+                    "Usage tiers: cron yielded no future fire time; "
+                    "maintainer loop stopping."
+                )
+                return
+            await asyncio.sleep(sleep_seconds)
+            try:
+                await self.verify_once()
+            except Exception as e:
+                logger.error(f"Usage tier verification failed: {e}")
+
+    def _seconds_until_next_fire(self) -> Optional[float]:
+        now = datetime.now(timezone.utc)
+        next_fire = self._trigger.get_next_fire_time(None, now)
+        if next_fire is None:
+            return None
+        return max(0.0, (next_fire - now).total_seconds())
+
+    async def verify_once(self) -> List[Tuple[str, date]]:
+        # Daily rows are dated in the rollup timezone, which can be a day
+        # ahead of UTC; one spare day keeps "today" inside the window.
+        today = datetime.now(timezone.utc).date() + timedelta(days=1)
+        start = MONTHLY_TIER.period_start(today)
+        for _ in range(self._months - 1):
+            start = MONTHLY_TIER.period_start(start - timedelta(days=1))
+        async with async_session() as session:
+            rebuilt = await verify_tiers(session, start, today, repair=True)
+        if rebuilt:
+            logger.info(
+                "Rebuilt usage tier periods that drifted from model_usages: "
+                + ", ".join(f"{g} {p.isoformat()}" for g, p in rebuilt)
+            )
+        return rebuilt
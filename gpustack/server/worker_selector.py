@@ -1,9 +1,9 @@
-import asyncio
 import logging
 from typing import List, Optional
 
 from gpustack.client.worker_filesystem_client import WorkerFilesystemClient
 from gpustack.schemas.workers import Worker
+from gpustack.utils.hedge import hedged_first
 
 logger = logging.getLogger(__name__)
 
@@ -82,28 +82,26 @@ class WorkerSelector:
             First worker that has the path, or None if not found
         """
 
-        async def check_worker(worker: Worker) -> tuple[Worker, bool]:
+        async def check_worker(worker: Worker) -> bool:
             """Check if a worker has the specified path."""
             try:
                 exists_response = await self._filesystem_client.path_exists(
                     worker, path
                 )
-                return worker, exists_response.exists
+                return exists_response.exists
             except Exception as e:
                 logger.warning(
                     f"Failed to check path {path} on worker {worker.id}: {e}"
                 )
-                return worker, False
-
-        # Create tasks for all workers
-        tasks = [check_worker(worker) for worker in workers]
-
-        # Execute tasks concurrently and get results as they complete
-        for completed_task in asyncio.as_completed(tasks):
-            worker, exists = await completed_task
-            if exists:
-                logger.info(f"Found path {path} on worker {worker.id}")
-                return worker
+                return False
+
+        # Ask a few workers, more only if they are slow or lack the path
+        result = await hedged_first(
+            workers, check_worker, kind="path_exists", accept=bool
+        )
+        if result is not None:
+            logger.info(f"Found path {path} on worker {result.candidate.id}")
+            return result.candidate
 
         # No worker has the path
         logger.warning(f"Path {path} not found on any worker")
@@ -1,7 +1,9 @@
 import asyncio
+import hashlib
 import logging
+import math
 import aiohttp
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 
 from gpustack.schemas.workers import Worker, WorkerStateEnum
 from gpustack.server.db import async_session
@@ -12,6 +14,68 @@ from gpustack import envs
 logger = logging.getLogger(__name__)
 
 
+def _hash(worker_id: int) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(str(worker_id).encode(), digest_size=8).digest(), "big"
+    )
+
+
+class WorkerProber:
+    """Probes worker reachability without a thundering herd.
+
+    Workers are split into shards of about ``shard_size`` by a stable hash of
+    their id, and each :meth:`probe_due` round probes the next shard, so a
+    large fleet is covered over several rounds. Within a round every worker
+    waits a stable, hash-derived share of ``window`` before its probe, and at
+    most ``concurrency`` probes run at once over the server's pooled HTTP
+    clients.
+    """
+
+    def __init__(
+        self,
+        http_client_getter: Callable[[], Optional[aiohttp.ClientSession]],
+        http_client_no_proxy_getter: Callable[[], Optional[aiohttp.ClientSession]],
+        timeout: float,
+        window: float,
+        concurrency: int,
+        shard_size: int,
+    ):
+        self._http_client_getter = http_client_getter
+        self._http_client_no_proxy_getter = http_client_no_proxy_getter
+        self._timeout = timeout
+        self._window = window
+        self._concurrency = max(1, concurrency)
+        self._shard_size = max(1, shard_size)
+        self._round = 0
+
+    def due(self, workers: List[Worker]) -> List[Worker]:
+        """The workers to probe this round."""
+        shards = max(1, math.ceil(len(workers) / self._shard_size))
+        shard = self._round % shards
+        self._round += 1
+        return [w for w in workers if _hash(w.id) % shards == shard]
+
+    async def probe(self, workers: List[Worker]) -> Dict[int, bool]:
+        """Reachability of ``workers``, by worker id."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def probe_one(worker: Worker):
+            # The high half of the hash, independent of the shard.
+            await asyncio.sleep((_hash(worker.id) >> 32) / 2**32 * self._window)
+            async with semaphore:
+                return worker.id, await is_worker_reachable(
+                    worker=worker,
+                    proxy_client=self._http_client_getter(),
+                    no_proxy_client=self._http_client_no_proxy_getter(),
+                    timeout_in_second=self._timeout,
+                )
+
+        return dict(await asyncio.gather(*(probe_one(w) for w in workers)))
+
+    async def probe_due(self, workers: List[Worker]) -> Dict[int, bool]:
+        return await self.probe(self.due(workers))
+
+
 class WorkerSyncer:
     """
     WorkerSyncer syncs worker status periodically.
@@ -30,6 +94,16 @@ class WorkerSyncer:
         self._worker_unreachable_timeout = worker_unreachable_timeout
         self._http_client_getter = http_client_getter
         self._http_client_no_proxy_getter = http_client_no_proxy_getter
+        # Probes are spread over half the interval, leaving the rest for
+        # the slow ones and the state update.
+        self._prober = WorkerProber(
+            http_client_getter,
+            http_client_no_proxy_getter,
+            timeout=worker_unreachable_timeout,
+            window=interval / 2,
+            concurrency=envs.WORKER_REACHABILITY_PROBE_CONCURRENCY,
+            shard_size=envs.WORKER_REACHABILITY_PROBE_SHARD_SIZE,
+        )
 
         logger.debug(
             f"WorkerSyncer initialized with unreachable check mode: {envs.WORKER_UNREACHABLE_CHECK_MODE}"
@@ -59,12 +133,13 @@ class WorkerSyncer:
             return
 
         if self._should_check_unreachable(len(all_workers)):
-            tasks = [
-                self._set_worker_unreachable(worker)
-                for worker in all_workers
-                if not worker.state.is_provisioning
-            ]
-            await asyncio.gather(*tasks)
+            # Workers not probed this round keep their last result.
+            reachable = await self._prober.probe_due(
+                [worker for worker in all_workers if not worker.state.is_provisioning]
+            )
+            for worker in all_workers:
+                if worker.id in reachable:
+                    worker.unreachable = not reachable[worker.id]
 
         state_changed_workers = self.filter_state_change_workers(all_workers)
 
@@ -80,15 +155,19 @@ class WorkerSyncer:
                 should_update_workers.append(worker)
                 state_to_worker_name[worker.state].append(worker.name)
 
-        async with async_session() as session:
-            for worker in should_update_workers:
-                # reload from DB and update states only
-                to_update_worker = await WorkerService(session).get_by_id(worker.id)
-                if to_update_worker:
+        if should_update_workers:
+            changed = {worker.id: worker for worker in should_update_workers}
+            async with async_session() as session:
+                # Reload in one query and update the states only, in one commit.
+                to_update_workers = await Worker.all_by_fields(
+                    session=session, extra_conditions=[Worker.id.in_(list(changed))]
+                )
+                for to_update_worker in to_update_workers:
+                    worker = changed[to_update_worker.id]
                     to_update_worker.unreachable = worker.unreachable
                     to_update_worker.state = worker.state
                     to_update_worker.state_message = worker.state_message
-                    await WorkerService(session).update(to_update_worker)
+                await WorkerService(session).batch_update(to_update_workers)
 
         for state, worker_names in state_to_worker_name.items():
             if worker_names:
@@ -105,30 +184,18 @@ class WorkerSyncer:
             True if unreachable check should be performed, False otherwise
         """
         mode = envs.WORKER_UNREACHABLE_CHECK_MODE
-        auto_threshold = 50  # Auto-disable threshold for worker count
 
         if mode == "disabled":
             return False
-        elif mode == "enabled":
-            return True
-        elif mode == "auto":
-            if worker_count > auto_threshold:
-                return False
+        elif mode in ("enabled", "auto"):
+            # Probes are sharded and bounded (see WorkerProber), so "auto" no
+            # longer needs to turn them off for large fleets.
             return True
         else:
             logger.warning(
                 f"Invalid WORKER_UNREACHABLE_CHECK_MODE: {mode}, defaulting to 'auto'"
             )
-            # Default to auto behavior
-            return worker_count <= auto_threshold
-
-    async def _set_worker_unreachable(self, worker: Worker):
-        worker.unreachable = not await is_worker_reachable(
-            worker=worker,
-            proxy_client=self._http_client_getter(),
-            no_proxy_client=self._http_client_no_proxy_getter(),
-            timeout_in_second=self._worker_unreachable_timeout,
-        )
+            return True
 
     @staticmethod
     def filter_state_change_workers(workers: list[Worker]) -> list[Worker]:
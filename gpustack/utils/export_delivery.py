@@ -19,16 +19,24 @@ from fastapi import Response
 from fastapi.responses import StreamingResponse
 
 from gpustack import envs
-from gpustack.schemas.usage import USAGE_EXPORT_FORMAT_XLSX
+from gpustack.schemas.usage import (
+    USAGE_EXPORT_FORMAT_ARROW,
+    USAGE_EXPORT_FORMAT_CSV,
+    USAGE_EXPORT_FORMAT_PARQUET,
+    USAGE_EXPORT_FORMAT_XLSX,
+)
 from gpustack.utils.export_limits import (
     attachment_headers,
     export_split_plan,
     split_member_name,
+    split_export_format,
     split_too_many_parts,
 )
 from gpustack.utils.tabular_export import (
     build_xlsx,
+    stream_arrow,
     stream_csv,
+    stream_parquet,
     stream_zip,
     take_rows,
 )
@@ -36,6 +44,33 @@ from gpustack.utils.tabular_export import (
 XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 
+@dataclass(frozen=True)
+class _StreamFormat:
+    """A format that streams one file per sheet: its writer and how it is named."""
+
+    extension: str
+    media_type: str
+    writer: Callable[..., AsyncIterator[bytes]]
+    # Parquet is compressed column by column already; deflating it again in
+    # the archive costs CPU for a few percent.
+    compressed: bool
+
+
+_STREAM_FORMATS = {
+    USAGE_EXPORT_FORMAT_CSV: _StreamFormat(
+        "csv", "text/csv; charset=utf-8", stream_csv, compressed=False
+    ),
+    USAGE_EXPORT_FORMAT_PARQUET: _StreamFormat(
+        "parquet", "application/vnd.apache.parquet", stream_parquet, compressed=True
+    ),
+    # ``.arrows`` is the registered extension of the IPC STREAM format (the
+    # file format, ``.arrow``, needs a seekable footer this writer never has).
+    USAGE_EXPORT_FORMAT_ARROW: _StreamFormat(
+        "arrows", "application/vnd.apache.arrow.stream", stream_arrow, compressed=False
+    ),
+}
+
+
 @dataclass
 class ExportSheetPlan:
     """One logical table, resolved to everything the writer needs.
@@ -66,43 +101,60 @@ def _sheet_trailer(plan: ExportSheetPlan, context: str) -> str:
     return f"rows={plan.total} {context}"
 
 
-async def export_response(
+@dataclass
+class ExportArtifact:
+    """A whole export as one file: what it is called and its bytes, in order.
+
+    What :func:`export_response` sends and what a background export job writes
+    to disk are the same artifact; only where the chunks go differs.
+    """
+
+    filename: str
+    media_type: str
+    chunks: AsyncIterator[bytes]
+
+
+async def _xlsx_chunks(plans: List[ExportSheetPlan]) -> AsyncIterator[bytes]:
+    yield await build_xlsx(
+        (plan.name or plan.key, plan.columns, plan.rows()) for plan in plans
+    )
+
+
+def export_artifact(
     plans: List[ExportSheetPlan],
     *,
     request,
     prefix: str,
     export_format: str,
     context: str,
-) -> Response:
+) -> ExportArtifact:
     """One sheet becomes a file, several become an archive or a workbook."""
     stamp = f"{request.start_date}_{request.end_date}"
 
     if export_format == USAGE_EXPORT_FORMAT_XLSX:
-        payload = await build_xlsx(
-            (plan.name or plan.key, plan.columns, plan.rows()) for plan in plans
-        )
-        return Response(
-            content=payload,
+        return ExportArtifact(
+            filename=f"{prefix}_{stamp}.xlsx",
             media_type=XLSX_MEDIA_TYPE,
-            headers=attachment_headers(f"{prefix}_{stamp}.xlsx"),
+            chunks=_xlsx_chunks(plans),
         )
 
+    stream_format = _STREAM_FORMATS[export_format]
     if len(plans) == 1:
         plan = plans[0]
-        return StreamingResponse(
-            stream_csv(
+        return ExportArtifact(
+            filename=f"{prefix}_by_{plan.key}_{stamp}.{stream_format.extension}",
+            media_type=stream_format.media_type,
+            chunks=stream_format.writer(
                 plan.columns,
                 plan.rows(),
                 trailer=_sheet_trailer(plan, context),
             ),
-            media_type="text/csv; charset=utf-8",
-            headers=attachment_headers(f"{prefix}_by_{plan.key}_{stamp}.csv"),
         )
 
     members = [
         (
-            f"by_{plan.key}.csv",
-            stream_csv(
+            f"by_{plan.key}.{stream_format.extension}",
+            stream_format.writer(
                 plan.columns,
                 plan.rows(),
                 trailer=_sheet_trailer(plan, context),
@@ -110,10 +162,43 @@ async def export_response(
         )
         for plan in plans
     ]
-    return StreamingResponse(
-        stream_zip(members),
+    return ExportArtifact(
+        filename=f"{prefix}_{stamp}.zip",
         media_type="application/zip",
-        headers=attachment_headers(f"{prefix}_{stamp}.zip"),
+        chunks=stream_zip(members, compress=not stream_format.compressed),
+    )
+
+
+async def export_response(
+    plans: List[ExportSheetPlan],
+    *,
+    request,
+    prefix: str,
+    export_format: str,
+    context: str,
+) -> Response:
+    """:func:`export_artifact` as an HTTP response.
+
+    xlsx is sent whole, with a length: the workbook is only valid once it is
+    complete, so there is nothing to gain from streaming it.
+    """
+    artifact = export_artifact(
+        plans,
+        request=request,
+        prefix=prefix,
+        export_format=export_format,
+        context=context,
+    )
+    if export_format == USAGE_EXPORT_FORMAT_XLSX:
+        return Response(
+            content=b"".join([chunk async for chunk in artifact.chunks]),
+            media_type=artifact.media_type,
+            headers=attachment_headers(artifact.filename),
+        )
+    return StreamingResponse(
+        artifact.chunks,
+        media_type=artifact.media_type,
+        headers=attachment_headers(artifact.filename),
     )
 
 
@@ -124,6 +209,7 @@ def split_export_response(
     prefix: str,
     context: str,
     limit: int,
+    export_format: str = USAGE_EXPORT_FORMAT_CSV,
 ) -> StreamingResponse:
     """Deliver an over-large export as one archive of row-sliced files.
 
@@ -137,12 +223,14 @@ def split_export_response(
     why one cursor can feed them all (a row inserted mid-export cannot land in
     two files or none).
 
-    Always CSV, whatever format was requested. Not a format constraint — every
+    Never xlsx, whatever format was requested. Not a format constraint — every
     part fits a worksheet — but a throughput one: xlsx must be assembled in
     full before any of it is valid, and a split multiplies that by the part
-    count. The estimate reports ``effective_format``, so this is announced
-    rather than sprung.
+    count. An xlsx request is split into CSV parts; the streaming formats keep
+    their own (see :func:`split_export_format`). The estimate reports
+    ``effective_format``, so this is announced rather than sprung.
     """
+    stream_format = _STREAM_FORMATS[split_export_format(export_format)]
     parts_by_sheet = export_split_plan({plan.key: plan.total for plan in plans}, limit)
     planned_members = sum(parts_by_sheet.values())
     if planned_members > envs.USAGE_EXPORT_MAX_SPLIT_MEMBERS:
@@ -164,8 +252,15 @@ def split_export_response(
                     first = (index - 1) * limit + 1
                     last = min(index * limit, plan.total)
                     yield (
-                        split_member_name(plan.key, index, parts, many, prefix=prefix),
-                        stream_csv(
+                        split_member_name(
+                            plan.key,
+                            index,
+                            parts,
+                            many,
+                            prefix=prefix,
+                            extension=stream_format.extension,
+                        ),
+                        stream_format.writer(
                             plan.columns,
                             take_rows(rows, limit),
                             trailer=(
@@ -177,7 +272,7 @@ def split_export_response(
 
     stamp = f"{request.start_date}_{request.end_date}"
     return StreamingResponse(
-        stream_zip(members()),
+        stream_zip(members(), compress=not stream_format.compressed),
         media_type="application/zip",
         headers=attachment_headers(f"{prefix}_{stamp}_split.zip"),
     )
@@ -18,6 +18,7 @@ from gpustack.api.exceptions import InvalidException
 from gpustack.schemas.usage import (
     USAGE_EXPORT_FORMAT_CSV,
     USAGE_EXPORT_FORMAT_XLSX,
+    USAGE_EXPORT_STREAMING_FORMATS,
     USAGE_SCOPE_ALL,
     UsageExportColumn,
     UsageExportEstimateResponse,
@@ -60,6 +61,18 @@ def effective_export_format(requested: str, totals) -> str:
     return requested
 
 
+def split_export_format(requested: str) -> str:
+    """The format the parts of a split export are written in.
+
+    A split is a zip of row slices written as they stream, so it keeps any
+    format that streams (CSV, Parquet, Arrow) and turns xlsx into CSV — see
+    ``split_export_response``.
+    """
+    if requested in USAGE_EXPORT_STREAMING_FORMATS:
+        return requested
+    return USAGE_EXPORT_FORMAT_CSV
+
+
 def shorten_range_days(request, total: int, limit: int) -> int:
     """How many days would fit under ``limit`` at the current row density."""
     days = (request.end_date - request.start_date).days + 1
@@ -170,12 +183,12 @@ def build_export_estimate(
             else []
         ),
         split_parts=split_parts,
-        # A split export is always CSV (it is the only format that streams),
+        # A split export is never xlsx (it only writes formats that stream),
         # so once splitting is the way out, that is the format the user will
         # get. Saying so here is what keeps the promise before the click equal
         # to the file after it.
         effective_format=(
-            USAGE_EXPORT_FORMAT_CSV
+            split_export_format(request.format)
             if exceeds_hard
             else effective_export_format(
                 request.format, [estimate.total for estimate in estimates]
@@ -227,7 +240,13 @@ def split_too_many_parts(planned_members: int) -> InvalidException:
 
 
 def split_member_name(
-    sheet_key: str, index: int, parts: int, many: bool, *, prefix: str = "usage"
+    sheet_key: str,
+    index: int,
+    parts: int,
+    many: bool,
+    *,
+    prefix: str = "usage",
+    extension: str = "csv",
 ) -> str:
     """Name for one part of a split export.
 
@@ -245,8 +264,8 @@ def split_member_name(
     width = len(str(parts))
     part = f"part-{index:0{width}d}-of-{parts}"
     if many:
-        return f"by_{sheet_key}/{part}.csv"
-    return f"{prefix}_by_{sheet_key}_{part}.csv"
+        return f"by_{sheet_key}/{part}.{extension}"
+    return f"{prefix}_by_{sheet_key}_{part}.{extension}"
 
 
 def export_columns_payload(
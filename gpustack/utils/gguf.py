@@ -0,0 +1,248 @@
+"""Read the header of GGUF files without reading their tensor data.
+
+A GGUF file starts with its key/value metadata and the shape, type and offset
+of every tensor; the tensor data, gigabytes of it, follows. The file is
+memory-mapped and only that leading header is walked, so the pages of tensor
+data are never touched.
+
+Tokenizer arrays (hundreds of thousands of strings in a large vocabulary) are
+stepped over rather than decoded; only their length is kept.
+
+See https://github.com/ggml-org/ggml/blob/master/docs/gguf.md for the format.
+"""
+
+import functools
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+GGUF_MAGIC = b"GGUF"
+
+# Metadata value types.
+_UINT8, _INT8, _UINT16, _INT16, _UINT32, _INT32, _FLOAT32, _BOOL = range(8)
+_STRING, _ARRAY, _UINT64, _INT64, _FLOAT64 = range(8, 13)
+
+_SCALAR_FORMATS = {
+    _UINT8: "<B",
+    _INT8: "<b",
+    _UINT16: "<H",
+    _INT16: "<h",
+    _UINT32: "<I",
+    _INT32: "<i",
+    _FLOAT32: "<f",
+    _BOOL: "<?",
+    _UINT64: "<Q",
+    _INT64: "<q",
+    _FLOAT64: "<d",
+}
+
+# ggml tensor type -> (elements per block, bytes per block).
+GGML_TYPE_SIZES: Dict[int, Tuple[int, int]] = {
+    0: (1, 4),  # F32
+    1: (1, 2),  # F16
+    2: (32, 18),  # Q4_0
+    3: (32, 20),  # Q4_1
+    6: (32, 22),  # Q5_0
+    7: (32, 24),  # Q5_1
+    8: (32, 34),  # Q8_0
+    9: (32, 36),  # Q8_1
+    10: (256, 84),  # Q2_K
+    11: (256, 110),  # Q3_K
+    12: (256, 144),  # Q4_K
+    13: (256, 176),  # Q5_K
+    14: (256, 210),  # Q6_K
+    15: (256, 292),  # Q8_K
+    16: (256, 66),  # IQ2_XXS
+    17: (256, 74),  # IQ2_XS
+    18: (256, 98),  # IQ3_XXS
+    19: (256, 50),  # IQ1_S
+    20: (32, 18),  # IQ4_NL
+    21: (256, 110),  # IQ3_S
+    22: (256, 82),  # IQ2_S
+    23: (256, 136),  # IQ4_XS
+    24: (1, 1),  # I8
+    25: (1, 2),  # I16
+    26: (1, 4),  # I32
+    27: (1, 8),  # I64
+    28: (1, 8),  # F64
+    29: (256, 56),  # IQ1_M
+    30: (1, 2),  # BF16
+    31: (32, 18),  # Q4_0_4_4
+    32: (32, 18),  # Q4_0_4_8
+    33: (32, 18),  # Q4_0_8_8
+    34: (256, 54),  # TQ1_0
+    35: (256, 66),  # TQ2_0
+    36: (32, 18),  # IQ4_NL_4_4
+    37: (32, 18),  # IQ4_NL_4_8
+    38: (32, 18),  # IQ4_NL_8_8
+    39: (32, 17),  # MXFP4
+}
+
+# Key prefixes whose array values are skipped instead of decoded.
+_SKIPPED_ARRAY_PREFIXES = ("tokenizer.",)
+
+
+class GGUFError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class GGUFSkippedArray:
+    """An array value that was not decoded."""
+
+    type: int
+    length: int
+
+    def __len__(self) -> int:
+        return self.length
+
+
+@dataclass(frozen=True)
+class GGUFTensorInfo:
+    name: str
+    dims: Tuple[int, ...]
+    type: int
+    offset: int
+
+    @property
+    def elements(self) -> int:
+        n = 1
+        for d in self.dims:
+            n *= d
+        return n
+
+    @property
+    def nbytes(self) -> int:
+        try:
+            block_size, type_size = GGML_TYPE_SIZES[self.type]
+        except KeyError:
+            raise GGUFError(f"Unknown ggml type {self.type} of tensor {self.name}")
+        return self.elements // block_size * type_size
+
+
+@dataclass(frozen=True)
+class GGUFHeader:
+    version: int
+    metadata: Dict[str, Any]
+    tensors: List[GGUFTensorInfo]
+
+    @property
+    def architecture(self) -> str:
+        return self.metadata.get("general.architecture", "")
+
+
+class _Cursor:
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def unpack(self, fmt: str):
+        try:
+            (value,) = struct.unpack_from(fmt, self.buf, self.pos)
+        except struct.error:
+            raise GGUFError("Truncated GGUF header")
+        self.pos += struct.calcsize(fmt)
+        return value
+
+    def string(self) -> str:
+        length = self.unpack("<Q")
+        end = self.pos + length
+        if end > len(self.buf):
+            raise GGUFError("Truncated GGUF header")
+        value = bytes(self.buf[self.pos : end]).decode("utf-8", errors="replace")
+        self.pos = end
+        return value
+
+    def skip_string(self) -> None:
+        length = self.unpack("<Q")
+        self.pos += length
+
+    def value(self, value_type: int, skip_arrays: bool = False):
+        fmt = _SCALAR_FORMATS.get(value_type)
+        if fmt is not None:
+            return self.unpack(fmt)
+        if value_type == _STRING:
+            return self.string()
+        if value_type == _ARRAY:
+            return self.array(skip_arrays)
+        raise GGUFError(f"Unknown GGUF metadata type {value_type}")
+
+    def array(self, skip: bool):
+        item_type = self.unpack("<I")
+        length = self.unpack("<Q")
+        fmt = _SCALAR_FORMATS.get(item_type)
+        if fmt is not None:
+            size = struct.calcsize(fmt)
+            if skip:
+                self.pos += size * length
+                return GGUFSkippedArray(item_type, length)
+            start = self.pos
+            self.pos += size * length
+            if self.pos > len(self.buf):
+                raise GGUFError("Truncated GGUF header")
+            return list(struct.unpack_from(f"<{length}{fmt[1]}", self.buf, start))
+        if item_type == _STRING and skip:
+            for _ in range(length):
+                self.skip_string()
+            return GGUFSkippedArray(item_type, length)
+        return [self.value(item_type, skip) for _ in range(length)]
+
+
+def _parse(buf) -> GGUFHeader:
+    if bytes(buf[:4]) != GGUF_MAGIC:
+        raise GGUFError("Not a GGUF file")
+    cursor = _Cursor(buf)
+    cursor.pos = 4
+    version = cursor.unpack("<I")
+    if version not in (2, 3):
+        # Version 1 used 32-bit counts; a byte-swapped version means a
+        # big-endian file. Neither is produced by current tools.
+        raise GGUFError(f"Unsupported GGUF version {version}")
+    tensor_count = cursor.unpack("<Q")
+    kv_count = cursor.unpack("<Q")
+
+    metadata: Dict[str, Any] = {}
+    for _ in range(kv_count):
+        key = cursor.string()
+        value_type = cursor.unpack("<I")
+        metadata[key] = cursor.value(
+            value_type, skip_arrays=key.startswith(_SKIPPED_ARRAY_PREFIXES)
+        )
+
+    tensors: List[GGUFTensorInfo] = []
+    for _ in range(tensor_count):
+        name = cursor.string()
+        n_dims = cursor.unpack("<I")
+        dims = tuple(cursor.unpack("<Q") for _ in range(n_dims))
+        tensor_type = cursor.unpack("<I")
+        offset = cursor.unpack("<Q")
+        tensors.append(GGUFTensorInfo(name, dims, tensor_type, offset))
+
+    return GGUFHeader(version=version, metadata=metadata, tensors=tensors)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_header(path: str, mtime_ns: int, size: int) -> GGUFHeader:
+    with open(path, "rb") as f:
+        if size < 4:
+            raise GGUFError("Not a GGUF file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return _parse(view)
+            finally:
+                view.release()
+
+
+def read_gguf_header(path: str) -> GGUFHeader:
+    """Read the metadata and tensor infos of the GGUF file at ``path``.
+
+    Headers are cached by path, modification time and size, so repeated
+    estimates of an unchanged file do not read it again.
+    """
+    stat = os.stat(path)
+    return _read_header(os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,159 @@
+"""Hedged fan-out: ask a few candidates, more only if they are slow.
+
+Asking every worker at once and waiting for all of them makes an answer as
+slow as the slowest worker in the cluster. :func:`hedged_first` instead asks
+a few candidates, and asks more only when none has answered by the time most
+past calls (a latency percentile, tracked per kind of call) would have, or
+when one of them fails. The first accepted answer wins; the calls still in
+flight are cancelled.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from gpustack import envs
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Latencies remembered per kind of call.
+_WINDOW = 128
+
+# Hedge delay while there is no history yet, and its lower bound.
+_DEFAULT_HEDGE_DELAY = 1.0
+_MIN_HEDGE_DELAY = 0.05
+
+
+class LatencyTracker:
+    """Recent latencies of successful calls of one kind."""
+
+    def __init__(self, window: int = _WINDOW):
+        self._samples: deque = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(int(p * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+
+
+def latency_tracker(kind: str) -> LatencyTracker:
+    tracker = _trackers.get(kind)
+    if tracker is None:
+        tracker = _trackers[kind] = LatencyTracker()
+    return tracker
+
+
+class HedgedResult(Generic[T, R]):
+    __slots__ = ("candidate", "value")
+
+    def __init__(self, candidate: T, value: R):
+        self.candidate = candidate
+        self.value = value
+
+
+async def hedged_first(
+    candidates: Sequence[T],
+    call: Callable[[T], Awaitable[R]],
+    kind: str,
+    accept: Callable[[R], bool] = lambda value: value is not None,
+    on_failure: Optional[Callable[[T, Any], None]] = None,
+    initial: Optional[int] = None,
+    percentile: Optional[float] = None,
+) -> Optional[HedgedResult[T, R]]:
+    """Return the first accepted ``call(candidate)``, or None if none is.
+
+    ``initial`` candidates are called at once. Each time the percentile of
+    past latencies of ``kind`` passes without an accepted answer, one more
+    is; so is one whenever a call fails or its answer is not accepted, which
+    is reported to ``on_failure`` with the exception or the answer. Calls
+    still in flight when one is accepted are cancelled.
+    """
+    initial = max(
+        1, initial if initial is not None else envs.WORKER_PROBE_INITIAL_FANOUT
+    )
+    percentile = (
+        percentile if percentile is not None else envs.WORKER_PROBE_HEDGE_PERCENTILE
+    )
+    tracker = latency_tracker(kind)
+    hedge_delay = tracker.percentile(percentile)
+    hedge_delay = (
+        _DEFAULT_HEDGE_DELAY
+        if hedge_delay is None
+        else max(hedge_delay, _MIN_HEDGE_DELAY)
+    )
+
+    remaining = list(candidates)
+    remaining.reverse()
+    running: Dict[asyncio.Task, Tuple[T, float]] = {}
+    hedge_at = 0.0
+
+    def launch() -> None:
+        nonlocal hedge_at
+        candidate = remaining.pop()
+        task = asyncio.create_task(call(candidate))
+        started = time.monotonic()
+        running[task] = (candidate, started)
+        # The hedge clock runs from the latest launch, whatever triggered it.
+        hedge_at = started + hedge_delay
+
+    for _ in range(min(initial, len(remaining))):
+        launch()
+
+    try:
+        while running:
+            done, _ = await asyncio.wait(
+                running.keys(),
+                timeout=(max(hedge_at - time.monotonic(), 0) if remaining else None),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                # Everyone in flight is slower than usual: ask one more.
+                logger.debug(f"Hedging {kind} after {hedge_delay:.3f}s")
+                launch()
+                continue
+            for task in done:
+                candidate, started = running.pop(task)
+                failure: Any
+                if task.exception() is not None:
+                    failure = task.exception()
+                else:
+                    value = task.result()
+                    if accept(value):
+                        tracker.observe(time.monotonic() - started)
+                        return HedgedResult(candidate, value)
+                    failure = value
+                if on_failure is not None:
+                    on_failure(candidate, failure)
+                # Replace a failed call right away rather than at the next
+                # hedge deadline.
+                if remaining:
+                    launch()
+        return None
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -1,4 +1,4 @@
-"""Streaming writers for tabular exports (CSV, zip-of-CSV, xlsx).
+"""Streaming writers for tabular exports (CSV, zip-of-CSV, xlsx, Parquet, Arrow).
 
 Shared by the usage and resource-usage export routes so both produce
 byte-identical file shapes. Nothing here knows about usage rows: callers hand
@@ -15,15 +15,26 @@ Why CSV is the primary format and xlsx the compatibility one:
   archive itself is still assembled before the first byte can be sent — so the
   xlsx path buffers where the CSV path streams. That is acceptable precisely
   because the format caps out around a million rows anyway.
+
+Parquet and Arrow IPC are the formats for data that goes straight into a BI
+tool or a dataframe. They stream like CSV — rows are transposed into columnar
+batches of ``USAGE_EXPORT_COLUMNAR_BATCH_ROWS`` and each batch is written as
+soon as it fills — but the file is typed (no re-parsing numbers and dates out
+of text) and the dimension columns are dictionary-encoded, which is where most
+of an export's bytes go: a user or route name repeats on every row it owns.
+Both need ``pyarrow``, which is optional; see :func:`columnar_export_available`.
 """
 
 import asyncio
 import contextlib
 import csv
+import importlib.util
 import io
 import time
 import zipfile
 from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import (
     Any,
     AsyncIterator,
@@ -36,8 +47,15 @@ from typing import (
     Union,
 )
 
+from gpustack import envs
+
 CSV_UTF8_BOM = b"\xef\xbb\xbf"
 
+# Schema metadata key carrying the trailer in the columnar formats. Parquet and
+# Arrow have no place for a trailing row, but both keep key/value metadata
+# with the schema, which every reader exposes.
+COLUMNAR_TRAILER_KEY = b"gpustack.export.trailer"
+
 # Columns are plain strings, and whatever the caller passes is written
 # verbatim. The usage exports pass readable-but-never-localized titles
 # ("User ID"), keeping the machine keys behind them on a separate channel
@@ -206,6 +224,228 @@ async def stream_csv(
         yield tail
 
 
+@lru_cache(maxsize=1)
+def columnar_export_available() -> bool:
+    """Whether ``pyarrow`` is installed, i.e. whether Parquet / Arrow can be written.
+
+    ``pyarrow`` is an optional dependency: it is large, and only these two
+    formats need it. Requests for them are refused up front when it is
+    missing, rather than failing after the response has started.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _columnar_type(pa, values: Sequence[Any]):
+    """The Arrow type of one column, decided from its first batch.
+
+    The type is fixed for the whole file — neither writer can change a
+    column's type once the first batch is out — so it has to be one every
+    later value can still be written as. Numbers are therefore always float:
+    a ratio or a cost that happens to be ``0`` on every row of the first
+    batch would otherwise type the column as integer and have a later ``1.5``
+    cut to ``1``. Counts lose nothing by it, float64 holds every integer up
+    to 2**53 exactly. A column with no value at all in the first batch falls
+    back to string for the same reason.
+    """
+    present = [value for value in values if value is not None]
+    if not present:
+        return pa.string()
+    # ``bool`` before numbers and ``datetime`` before ``date``: each is a
+    # subclass of the other, same as in ``_write_row``.
+    if all(isinstance(value, bool) for value in present):
+        return pa.bool_()
+    if all(isinstance(value, datetime) for value in present):
+        aware = present[0].tzinfo is not None
+        return pa.timestamp("us", tz="UTC" if aware else None)
+    if all(isinstance(value, date) for value in present):
+        return pa.date32()
+    if all(
+        isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+        for value in present
+    ):
+        return pa.float64()
+    return pa.string()
+
+
+def _as_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _columnar_values(pa, values: Sequence[Any], arrow_type) -> List[Any]:
+    """Coerce one column of one batch to the column's fixed type.
+
+    The type was sampled from the first batch, so a later value may not fit
+    it (a column that was all numbers meets a ``"n/a"``). Such a value is
+    written as null: the file is already part-way out, and raising here would
+    end the download with a truncated file instead of one with a gap.
+    """
+    if pa.types.is_string(arrow_type):
+        return [None if value is None else str(value) for value in values]
+    if pa.types.is_floating(arrow_type):
+        return [None if value is None else _as_float(value) for value in values]
+    if pa.types.is_boolean(arrow_type):
+        fits = (bool,)
+    elif pa.types.is_timestamp(arrow_type):
+        fits = (datetime,)
+    elif pa.types.is_date(arrow_type):
+        fits = (date,)
+    else:
+        return list(values)
+    return [value if isinstance(value, fits) else None for value in values]
+
+
+async def _row_batches(
+    rows: AsyncIterator[Sequence[Any]], size: int
+) -> AsyncIterator[List[Sequence[Any]]]:
+    batch: List[Sequence[Any]] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _stream_columnar(  # noqa: C901
+    columns: Sequence[str],
+    rows: AsyncIterator[Sequence[Any]],
+    *,
+    parquet: bool,
+    trailer: Optional[str],
+) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+
+    columns = list(columns)
+    buffer = _ChunkBuffer()
+    sink = pa.PythonFile(buffer, mode="w")
+    writer = None
+    schema = None
+    metadata = {COLUMNAR_TRAILER_KEY: trailer.encode("utf-8")} if trailer else None
+
+    def open_writer(types):
+        nonlocal schema
+        dimensions = [
+            name
+            for name, arrow_type in zip(columns, types)
+            if pa.types.is_string(arrow_type)
+        ]
+        if parquet:
+            import pyarrow.parquet as pq
+
+            schema = pa.schema(
+                [pa.field(name, t) for name, t in zip(columns, types)], metadata
+            )
+            # Dictionary encoding is a per-column-chunk property in Parquet, so
+            # the schema keeps plain strings and the writer encodes them.
+            return pq.ParquetWriter(
+                sink, schema, compression="zstd", use_dictionary=dimensions or False
+            )
+        schema = pa.schema(
+            [
+                pa.field(
+                    name,
+                    (pa.dictionary(pa.int32(), t) if name in dimensions else t),
+                )
+                for name, t in zip(columns, types)
+            ],
+            metadata,
+        )
+        # The STREAM format, not the file format: it may replace a column's
+        # dictionary between batches, which a forward-only writer needs.
+        return pa.ipc.new_stream(sink, schema)
+
+    def to_batch(batch_rows):
+        arrays = []
+        for index, field in enumerate(schema):
+            values = [row[index] if index < len(row) else None for row in batch_rows]
+            if pa.types.is_dictionary(field.type):
+                array = pa.array(
+                    _columnar_values(pa, values, field.type.value_type),
+                    type=field.type.value_type,
+                ).dictionary_encode()
+            else:
+                array = pa.array(
+                    _columnar_values(pa, values, field.type), type=field.type
+                )
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def write(batch_rows):
+        nonlocal writer
+        if writer is None:
+            writer = open_writer(
+                [
+                    _columnar_type(pa, [row[i] for row in batch_rows if i < len(row)])
+                    for i in range(len(columns))
+                ]
+            )
+        batch = to_batch(batch_rows)
+        if parquet:
+            writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            writer.write_batch(batch)
+
+    try:
+        async with _closing(rows):
+            async for batch_rows in _row_batches(
+                rows, envs.USAGE_EXPORT_COLUMNAR_BATCH_ROWS
+            ):
+                # Transposing and encoding a batch is pure CPU; off the event
+                # loop it stops being a stall for every other request.
+                await asyncio.to_thread(write, batch_rows)
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+        if writer is None:
+            # No rows at all: still a valid, typed-as-string, empty file.
+            writer = open_writer([pa.string()] * len(columns))
+    finally:
+        if writer is not None:
+            writer.close()
+    tail = buffer.drain()
+    if tail:
+        yield tail
+
+
+async def stream_parquet(
+    columns: Sequence[str],
+    rows: AsyncIterator[Sequence[Any]],
+    *,
+    trailer: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Yield a zstd-compressed Parquet file, one row group per batch.
+
+    A truncated Parquet file has no footer and will not open at all, so
+    unlike CSV a mid-stream failure cannot pass for a complete export; the
+    ``trailer`` rides in the schema metadata for the same reconciliation the
+    CSV trailer serves.
+    """
+    async for chunk in _stream_columnar(columns, rows, parquet=True, trailer=trailer):
+        yield chunk
+
+
+async def stream_arrow(
+    columns: Sequence[str],
+    rows: AsyncIterator[Sequence[Any]],
+    *,
+    trailer: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Yield an Arrow IPC stream, one record batch per batch of rows.
+
+    Dimension (string) columns are dictionary-typed, so a dataframe library
+    loads them as categoricals without re-encoding. ``trailer`` rides in the
+    schema metadata, as in :func:`stream_parquet`.
+    """
+    async for chunk in _stream_columnar(columns, rows, parquet=False, trailer=trailer):
+        yield chunk
+
+
 async def take_rows(
     rows: AsyncIterator[Sequence[Any]], count: int
 ) -> AsyncIterator[Sequence[Any]]:
@@ -261,6 +501,8 @@ async def stream_zip(
         Iterable[Tuple[str, AsyncIterator[bytes]]],
         AsyncIterator[Tuple[str, AsyncIterator[bytes]]],
     ],
+    *,
+    compress: bool = True,
 ) -> AsyncIterator[bytes]:
     """Yield a zip archive built from named byte streams, without buffering it.
 
@@ -273,11 +515,15 @@ async def stream_zip(
     generator ends — including when the client disconnects mid-archive, which
     is the case that would otherwise strand an open cursor until the event
     loop got around to finalizing an abandoned generator.
+
+    ``compress=False`` stores members as they are, for payloads that are
+    compressed already.
     """
     buffer = _ChunkBuffer()
     if not hasattr(members, "__aiter__"):
         members = _as_async_iterator(members)
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(buffer, mode="w", compression=compression) as archive:
         async with _closing(members) as member_stream:
             async for name, chunks in member_stream:
                 async with _closing(chunks):
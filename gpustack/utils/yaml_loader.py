@@ -0,0 +1,20 @@
+"""YAML loading through libyaml when PyYAML was built with it.
+
+``yaml.safe_load`` is pure Python and takes a noticeable part of server
+start-up on the bundled catalogs; the C loader parses them tens of times
+faster into the same data.
+"""
+
+from typing import Any, IO, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """Drop-in for ``yaml.safe_load``."""
+    return yaml.load(stream, Loader=SafeLoader)
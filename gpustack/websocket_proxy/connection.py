@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 import asyncio
 import logging
 import uuid
+from dataclasses import dataclass
 from functools import partial
 from typing import Optional, Union, TYPE_CHECKING, Callable, Coroutine, Any
 from fastapi import HTTPException
@@ -16,10 +17,21 @@ if TYPE_CHECKING:
     from websockets.server import ServerConnection
     from starlette.websockets import WebSocket as StarletteWebSocket
 
-from .message import DataMessage, DisconnectMessage, pack_message
+from .constants import default_session_buffer_limit, default_session_window
+from .message import (
+    DATA_COMPRESSION_NONE,
+    AdaptiveCompressor,
+    DisconnectMessage,
+    WindowUpdateMessage,
+    pack_message,
+)
 
 logger = logging.getLogger(__name__)
 
+# Adaptive read sizes for relay, see relay()
+RELAY_MIN_READ_SIZE = 8 * 1024
+RELAY_MAX_READ_SIZE = 256 * 1024
+
 
 class IOConnection(ABC):
     @abstractmethod
@@ -78,8 +90,35 @@ class AsyncIOConnection(IOConnection):
         await self.write(response)
 
 
+@dataclass
+class BufferStats:
+    """Buffer accounting for one tunnel session, or summed over a websocket"""
+
+    # Received bytes queued for the local consumer
+    buffered_bytes: int = 0
+    peak_buffered_bytes: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    # Times a writer had to wait for credit, and writers waiting right now
+    credit_stalls: int = 0
+    blocked_writers: int = 0
+
+    def buffer(self, n: int) -> None:
+        self.buffered_bytes += n
+        self.bytes_received += n
+        self.peak_buffered_bytes = max(self.peak_buffered_bytes, self.buffered_bytes)
+
+
 class TunnelConnection(IOConnection):
-    """Represents a tunnel connection to target server"""
+    """Represents a tunnel connection to target server
+
+    Sessions multiplexed over one websocket are flow controlled independently:
+    when ``send_window`` is given (the peer advertised it during the
+    handshake) a writer may only have that many unacknowledged bytes in flight
+    and waits for WINDOW_UPDATE credit beyond it, and the reader hands credit
+    back as its consumer drains the buffer. Without it the peer predates flow
+    control, and the receive buffer is capped at ``buffer_limit`` instead.
+    """
 
     def __init__(
         self,
@@ -87,6 +126,11 @@ class TunnelConnection(IOConnection):
         websocket: Union[
             "ClientConnection", "ServerConnection", "StarletteWebSocket", None
         ],
+        send_window: Optional[int] = None,
+        recv_window: int = default_session_window,
+        buffer_limit: int = default_session_buffer_limit,
+        compression: int = DATA_COMPRESSION_NONE,
+        connection_stats: Optional[BufferStats] = None,
     ) -> None:
         self.session_id = session_id
         self.websocket = websocket
@@ -94,9 +138,30 @@ class TunnelConnection(IOConnection):
         self._pending_future: Optional[asyncio.Future[bool]] = (
             asyncio.get_running_loop().create_future()
         )
-        # Response tracking queue for WebSocket tunnel mode
+        # Response tracking queue for WebSocket tunnel mode, bounded in bytes
+        # by the receive window (or buffer_limit without flow control)
         self._response_queue: asyncio.Queue[bytes] = asyncio.Queue()
         self._connection_error: Optional[Exception] = None
+        self._closed = False
+
+        self._flow_control = send_window is not None
+        self._send_window = send_window or 0
+        self._send_credit = asyncio.Event()
+        self._recv_window = recv_window
+        self._recv_unacked = 0
+        self._buffer_limit = buffer_limit
+        self._buffer_drained = asyncio.Event()
+        self._buffer_drained.set()
+
+        self._compressor = AdaptiveCompressor(compression)
+
+        self.buffer_stats = BufferStats()
+        self._connection_stats = connection_stats
+
+    @property
+    def send_window(self) -> Optional[int]:
+        """Bytes this session may still send, None without flow control"""
+        return self._send_window if self._flow_control else None
 
     @property
     def is_pending(self) -> bool:
@@ -143,6 +208,16 @@ class TunnelConnection(IOConnection):
         else:
             await self.websocket.send(data)
 
+    def _account(self, attr: str, n: int) -> None:
+        for stats in (self.buffer_stats, self._connection_stats):
+            if stats is not None:
+                setattr(stats, attr, getattr(stats, attr) + n)
+
+    def _buffer(self, n: int) -> None:
+        for stats in (self.buffer_stats, self._connection_stats):
+            if stats is not None:
+                stats.buffer(n)
+
     async def handle_data(self, data: bytes) -> None:
         """Handle data received from WebSocket, forward to target"""
         logger.trace(
@@ -156,10 +231,55 @@ class TunnelConnection(IOConnection):
 
         if not data:
             logger.trace("[Tunnel] Empty data received, signaling EOF")
+            await self._response_queue.put(data)
+            return
+
+        buffered = self.buffer_stats.buffered_bytes
+        if self._flow_control:
+            if buffered + len(data) > self._recv_window:
+                logger.warning(
+                    "[Tunnel] Peer overran the session window "
+                    f"({buffered + len(data)} > {self._recv_window} bytes), "
+                    f"closing session_id={self.session_id}"
+                )
+                await self.close()
+                return
         else:
-            logger.trace(f"[Tunnel] Queuing {len(data)} bytes for response tracking")
+            # The peer cannot be asked to slow down per session, so push back on
+            # the whole websocket rather than buffer without limit.
+            while (
+                self.buffer_stats.buffered_bytes >= self._buffer_limit
+                and not self._closed
+            ):
+                self._buffer_drained.clear()
+                await self._buffer_drained.wait()
+            if self._closed:
+                return
+
+        logger.trace(f"[Tunnel] Queuing {len(data)} bytes for response tracking")
+        self._buffer(len(data))
         await self._response_queue.put(data)
-        return
+
+    def grant_credit(self, increment: int) -> None:
+        """Handle a WINDOW_UPDATE from the peer"""
+        self._send_window += increment
+        self._send_credit.set()
+
+    async def _consumed(self, n: int) -> None:
+        """Release ``n`` read bytes from the buffer, returning credit to the peer"""
+        self._account("buffered_bytes", -n)
+        if self.buffer_stats.buffered_bytes < self._buffer_limit:
+            self._buffer_drained.set()
+        if not self._flow_control or self._closed:
+            return
+        # Batch credit so a stream of small reads does not become a stream of
+        # WINDOW_UPDATE messages.
+        self._recv_unacked += n
+        if self._recv_unacked < self._recv_window // 2:
+            return
+        increment, self._recv_unacked = self._recv_unacked, 0
+        msg = WindowUpdateMessage(session_id=self.session_id, increment=increment)
+        await self._send_to_websocket(pack_message(msg))
 
     # Followings methods are for compatibility with IOConnection interface, used in tunnel function
     async def close(self) -> None:
@@ -175,38 +295,93 @@ class TunnelConnection(IOConnection):
             logger.trace(
                 f"[Tunnel] Failed to send DisconnectMessage (websocket may already be closed): {e}, session_id={self.session_id}"
             )
+        if not self._closed:
+            self._closed = True
+            # Wake writers waiting for credit and readers waiting on space
+            self._send_credit.set()
+            self._buffer_drained.set()
+            # Whatever the consumer did not read no longer counts as buffered
+            self._account("buffered_bytes", -self.buffer_stats.buffered_bytes)
         await self._response_queue.put(b"")  # Unblock any pending reads
 
     async def read(self, _n: int = -1, timeout: float = 3000.0) -> bytes:
-        return await asyncio.wait_for(self._response_queue.get(), timeout=timeout)
+        data = await asyncio.wait_for(self._response_queue.get(), timeout=timeout)
+        if data and not self._closed:
+            await self._consumed(len(data))
+        return data
+
+    async def _wait_for_credit(self) -> None:
+        self._account("credit_stalls", 1)
+        self._account("blocked_writers", 1)
+        try:
+            while self._send_window <= 0 and not self._closed:
+                self._send_credit.clear()
+                await self._send_credit.wait()
+        finally:
+            self._account("blocked_writers", -1)
 
     async def write(self, data: bytes) -> None:
-        """Send data to WebSocket"""
+        """Send data to WebSocket
+
+        With flow control the data is split to fit the session's send window,
+        and the call waits for credit when the window is exhausted; that wait
+        is what pushes back on ``relay`` reading from the source.
+        """
         logger.trace(
             f"[Tunnel] Sending {len(data)} bytes to WebSocket, session_id={self.session_id}"
         )
-        msg = DataMessage(session_id=self.session_id, data=data)
-        await self._send_to_websocket(pack_message(msg))
+        if not self._flow_control:
+            msg = self._compressor.message(self.session_id, data)
+            await self._send_to_websocket(pack_message(msg))
+            self._account("bytes_sent", len(data))
+            return
+
+        # Slices of a view are sent without copying the data per frame
+        view = memoryview(data)
+        offset = 0
+        while offset < len(data):
+            if self._send_window <= 0:
+                await self._wait_for_credit()
+            if self._closed:
+                raise ConnectionResetError(
+                    f"Tunnel session closed while sending, session_id={self.session_id}"
+                )
+            n = min(self._send_window, len(data) - offset)
+            self._send_window -= n
+            msg = self._compressor.message(self.session_id, view[offset : offset + n])
+            await self._send_to_websocket(pack_message(msg))
+            self._account("bytes_sent", n)
+            offset += n
 
 
 async def relay(
     reader: IOConnection,
     writer: IOConnection,
     name: str,
+    min_read_size: int = RELAY_MIN_READ_SIZE,
+    max_read_size: int = RELAY_MAX_READ_SIZE,
 ) -> None:
     """Relay data from ``reader`` to ``writer`` until EOF or error.
 
-    Reads in 8 KiB chunks and writes each to the writer. Closes the writer
-    when the reader signals EOF (empty bytes) or raises an exception.
+    Reads start at ``min_read_size`` and double while the reader keeps filling
+    them, up to ``max_read_size``, so a bulk transfer moves in few large
+    frames; a read that comes back under half full halves the size again, so
+    interactive traffic is not held to large reads. Closes the writer when the
+    reader signals EOF (empty bytes) or raises an exception.
     """
+    read_size = min_read_size
     try:
         while True:
-            data = await reader.read(8192)
+            data = await reader.read(read_size)
             if not data:
                 logger.trace(f"{name}: read EOF")
                 break
             logger.trace(f"{name}: forwarding {len(data)} bytes")
             await writer.write(data)
+            if len(data) >= read_size:
+                read_size = min(read_size * 2, max_read_size)
+            elif len(data) < read_size // 2:
+                read_size = max(read_size // 2, min_read_size)
     except Exception as e:
         logger.error(f"{name}: error {e}")
     finally:
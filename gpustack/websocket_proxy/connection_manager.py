@@ -14,13 +14,21 @@ if TYPE_CHECKING:
     from websockets.server import ServerConnection
     from starlette.websockets import WebSocket as StarletteWebSocket
 
-from .connection import TunnelConnection, IOConnection, AsyncIOConnection, tunnel
+from .connection import (
+    BufferStats,
+    TunnelConnection,
+    IOConnection,
+    AsyncIOConnection,
+    tunnel,
+)
 from .message import (
+    DATA_COMPRESSION_NONE,
     SessionBaseMessage,
     ConnectRequestMessage,
     ConnectResponseMessage,
     DataMessage,
     DisconnectMessage,
+    WindowUpdateMessage,
     pack_message,
 )
 
@@ -30,26 +38,74 @@ logger = logging.getLogger(__name__)
 # ==================== Independent Handlers ====================
 
 
+WebSocketChannel = Union["ClientConnection", "ServerConnection", "StarletteWebSocket"]
+
+
 class ConnectionManager:
-    """Manages all tunnel connections lifecycle (server-side)"""
+    """Manages all tunnel connections lifecycle (server-side)
+
+    A client may open several websocket channels; sessions are striped across
+    them, each new session going to the least loaded channel and staying on it
+    for its lifetime.
+    """
 
     def __init__(
         self,
-        websocket: Optional[
-            Union["ClientConnection", "ServerConnection", "StarletteWebSocket"]
-        ] = None,
+        websocket: Optional[WebSocketChannel] = None,
+        peer_window: Optional[int] = None,
+        compression: int = DATA_COMPRESSION_NONE,
+        channel: int = 0,
     ) -> None:
-        self.websocket = websocket
+        self._tunneled = websocket is not None
+        self._channels: Dict[int, WebSocketChannel] = {}
+        if websocket is not None:
+            self._channels[channel] = websocket
         self._connections: Dict[uuid.UUID, TunnelConnection] = {}
+        # Per-session window the client advertised, None without flow control
+        self.peer_window = peer_window
+        # DATA codec negotiated with the client
+        self.compression = compression
+        self.buffer_stats = BufferStats()
+
+    @property
+    def websocket(self) -> Optional[WebSocketChannel]:
+        """Any live channel, None for a manager that connects directly"""
+        return next(iter(self._channels.values()), None)
+
+    def channels(self) -> Dict[int, WebSocketChannel]:
+        """Get live channels by index"""
+        return self._channels
+
+    def add_channel(self, channel: int, websocket: WebSocketChannel) -> None:
+        """Attach another websocket of the same client to stripe sessions over.
+
+        A channel index that is already attached belongs to a connection the
+        client has given up on, and is replaced.
+        """
+        self._channels[channel] = websocket
 
-    async def _send_to_websocket(self, data: bytes) -> None:
-        """Send data to WebSocket, compatible with Starlette and websockets library"""
-        if self.websocket is None:
-            return
-        if hasattr(self.websocket, 'send_bytes'):
-            await self.websocket.send_bytes(data)
-        else:
-            await self.websocket.send(data)
+    async def remove_channel(self, channel: int, websocket: WebSocketChannel) -> bool:
+        """Detach a dropped channel and end the sessions it carried.
+
+        Returns whether other channels remain to carry new sessions.
+        """
+        if self._channels.get(channel) is websocket:
+            del self._channels[channel]
+        for session_id, connection in list(self._connections.items()):
+            if getattr(connection, "websocket", None) is websocket:
+                self._connections.pop(session_id, None)
+                await connection.close()
+        return bool(self._channels)
+
+    def _pick_channel(self) -> WebSocketChannel:
+        """Least loaded channel: fewest sessions, then fewest buffered bytes"""
+        load = {id(ws): [0, 0] for ws in self._channels.values()}
+        for connection in self._connections.values():
+            channel_load = load.get(id(getattr(connection, "websocket", None)))
+            if channel_load is not None:
+                channel_load[0] += 1
+                channel_load[1] += connection.buffer_stats.buffered_bytes
+        return min(self._channels.values(), key=lambda ws: load[id(ws)])
 
     async def _direct_connect(
         self, session_id: uuid.UUID, target_url: str
@@ -66,11 +122,19 @@ class ConnectionManager:
     async def _websocket_connect(
         self, session_id: uuid.UUID, target_url: str
     ) -> TunnelConnection:
-        connection = TunnelConnection(session_id, self.websocket)
+        if not self._channels:
+            raise ConnectionError("No tunnel channel available")
+        connection = TunnelConnection(
+            session_id,
+            self._pick_channel(),
+            send_window=self.peer_window,
+            compression=self.compression,
+            connection_stats=self.buffer_stats,
+        )
         self._connections[session_id] = connection
 
         message = ConnectRequestMessage(session_id=session_id, target_url=target_url)
-        await self._send_to_websocket(pack_message(message))
+        await connection._send_to_websocket(pack_message(message))
         logger.trace(
             f"[ConnectionManager] Sent CONNECT_REQUEST for {target_url} (session={session_id})"
         )
@@ -95,7 +159,7 @@ class ConnectionManager:
         URL format: tcp://host:port or unix:///path/to/socket
         """
         session_id = uuid.uuid4()
-        if self.websocket is None:
+        if not self._tunneled:
             connection = await self._direct_connect(session_id, target_url)
         else:
             connection = await self._websocket_connect(session_id, target_url)
@@ -116,6 +180,9 @@ class ConnectionManager:
     async def dispatch(self, msg: SessionBaseMessage) -> None:
         """Dispatch message to appropriate handler based on message type"""
         connection = self.get_connection(msg.session_id)
+        if connection is None and isinstance(msg, WindowUpdateMessage):
+            # Credit can cross a disconnect on the wire
+            return
         if connection is None and not isinstance(msg, DisconnectMessage):
             logger.error(
                 f"[ConnectionManager] WARNING: No connection found for session_id={msg.session_id}, message type={type(msg).__name__}"
@@ -129,6 +196,8 @@ class ConnectionManager:
                 connection.connect_error(Exception(f"Connection failed: {msg.error}"))
         elif isinstance(msg, DataMessage):
             await connection.handle_data(msg.data)
+        elif isinstance(msg, WindowUpdateMessage):
+            connection.grant_credit(msg.increment)
         elif isinstance(msg, DisconnectMessage):
             connection = self.pop_connection(msg.session_id)
             if connection:
@@ -156,10 +225,17 @@ class ClientConnectionManager:
     def __init__(
         self,
         websocket: Union["ClientConnection", "ServerConnection", "StarletteWebSocket"],
+        peer_window: Optional[int] = None,
+        compression: int = DATA_COMPRESSION_NONE,
     ) -> None:
         self.websocket = websocket
         self._connections: Dict[uuid.UUID, TunnelConnection] = {}
         self._tasks: set[asyncio.Task] = set()
+        # Per-session window the server advertised, None without flow control
+        self.peer_window = peer_window
+        # DATA codec negotiated with the server
+        self.compression = compression
+        self.buffer_stats = BufferStats()
 
     async def _send_to_websocket(self, data: bytes) -> None:
         """Send data to WebSocket, compatible with Starlette and websockets library"""
@@ -183,6 +259,13 @@ class ClientConnectionManager:
         """Get all connections"""
         return self._connections
 
+    async def close(self) -> None:
+        """End every session, used once the websocket carrying them is gone"""
+        for session_id in list(self._connections):
+            connection = self.pop_connection(session_id)
+            if connection:
+                await connection.close()
+
     async def dispatch(self, msg: SessionBaseMessage) -> None:
         """Dispatch message to appropriate handler based on message type"""
         connection = self.get_connection(msg.session_id)
@@ -192,6 +275,9 @@ class ClientConnectionManager:
         elif isinstance(msg, DataMessage):
             if connection:
                 await connection.handle_data(msg.data)
+        elif isinstance(msg, WindowUpdateMessage):
+            if connection:
+                connection.grant_credit(msg.increment)
         elif isinstance(msg, DisconnectMessage):
             connection = self.pop_connection(msg.session_id)
             if connection:
@@ -217,6 +303,9 @@ class ClientConnectionManager:
             connection = TunnelConnection(
                 session_id=msg.session_id,
                 websocket=self.websocket,
+                send_window=self.peer_window,
+                compression=self.compression,
+                connection_stats=self.buffer_stats,
             )
             connection.set_connected()
             self._connections[msg.session_id] = connection
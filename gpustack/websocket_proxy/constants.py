@@ -1 +1,21 @@
 default_connect_path = "/connect"
+
+# Per-session credit window, in bytes, that a tunnel endpoint grants its peer.
+# A peer never has more than this much unconsumed data in flight for a session.
+default_session_window = 1024 * 1024
+
+# Bytes a session may buffer before a peer without flow control is pushed back
+# on; only relevant when talking to endpoints that predate WINDOW_UPDATE.
+default_session_buffer_limit = 4 * 1024 * 1024
+
+# Handshake header carrying the sender's per-session receive window. Its
+# presence on both sides of the handshake turns on credit-based flow control.
+tunnel_window_header = "x-tunnel-window"
+
+# Handshake header negotiating the DATA frame codec: the client lists the codecs
+# it supports, the server answers with the one both ends will send.
+tunnel_compression_header = "x-tunnel-compression"
+
+# Handshake header carrying the index of one of several parallel websockets a
+# client opens; channels with the same client id share one sessions table.
+tunnel_channel_header = "x-tunnel-channel"
@@ -23,7 +23,8 @@ Client API:
     - GET /clients/{client_id} - Get details for a specific client
       Returns: client info including CIDRs, unix sockets, active sessions
     - GET /clients/{client_id}/connections - Get active tunnel connections for a client
-      Returns: {"connections": [...], "total": N}
+      Returns: {"connections": [...], "total": N, "channels": [...], "flow_control": bool,
+                "buffer": {...}} with per-session and per-websocket buffer stats
 
 Federation API:
     - POST /register-peer - Register a peer server
@@ -43,6 +44,7 @@ import argparse
 import logging
 import uuid
 import uvicorn
+from dataclasses import asdict
 from typing import Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -159,9 +161,17 @@ def _create_server_app(message_handler: MessageServerHandler):  # noqa: C901
                     "session_id": str(session_id),
                     "is_pending": conn.is_pending,
                     "is_connected": conn.is_connected,
+                    "send_window": conn.send_window,
+                    "buffer": asdict(conn.buffer_stats),
                 }
             )
-        return {"connections": connections, "total": len(connections)}
+        return {
+            "connections": connections,
+            "total": len(connections),
+            "channels": sorted(conn_mgr.channels()),
+            "flow_control": conn_mgr.peer_window is not None,
+            "buffer": asdict(conn_mgr.buffer_stats),
+        }
 
     @app.get("/peers")
     async def list_peers():
@@ -256,6 +266,7 @@ async def _run_client(args):
         client_id=args.client_id,
         cidrs=args.cidr,
         unix_sockets=args.unix_sockets,
+        channels=args.channels,
     )
     await client.run()
 
@@ -294,6 +305,12 @@ def _parse_args():
         dest='unix_sockets',
         help='Unix socket path to register (can be specified multiple times)',
     )
+    parser.add_argument(
+        '--channels',
+        type=int,
+        default=1,
+        help='Parallel websockets to stripe tunnel sessions over (client only)',
+    )
     return parser.parse_args()
 
 
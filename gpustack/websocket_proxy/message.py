@@ -1,12 +1,29 @@
 import uuid
 import gzip
-import io
+import importlib.util
 import json
 import struct
+import zlib
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Type, Callable, TypeVar, Dict, Literal
+from typing import (
+    Optional,
+    List,
+    Tuple,
+    Type,
+    Callable,
+    TypeVar,
+    Dict,
+    Literal,
+    Union,
+)
 from enum import IntEnum
 
+from .constants import (
+    tunnel_channel_header,
+    tunnel_compression_header,
+    tunnel_window_header,
+)
+
 # Protocol version
 PROTOCOL_VERSION = 0x01
 
@@ -14,9 +31,27 @@ PROTOCOL_VERSION = 0x01
 M = TypeVar('M', bound='BaseMessage')
 
 
+def parse_tunnel_window(value: Optional[str]) -> Optional[int]:
+    """Parse an advertised per-session window, None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        window = int(value)
+    except ValueError:
+        return None
+    return window if window > 0 else None
+
+
 # ==================== Info Dataclasses ====================
 
 
+def _parse_channel(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
 @dataclass
 class BaseClientInfo:
     """Base class for client information"""
@@ -24,14 +59,29 @@ class BaseClientInfo:
     client_id: uuid.UUID
     cidrs: List[str] = field(default_factory=list)
     unix_sockets: List[str] = field(default_factory=list)
+    # Per-session receive window advertised by the client, None if the client
+    # does not support WINDOW_UPDATE flow control.
+    tunnel_window: Optional[int] = None
+    # DATA codecs the client can use, most preferred first
+    tunnel_codecs: List[str] = field(default_factory=list)
+    # Index of this websocket among the client's parallel channels, None for
+    # a client that keeps a single websocket
+    tunnel_channel: Optional[int] = None
 
     def to_headers(self) -> Dict[str, str]:
         """Convert to headers dict for websockets client library."""
-        return {
+        headers = {
             'x-client-id': str(self.client_id),
             'x-cidrs': ','.join(self.cidrs),
             'x-unix-sockets': ','.join(self.unix_sockets),
         }
+        if self.tunnel_window is not None:
+            headers[tunnel_window_header] = str(self.tunnel_window)
+        if self.tunnel_codecs:
+            headers[tunnel_compression_header] = ','.join(self.tunnel_codecs)
+        if self.tunnel_channel is not None:
+            headers[tunnel_channel_header] = str(self.tunnel_channel)
+        return headers
 
 
 @dataclass
@@ -65,6 +115,13 @@ class RegisteredClientInfo(BaseClientInfo):
             client_id=client_id,
             cidrs=cidr_list,
             unix_sockets=socket_list,
+            tunnel_window=parse_tunnel_window(headers.get(tunnel_window_header)),
+            tunnel_codecs=[
+                c.strip()
+                for c in (headers.get(tunnel_compression_header) or '').split(',')
+                if c.strip()
+            ],
+            tunnel_channel=_parse_channel(headers.get(tunnel_channel_header)),
         )
 
 
@@ -165,6 +222,8 @@ class BinaryType(IntEnum):
     LIST_CLIENTS_RESPONSE = 0x07
     # Server <-> Server messages
     CLIENT_UPDATE = 0x08
+    # Flow control
+    WINDOW_UPDATE = 0x09
 
 
 # Protocol types
@@ -183,10 +242,19 @@ TYPE_HEARTBEAT = "heartbeat"
 TYPE_LIST_CLIENTS = "list_clients"
 TYPE_LIST_CLIENTS_RESPONSE = "list_clients_response"
 TYPE_CLIENT_UPDATE = "client_update"
+TYPE_WINDOW_UPDATE = "window_update"
 
 # Compression flags
 DATA_COMPRESSION_NONE = 0x00
 DATA_COMPRESSION_GZIP = 0x01
+DATA_COMPRESSION_DEFLATE = 0x02
+DATA_COMPRESSION_ZSTD = 0x03
+
+# Adaptive compression policy, see AdaptiveCompressor
+DATA_COMPRESSION_LEVEL = 1
+DATA_COMPRESSION_MIN_SIZE = 1024
+DATA_COMPRESSION_MIN_RATIO = 0.9
+DATA_COMPRESSION_BACKOFF = 16
 
 
 # ==================== Protocol Helpers ====================
@@ -274,7 +342,6 @@ class BaseMessage:
             raise ValueError(f"Unsupported protocol version: {version}")
 
         msg_type = data[1]
-        payload = data[2:]
 
         # Check if msg_type is a valid BinaryType value
         if msg_type not in BinaryType._value2member_map_:
@@ -284,7 +351,12 @@ class BaseMessage:
         if not message_cls:
             raise ValueError(f"Unknown binary message type: {msg_type}")
 
-        return message_cls._parse_payload(payload)
+        return message_cls._parse_frame(data)
+
+    @classmethod
+    def _parse_frame(cls, frame: bytes) -> M:
+        """Parse a whole frame whose header has been validated"""
+        return cls._parse_payload(frame[2:])
 
     @classmethod
     def _parse_payload(cls, payload: bytes) -> M:
@@ -305,27 +377,115 @@ DataCompressor = Callable[[bytes], bytes]
 
 
 def compress_gzip(data: bytes) -> bytes:
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-        gz.write(data)
-    return buf.getvalue()
+    return gzip.compress(data, compresslevel=DATA_COMPRESSION_LEVEL)
 
 
 def decompress_gzip(data: bytes) -> bytes:
-    with gzip.GzipFile(fileobj=io.BytesIO(data), mode="rb") as gz:
-        return gz.read()
+    return gzip.decompress(data)
+
+
+def compress_deflate(data: bytes) -> bytes:
+    return zlib.compress(data, DATA_COMPRESSION_LEVEL)
 
 
 _DATA_COMPRESSORS: dict[int, DataCompressor] = {
     DATA_COMPRESSION_NONE: lambda x: x,
     DATA_COMPRESSION_GZIP: compress_gzip,
+    DATA_COMPRESSION_DEFLATE: compress_deflate,
 }
 
 _DATA_DECOMPRESSORS: dict[int, DataCompressor] = {
-    DATA_COMPRESSION_NONE: lambda x: x,
+    DATA_COMPRESSION_NONE: bytes,
     DATA_COMPRESSION_GZIP: decompress_gzip,
+    DATA_COMPRESSION_DEFLATE: zlib.decompress,
 }
 
+if importlib.util.find_spec("zstandard") is not None:
+    import zstandard
+
+    # Compressor objects are reusable but not thread-safe; the tunnel only
+    # touches them from the event loop thread.
+    _zstd_compressor = zstandard.ZstdCompressor(level=DATA_COMPRESSION_LEVEL)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+
+    _DATA_COMPRESSORS[DATA_COMPRESSION_ZSTD] = _zstd_compressor.compress
+    # Frames written by ZstdCompressor.compress always record their size
+    _DATA_DECOMPRESSORS[DATA_COMPRESSION_ZSTD] = _zstd_decompressor.decompress
+
+# Codecs offered during the handshake, most preferred first. Plain gzip is
+# kept for decoding only; deflate is the same algorithm without the header.
+_CODEC_NAMES: dict[int, str] = {
+    DATA_COMPRESSION_ZSTD: "zstd",
+    DATA_COMPRESSION_DEFLATE: "deflate",
+}
+
+
+def supported_codecs() -> List[str]:
+    """Names of the DATA codecs this process can encode and decode"""
+    return [name for codec, name in _CODEC_NAMES.items() if codec in _DATA_COMPRESSORS]
+
+
+def codec_from_name(name: Optional[str]) -> int:
+    """Map a negotiated codec name to its DATA compression flag"""
+    for codec, codec_name in _CODEC_NAMES.items():
+        if codec_name == name and codec in _DATA_COMPRESSORS:
+            return codec
+    return DATA_COMPRESSION_NONE
+
+
+def negotiate_codec(offered: Optional[str]) -> Optional[str]:
+    """Pick our most preferred codec out of a peer's comma separated offer"""
+    if not offered:
+        return None
+    names = {name.strip() for name in offered.split(',')}
+    for name in supported_codecs():
+        if name in names:
+            return name
+    return None
+
+
+class AdaptiveCompressor:
+    """Decides per DATA frame whether compressing is worth the CPU
+
+    Frames under ``min_size`` (small JSON and SSE events) go out as they are.
+    Larger frames are compressed and sent raw if that saves too little, and
+    after such a frame the next ``backoff`` frames skip the attempt, so an
+    already compressed stream (model weights, images) costs one probe every
+    few frames instead of a compression pass on each of them.
+    """
+
+    def __init__(
+        self,
+        codec: int = DATA_COMPRESSION_NONE,
+        min_size: int = DATA_COMPRESSION_MIN_SIZE,
+        min_ratio: float = DATA_COMPRESSION_MIN_RATIO,
+        backoff: int = DATA_COMPRESSION_BACKOFF,
+    ) -> None:
+        self.codec = codec if codec in _DATA_COMPRESSORS else DATA_COMPRESSION_NONE
+        self.min_size = min_size
+        self.min_ratio = min_ratio
+        self.backoff = backoff
+        self._skip = 0
+
+    def message(self, session_id: uuid.UUID, data: bytes) -> 'DataMessage':
+        """Build the DataMessage for ``data``, compressed if it pays off"""
+        if self.codec == DATA_COMPRESSION_NONE or len(data) < self.min_size:
+            return DataMessage(session_id=session_id, data=data)
+        if self._skip > 0:
+            self._skip -= 1
+            return DataMessage(session_id=session_id, data=data)
+
+        compressed = _DATA_COMPRESSORS[self.codec](data)
+        if len(compressed) > len(data) * self.min_ratio:
+            self._skip = self.backoff
+            return DataMessage(session_id=session_id, data=data)
+        return DataMessage(
+            session_id=session_id,
+            data=data,
+            compression=self.codec,
+            compressed=compressed,
+        )
+
 
 def _pack_string_list(strings: List[str]) -> bytes:
     """Pack a list of strings"""
@@ -434,32 +594,52 @@ class ConnectResponseMessage(SessionBaseMessage):
 class DataMessage(SessionBaseMessage):
     """Data transmission message"""
 
+    # Any bytes-like object when sending; always bytes once parsed
     data: bytes
     compression: int = DATA_COMPRESSION_NONE
+    # ``data`` already run through ``compression``, so a frame the sender
+    # compressed to decide whether to send it compressed is not packed twice
+    compressed: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def get_type(self) -> str:
         return TYPE_DATA
 
+    def _payload_parts(self) -> List[bytes]:
+        compressed = self.compressed
+        if compressed is None:
+            compressor = _DATA_COMPRESSORS.get(self.compression, lambda x: x)
+            compressed = compressor(self.data)
+        return [
+            self.session_id.bytes,
+            struct.pack(">BI", self.compression, len(compressed)),
+            compressed,
+        ]
+
+    def pack(self) -> bytes:
+        # A single join copies the data into the frame once; ``data`` may be a
+        # memoryview over the sender's read buffer rather than its own bytes
+        header = bytes([PROTOCOL_VERSION, MessageRegistry.get_binary_type(TYPE_DATA)])
+        return b"".join([header, *self._payload_parts()])
+
     def _pack_payload(self) -> bytes:
-        compressor = _DATA_COMPRESSORS.get(self.compression, lambda x: x)
-        compressed = compressor(self.data)
-        result = self.session_id.bytes
-        result += bytes([self.compression])
-        result += struct.pack(">I", len(compressed))
-        result += compressed
-        return result
+        return b"".join(self._payload_parts())
+
+    @classmethod
+    def _parse_frame(cls, frame: bytes) -> 'DataMessage':
+        # Parse over a view so the data is copied once, straight out of the frame
+        return cls._parse_payload(memoryview(frame)[2:])
 
     @classmethod
-    def _parse_payload(cls, payload: bytes) -> 'DataMessage':
+    def _parse_payload(cls, payload: Union[bytes, memoryview]) -> 'DataMessage':
         if len(payload) < 21:
             raise ValueError("Invalid data message")
-        session_id = uuid.UUID(bytes=payload[:16])
+        session_id = uuid.UUID(bytes=bytes(payload[:16]))
         compression = payload[16]
-        data_len = struct.unpack(">I", payload[17:21])[0]
+        data_len = struct.unpack_from(">I", payload, 17)[0]
         if len(payload) < 21 + data_len:
             raise ValueError("Invalid data message")
 
-        decompressor = _DATA_DECOMPRESSORS.get(compression, lambda x: x)
+        decompressor = _DATA_DECOMPRESSORS.get(compression, bytes)
         data = decompressor(payload[21 : 21 + data_len])
 
         return cls(session_id=session_id, data=data, compression=compression)
@@ -489,6 +669,31 @@ class DisconnectMessage(SessionBaseMessage):
         return cls(session_id=session_id, error=error)
 
 
+@MessageRegistry.register(BinaryType.WINDOW_UPDATE, TYPE_WINDOW_UPDATE)
+@dataclass
+class WindowUpdateMessage(SessionBaseMessage):
+    """Grants the peer ``increment`` more bytes of DATA for a session
+
+    Only sent to peers that advertised a tunnel window during the handshake.
+    """
+
+    increment: int
+
+    def get_type(self) -> str:
+        return TYPE_WINDOW_UPDATE
+
+    def _pack_payload(self) -> bytes:
+        return self.session_id.bytes + struct.pack(">I", self.increment)
+
+    @classmethod
+    def _parse_payload(cls, payload: bytes) -> 'WindowUpdateMessage':
+        if len(payload) < 20:
+            raise ValueError("Invalid window update message")
+        session_id = uuid.UUID(bytes=payload[:16])
+        increment = struct.unpack(">I", payload[16:20])[0]
+        return cls(session_id=session_id, increment=increment)
+
+
 @MessageRegistry.register(BinaryType.HEARTBEAT, TYPE_HEARTBEAT)
 @dataclass
 class HeartbeatMessage(BaseMessage):
@@ -664,7 +869,7 @@ def message_to_json(msg: BaseMessage) -> str:
     def serialize_value(v):
         if isinstance(v, uuid.UUID):
             return str(v)
-        if isinstance(v, bytes):
+        if isinstance(v, (bytes, memoryview)):
             return v.hex()
         if isinstance(v, list):
             return [serialize_value(x) for x in v]
@@ -7,17 +7,26 @@ import asyncio
 import logging
 import random
 import uuid
-from websockets.asyncio.client import connect
+from dataclasses import replace
+from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import ConnectionClosed
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .connection_manager import ClientConnectionManager
 from .message import (
     BaseClientInfo,
     SessionBaseMessage,
+    codec_from_name,
     parse_message,
+    parse_tunnel_window,
+    supported_codecs,
 )
 from .authenticator import Authenticator, create_authenticator
-from .constants import default_connect_path
+from .constants import (
+    default_connect_path,
+    default_session_window,
+    tunnel_compression_header,
+    tunnel_window_header,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +48,7 @@ class MessageClient:
         cidrs: Optional[List[str]] = None,
         unix_sockets: Optional[List[str]] = None,
         authenticator: Optional[Authenticator] = None,
+        channels: int = 1,
     ) -> None:
         # replace http(s):// with ws(s):// and append connect path
         self.server_uri = (
@@ -49,46 +59,78 @@ class MessageClient:
             client_id=client_id,
             cidrs=cidrs or [],
             unix_sockets=unix_sockets or [],
+            tunnel_window=default_session_window,
+            tunnel_codecs=supported_codecs(),
         )
         self._authenticator = (
             authenticator if authenticator is not None else create_authenticator(None)
         )
         self._lock = asyncio.Lock()
-        self._websocket = None
+        # Number of parallel websockets sessions are striped over
+        self._channels = max(1, channels)
+        self._websockets: Dict[Optional[int], ClientConnection] = {}
 
     async def update_cidrs(self, cidrs: List[str]) -> None:
         """Update CIDRs for the client (thread-safe)"""
         async with self._lock:
             self._client_info.cidrs = cidrs
         logger.debug(f"[Client] Updated CIDRs: {cidrs}")
-        if self._websocket and not self._websocket.close_code:
-            await self._websocket.close(
-                code=1008, reason="CIDRs updated"
-            )  # Trigger reconnect to update server with new CIDRs
+        for websocket in list(self._websockets.values()):
+            if not websocket.close_code:
+                await websocket.close(
+                    code=1008, reason="CIDRs updated"
+                )  # Trigger reconnect to update server with new CIDRs
 
     async def run(self) -> None:
-        """Connect to server and handle incoming messages with automatic reconnect"""
+        """Connect to server and handle incoming messages with automatic reconnect
+
+        With several channels each one connects and reconnects on its own; the
+        server stripes new sessions over the channels that are up, so losing
+        one only ends the sessions it carried.
+        """
+        if self._channels == 1:
+            await self._run_channel(None)
+            return
+        await asyncio.gather(
+            *(self._run_channel(channel) for channel in range(self._channels))
+        )
+
+    async def _run_channel(self, channel: Optional[int]) -> None:
         reconnect_delay = INITIAL_RECONNECT_DELAY
 
         while True:
             async with self._lock:
-                headers = self._client_info.to_headers()
+                client_info = replace(self._client_info, tunnel_channel=channel)
+            headers = client_info.to_headers()
             self._authenticator.inject_headers(headers)
+            connection_manager = None
             try:
-                self._websocket = await connect(
+                websocket = await connect(
                     self.server_uri,
                     proxy=None,
                     additional_headers=headers,
                 )
+                self._websockets[channel] = websocket
                 logger.debug(
-                    f"[Client] Connected to {self.server_uri} with client_id: {self._client_info.client_id}"
+                    f"[Client] Connected to {self.server_uri} with client_id: {self._client_info.client_id}, channel: {channel}"
+                )
+                # A server that predates flow control or compression does not
+                # answer the corresponding handshake headers
+                response_headers = websocket.response.headers
+                connection_manager = ClientConnectionManager(
+                    websocket,
+                    peer_window=parse_tunnel_window(
+                        response_headers.get(tunnel_window_header)
+                    ),
+                    compression=codec_from_name(
+                        response_headers.get(tunnel_compression_header)
+                    ),
                 )
-                connection_manager = ClientConnectionManager(self._websocket)
                 reconnect_delay = (
                     INITIAL_RECONNECT_DELAY  # Reset delay on successful connection
                 )
 
-                async for raw_data in self._websocket:
+                async for raw_data in websocket:
                     msg = parse_message(raw_data)
                     logger.trace(f"[Client] Received: {msg.get_type()}")
 
@@ -107,6 +149,12 @@ class MessageClient:
             except Exception as e:
                 logger.error(f"[Client] Unexpected error: {e}, reconnecting...")
 
+            finally:
+                self._websockets.pop(channel, None)
+                if connection_manager is not None:
+                    # Unblock the tunnels of sessions that died with the channel
+                    await connection_manager.close()
+
             # Exponential backoff with jitter
             jitter = (
                 reconnect_delay * RECONNECT_JITTER_FACTOR * (2 * random.random() - 1)
@@ -20,11 +20,18 @@ from .message import (
     RegisteredClientInfo,
     ServerInfo,
     ServerPeer,
+    codec_from_name,
+    negotiate_codec,
     parse_message,
     pack_message,
 )
 from .authenticator import Authenticator, NoOpAuthenticator
-from .constants import default_connect_path
+from .constants import (
+    default_connect_path,
+    default_session_window,
+    tunnel_compression_header,
+    tunnel_window_header,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -467,23 +474,61 @@ class MessageServerHandler:
         self, websocket: WebSocket, client_info: RegisteredClientInfo
     ):
         """Handle a client WebSocket connection"""
-        # Accept first — if the handshake fails nothing needs cleanup.
-        await websocket.accept()
+        # Accept first — if the handshake fails nothing needs cleanup. Only a
+        # client that advertised a window is told ours, which is what turns
+        # on flow control for both ends; likewise the codec is only answered
+        # when the client offered one we support.
+        accept_headers = []
+        if client_info.tunnel_window is not None:
+            accept_headers.append(
+                (tunnel_window_header.encode(), str(default_session_window).encode())
+            )
+        codec = negotiate_codec(','.join(client_info.tunnel_codecs))
+        if codec is not None:
+            accept_headers.append((tunnel_compression_header.encode(), codec.encode()))
+        await websocket.accept(headers=accept_headers or None)
 
         client_id = client_info.client_id
         cidr_list = client_info.cidrs
         socket_list = client_info.unix_sockets
+        channel = client_info.tunnel_channel or 0
 
-        connection_manager = ConnectionManager(websocket)
-        self.connection_managers[client_id] = connection_manager
+        connection_manager = self.connection_managers.get(client_id)
+        if client_info.tunnel_channel is not None and connection_manager is not None:
+            # Another channel of a striped client shares its sessions table
+            connection_manager.add_channel(channel, websocket)
+            logger.debug(f"[Server] Client {client_id} attached channel {channel}")
+        else:
+            connection_manager = ConnectionManager(
+                websocket,
+                peer_window=client_info.tunnel_window,
+                compression=codec_from_name(codec),
+                channel=channel,
+            )
+            self.connection_managers[client_id] = connection_manager
+
+        registered = self.client_registry.get(client_id)
+        if (
+            registered is not None
+            and connection_manager.channels().keys() - {channel}
+            and (registered.cidrs, registered.unix_sockets) == (cidr_list, socket_list)
+        ):
+            # Other channels already registered the client as it is
+            generation = self._client_generations.get(client_id, 0)
+            await self.handle_client(websocket, client_id, generation, channel)
+            return
 
         # Set server_id so send_client_update_to_peer can filter correctly
         client_info.server_id = self._server_info.server_id
         self.client_registry[client_id] = client_info
 
-        # Index CIDRs for efficient lookup
-        for cidr in cidr_list:
-            self._cidr_registry.insert(cidr, client_id)
+        # Index CIDRs for efficient lookup, replacing those of an earlier
+        # registration (the client reconnects when its CIDRs change)
+        if registered is not None:
+            self._cidr_registry.update_client(client_id, cidr_list)
+        else:
+            for cidr in cidr_list:
+                self._cidr_registry.insert(cidr, client_id)
 
         logger.debug(
             f"[Server] Client registered via WS: {client_id}, CIDRs: {cidr_list}"
@@ -497,7 +542,7 @@ class MessageServerHandler:
 
         if self._callback_on_connect:
             await self._safe_callback(self._callback_on_connect, None, client_info)
-        await self.handle_client(websocket, client_id, generation)
+        await self.handle_client(websocket, client_id, generation, channel)
 
     async def handle_server_federation(
         self,
@@ -540,7 +585,11 @@ class MessageServerHandler:
         await self.handle_peer(websocket, server_info.server_id)
 
     async def handle_client(
-        self, websocket: WebSocket, client_id: uuid.UUID, generation: int
+        self,
+        websocket: WebSocket,
+        client_id: uuid.UUID,
+        generation: int,
+        channel: int = 0,
     ):
         """Handle a client connection"""
         try:
@@ -580,29 +629,46 @@ class MessageServerHandler:
         except Exception as e:
             logger.debug(f"[Server] Client error: {e}")
         finally:
-            # Get client info before removing
-            client_info = self.client_registry.get(client_id)
-            cidr_list = client_info.cidrs if client_info else []
-            socket_list = client_info.unix_sockets if client_info else []
-
-            if client_id and client_id in self.client_registry:
-                self._cidr_registry.remove_client(client_id)
-                del self.client_registry[client_id]
-            if client_id and client_id in self.connection_managers:
-                del self.connection_managers[client_id]
-
-            # Broadcast client disconnection to peers
-            await self.broadcast_client_update(
-                "remove", client_id, cidr_list, socket_list
-            )
+            await self._client_channel_closed(websocket, client_id, generation, channel)
 
-            # Call disconnect callback (filtered by generation to avoid stale callbacks)
-            if self._callback_on_disconnect:
-                await self._safe_disconnect_callback(
-                    self._callback_on_disconnect, client_info, generation
-                )
+    async def _client_channel_closed(
+        self,
+        websocket: WebSocket,
+        client_id: uuid.UUID,
+        generation: int,
+        channel: int,
+    ) -> None:
+        """Unregister a client once the last of its channels is gone"""
+        connection_manager = self.connection_managers.get(client_id)
+        if connection_manager is not None and await connection_manager.remove_channel(
+            channel, websocket
+        ):
+            # Sessions on this channel ended; new ones go to the channels left,
+            # or to the connection that replaced this one
+            logger.debug(f"[Server] Client {client_id} lost channel {channel}")
+            return
+
+        # Get client info before removing
+        client_info = self.client_registry.get(client_id)
+        cidr_list = client_info.cidrs if client_info else []
+        socket_list = client_info.unix_sockets if client_info else []
+
+        if client_id and client_id in self.client_registry:
+            self._cidr_registry.remove_client(client_id)
+            del self.client_registry[client_id]
+        if client_id and client_id in self.connection_managers:
+            del self.connection_managers[client_id]
+
+        # Broadcast client disconnection to peers
+        await self.broadcast_client_update("remove", client_id, cidr_list, socket_list)
+
+        # Call disconnect callback (filtered by generation to avoid stale callbacks)
+        if self._callback_on_disconnect:
+            await self._safe_disconnect_callback(
+                self._callback_on_disconnect, client_info, generation
+            )
 
-            logger.debug(f"[Server] Client disconnected: {client_id}")
+        logger.debug(f"[Server] Client disconnected: {client_id}")
 
 
 def handler_getter(websocket: WebSocket) -> MessageServerHandler:
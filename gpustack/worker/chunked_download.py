@@ -0,0 +1,282 @@
+"""Concurrent HTTP range downloads of large model files.
+
+A model with a handful of multi-GiB safetensors shards gets little from
+downloading one file per thread: each shard is still one TCP stream. Here a
+file is split into fixed-size chunks that are fetched concurrently with
+``Range`` requests and written in place at their offsets.
+
+Progress is kept in a sidecar state file next to the data, saved as chunks
+advance, so a download interrupted by a worker restart continues from the
+bytes already on disk, inside a chunk as well as between chunks. Each chunk
+is checked against the ``Content-Range`` the server answered with and its
+length; the finished file is checked for its size and, when known, its
+SHA-256.
+
+Progress is reported through a callback with the bytes just written, so
+callers do not need to scrape a progress bar for it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gpustack import envs
+
+logger = logging.getLogger(__name__)
+
+# Read size of a chunk's response body, and of the final hash.
+_BLOCK_SIZE = 1024 * 1024
+
+# Progress state is saved at least this often (in bytes written), so a crash
+# costs at most this much of the download.
+_STATE_SAVE_INTERVAL = 64 * 1024 * 1024
+
+_CHUNK_ATTEMPTS = 3
+
+# Called with (bytes just written, bytes written in total, file size).
+ProgressCallback = Callable[[int, int, int], None]
+
+
+class RangeNotSupportedError(Exception):
+    """The server answered a range request with something other than it."""
+
+
+class ChunkVerificationError(Exception):
+    pass
+
+
+class ChunkedDownload:
+    """Download ``url`` to ``file_path`` in concurrently fetched chunks.
+
+    ``incomplete_path`` holds the data until it is complete and verified, and
+    ``state_path`` (by default next to it) the progress needed to resume. The
+    data is renamed into place, so it must be on the volume of ``file_path``.
+    A resumed download must have the same ``etag`` (by default, the URL
+    without its query) and size as the one that left the data behind.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        file_path: os.PathLike,
+        incomplete_path: os.PathLike,
+        size: int,
+        headers: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        sha256: Optional[str] = None,
+        state_path: Optional[os.PathLike] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        session: Optional[requests.Session] = None,
+        timeout: float = 30,
+    ):
+        self._url = url
+        self._file_path = Path(file_path)
+        self._incomplete_path = Path(incomplete_path)
+        self._state_path = (
+            Path(state_path)
+            if state_path is not None
+            else self._incomplete_path.with_name(self._incomplete_path.name + ".state")
+        )
+        self._size = size
+        self._headers = dict(headers or {})
+        self._etag = etag or url.split("?", 1)[0]
+        self._sha256 = sha256
+        self._chunk_size = chunk_size or envs.MODEL_DOWNLOAD_CHUNK_SIZE
+        self._max_workers = max(1, max_workers or envs.MODEL_DOWNLOAD_CHUNK_CONCURRENCY)
+        self._progress = progress
+        self._timeout = timeout
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self._max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # Bytes written so far of each chunk, by chunk index.
+        self._done: List[int] = []
+        self._written = 0
+        self._unsaved = 0
+
+    def chunks(self) -> List[Tuple[int, int]]:
+        """The [start, end) byte range of each chunk."""
+        return [
+            (start, min(start + self._chunk_size, self._size))
+            for start in range(0, self._size, self._chunk_size)
+        ]
+
+    def run(self) -> Path:
+        chunks = self.chunks()
+        self._done = self._load_state(len(chunks))
+        self._written = sum(self._done)
+        if self._written and self._progress:
+            # Report what a previous run already wrote.
+            self._progress(self._written, self._written, self._size)
+
+        mode = "r+b" if self._incomplete_path.exists() else "w+b"
+        with open(self._incomplete_path, mode) as f:
+            f.truncate(self._size)
+
+        pending = [
+            (index, start, end)
+            for index, (start, end) in enumerate(chunks)
+            if self._done[index] < end - start
+        ]
+        try:
+            self._fetch_chunks(pending)
+        finally:
+            self._save_state()
+            if self._owns_session:
+                self._session.close()
+
+        self._verify()
+        os.replace(self._incomplete_path, self._file_path)
+        self._state_path.unlink(missing_ok=True)
+        return self._file_path
+
+    def _fetch_chunks(self, pending: List[Tuple[int, int, int]]) -> None:
+        if not pending:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(pending)),
+            thread_name_prefix="chunked-download",
+        ) as executor:
+            futures = [
+                executor.submit(self._fetch_chunk, index, start, end)
+                for index, start, end in pending
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    # Stop the chunks in flight; queued ones return at once.
+                    self._stop.set()
+                    raise future.exception()
+
+    def _fetch_chunk(self, index: int, start: int, end: int) -> None:
+        for attempt in range(_CHUNK_ATTEMPTS):
+            if self._stop.is_set():
+                return
+            try:
+                self._fetch_range(index, start, end)
+                return
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == _CHUNK_ATTEMPTS - 1:
+                    raise
+                logger.debug(
+                    f"Retrying chunk {index} of {self._file_path.name} after: {e}"
+                )
+
+    def _fetch_range(self, index: int, start: int, end: int) -> None:
+        offset = start + self._done[index]
+        headers = dict(self._headers)
+        headers["Range"] = f"bytes={offset}-{end - 1}"
+        with self._session.get(
+            self._url, headers=headers, stream=True, timeout=self._timeout
+        ) as resp:
+            resp.raise_for_status()
+            if resp.status_code != 206:
+                raise RangeNotSupportedError(
+                    f"Expected 206 for a range request, got {resp.status_code}"
+                )
+            content_range = resp.headers.get("Content-Range", "")
+            expected = f"bytes {offset}-{end - 1}/"
+            if not content_range.startswith(expected):
+                raise ChunkVerificationError(
+                    f"Asked for {expected}, got {content_range!r}"
+                )
+
+            # Unbuffered: a byte counted in the state is already with the OS.
+            with open(self._incomplete_path, "r+b", buffering=0) as f:
+                f.seek(offset)
+                for block in resp.iter_content(_BLOCK_SIZE):
+                    if self._stop.is_set():
+                        return
+                    if offset + len(block) > end:
+                        raise ChunkVerificationError(
+                            f"Chunk {index} of {self._file_path.name} is longer "
+                            "than requested"
+                        )
+                    f.write(block)
+                    offset += len(block)
+                    self._advance(index, len(block))
+
+        if offset != end:
+            # The connection ended early; the retry continues from here.
+            raise requests.ConnectionError(
+                f"Chunk {index} of {self._file_path.name} ended at {offset}, "
+                f"expected {end}"
+            )
+
+    def _advance(self, index: int, n: int) -> None:
+        with self._lock:
+            self._done[index] += n
+            self._written += n
+            self._unsaved += n
+            written = self._written
+            save = self._unsaved >= _STATE_SAVE_INTERVAL
+        if save:
+            self._save_state()
+        if self._progress:
+            self._progress(n, written, self._size)
+
+    def _state(self) -> dict:
+        return {
+            "etag": self._etag,
+            "size": self._size,
+            "chunk_size": self._chunk_size,
+            "sha256": self._sha256,
+        }
+
+    def _load_state(self, chunk_count: int) -> List[int]:
+        if self._incomplete_path.exists() and self._state_path.exists():
+            try:
+                state = json.loads(self._state_path.read_text())
+                done = state.pop("done")
+                if state == self._state() and len(done) == chunk_count:
+                    return done
+            except (OSError, ValueError, KeyError):
+                pass
+        # Nothing to resume from, or it was for another file or layout.
+        self._incomplete_path.unlink(missing_ok=True)
+        return [0] * chunk_count
+
+    def _save_state(self) -> None:
+        with self._lock:
+            state = dict(self._state(), done=list(self._done))
+            self._unsaved = 0
+        tmp_path = self._state_path.with_name(self._state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self._state_path)
+
+    def _verify(self) -> None:
+        actual_size = self._incomplete_path.stat().st_size
+        if sum(self._done) != self._size or actual_size != self._size:
+            raise ChunkVerificationError(
+                f"Downloaded {sum(self._done)} of {self._size} bytes of "
+                f"{self._file_path.name}"
+            )
+        if not self._sha256:
+            return
+        digest = hashlib.sha256()
+        with open(self._incomplete_path, "rb") as f:
+            while block := f.read(_BLOCK_SIZE):
+                digest.update(block)
+        if digest.hexdigest() != self._sha256:
+            # Corrupt as a whole; start over next time.
+            self._incomplete_path.unlink(missing_ok=True)
+            self._state_path.unlink(missing_ok=True)
+            raise ChunkVerificationError(
+                f"SHA-256 of {self._file_path.name} does not match"
+            )
@@ -1,15 +1,30 @@
 import logging
 import os
-from typing import List, Optional, Union
+import re
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+from urllib.parse import urlparse
 from tqdm.contrib.concurrent import thread_map
 
 from huggingface_hub import HfApi, hf_hub_download
+from huggingface_hub._local_folder import (
+    get_local_download_paths,
+    read_download_metadata,
+    write_download_metadata,
+)
+from huggingface_hub.file_download import (
+    get_hf_file_metadata,
+    hf_hub_url,
+    is_xet_available,
+)
+from huggingface_hub.utils import build_hf_headers
 from modelscope.hub.api import HubApi
 from modelscope.hub.snapshot_download import (
     snapshot_download as modelscope_snapshot_download,
 )
 from modelscope.hub.utils.utils import model_id_to_group_owner_name
 
+from gpustack import envs
 from gpustack.schemas.models import Model, ModelSource, SourceEnum, get_mmproj_filename
 from gpustack.utils import file
 from gpustack.utils.hub import (
@@ -18,15 +33,23 @@ from gpustack.utils.hub import (
     FileEntry,
 )
 from gpustack.utils.locks import HeartbeatSoftFileLock
+from gpustack.worker.chunked_download import ChunkedDownload, RangeNotSupportedError
 
 logger = logging.getLogger(__name__)
 
+# Called with (filename, bytes just written, bytes written, file size) by
+# downloads that report progress themselves instead of through tqdm.
+DownloadProgressCallback = Callable[[str, int, int, int], None]
+
+_SHA256_ETAG = re.compile(r"[0-9a-f]{64}")
+
 
 def download_model(
     model: ModelSource,
     local_dir: Optional[str] = None,
     cache_dir: Optional[str] = None,
     huggingface_token: Optional[str] = None,
+    progress: Optional[DownloadProgressCallback] = None,
 ) -> List[str]:
     if model.source == SourceEnum.HUGGING_FACE:
         return HfDownloader.download(
@@ -37,6 +60,7 @@ def download_model(
             local_dir=local_dir,
             cache_dir=os.path.join(cache_dir, "huggingface"),
             owner_worker_id=getattr(model, "worker_id", None),
+            progress=progress,
         )
     elif model.source == SourceEnum.MODEL_SCOPE:
         return ModelScopeDownloader.download(
@@ -97,6 +121,7 @@ class HfDownloader:
         cache_dir: Optional[Union[str, os.PathLike[str]]] = None,
         max_workers: int = 8,
         owner_worker_id: Optional[int] = None,
+        progress: Optional[DownloadProgressCallback] = None,
     ) -> List[str]:
         """Download a model from the Hugging Face Hub.
 
@@ -112,6 +137,8 @@ class HfDownloader:
             max_workers (`int`, *optional*):
                 Number of concurrent threads to download files (1 thread = 1 file download).
                 Defaults to 8.
+            progress:
+                Called with the progress of files downloaded in chunks.
 
         Returns:
             The paths to the downloaded model files.
@@ -132,6 +159,7 @@ class HfDownloader:
                     token=token,
                     local_dir=local_dir,
                     extra_filename=extra_filename,
+                    progress=progress,
                 )
 
             # huggingface_hub>=1.0 snapshot_download aggregates per-file progress
@@ -144,6 +172,7 @@ class HfDownloader:
                 token=token,
                 local_dir=local_dir,
                 max_workers=max_workers,
+                progress=progress,
             )
             return [local_dir]
 
@@ -156,6 +185,7 @@ class HfDownloader:
         local_dir: Optional[Union[str, os.PathLike[str]]] = None,
         max_workers: int = 8,
         extra_filename: Optional[str] = None,
+        progress: Optional[DownloadProgressCallback] = None,
     ) -> List[str]:
         """Download a model from the Hugging Face Hub.
         Args:
@@ -163,6 +193,7 @@ class HfDownloader:
             filename: A filename or glob pattern to match the model file in the repo.
             token: The Hugging Face API token.
             local_dir: The local directory to save the model to.
+            progress: Called with the progress of files downloaded in chunks.
         Returns:
             The path to the downloaded model.
         """
@@ -179,6 +210,12 @@ class HfDownloader:
         # Pass full repo-relative paths so files from mixed directories
         # (e.g. weights in a subfolder + mmproj at repo root) all download.
         def _inner_hf_hub_download(repo_file: str) -> str:
+            if local_dir is not None:
+                path = cls._download_file_in_chunks(
+                    repo_id, repo_file, token, local_dir, progress
+                )
+                if path is not None:
+                    return path
             return hf_hub_download(
                 repo_id=repo_id,
                 filename=repo_file,
@@ -196,6 +233,99 @@ class HfDownloader:
         logger.info(f"Downloaded model {repo_id}/{filename}")
         return sorted(downloaded_files)
 
+    @classmethod
+    def _download_file_in_chunks(
+        cls,
+        repo_id: str,
+        repo_file: str,
+        token: Optional[str],
+        local_dir: Union[str, os.PathLike[str]],
+        progress: Optional[DownloadProgressCallback] = None,
+    ) -> Optional[str]:
+        """Download a large file with concurrent range requests.
+
+        Returns None, having downloaded nothing, for files better left to
+        hf_hub_download: small ones, Xet-backed ones (hf_xet already fetches
+        those in parallel) and those whose server does not serve ranges.
+        The file lands where hf_hub_download would put it, with the same
+        download metadata, so either can pick up after the other.
+        """
+        chunk_size = envs.MODEL_DOWNLOAD_CHUNK_SIZE
+        headers = build_hf_headers(token=token)
+        metadata = get_hf_file_metadata(
+            hf_hub_url(repo_id, repo_file), token=token, headers=headers
+        )
+        if (
+            not metadata.etag
+            or not metadata.commit_hash
+            or metadata.size is None
+            or metadata.size < 2 * chunk_size
+            or (metadata.xet_file_data is not None and is_xet_available())
+        ):
+            return None
+
+        local_dir = Path(local_dir)
+        paths = get_local_download_paths(local_dir, repo_file)
+        local_metadata = read_download_metadata(local_dir, repo_file)
+        if (
+            local_metadata is not None
+            and local_metadata.etag == metadata.etag
+            and paths.file_path.exists()
+        ):
+            return str(paths.file_path)
+
+        # Named so that the cleanup of a deleted model's *.<etag>.incomplete
+        # files catches them too.
+        incomplete_path = paths.incomplete_path(metadata.etag)
+        prefix = incomplete_path.name[: -len(f".{metadata.etag}.incomplete")]
+        data_path = incomplete_path.with_name(
+            f"{prefix}.chunked.{metadata.etag}.incomplete"
+        )
+        state_path = incomplete_path.with_name(
+            f"{prefix}.chunks.{metadata.etag}.incomplete"
+        )
+
+        # Downloads are redirected to a CDN that must not see the Hub token.
+        same_host = (
+            urlparse(metadata.location).netloc
+            == urlparse(hf_hub_url(repo_id, repo_file)).netloc
+        )
+        # The etag of an LFS file is its SHA-256.
+        etag = metadata.etag.strip('"')
+        download = ChunkedDownload(
+            url=metadata.location,
+            file_path=paths.file_path,
+            incomplete_path=data_path,
+            state_path=state_path,
+            size=metadata.size,
+            headers=headers if same_host else None,
+            etag=metadata.etag,
+            sha256=etag if _SHA256_ETAG.fullmatch(etag) else None,
+            chunk_size=chunk_size,
+            progress=(
+                (lambda n, written, size: progress(repo_file, n, written, size))
+                if progress
+                else None
+            ),
+        )
+        logger.info(
+            f"Downloading {repo_id}/{repo_file} in " f"{len(download.chunks())} chunks"
+        )
+        try:
+            download.run()
+        except RangeNotSupportedError as e:
+            logger.info(
+                f"Falling back to a single stream for {repo_id}/{repo_file}: {e}"
+            )
+            data_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            return None
+
+        write_download_metadata(
+            local_dir, repo_file, metadata.commit_hash, metadata.etag
+        )
+        return str(paths.file_path)
+
     def __call__(self):
         return self.download()
 
@@ -7,6 +7,7 @@ from prometheus_client import (
     CONTENT_TYPE_LATEST,
 )
 from prometheus_client.core import (
+    CounterMetricFamily,
     GaugeMetricFamily,
     InfoMetricFamily,
 )
@@ -16,6 +17,9 @@ from gpustack.logging import setup_logging
 from gpustack.policies.utils import compute_worker_allocated
 from gpustack.utils.name import metric_name
 from gpustack.worker.collector import WorkerStatusCollector
+from gpustack.worker.inference_health import InferenceHealthStats
+from gpustack.worker.runtime_metrics_aggregator import build_raw_metrics
+from gpustack.worker.upstream_pool import UpstreamStats
 import uvicorn
 import logging
 from fastapi import FastAPI, Response
@@ -55,6 +59,8 @@ class MetricExporter(Collector):
         worker_id_getter: Callable[[], int],
         clientset_getter: Callable[[], ClientSet] = None,
         cache: dict = None,
+        inference_health: InferenceHealthStats = None,
+        upstream: UpstreamStats = None,
     ):
         self._collector = collector
         self._worker_name_getter = worker_name_getter
@@ -63,6 +69,8 @@ class MetricExporter(Collector):
         self._port = cfg.worker_metrics_port
         self._cache = cache
         self._clientset_getter = clientset_getter
+        self._inference_health = inference_health
+        self._upstream = upstream
 
     def collect(self):
         with ThreadPoolExecutor() as executor:
@@ -72,6 +80,8 @@ class MetricExporter(Collector):
                 yield metric
             for metric in runtime_future.result():
                 yield metric
+        yield from self.collect_inference_health_metrics()
+        yield from self.collect_proxy_upstream_metrics()
 
     def collect_worker_metrics(self):  # noqa: C901
         labels = ["worker_id", "worker_name", "instance"]
@@ -362,6 +372,116 @@ class MetricExporter(Collector):
         yield filesystem_used
         yield filesystem_utilization_rate
 
+    def collect_inference_health_metrics(self):
+        if self._inference_health is None:
+            return
+
+        labels = [
+            "worker_id",
+            "worker_name",
+            "instance",
+            "model_name",
+            "model_instance_name",
+        ]
+        duration = GaugeMetricFamily(
+            metric_name(
+                "worker_model_instance_inference_health_check_duration_seconds"
+            ),
+            "Duration in seconds of the latest inference health check",
+            labels=labels,
+        )
+        healthy = GaugeMetricFamily(
+            metric_name("worker_model_instance_inference_healthy"),
+            "Whether the latest inference health check succeeded (1) or not (0)",
+            labels=labels,
+        )
+        consecutive_failures = GaugeMetricFamily(
+            metric_name(
+                "worker_model_instance_inference_health_check_consecutive_failures"
+            ),
+            "Consecutive failed inference health checks",
+            labels=labels,
+        )
+        checks = CounterMetricFamily(
+            metric_name("worker_model_instance_inference_health_checks"),
+            "Inference health checks run",
+            labels=labels,
+        )
+        failures = CounterMetricFamily(
+            metric_name("worker_model_instance_inference_health_check_failures"),
+            "Inference health checks failed",
+            labels=labels,
+        )
+
+        worker_label_values = [
+            _safe_label(self._worker_id_getter()),
+            _safe_label(self._worker_name_getter()),
+            _safe_label(self._worker_ip_getter()),
+        ]
+        for health in self._inference_health.snapshot():
+            label_values = worker_label_values + [
+                health.model_name,
+                health.model_instance_name,
+            ]
+            duration.add_metric(label_values, health.duration_seconds)
+            healthy.add_metric(label_values, 1 if health.healthy else 0)
+            consecutive_failures.add_metric(label_values, health.consecutive_failures)
+            checks.add_metric(label_values, health.checks_total)
+            failures.add_metric(label_values, health.failures_total)
+
+        yield duration
+        yield healthy
+        yield consecutive_failures
+        yield checks
+        yield failures
+
+    def collect_proxy_upstream_metrics(self):
+        if self._upstream is None:
+            return
+
+        labels = ["worker_id", "worker_name", "instance", "port", "model_instance_id"]
+        in_flight = GaugeMetricFamily(
+            metric_name("worker_model_instance_proxy_requests_in_flight"),
+            "Requests the worker proxy has in flight to the model instance",
+            labels=labels,
+        )
+        latency = GaugeMetricFamily(
+            metric_name("worker_model_instance_proxy_latency_seconds"),
+            "Moving average of the time until the model instance answered "
+            "proxied requests with response headers",
+            labels=labels,
+        )
+        requests = CounterMetricFamily(
+            metric_name("worker_model_instance_proxy_requests"),
+            "Requests proxied to the model instance",
+            labels=labels,
+        )
+        errors = CounterMetricFamily(
+            metric_name("worker_model_instance_proxy_errors"),
+            "Proxied requests that failed or got a server error",
+            labels=labels,
+        )
+
+        worker_label_values = [
+            _safe_label(self._worker_id_getter()),
+            _safe_label(self._worker_name_getter()),
+            _safe_label(self._worker_ip_getter()),
+        ]
+        for load in self._upstream.snapshot():
+            label_values = worker_label_values + [
+                str(load.port),
+                _safe_label(load.model_instance_id),
+            ]
+            in_flight.add_metric(label_values, load.in_flight)
+            _add_metric(latency, label_values, load.latency_seconds)
+            requests.add_metric(label_values, load.requests_total)
+            errors.add_metric(label_values, load.errors_total)
+
+        yield in_flight
+        yield latency
+        yield requests
+        yield errors
+
     def collect_runtime_metrics(self):
         if not self._cache or self._cache.get("unified") is None:
             return
@@ -419,10 +539,11 @@ class RawCollector(Collector):
 
     def collect(self):
         # passthrough raw metrics from runtime and add gpustack related labels.
-        if not self._cache or self._cache.get("raw") is None:
+        if not self._cache or not self._cache.get("raw"):
             return
 
-        for _, prom_metric in self._cache["raw"].items():
+        # Scrapes keep the raw text; it is only parsed when asked for here.
+        for _, prom_metric in build_raw_metrics(self._cache["raw"]).items():
             yield prom_metric
 
 
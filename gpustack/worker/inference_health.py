@@ -0,0 +1,266 @@
+"""Active inference health checks for the model instances on this worker.
+
+Each opted-in instance (``GPUSTACK_MODEL_INFERENCE_HEALTH_CHECK_ENABLED``) is
+sent a minimal inference request on its own schedule. The checks run
+concurrently on the worker's event loop, so one hung engine costs its own
+check its own timeout and nothing else: up to
+``INFERENCE_HEALTH_CHECK_CONCURRENCY`` checks are in flight at once, over one
+shared connection pool, each bounded by its model's timeout.
+
+Schedules are jittered. A worker restart (or a model scaled out to many
+replicas at once) would otherwise line every instance's check up on the same
+second, forever.
+
+Verdicts go to :class:`~gpustack.worker.serve_manager.ServeManager`, which
+owns the failure threshold and the ERROR transition; latencies and outcomes
+are kept in :class:`InferenceHealthStats` for the worker metrics exporter.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Set
+
+import aiohttp
+
+from gpustack import envs
+from gpustack.schemas.inference_backend import is_custom_backend
+from gpustack.schemas.models import CategoryEnum, Model, ModelInstance
+from gpustack.worker.serve_manager import ServeManager
+
+logger = logging.getLogger(__name__)
+
+# How often the schedule is looked at. Bounds how late a check can start, not
+# how often checks run — that is each model's own interval.
+_TICK_SECONDS = 2
+
+
+def get_inference_endpoint_and_payload(model: Model) -> tuple[str, dict] | None:
+    """
+    Get inference endpoint and payload for the model.
+    Returns None if the model type should skip health check.
+    """
+    skip_categories = {
+        CategoryEnum.IMAGE,
+        CategoryEnum.SPEECH_TO_TEXT,
+        CategoryEnum.TEXT_TO_SPEECH,
+        CategoryEnum.UNKNOWN,
+    }
+    if not skip_categories.isdisjoint(model.categories):
+        return None
+
+    # Return endpoint and payload based on model type (priority order)
+    if CategoryEnum.EMBEDDING in model.categories:
+        return "/v1/embeddings", {"model": model.name, "input": "test"}
+
+    if CategoryEnum.RERANKER in model.categories:
+        return "/v1/rerank", {
+            "model": model.name,
+            "query": "test",
+            "documents": ["test"],
+        }
+
+    return "/v1/chat/completions", {
+        "model": model.name,
+        "messages": [{"role": "user", "content": "ping"}],
+        "max_tokens": 1,
+        "max_completion_tokens": 1,
+    }
+
+
+async def is_inference_ready(
+    session: aiohttp.ClientSession, mi: ModelInstance, model: Model, timeout: int = 15
+) -> bool:
+    """
+    Send a minimal inference request to verify the inference capability is working.
+    """
+    # Check Custom backend (no standard inference API)
+    if is_custom_backend(model.backend):
+        return True
+
+    # Check port assignment
+    if not mi.port:
+        logger.debug(f"Model instance {mi.name} does not have port assigned yet.")
+        return False
+
+    # Get endpoint and payload, None means skip health check
+    result = get_inference_endpoint_and_payload(model)
+    if not result:
+        logger.debug(f"Skipping inference check for {mi.name}")
+        return True
+
+    endpoint_path, payload = result
+    inference_url = f"http://{mi.worker_ip}:{mi.port}{endpoint_path}"
+
+    try:
+        async with session.post(
+            inference_url,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 200:
+                return True
+            logger.warning(
+                f"Model instance {mi.name} inference health check failed "
+                f"with status {response.status} for endpoint {endpoint_path}"
+            )
+    except Exception as e:
+        logger.debug(
+            f"Error checking model instance {mi.name} inference at {endpoint_path}: "
+            f"{e!r}"
+        )
+
+    return False
+
+
+@dataclass(frozen=True)
+class InstanceHealth:
+    model_instance_id: int
+    model_instance_name: str
+    model_name: str
+    healthy: bool
+    duration_seconds: float
+    consecutive_failures: int
+    checks_total: int
+    failures_total: int
+
+
+class InferenceHealthStats:
+    """The latest check of each instance, shared with the metrics exporter.
+
+    Written on the event loop and read from the exporter's threads, hence the
+    lock; readers get a snapshot, never the live dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_instance: Dict[int, InstanceHealth] = {}
+
+    def record(
+        self,
+        mi: ModelInstance,
+        model: Model,
+        healthy: bool,
+        duration_seconds: float,
+        consecutive_failures: int,
+    ) -> None:
+        with self._lock:
+            previous = self._by_instance.get(mi.id)
+            checks_total = previous.checks_total if previous else 0
+            failures_total = previous.failures_total if previous else 0
+            self._by_instance[mi.id] = InstanceHealth(
+                model_instance_id=mi.id,
+                model_instance_name=mi.name,
+                model_name=model.name,
+                healthy=healthy,
+                duration_seconds=duration_seconds,
+                consecutive_failures=consecutive_failures,
+                checks_total=checks_total + 1,
+                failures_total=failures_total + (0 if healthy else 1),
+            )
+
+    def retain(self, instance_ids: Set[int]) -> None:
+        """Drop instances that are no longer checked here."""
+        with self._lock:
+            for instance_id in set(self._by_instance) - instance_ids:
+                del self._by_instance[instance_id]
+
+    def snapshot(self) -> List[InstanceHealth]:
+        with self._lock:
+            return [replace(health) for health in self._by_instance.values()]
+
+
+class InferenceHealthProber:
+    def __init__(
+        self,
+        serve_manager: ServeManager,
+        stats: InferenceHealthStats,
+        concurrency: Optional[int] = None,
+    ):
+        self._serve_manager = serve_manager
+        self._stats = stats
+        self._concurrency = max(
+            1, concurrency or envs.INFERENCE_HEALTH_CHECK_CONCURRENCY
+        )
+        self._slots = asyncio.Semaphore(self._concurrency)
+        self._next_due: Dict[int, float] = {}
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self):
+        # One pool for every check: keep-alive connections are reused across
+        # rounds instead of a TCP handshake per instance per check. Capped at
+        # the concurrency, which is the most it can ever have in use. Engines
+        # are reached directly, never through an environment proxy.
+        connector = aiohttp.TCPConnector(limit=self._concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self._session = session
+            while True:
+                try:
+                    await self.schedule()
+                except Exception:
+                    logger.exception("Failed to schedule inference health checks")
+                await asyncio.sleep(_TICK_SECONDS)
+
+    async def schedule(self, now: Optional[float] = None) -> List[asyncio.Task]:
+        """Start the checks that are due. Returns the tasks it started."""
+        # May fetch a model from the server on a cache miss.
+        targets = await asyncio.to_thread(self._serve_manager.inference_health_targets)
+        now = time.time() if now is None else now
+
+        live = {mi.id for mi, _, _ in targets}
+        for instance_id in set(self._next_due) - live:
+            del self._next_due[instance_id]
+        self._stats.retain(live)
+
+        started = []
+        for mi, model, config in targets:
+            interval = config["interval"]
+            due = self._next_due.get(mi.id)
+            if due is None:
+                # First sight of this instance (or of this worker): spread the
+                # first checks over a slice of the interval.
+                self._next_due[mi.id] = now + self._jitter(interval)
+                continue
+            if due > now or mi.id in self._in_flight:
+                continue
+            self._next_due[mi.id] = now + interval + self._jitter(interval)
+
+            # Real traffic succeeding recently says more than a probe would.
+            if self._serve_manager.had_recent_successful_inference(mi, interval, now):
+                continue
+
+            task = asyncio.create_task(self._check(mi, model, config))
+            self._in_flight[mi.id] = task
+            task.add_done_callback(lambda _, mi_id=mi.id: self._in_flight.pop(mi_id))
+            started.append(task)
+        return started
+
+    @staticmethod
+    def _jitter(interval: int) -> float:
+        return random.uniform(0, interval * envs.INFERENCE_HEALTH_CHECK_JITTER)
+
+    async def _check(self, mi: ModelInstance, model: Model, config: dict):
+        async with self._slots:
+            started = time.monotonic()
+            healthy = await is_inference_ready(
+                self._session, mi, model, timeout=config["timeout"]
+            )
+            duration = time.monotonic() - started
+        try:
+            # May patch the instance to ERROR through the API.
+            failures = await asyncio.to_thread(
+                self._serve_manager.record_inference_health,
+                mi,
+                healthy,
+                config["threshold"],
+            )
+        except Exception:
+            logger.exception(
+                f"Failed to record inference health of model instance {mi.name}"
+            )
+            return
+        self._stats.record(mi, model, healthy, duration, failures)
@@ -9,7 +9,7 @@ from pathlib import Path
 import platform
 import time
 import threading
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from filelock import Timeout
 from modelscope.hub.constants import TEMPORARY_FOLDER_NAME, API_FILE_DOWNLOAD_CHUNK_SIZE
@@ -18,6 +18,7 @@ from huggingface_hub._local_folder import get_local_download_paths
 from huggingface_hub.file_download import get_hf_file_metadata, hf_hub_url
 import huggingface_hub.constants
 from huggingface_hub.utils import build_hf_headers
+from tqdm import tqdm
 
 from gpustack.api.exceptions import NotFoundException
 from gpustack.config.config import Config
@@ -75,7 +76,8 @@ class ModelFileManager:
             try:
                 logger.debug("Started watching model files.")
                 await self._clientset.model_files.awatch(
-                    callback=self._handle_model_file_event
+                    callback=self._handle_model_file_event,
+                    params={"worker_id": self._worker_id},
                 )
             except asyncio.CancelledError:
                 break
@@ -312,6 +314,10 @@ class ModelFileDownloadTask:
         # Dict[tqdm_id, {'last_update_time': float, 'last_progress': float}]
         self._file_progress_tracking = {}
         self._tqdm_file_basename = {}
+        # Files reporting progress natively: filename -> id, id -> start time.
+        # Ids are shared with the tqdm ones, so every file gets its own line.
+        self._native_file_ids: Dict[str, int] = {}
+        self._native_file_started: Dict[int, float] = {}
         # Number of header lines in the log file
         self._log_header_lines = 1
         self._resume_threshold = 0
@@ -626,6 +632,7 @@ class ModelFileDownloadTask:
             local_dir=self._model_file.local_dir,
             cache_dir=self._config.cache_dir,
             huggingface_token=self._config.huggingface_token,
+            progress=self._handle_download_progress,
         )
         self._download_completed = True
 
@@ -714,11 +721,57 @@ class ModelFileDownloadTask:
             # We need to intercept this behavior and read the actual cached file size to correct the progress display.
             n = self._adjust_downloaded_by_cache_size(tqdm_instance, n)
         original_update(tqdm_instance, n)
+        self._report_file_progress(
+            tqdm_id, n, tqdm_instance.n, tqdm_instance.total, lambda: str(tqdm_instance)
+        )
+
+    def _handle_download_progress(
+        self, filename: str, n: int, downloaded: int, total: int
+    ):
+        """Progress reported by the downloaders themselves, one file at a time.
 
+        Files fetched in parallel chunks report here rather than through tqdm.
+        """
+        with self._speed_lock:
+            file_id = self._native_file_ids.get(filename)
+            if file_id is None:
+                file_id = self._tqdm_counter
+                self._tqdm_counter += 1
+                self._native_file_ids[filename] = file_id
+                self._native_file_started[file_id] = time.time()
+                self._file_line_mapping[file_id] = file_id
+                self._file_progress_tracking[file_id] = {
+                    'last_update_time': 0,
+                    'last_progress': 0.0,
+                }
+        started = self._native_file_started[file_id]
+
+        def describe() -> str:
+            return tqdm.format_meter(
+                downloaded,
+                total,
+                time.time() - started,
+                prefix=filename,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+            )
+
+        self._report_file_progress(file_id, n, downloaded, total, describe)
+
+    def _report_file_progress(
+        self,
+        file_id: int,
+        n: int,
+        downloaded: int,
+        total: Optional[int],
+        describe: Callable[[], str],
+    ):
+        """Count ``n`` more bytes of a file and report progress if it is due."""
         if self._cancel_flag.is_set():
             raise asyncio.CancelledError("Download cancelled")
 
-        line_number = self._file_line_mapping[tqdm_id]
+        line_number = self._file_line_mapping[file_id]
 
         with self._speed_lock:
             self._model_downloaded_size += n
@@ -756,12 +809,12 @@ class ModelFileDownloadTask:
 
             # Get file-specific progress tracking info
             file_tracking = self._file_progress_tracking.get(
-                tqdm_id, {'last_update_time': 0, 'last_progress': 0.0}
+                file_id, {'last_update_time': 0, 'last_progress': 0.0}
             )
 
             # Calculate individual file progress percentage
-            if tqdm_instance.total and tqdm_instance.total > 0:
-                file_progress = (tqdm_instance.n / tqdm_instance.total) * 100
+            if total and total > 0:
+                file_progress = (downloaded / total) * 100
             else:
                 file_progress = 0.0
 
@@ -772,8 +825,7 @@ class ModelFileDownloadTask:
                 time_elapsed >= self._log_update_interval  # 2 seconds elapsed
                 or file_progress >= 100.0  # Always log when complete
                 or (
-                    tqdm_instance.total is not None
-                    and tqdm_instance.n >= tqdm_instance.total
+                    total is not None and downloaded >= total
                 )  # Always log when download completes
             )
 
@@ -782,13 +834,13 @@ class ModelFileDownloadTask:
                 self._update_progress_func(progress)
 
                 # Format progress message using tqdm's string representation
-                progress_str = str(tqdm_instance)
+                progress_str = describe()
                 self._write_progress_with_cursor_positioning(
-                    line_number, progress_str, tqdm_id
+                    line_number, progress_str, file_id
                 )
 
                 # Update file-specific tracking info
-                self._file_progress_tracking[tqdm_id] = {
+                self._file_progress_tracking[file_id] = {
                     'last_update_time': current_time,
                     'last_progress': file_progress,
                 }
@@ -1,4 +1,6 @@
-from typing import Callable
+import asyncio
+import time
+from typing import Callable, Dict, List, Set, Tuple
 from cachetools import TTLCache
 from prometheus_client.core import (  # noqa: F401
     GaugeMetricFamily,
@@ -18,6 +20,7 @@ from gpustack.worker.runtime_metrics_client import (
     Config as RunTimeMetricsClientConfig,
 )
 from gpustack.worker.runtime_metrics_client import Client as RuntimeMetricsClient
+from gpustack.worker.runtime_metrics_client import Scrape, parse_metric_families
 from gpustack.schemas.models import (
     BackendEnum,
     Model,
@@ -38,6 +41,21 @@ logger = logging.getLogger(__name__)
 
 METRICS_CONFIG_FETCH_TIMEOUT_SECONDS = 30
 
+# How long an endpoint whose scrapes fail keeps its last metrics exported.
+RUNTIME_METRICS_MAX_STALENESS_SECONDS = 30
+
+RUNTIME_METRICS_STALE = "gpustack:runtime_metrics_stale"
+
+_BASE_LABEL_KEYS = [
+    "worker_id",
+    "worker_name",
+    "model_id",
+    "model_name",
+    "model_instance_id",
+    "model_instance_name",
+    "runtime",
+]
+
 # unified registry
 unified_registry = CollectorRegistry()
 
@@ -46,11 +64,24 @@ raw_registry = CollectorRegistry()
 
 
 class RuntimeMetricsAggregator:
+    """Scrapes the engines on this worker and normalizes their metrics.
+
+    Runs on the worker's event loop; the endpoints are scraped concurrently
+    over one keep-alive session. Only the families the metrics config maps
+    for a runtime are parsed. The whole exposition is kept as text and parsed
+    only when ``/metrics/raw`` is scraped.
+
+    A failed scrape keeps serving the endpoint's previous result for up to
+    ``max_staleness`` seconds, flagged by ``gpustack:runtime_metrics_stale``,
+    so one slow scrape does not punch a hole in every series of the instance.
+    """
+
     def __init__(
         self,
         cache: dict = None,
         worker_id_getter=Callable[[], int],
         clientset: ClientSet = None,
+        max_staleness: float = RUNTIME_METRICS_MAX_STALENESS_SECONDS,
     ):
         self._cache = cache
         self._metrics_client_config = RunTimeMetricsClientConfig(
@@ -59,11 +90,27 @@ class RuntimeMetricsAggregator:
         self._metrics_client = RuntimeMetricsClient(self._metrics_client_config)
         self._worker_id_getter = worker_id_getter
         self._clientset = clientset
+        self._max_staleness = max_staleness
+        # The latest successful scrape of each endpoint.
+        self._scrapes: Dict[str, Scrape] = {}
 
         # Cache for metrics config (refresh every 300 seconds)
         self._metrics_config_cache = TTLCache(maxsize=1, ttl=300)
 
-    def aggregate(self):
+    async def start(self, interval: float = 3, initial_delay: float = 0):
+        if initial_delay > 0:
+            await asyncio.sleep(initial_delay)
+        try:
+            while True:
+                try:
+                    await self.aggregate()
+                except Exception:
+                    logger.exception("Failed to aggregate runtime metrics")
+                await asyncio.sleep(interval)
+        finally:
+            await self._metrics_client.close()
+
+    async def aggregate(self):
         """
         Fetch metrics from all model instances, normalize and aggregate both unified and raw metrics, and write results to cache.
         """
@@ -73,16 +120,20 @@ class RuntimeMetricsAggregator:
             return
 
         # 1. Get metrics config
-        metrics_config = self._get_metrics_config()
+        metrics_config = await asyncio.to_thread(self._get_metrics_config)
 
         # 2. Get active model endpoints
-        endpoints, endpoint_to_instance, instance_id_to_model = (
-            self._find_active_model_endpoints(worker_id, metrics_config)
+        endpoints, endpoint_to_instance, instance_id_to_model = await asyncio.to_thread(
+            self._find_active_model_endpoints, worker_id, metrics_config
         )
+        for ep in set(self._scrapes) - endpoints:
+            del self._scrapes[ep]
         if not endpoints:
             logger.trace(
                 "No valid endpoints found for model instances. Skipping runtime metrics fetch."
             )
+            self._cache["unified"] = {}
+            self._cache["raw"] = []
             return
 
         trace_id = uuid.uuid4().hex[:8]
@@ -90,37 +141,63 @@ class RuntimeMetricsAggregator:
             f"trace_id: {trace_id}, fetching runtime metrics from {len(endpoints)} endpoints"
         )
 
-        # 3. Batch fetch metrics from all endpoints
-        endpoint_metrics = self._metrics_client.fetch_metrics_from_endpoints(endpoints)
+        # 3. Batch fetch the mapped families from all endpoints
+        families = {
+            ep: get_runtime_source_families(
+                metrics_config,
+                get_backend(instance_id_to_model.get(endpoint_to_instance[ep].id)),
+            )
+            for ep in endpoints
+        }
+        endpoint_metrics = await self._metrics_client.fetch_metrics_from_endpoints(
+            endpoints, families
+        )
 
-        # 4. Unified and raw aggregation
+        # 4. Unified aggregation, raw metrics left for /metrics/raw
+        now = time.monotonic()
         unified_metrics = {}
-        raw_metrics = {}
-        for ep, metrics in endpoint_metrics.items():
-            if not metrics:
-                continue
+        raw_sources = []
+        stale = GaugeMetricFamily(
+            RUNTIME_METRICS_STALE,
+            "Whether the runtime metrics of the model instance are from an "
+            "earlier scrape because the latest one failed.",
+            labels=_BASE_LABEL_KEYS,
+        )
+        for ep, scrape in endpoint_metrics.items():
+            is_stale = scrape is None
+            if is_stale:
+                scrape = self._scrapes.get(ep)
+                if scrape is None or now - scrape.scraped_at > self._max_staleness:
+                    self._scrapes.pop(ep, None)
+                    continue
+            else:
+                self._scrapes[ep] = scrape
+
             mi = endpoint_to_instance[ep]
             m = instance_id_to_model.get(mi.id)
 
             runtime = get_backend(m)
-            runtime_version = self.fetch_and_update_api_backend_version(mi, ep)
+            runtime_version = await self.fetch_and_update_api_backend_version(mi, ep)
 
             base_labels = self._build_base_labels(mi, m, runtime)
+            stale.add_metric(list(base_labels.values()), 1 if is_stale else 0)
+            raw_sources.append((scrape.text, base_labels))
             self._process_endpoint_metrics(
-                metrics,
+                scrape.metrics,
                 base_labels,
                 runtime,
                 runtime_version,
                 unified_metrics,
-                raw_metrics,
+                None,
                 metrics_config,
             )
 
+        unified_metrics[RUNTIME_METRICS_STALE] = stale
         self._cache["unified"] = unified_metrics
-        self._cache["raw"] = raw_metrics
+        self._cache["raw"] = raw_sources
         logger.trace(f"trace_id: {trace_id}, completed fetching runtime metrics.")
 
-    def fetch_and_update_api_backend_version(
+    async def fetch_and_update_api_backend_version(
         self,
         model_instance: ModelInstance,
         endpoint: str,
@@ -128,12 +205,14 @@ class RuntimeMetricsAggregator:
         if model_instance.api_detected_backend_version is not None:
             return model_instance.api_detected_backend_version
 
-        version = self._metrics_client.fetch_runtime_version_from_endpoint(
+        version = await self._metrics_client.fetch_runtime_version_from_endpoint(
             endpoint, model_instance.backend
         )
         if version is not None:
-            self._update_model_instance(
-                model_instance.id, api_detected_backend_version=version
+            await asyncio.to_thread(
+                self._update_model_instance,
+                model_instance.id,
+                api_detected_backend_version=version,
             )
             return version
 
@@ -198,6 +277,7 @@ class RuntimeMetricsAggregator:
         """
         Build base labels for each metric.
         """
+        # Keys in the order of _BASE_LABEL_KEYS.
         return {
             "worker_id": str(mi.worker_id) if mi.worker_id else "",
             "worker_name": mi.worker_name if mi.worker_name else "",
@@ -208,8 +288,8 @@ class RuntimeMetricsAggregator:
             "runtime": runtime,
         }
 
+    @staticmethod
     def _process_endpoint_metrics(
-        self,
         metrics,
         base_labels,
         runtime,
@@ -220,89 +300,121 @@ class RuntimeMetricsAggregator:
     ):
         """
         Process metrics for a single endpoint, aggregate to unified and raw.
+        Raw aggregation is skipped when ``raw_metrics`` is None.
         """
         for source_family_name, family in metrics.items():
-            first_sample = family.samples[0] if family.samples else None
-            if not first_sample:
+            if not family.samples:
                 continue
 
             label_keys = list(base_labels.keys())
-            for k in first_sample.labels.keys():
+            for k in family.samples[0].labels.keys():
                 if k not in label_keys:
                     label_keys.append(k)
 
-            # raw metrics
-            if source_family_name not in raw_metrics:
-                raw_metrics[source_family_name] = create_prom_metric_family(
-                    name=source_family_name,
-                    type=family.type,
-                    description=family.documentation,
-                    labels=label_keys,
+            if raw_metrics is not None:
+                RuntimeMetricsAggregator._add_raw_samples(
+                    raw_metrics, source_family_name, family, label_keys, base_labels
                 )
-            raw_family = raw_metrics[source_family_name]
 
-            # unified metrics
-            unified_family = None
             unified_metric_family_name = get_unified_metric_family_name(
                 metrics_config, source_family_name, runtime, runtime_version
             )
             if unified_metric_family_name:
-                cfg = get_unified_metric_family_config(
-                    metrics_config, unified_metric_family_name
+                RuntimeMetricsAggregator._add_unified_samples(
+                    unified_metrics,
+                    unified_metric_family_name,
+                    source_family_name,
+                    family,
+                    label_keys,
+                    base_labels,
+                    metrics_config,
                 )
-                if cfg:
-                    if unified_metric_family_name not in unified_metrics:
-                        unified_metrics[unified_metric_family_name] = (
-                            create_prom_metric_family(
-                                name=unified_metric_family_name,
-                                type=cfg.get("type"),
-                                description=cfg.get("description"),
-                                labels=label_keys,
-                            )
-                        )
-                    unified_family = unified_metrics[unified_metric_family_name]
-
-            for sample in family.samples:
-                label_values = [
-                    (
-                        base_labels.get(k, sample.labels.get(k, ""))
-                        if k in base_labels
-                        else sample.labels.get(k, "")
-                    )
-                    for k in label_keys
-                ]
-                labels = sample.labels.copy()
-                labels.update(base_labels)
-
-                if family.type in ("histogram", "summary"):
-                    raw_family.add_sample(
-                        name=sample.name,
-                        labels=labels,
-                        value=sample.value,
-                        timestamp=sample.timestamp,
-                    )
-                    if unified_family:
-                        new_name = sample.name.replace(
-                            source_family_name, unified_metric_family_name
-                        )
-                        unified_family.add_sample(
-                            name=new_name,
-                            labels=labels,
-                            value=sample.value,
-                            timestamp=sample.timestamp,
-                        )
-                else:
-                    raw_family.add_metric(
-                        labels=label_values,
-                        value=sample.value,
-                        timestamp=sample.timestamp,
-                    )
-                    if unified_family:
-                        unified_family.add_metric(
-                            labels=label_values,
-                            value=sample.value,
-                            timestamp=sample.timestamp,
+
+    @staticmethod
+    def _add_raw_samples(
+        raw_metrics, source_family_name, family, label_keys, base_labels
+    ):
+        """Copy a family's samples under its own name into ``raw_metrics``."""
+        raw_family = raw_metrics.get(source_family_name)
+        if raw_family is None:
+            raw_family = raw_metrics[source_family_name] = create_prom_metric_family(
+                name=source_family_name,
+                type=family.type,
+                description=family.documentation,
+                labels=label_keys,
+            )
+        RuntimeMetricsAggregator._add_samples(
+            raw_family, family, label_keys, base_labels
+        )
+
+    @staticmethod
+    def _add_unified_samples(
+        unified_metrics,
+        unified_metric_family_name,
+        source_family_name,
+        family,
+        label_keys,
+        base_labels,
+        metrics_config,
+    ):
+        """Copy a family's samples into ``unified_metrics`` under its unified
+        name, if the metrics config defines that name."""
+        unified_family = unified_metrics.get(unified_metric_family_name)
+        if unified_family is None:
+            cfg = get_unified_metric_family_config(
+                metrics_config, unified_metric_family_name
+            )
+            if not cfg:
+                return
+            unified_family = unified_metrics[unified_metric_family_name] = (
+                create_prom_metric_family(
+                    name=unified_metric_family_name,
+                    type=cfg.get("type"),
+                    description=cfg.get("description"),
+                    labels=label_keys,
+                )
+            )
+        RuntimeMetricsAggregator._add_samples(
+            unified_family,
+            family,
+            label_keys,
+            base_labels,
+            rename=(source_family_name, unified_metric_family_name),
+        )
+
+    @staticmethod
+    def _add_samples(target, family, label_keys, base_labels, rename=None):
+        """Add every sample of ``family`` to ``target`` with the base labels.
+
+        Histogram and summary samples keep their own names (``_bucket``,
+        ``_sum``...), with the family prefix swapped when ``rename`` is given.
+        """
+        for sample in family.samples:
+            labels = sample.labels.copy()
+            labels.update(base_labels)
+            if family.type in ("histogram", "summary"):
+                name = sample.name
+                if rename is not None:
+                    name = name.replace(*rename)
+                target.add_sample(
+                    name=name,
+                    labels=labels,
+                    value=sample.value,
+                    timestamp=sample.timestamp,
+                )
+            else:
+                target.add_metric(
+                    labels=[
+                        (
+                            base_labels.get(k, sample.labels.get(k, ""))
+                            if k in base_labels
+                            else sample.labels.get(k, "")
                         )
+                        for k in label_keys
+                    ],
+                    value=sample.value,
+                    timestamp=sample.timestamp,
+                )
 
     def _should_skip_endpoint(
         self, model: Model, model_instance: ModelInstance, metrics_config: dict
@@ -410,6 +522,27 @@ def create_prom_metric_family(type: str, name: str, description: str, labels=Non
         return cls(name, description)
 
 
+def get_runtime_source_families(config: dict, runtime: str) -> Set[str]:
+    """The runtime's metric families the config maps, for any version."""
+    runtime_cfg = get_runtime_metrics_config(config, runtime) or {}
+    return {name for mapping in runtime_cfg.values() for name in mapping}
+
+
+def build_raw_metrics(sources: List[Tuple[str, dict]]) -> dict:
+    """Parse the kept expositions into raw families, labelled per instance.
+
+    ``sources`` is what the aggregator caches under ``raw``: the text of each
+    endpoint's latest scrape and its base labels.
+    """
+    raw_metrics = {}
+    for text, base_labels in sources:
+        metrics = parse_metric_families(text.splitlines())
+        RuntimeMetricsAggregator._process_endpoint_metrics(
+            metrics, base_labels, None, None, {}, raw_metrics, {}
+        )
+    return raw_metrics
+
+
 def get_unified_metric_family_name(
     config: dict,
     source_metric_family_name: str,
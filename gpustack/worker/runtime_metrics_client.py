@@ -1,8 +1,12 @@
+import asyncio
 import logging
-from typing import Optional
-import requests
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Collection, Dict, Iterable, List, Optional
+
+import aiohttp
 from prometheus_client.parser import text_string_to_metric_families
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from gpustack.schemas.models import BackendEnum
 
@@ -15,43 +19,160 @@ BackendVersionAPI = {
     BackendEnum.ASCEND_MINDIE.value: ["info"],
 }
 
+# Suffixes a sample (or, for counters and info, a HELP/TYPE line) adds to the
+# name of the family it belongs to.
+_SAMPLE_SUFFIXES = (
+    "_total",
+    "_bucket",
+    "_count",
+    "_sum",
+    "_created",
+    "_gcount",
+    "_gsum",
+    "_info",
+)
+
+_METRIC_NAME = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+
 
 class Config:
     def __init__(
-        self, timeout=3, max_retries=2, base_delay=1, max_delay=3, insecure_tls=True
+        self,
+        timeout=3,
+        max_retries=2,
+        base_delay=1,
+        max_delay=3,
+        insecure_tls=True,
+        max_connections=16,
     ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.insecure_tls = insecure_tls
+        self.max_connections = max_connections
+
+
+class MetricFamilyFilter:
+    """Keep the exposition lines of the wanted metric families.
+
+    Fed one line at a time as the response arrives, so the families nobody
+    maps are never parsed: only the kept lines reach the Prometheus parser.
+    With ``families=None`` every line is kept.
+    """
+
+    def __init__(self, families: Optional[Collection[str]] = None):
+        self._families = families
+        # Sample names repeat (a histogram's buckets), decide each only once.
+        self._wanted_names: Dict[str, bool] = {}
+        self._keep = families is None
+        self.lines: List[str] = []
+
+    def _wanted(self, name: str) -> bool:
+        wanted = self._wanted_names.get(name)
+        if wanted is None:
+            wanted = name in self._families or any(
+                name.endswith(suffix) and name[: -len(suffix)] in self._families
+                for suffix in _SAMPLE_SUFFIXES
+            )
+            self._wanted_names[name] = wanted
+        return wanted
+
+    def feed(self, line: str) -> None:
+        if self._families is None:
+            self.lines.append(line)
+            return
+        if line.startswith("#"):
+            parts = line.split(None, 3)
+            if len(parts) >= 3 and parts[1] in ("HELP", "TYPE"):
+                self._keep = self._wanted(parts[2])
+            if self._keep:
+                self.lines.append(line)
+            return
+        match = _METRIC_NAME.match(line)
+        if match and self._wanted(match.group()):
+            self.lines.append(line)
+
+    def metric_families(self) -> Dict[str, object]:
+        text = "\n".join(line.rstrip("\n") for line in self.lines)
+        return {
+            family.name: family
+            for family in text_string_to_metric_families(text + "\n")
+        }
+
+
+def parse_metric_families(
+    lines: Iterable[str], families: Optional[Collection[str]] = None
+) -> Dict[str, object]:
+    metric_filter = MetricFamilyFilter(families)
+    for line in lines:
+        metric_filter.feed(line)
+    return metric_filter.metric_families()
+
+
+@dataclass
+class Scrape:
+    # The families that were asked for, parsed.
+    metrics: Dict[str, object]
+    # The whole exposition, parsed only if /metrics/raw is scraped.
+    text: str = field(repr=False)
+    scraped_at: float = field(default_factory=time.monotonic)
 
 
 class Client:
+    """Scrapes the engines' metrics on the worker's event loop.
+
+    One session serves every scrape, so connections to the engines are kept
+    alive between rounds instead of being opened per endpoint per scrape.
+    """
+
     def __init__(self, config=None):
         self.config = config or Config()
-
-    def fetch_metrics_from_endpoint(self, endpoint):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                ssl=False if self.config.insecure_tls else None,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def fetch_metrics_from_endpoint(
+        self, endpoint, families: Optional[Collection[str]] = None
+    ) -> Optional[Scrape]:
+        """Scrape ``endpoint``, parsing only ``families`` (all if None)."""
         url = f"http://{endpoint}/metrics"
 
         logger.trace(f"Fetching metrics from {url}")
 
         for attempt in range(self.config.max_retries + 1):
             try:
-                resp = requests.get(
-                    url,
-                    timeout=self.config.timeout,
-                    verify=not self.config.insecure_tls,
-                )
-                if resp.status_code == 200:
-                    metrics = {}
-                    for family in text_string_to_metric_families(resp.text):
-                        metrics[family.name] = family
-                    return metrics
-                else:
-                    logger.warning(
-                        f"[{endpoint}] Attempt {attempt + 1}: Bad status {resp.status_code}"
-                    )
+                async with self._get_session().get(url) as resp:
+                    if resp.status == 200:
+                        metric_filter = MetricFamilyFilter(families)
+                        raw = []
+                        async for chunk in resp.content:
+                            line = chunk.decode("utf-8")
+                            raw.append(line)
+                            metric_filter.feed(line)
+                        return Scrape(
+                            metrics=metric_filter.metric_families(),
+                            text="".join(raw),
+                        )
+                    else:
+                        logger.warning(
+                            f"[{endpoint}] Attempt {attempt + 1}: Bad status {resp.status}"
+                        )
             except Exception as e:
                 logger.error(f"[{endpoint}] Attempt {attempt + 1}: Error {e}")
             # Exponential backoff
@@ -59,24 +180,27 @@ class Client:
                 delay = min(
                     self.config.base_delay * (2**attempt), self.config.max_delay
                 )
-                import time
-
-                time.sleep(delay)
+                await asyncio.sleep(delay)
         return None
 
-    def fetch_metrics_from_endpoints(self, endpoints, max_workers=16):
-        results = {}
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = {
-                pool.submit(self.fetch_metrics_from_endpoint, ep): ep
+    async def fetch_metrics_from_endpoints(
+        self, endpoints, families: Optional[Dict[str, Collection[str]]] = None
+    ) -> Dict[str, Optional[Scrape]]:
+        """Scrape all endpoints concurrently.
+
+        ``families`` maps an endpoint to the families to parse from it.
+        """
+        endpoints = list(endpoints)
+        families = families or {}
+        results = await asyncio.gather(
+            *(
+                self.fetch_metrics_from_endpoint(ep, families.get(ep))
                 for ep in endpoints
-            }
-            for future in as_completed(futures):
-                ep = futures[future]
-                results[ep] = future.result()
-        return results
+            )
+        )
+        return dict(zip(endpoints, results))
 
-    def fetch_runtime_version_from_endpoint(
+    async def fetch_runtime_version_from_endpoint(
         self, endpoint: str, runtime: str
     ) -> Optional[str]:
         """
@@ -93,16 +217,12 @@ class Client:
         for path in paths:
             url = f"http://{endpoint}/{path}"
             try:
-                resp = requests.get(
-                    url,
-                    timeout=self.config.timeout,
-                    verify=not self.config.insecure_tls,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return data.get("version", None)
-                else:
-                    warning_msg = f"[{endpoint}] Bad status {resp.status_code} when fetching {runtime} version from {url}"
+                async with self._get_session().get(url) as resp:
+                    if resp.status == 200:
+                        data = await resp.json(content_type=None)
+                        return data.get("version", None)
+                    else:
+                        warning_msg = f"[{endpoint}] Bad status {resp.status} when fetching {runtime} version from {url}"
             except Exception as e:
                 error_msg = (
                     f"[{endpoint}] Error {e} when fetching {runtime} version from {url}"
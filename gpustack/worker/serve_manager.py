@@ -11,7 +11,7 @@ import time
 import requests
 import setproctitle
 import os
-from typing import Dict, Optional, Set, List, Callable
+from typing import Dict, Optional, Set, List, Callable, Tuple
 from pathlib import Path
 import logging
 
@@ -33,7 +33,6 @@ from gpustack.logging import (
 from gpustack.schemas.inference_backend import (
     InferenceBackend,
     is_built_in_backend,
-    is_custom_backend,
 )
 from gpustack.utils import network
 from gpustack.utils.convert import safe_int
@@ -268,8 +267,6 @@ class ServeManager:
 
         # Track last successful inference per port (set by worker proxy)
         self._last_successful_inference: Dict[int, float] = {}
-        # Track last health check time per model instance
-        self._last_health_check_time: Dict[int, float] = {}
 
         # Timestamp of the last authoritative (uncached) DB reconciliation in
         # the state sync, for the optional periodic backstop. Starts "now" so
@@ -310,8 +307,11 @@ class ServeManager:
 
         while True:
             try:
+                # Server-side scoped to the instances this worker runs, as
+                # main or subordinate, so the cache only holds those.
                 await self._clientset.model_instances.awatch(
-                    callback=self._handle_model_instance_event
+                    callback=self._handle_model_instance_event,
+                    params={"assigned_worker_id": self._worker_id},
                 )
             except asyncio.CancelledError:
                 break
@@ -355,11 +355,11 @@ class ServeManager:
             if mi.get_deployment_metadata(self._worker_id) is not None
         }
 
-        # Read from the watch-backed cache. It holds the full set, so the
-        # common (nothing-to-reap) path stays O(1) with no server/DB round
-        # trip and scales independently of worker count — a direct per-worker
-        # poll here is one SELECT over model_instances per worker every few
-        # seconds, which does not scale to hundreds of workers.
+        # Read from the watch-backed cache. It holds every instance assigned
+        # to this worker, so the common (nothing-to-reap) path stays O(1) with
+        # no server/DB round trip and scales independently of worker count —
+        # a direct per-worker poll here is one SELECT over model_instances per
+        # worker every few seconds, which does not scale to hundreds of workers.
         response = self._clientset.model_instances.list()
         all_items = response.items or []
         reap_ids = local_assigned_ids - {
@@ -859,9 +859,10 @@ class ServeManager:
                     )
                     raise e
 
-    def sync_model_instances_inference_health(self):
+    def inference_health_targets(self) -> List[Tuple[ModelInstance, Model, dict]]:
         """
-        Synchronize model instances' inference health by sending actual inference requests.
+        RUNNING model instances whose model opts in to the inference health
+        check, with the model and its check config.
 
         Per-model configuration is read from model.env:
         - GPUSTACK_MODEL_INFERENCE_HEALTH_CHECK_ENABLED: "true"/"false" (default: false)
@@ -869,85 +870,80 @@ class ServeManager:
         - GPUSTACK_MODEL_INFERENCE_HEALTH_CHECK_TIMEOUT: seconds (default: 15)
         - GPUSTACK_MODEL_INFERENCE_HEALTH_CHECK_FAILURE_THRESHOLD: count (default: global env)
 
-        If the model has received successful inference traffic recently
-        (within the configured interval), the active health check is skipped.
+        Scheduling and the checks themselves belong to
+        ``gpustack.worker.inference_health.InferenceHealthProber``.
         """
-
+        targets = []
         # Use the event-driven local cache instead of an API call.
-        model_instances = [
-            mi
-            for mi in self._model_instance_by_instance_id.values()
-            if mi.state == ModelInstanceStateEnum.RUNNING
-        ]
-        if not model_instances:
-            return
-
-        now = time.time()
-
-        for model_instance in model_instances:
+        for model_instance in list(self._model_instance_by_instance_id.values()):
+            if model_instance.state != ModelInstanceStateEnum.RUNNING:
+                continue
             model = self._get_model(model_instance)
             if not model:
                 continue
-
-            # Read per-model config from model.env.
             config = _get_inference_health_check_config(model)
             if not config["enabled"]:
                 continue
-
-            interval = config["interval"]
-            timeout = config["timeout"]
-            threshold = config["threshold"]
-
             # Skip if the model is still provisioning.
             if self._is_provisioning(model_instance):
                 continue
+            targets.append((model_instance, model, config))
+        return targets
 
-            # Skip if not enough time has passed since last check.
-            last_check = self._last_health_check_time.get(model_instance.id, 0)
-            if now - last_check < interval:
-                continue
+    def had_recent_successful_inference(
+        self, model_instance: ModelInstance, interval: int, now: float
+    ) -> bool:
+        """
+        Whether real traffic succeeded on the instance within ``interval``, in
+        which case an active check would prove nothing new.
+        """
+        last_success = self._last_successful_inference.get(model_instance.id, 0)
+        if last_success <= now - interval:
+            return False
+        logger.debug(
+            f"Model instance {model_instance.name} had recent successful "
+            f"inference, skipping health check."
+        )
+        # Reset failure count since real traffic is succeeding.
+        self._inference_health_check_failures.pop(model_instance.id, None)
+        return True
 
-            self._last_health_check_time[model_instance.id] = now
+    def record_inference_health(
+        self, model_instance: ModelInstance, healthy: bool, threshold: int
+    ) -> int:
+        """
+        Apply one inference health check verdict, marking the instance ERROR
+        after ``threshold`` consecutive failures.
 
-            # Skip if recent successful inference was observed for this instance.
-            last_success = self._last_successful_inference.get(model_instance.id, 0)
-            if last_success > now - interval:
-                logger.debug(
-                    f"Model instance {model_instance.name} had recent successful "
-                    f"inference, skipping health check."
-                )
-                # Reset failure count since real traffic is succeeding.
-                self._inference_health_check_failures.pop(model_instance.id, None)
-                continue
+        Returns the consecutive failure count after this verdict.
+        """
+        if healthy:
+            # Reset failure count on success.
+            self._inference_health_check_failures.pop(model_instance.id, None)
+            return 0
 
-            # Perform inference health check.
-            if not is_inference_ready(model_instance, model, timeout=timeout):
-                failure_count = self._inference_health_check_failures.get(
-                    model_instance.id, 0
-                )
-                failure_count += 1
-                self._inference_health_check_failures[model_instance.id] = failure_count
+        failure_count = self._inference_health_check_failures.get(model_instance.id, 0)
+        failure_count += 1
+        self._inference_health_check_failures[model_instance.id] = failure_count
 
-                if failure_count >= threshold:
-                    logger.warning(
-                        f"Model instance {model_instance.name} inference health check failed "
-                        f"{failure_count} times, updating state to ERROR."
-                    )
-                    patch_dict = {
-                        "state": ModelInstanceStateEnum.ERROR,
-                        "state_message": _INFERENCE_HEALTH_CHECK_FAILED_MESSAGE,
-                    }
-                    self._update_model_instance(model_instance.id, **patch_dict)
-                    # Reset failure count after marking as error.
-                    del self._inference_health_check_failures[model_instance.id]
-                else:
-                    logger.debug(
-                        f"Model instance {model_instance.name} inference health check failed "
-                        f"{failure_count}/{threshold} times."
-                    )
-            else:
-                # Reset failure count on success.
-                self._inference_health_check_failures.pop(model_instance.id, None)
+        if failure_count >= threshold:
+            logger.warning(
+                f"Model instance {model_instance.name} inference health check failed "
+                f"{failure_count} times, updating state to ERROR."
+            )
+            patch_dict = {
+                "state": ModelInstanceStateEnum.ERROR,
+                "state_message": _INFERENCE_HEALTH_CHECK_FAILED_MESSAGE,
+            }
+            self._update_model_instance(model_instance.id, **patch_dict)
+            # Reset failure count after marking as error.
+            del self._inference_health_check_failures[model_instance.id]
+        else:
+            logger.debug(
+                f"Model instance {model_instance.name} inference health check failed "
+                f"{failure_count}/{threshold} times."
+            )
+        return failure_count
 
     def _handle_model_instance_event(self, event: Event):
         """Handle a model instance event without ever crashing the watch stream.
@@ -1834,7 +1830,6 @@ class ServeManager:
         if clear_restart_backoff:
             self._restart_backoff_counts.pop(mi.id, None)
         self._inference_health_check_failures.pop(mi.id, None)
-        self._last_health_check_time.pop(mi.id, None)
         self._last_successful_inference.pop(mi.id, None)
 
         logger.info(f"Stopped model instance {mi.name or mi.id}")
@@ -2018,39 +2013,6 @@ def is_ready(
     return False
 
 
-def _get_inference_endpoint_and_payload(model: Model) -> tuple[str, dict] | None:
-    """
-    Get inference endpoint and payload for the model.
-    Returns None if the model type should skip health check.
-    """
-    skip_categories = {
-        CategoryEnum.IMAGE,
-        CategoryEnum.SPEECH_TO_TEXT,
-        CategoryEnum.TEXT_TO_SPEECH,
-        CategoryEnum.UNKNOWN,
-    }
-    if not skip_categories.isdisjoint(model.categories):
-        return None
-
-    # Return endpoint and payload based on model type (priority order)
-    if CategoryEnum.EMBEDDING in model.categories:
-        return "/v1/embeddings", {"model": model.name, "input": "test"}
-
-    if CategoryEnum.RERANKER in model.categories:
-        return "/v1/rerank", {
-            "model": model.name,
-            "query": "test",
-            "documents": ["test"],
-        }
-
-    return "/v1/chat/completions", {
-        "model": model.name,
-        "messages": [{"role": "user", "content": "ping"}],
-        "max_tokens": 1,
-        "max_completion_tokens": 1,
-    }
-
-
 def _get_inference_health_check_config(model: Model) -> dict:
     """Read per-model inference health check config from model.env."""
     env = model.env or {}
@@ -2078,42 +2040,3 @@ def _get_inference_health_check_config(model: Model) -> dict:
         "timeout": timeout,
         "threshold": threshold,
     }
-
-
-def is_inference_ready(mi: ModelInstance, model: Model, timeout: int = 15) -> bool:
-    """
-    Send a minimal inference request to verify the inference capability is working.
-    """
-    # Check Custom backend (no standard inference API)
-    if is_custom_backend(model.backend):
-        return True
-
-    # Check port assignment
-    if not mi.port:
-        logger.debug(f"Model instance {mi.name} does not have port assigned yet.")
-        return False
-
-    # Get endpoint and payload, None means skip health check
-    result = _get_inference_endpoint_and_payload(model)
-    if not result:
-        logger.debug(f"Skipping inference check for {mi.name}")
-        return True
-
-    endpoint_path, payload = result
-    inference_url = f"http://{mi.worker_ip}:{mi.port}{endpoint_path}"
-
-    try:
-        response = requests.post(inference_url, json=payload, timeout=timeout)
-        if response.status_code == 200:
-            return True
-        else:
-            logger.warning(
-                f"Model instance {mi.name} inference health check failed "
-                f"with status {response.status_code} for endpoint {endpoint_path}"
-            )
-    except Exception as e:
-        logger.debug(
-            f"Error checking model instance {mi.name} inference at {endpoint_path}: {e}"
-        )
-
-    return False
@@ -0,0 +1,161 @@
+"""Pooled upstream connections for the worker's inference proxy.
+
+Every proxied inference request passes through the worker, so the hop to the
+engine should cost as little as possible. :class:`UpstreamPool` keeps idle
+HTTP/1.1 connections to each instance port alive between requests instead of
+opening (and tearing down) one per call, as the worker's general-purpose
+sessions do with ``force_close``.
+
+Reuse is pipelining-safe: requests are never pipelined, and a connection goes
+back to the pool only once its response has been read to the end. A response
+abandoned midway (the client went away) closes its connection rather than
+handing the next request a socket with stale bytes on it. Idle connections are
+dropped before the engines' own keep-alive timeouts (uvicorn's is 5s) would
+close them under us.
+
+Per-instance in-flight counts and latencies are kept in
+:class:`UpstreamStats`, published by the metrics exporter and served on the
+worker API for the server to route on.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from gpustack import envs
+
+# Weight of the newest sample in the latency moving average.
+_LATENCY_EWMA_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class UpstreamLoad:
+    port: int
+    model_instance_id: Optional[int]
+    in_flight: int
+    requests_total: int
+    errors_total: int
+    # Moving average of the time until the engine answered with its headers.
+    # Unlike the full duration, this does not grow with the length of the
+    # generated output, so it reflects how queued the engine is.
+    latency_seconds: Optional[float]
+
+
+class _Counters:
+    __slots__ = (
+        "model_instance_id",
+        "in_flight",
+        "requests_total",
+        "errors_total",
+        "latency_seconds",
+    )
+
+    def __init__(self, model_instance_id: Optional[int]):
+        self.model_instance_id = model_instance_id
+        self.in_flight = 0
+        self.requests_total = 0
+        self.errors_total = 0
+        self.latency_seconds: Optional[float] = None
+
+
+class UpstreamStats:
+    """Load of each instance port, shared with the metrics exporter.
+
+    Written on the event loop and read from the exporter's threads, hence the
+    lock; readers get a snapshot, never the live dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_port: Dict[int, _Counters] = {}
+
+    def begin(self, port: int, model_instance_id: Optional[int] = None) -> float:
+        """Count a request to ``port`` as in flight; returns its start time."""
+        with self._lock:
+            counters = self._by_port.get(port)
+            if counters is None or (
+                model_instance_id is not None
+                and counters.model_instance_id != model_instance_id
+            ):
+                # A port taken over by another instance starts from scratch,
+                # keeping only the requests still in flight to it.
+                in_flight = counters.in_flight if counters else 0
+                counters = _Counters(model_instance_id)
+                counters.in_flight = in_flight
+                self._by_port[port] = counters
+            counters.in_flight += 1
+            counters.requests_total += 1
+        return time.monotonic()
+
+    def responded(self, port: int, started: float) -> None:
+        """Record the time the engine took to answer with its headers."""
+        latency = time.monotonic() - started
+        with self._lock:
+            counters = self._by_port.get(port)
+            if counters is None:
+                return
+            if counters.latency_seconds is None:
+                counters.latency_seconds = latency
+            else:
+                counters.latency_seconds += _LATENCY_EWMA_ALPHA * (
+                    latency - counters.latency_seconds
+                )
+
+    def end(self, port: int, failed: bool = False) -> None:
+        with self._lock:
+            counters = self._by_port.get(port)
+            if counters is None:
+                return
+            counters.in_flight = max(0, counters.in_flight - 1)
+            if failed:
+                counters.errors_total += 1
+
+    def snapshot(self) -> List[UpstreamLoad]:
+        with self._lock:
+            return [
+                UpstreamLoad(
+                    port=port,
+                    model_instance_id=c.model_instance_id,
+                    in_flight=c.in_flight,
+                    requests_total=c.requests_total,
+                    errors_total=c.errors_total,
+                    latency_seconds=c.latency_seconds,
+                )
+                for port, c in self._by_port.items()
+            ]
+
+
+class UpstreamPool:
+    """Keep-alive connections to the instance ports, one pool per port."""
+
+    def __init__(
+        self,
+        stats: Optional[UpstreamStats] = None,
+        keepalive_timeout: Optional[float] = None,
+    ):
+        self.stats = stats if stats is not None else UpstreamStats()
+        # aiohttp keys its pool by (host, port), so each instance port gets
+        # its own set of idle connections. No per-port cap: the engines queue
+        # requests themselves, and a cap here would only add a second queue.
+        self._connector = aiohttp.TCPConnector(
+            limit=envs.TCP_CONNECTOR_LIMIT,
+            limit_per_host=0,
+            keepalive_timeout=(
+                keepalive_timeout
+                if keepalive_timeout is not None
+                else envs.PROXY_UPSTREAM_KEEPALIVE_TIMEOUT
+            ),
+        )
+        # Both share the pool; the second honours the proxy environment for
+        # instance addresses that NO_PROXY does not exempt.
+        self.session = aiohttp.ClientSession(connector=self._connector)
+        self.session_with_proxy_env = aiohttp.ClientSession(
+            connector=self._connector, trust_env=True
+        )
+
+    async def close(self) -> None:
+        await self.session_with_proxy_env.close()
+        await self.session.close()
@@ -47,7 +47,12 @@ from gpustack.worker.model_file_manager import ModelFileManager
 from gpustack.worker.runtime_metrics_aggregator import RuntimeMetricsAggregator
 from gpustack.worker.serve_manager import ServeManager
 from gpustack.worker.exporter import MetricExporter
+from gpustack.worker.inference_health import (
+    InferenceHealthProber,
+    InferenceHealthStats,
+)
 from gpustack.worker.tools_manager import ToolsManager
+from gpustack.worker.upstream_pool import UpstreamPool, UpstreamStats
 from gpustack.worker.worker_manager import WorkerManager
 from gpustack.worker.collector import WorkerStatusCollector
 from gpustack.config.registration import read_worker_token
@@ -114,6 +119,8 @@ class Worker:
         self._worker_ip, self._worker_ifname = self._detect_worker_ip_and_ifname()
 
         self._runtime_metrics_cache = defaultdict()
+        self._inference_health_stats = InferenceHealthStats()
+        self._upstream_stats = UpstreamStats()
 
         self._status_collector = WorkerStatusCollector(
             cfg=cfg,
@@ -137,6 +144,8 @@ class Worker:
             worker_name_getter=self.worker_name,
             clientset_getter=self.clientset,
             cache=self._runtime_metrics_cache,
+            inference_health=self._inference_health_stats,
+            upstream=self._upstream_stats,
         )
 
         self._serve_manager = ServeManager(
@@ -253,7 +262,9 @@ class Worker:
                 worker_id_getter=self.worker_id,
                 clientset=self._clientset,
             )
-            run_periodically_in_thread(_runtime_metrics_aggregator.aggregate, 3, 30)
+            self._create_async_task(
+                _runtime_metrics_aggregator.start(interval=3, initial_delay=30)
+            )
 
             # Start the metric exporter with retry.
             run_periodically_in_thread(self._exporter.start, 15)
@@ -287,12 +298,11 @@ class Worker:
             self._serve_manager.sync_model_instances_state,
             envs.MODEL_INSTANCE_HEALTH_CHECK_INTERVAL,
         )
-        # Use a short fixed loop interval so that per-model intervals
-        # shorter than the global default can still be honoured.
-        run_periodically_in_thread(
-            self._serve_manager.sync_model_instances_inference_health,
-            10,
+        # Checks run on this loop, concurrently, each on its own schedule.
+        inference_health_prober = InferenceHealthProber(
+            self._serve_manager, self._inference_health_stats
         )
+        self._create_async_task(inference_health_prober.start())
         run_periodically_in_thread(
             self._workload_cleaner.cleanup_orphan_workloads, 120, 15
         )
@@ -318,6 +328,7 @@ class Worker:
                 cidrs=[f"{self.worker_ip()}/32"] if self.worker_ip() else [],
                 unix_sockets=sockets,
                 authenticator=BearerTokenAuthenticator(headers=self._clientset.headers),
+                channels=envs.TUNNEL_CHANNELS,
             )
             self._create_async_task(self._message_client.run())
         else:
@@ -344,7 +355,9 @@ class Worker:
                 connector=connector, trust_env=True
             )
             app.state.http_client_no_proxy = aiohttp.ClientSession(connector=connector)
+            app.state.upstream_pool = UpstreamPool(stats=self._upstream_stats)
             yield
+            await app.state.upstream_pool.close()
             await app.state.http_client.close()
             await app.state.http_client_no_proxy.close()
             kube_session = getattr(app.state, "kube_api_session", None)
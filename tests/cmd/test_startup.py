@@ -0,0 +1,64 @@
+"""Cold start of the CLI: a sub-command imports only what it runs.
+
+The timings double as a start-up benchmark; run with ``-s`` to see them.
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Modules that take seconds to import and that only `start` needs.
+HEAVY = [
+    "gpustack.server.server",
+    "gpustack.worker.worker",
+    "gpustack.gateway",
+    "gpustack.routes.routes",
+]
+
+
+def run_cli(*args: str) -> dict:
+    """Run ``gpustack <args>`` in a fresh interpreter, returning which heavy
+    modules it imported and how long it took."""
+    script = (
+        "import json, sys\n"
+        "from gpustack.main import main\n"
+        f"sys.argv = ['gpustack', *{list(args)!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))\n"
+    )
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - started
+    print(f"gpustack {' '.join(args)}: {elapsed:.2f}s")
+    return {
+        "imported": json.loads(result.stdout.strip().splitlines()[-1]),
+        "elapsed": elapsed,
+        "stdout": result.stdout,
+    }
+
+
+def test_version_imports_nothing_heavy():
+    result = run_cli("version")
+
+    assert result["imported"] == []
+    assert result["elapsed"] < 5.0, f"gpustack version took {result['elapsed']:.2f}s"
+
+
+@pytest.mark.parametrize("command", ["reload-config", "migrate", "start"])
+def test_subcommand_help_does_not_import_server_or_worker(command):
+    assert run_cli(command, "--help")["imported"] == []
+
+
+def test_top_level_help_lists_the_subcommands():
+    stdout = run_cli("--help")["stdout"]
+
+    for command in ["start", "reload-config", "list-images", "version"]:
+        assert f"{command}  " in stdout
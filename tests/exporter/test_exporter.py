@@ -6,7 +6,9 @@ from unittest.mock import patch
 import pytest
 
 from gpustack.exporter.exporter import MetricExporter
-from gpustack.schemas.models import ModelInstanceStateEnum
+from gpustack.schemas.clusters import Cluster
+from gpustack.schemas.models import Model, ModelInstance, ModelInstanceStateEnum
+from gpustack.server.bus import Event, EventType
 
 
 def _sample_value(metrics, metric_name):
@@ -42,6 +44,8 @@ async def test_model_instance_restart_metrics_are_collected():
     latest_restart_time = datetime(2026, 4, 17, 8, 30, tzinfo=timezone.utc)
 
     instance = SimpleNamespace(
+        id=100,
+        model_id=10,
         worker_id=2,
         worker_name="worker-2",
         name="qwen-1",
@@ -51,6 +55,7 @@ async def test_model_instance_restart_metrics_are_collected():
     )
     model = SimpleNamespace(
         id=10,
+        cluster_id=1,
         name="qwen",
         backend="vllm",
         backend_version="0.8.0",
@@ -71,7 +76,8 @@ async def test_model_instance_restart_metrics_are_collected():
     )
 
     with patch("gpustack.exporter.exporter.Cluster.all", return_value=[cluster]):
-        metrics = await exporter._collect_metrics(session=SimpleNamespace())
+        await exporter._collect_metrics(session=SimpleNamespace())
+    metrics = list(exporter.collect())
 
     assert _sample_value(metrics, "gpustack:model_instance_restart_count") == 3
     assert (
@@ -94,6 +100,7 @@ async def test_model_info_metric_includes_category_label():
     exporter = MetricExporter(SimpleNamespace(metrics_port=10161))
     model = SimpleNamespace(
         id=10,
+        cluster_id=1,
         name="embedding",
         backend="vllm",
         backend_version="0.8.0",
@@ -109,7 +116,8 @@ async def test_model_info_metric_includes_category_label():
         "gpustack.exporter.exporter.Cluster.all",
         return_value=[_cluster_with_model(model)],
     ):
-        metrics = await exporter._collect_metrics(session=SimpleNamespace())
+        await exporter._collect_metrics(session=SimpleNamespace())
+    metrics = list(exporter.collect())
 
     assert _sample_labels(metrics, "gpustack:model") == {
         "cluster_id": "1",
@@ -129,6 +137,7 @@ async def test_model_info_metric_uses_unknown_for_uncategorized_models():
     exporter = MetricExporter(SimpleNamespace(metrics_port=10161))
     model = SimpleNamespace(
         id=10,
+        cluster_id=1,
         name="qwen",
         backend="vllm",
         backend_version=None,
@@ -144,7 +153,8 @@ async def test_model_info_metric_uses_unknown_for_uncategorized_models():
         "gpustack.exporter.exporter.Cluster.all",
         return_value=[_cluster_with_model(model)],
     ):
-        metrics = await exporter._collect_metrics(session=SimpleNamespace())
+        await exporter._collect_metrics(session=SimpleNamespace())
+    metrics = list(exporter.collect())
 
     labels = _sample_labels(metrics, "gpustack:model")
     assert labels["category"] == "unknown"
@@ -167,7 +177,8 @@ async def test_generate_metrics_cache_survives_transient_db_error(monkeypatch):
     loop should keep the last cache and retry on the next tick.
     """
     exporter = MetricExporter(SimpleNamespace(metrics_port=10162))
-    exporter._cache_metrics = ["stale"]
+    stale = {(Cluster, 1): []}
+    exporter._series = stale
 
     collect_calls = {"n": 0}
 
@@ -194,4 +205,109 @@ async def test_generate_metrics_cache_survives_transient_db_error(monkeypatch):
         await exporter.generate_metrics_cache()
 
     assert collect_calls["n"] == 1  # ran once, error swallowed, reached sleep
-    assert exporter._cache_metrics == ["stale"]  # kept last cache, no crash
+    assert exporter._series is stale  # kept the last series, no crash
+
+
+def _rows():
+    cluster = Cluster(id=1, name="default", provider="Docker", state="ready")
+    model = Model(
+        id=10,
+        name="qwen",
+        cluster_id=1,
+        replicas=1,
+        ready_replicas=0,
+        backend="vLLM",
+        source="huggingface",
+        huggingface_repo_id="Qwen/Qwen2.5-0.5B-Instruct",
+    )
+    instance = ModelInstance(
+        id=100,
+        name="qwen-1",
+        model_id=10,
+        model_name="qwen",
+        worker_id=2,
+        worker_name="worker-2",
+        state=ModelInstanceStateEnum.STARTING,
+    )
+    return cluster, model, instance
+
+
+def _instance_state(metrics):
+    return _sample_labels(metrics, "gpustack:model_instance_status")["state"]
+
+
+def _created(exporter, *rows):
+    for row in rows:
+        exporter._on_event(type(row), Event(type=EventType.CREATED, data=row))
+
+
+def test_events_update_metrics_without_reloading():
+    exporter = MetricExporter(SimpleNamespace(metrics_port=10161))
+    cluster, model, instance = _rows()
+    _created(exporter, cluster, model, instance)
+
+    assert _instance_state(list(exporter.collect())) == "starting"
+
+    cluster_series = exporter._series[(Cluster, 1)]
+    model_series = exporter._series[(Model, 10)]
+    running = instance.model_copy(update={"state": ModelInstanceStateEnum.RUNNING})
+    exporter._on_event(ModelInstance, Event(type=EventType.UPDATED, data=running))
+    assert _instance_state(list(exporter.collect())) == "running"
+    # Only the instance's own samples were replaced.
+    assert exporter._series[(Cluster, 1)] is cluster_series
+    assert exporter._series[(Model, 10)] is model_series
+
+    exporter._on_event(ModelInstance, Event(type=EventType.DELETED, data=running))
+    metrics = list(exporter.collect())
+    assert [
+        m.samples for m in metrics if m.name == "gpustack:model_instance_status"
+    ] == [[]]
+    assert (ModelInstance, 100) not in exporter._series
+
+    # A relayed event whose row could not be loaded asks for a resync.
+    exporter._resync_requested = False
+    exporter._on_event(Model, Event(type=EventType.UPDATED, data={"id": 10}))
+    assert exporter._resync_requested
+
+
+def test_renamed_rows_relabel_the_rows_under_them():
+    exporter = MetricExporter(SimpleNamespace(metrics_port=10161))
+    cluster, model, instance = _rows()
+    # Out of order: the instance is only exported once its model is known.
+    _created(exporter, cluster, instance)
+    assert (ModelInstance, 100) not in exporter._series
+    _created(exporter, model)
+    assert _sample_labels(list(exporter.collect()), "gpustack:model_instance_status")
+
+    renamed = cluster.model_copy(update={"name": "renamed"})
+    exporter._on_event(Cluster, Event(type=EventType.UPDATED, data=renamed))
+
+    metrics = list(exporter.collect())
+    for name in ("gpustack:model_instance_status", "gpustack:model_desired_instances"):
+        assert _sample_labels(metrics, name)["cluster_name"] == "renamed"
+
+    exporter._on_event(Cluster, Event(type=EventType.DELETED, data=renamed))
+    assert exporter._series == {}
+
+
+@pytest.mark.asyncio
+async def test_resync_keeps_events_received_while_loading():
+    exporter = MetricExporter(SimpleNamespace(metrics_port=10161))
+    cluster, model, instance = _rows()
+    cluster.cluster_workers = []
+    cluster.cluster_models = [model]
+    model.instances = [instance]
+    running = instance.model_copy(update={"state": ModelInstanceStateEnum.RUNNING})
+
+    async def load_then_race(*args, **kwargs):
+        # The instance starts running after the snapshot was read.
+        exporter._on_event(ModelInstance, Event(type=EventType.UPDATED, data=running))
+        return [cluster]
+
+    with patch("gpustack.exporter.exporter.Cluster.all", side_effect=load_then_race):
+        await exporter._collect_metrics(session=SimpleNamespace())
+    metrics = list(exporter.collect())
+
+    assert _instance_state(metrics) == "running"
+    assert exporter._resync_events is None
+    assert not exporter._resync_requested
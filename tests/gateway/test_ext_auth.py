@@ -24,8 +24,10 @@ from gpustack.gateway.client import WasmPluginMatchRule, WasmPluginSpec
 from gpustack.gateway.ext_auth import (
     ext_auth_init_spec_diff,
     ext_auth_reconcile_spec_diff,
+    ext_auth_shard_resource_name,
     public_route_match_rules,
     route_match_regexes,
+    validate_ext_auth_key_shards,
 )
 from gpustack.schemas.model_routes import AccessPolicyEnum
 from gpustack.schemas.principals import PrincipalType
@@ -37,6 +39,9 @@ from gpustack.server.gateway_auth_reconciler import (
     build_local_auth_tables,
     split_cr_budget,
     build_public_route_ids,
+    key_shard,
+    key_shard_count,
+    shard_local_auth_tables,
     gateway_digest_publishable,
     gateway_ref_eligible,
     gateway_ref_indexable,
@@ -658,7 +663,7 @@ def stub_reconcile_inputs(monkeypatch):
         yield object()
 
     async def _tables(session, max_entries=0):
-        return {}, {}
+        return dict(state.get("keys", {})), {}
 
     async def _ids(session):
         return state["public_ids"]
@@ -683,14 +688,26 @@ def stub_reconcile_inputs(monkeypatch):
     return state
 
 
-def _live_reconciler():
+def _live_reconciler(shards=1, live_plugins=()):
+    deleted = []
+
+    async def _list(namespace, label_selector=None):
+        return {"items": [{"metadata": {"name": name}} for name in live_plugins]}
+
+    async def _delete(namespace, name):
+        deleted.append(name)
+
     reconciler = GatewayAuthReconciler.__new__(GatewayAuthReconciler)
     reconciler._config = _cfg()
     reconciler._budget = 10_000_000
-    reconciler._extensions_api = object()
+    reconciler._shards = shards
+    reconciler._extensions_api = SimpleNamespace(
+        list_wasmplugins=_list, delete_wasmplugin=_delete, deleted=deleted
+    )
     reconciler._registry = MagicMock()
     reconciler._applied_public_route_ids = None
     reconciler._applied_state = None
+    reconciler._applied_shards = {}
     return reconciler
 
 
@@ -848,3 +865,195 @@ def test_the_server_withholds_a_ref_wherever_refs_would_be_empty(monkeypatch):
         assert not gateway_ref_indexable(
             _key(is_custom=True, secret_key_digest=digest), _principal()
         )
+
+
+# --- Sharding past one CR ----------------------------------------------------
+#
+# Placement is a function of the key alone, so a revocation rewrites the one
+# shard holding the key, and a shard count that went down must not leave a CR
+# behind still carrying keys nobody recomputes.
+
+
+def _entries(count):
+    return {f"ak-{i}": {"digest": _CONFIG_DIGEST, "user_id": i} for i in range(count)}
+
+
+def test_every_key_lands_in_exactly_the_shard_it_hashes_to():
+    keys = _entries(200)
+
+    tables = shard_local_auth_tables(keys, {"9": {}}, shards=4, max_entries=1000)
+
+    assert sum(len(k) for k, _ in tables) == 200
+    for shard, (shard_keys, shard_refs) in enumerate(tables):
+        assert all(key_shard(k, 4) == shard for k in shard_keys)
+        assert all(key_shard(r, 4) == shard for r in shard_refs)
+        assert len(shard_keys) > 20, "the hash spreads keys out"
+    assert any("9" in refs for _, refs in tables)
+
+
+def test_a_full_shard_moves_its_surplus_to_the_next_one(caplog):
+    keys = _entries(50)
+    homes = [key_shard(k, 2) for k in keys]
+    crowded = max((0, 1), key=homes.count)
+    assert homes.count(crowded) > 25, "the test needs one shard over budget"
+
+    tables = shard_local_auth_tables(keys, {}, shards=2, max_entries=25)
+
+    assert [len(shard_keys) for shard_keys, _ in tables] == [25, 25]
+    assert set(tables[0][0]) | set(tables[1][0]) == set(keys)
+    moved = [k for k in tables[1 - crowded][0] if key_shard(k, 2) == crowded]
+    assert len(moved) == homes.count(crowded) - 25
+    # The newest keys are the ones moved.
+    assert moved == [k for k in keys if key_shard(k, 2) == crowded][25:]
+    assert f"{len(moved)} API keys" in caplog.text
+    assert "left out" not in caplog.text
+
+
+def test_keys_past_every_shard_budget_are_left_out(caplog):
+    tables = shard_local_auth_tables(_entries(100), {}, shards=2, max_entries=30)
+
+    assert [len(keys) for keys, _ in tables] == [30, 30]
+    assert "40 API keys found every ext-auth shard" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_an_event_pass_rewrites_only_the_shard_that_changed(
+    stub_reconcile_inputs,
+):
+    keys = _entries(40)
+    stub_reconcile_inputs["keys"] = keys
+    reconciler = _live_reconciler(shards=4)
+    await reconciler.reconcile(full=False)
+    assert [c["name"] for c in stub_reconcile_inputs["applied"]] == [
+        "gpustack-llm-ext-auth",
+        "gpustack-llm-ext-auth-shard-1",
+        "gpustack-llm-ext-auth-shard-2",
+        "gpustack-llm-ext-auth-shard-3",
+    ]
+
+    revoked = "ak-7"
+    del keys[revoked]
+    stub_reconcile_inputs["applied"].clear()
+    await reconciler.reconcile(full=False)
+
+    [write] = stub_reconcile_inputs["applied"]
+    assert write["name"] == ext_auth_shard_resource_name(key_shard(revoked, 4))
+    assert write["spec_diff"].keywords["shard"] == (key_shard(revoked, 4), 4)
+    assert revoked not in write["spec_diff"].keywords["keys"]
+
+    # The periodic pass still puts every shard through the compare-and-skip.
+    stub_reconcile_inputs["applied"].clear()
+    await reconciler.reconcile(full=True)
+    assert len(stub_reconcile_inputs["applied"]) == 4
+
+
+def test_shards_need_a_plugin_build_that_passes_on_other_shards_keys(
+    monkeypatch, caplog
+):
+    monkeypatch.setattr(envs, "GATEWAY_AUTH_KEY_SHARDS", 4)
+    assert key_shard_count(_cfg()) == 4
+
+    # The bundled plugin asks the server about every key it does not hold, so
+    # each extra shard would add a server round-trip to every request.
+    bundled = _cfg()
+    bundled.gateway_plugin = {}
+    with caplog.at_level(logging.ERROR):
+        assert key_shard_count(bundled) == 1
+    assert "using a single shard" in caplog.text
+
+    monkeypatch.setattr(envs, "GATEWAY_AUTH_KEY_SHARDS", 1)
+    assert key_shard_count(bundled) == 1
+
+
+def test_shards_with_the_bundled_plugin_fail_gateway_initialization(monkeypatch):
+    bundled = _cfg()
+    bundled.gateway_plugin = {}
+
+    monkeypatch.setattr(envs, "GATEWAY_AUTH_KEY_SHARDS", 4)
+    validate_ext_auth_key_shards(_cfg())
+    with pytest.raises(ValueError, match="gpustack-ext-auth.url"):
+        validate_ext_auth_key_shards(bundled)
+
+    monkeypatch.setattr(envs, "GATEWAY_AUTH_KEY_SHARDS", 1)
+    validate_ext_auth_key_shards(bundled)
+
+
+def test_each_shard_cr_is_told_its_place():
+    live = WasmPluginSpec(
+        defaultConfig={"local_auth": {"enabled": True, "keys": {}, "refs": {}}}
+    )
+
+    spec = ext_auth_reconcile_spec_diff(
+        live,
+        keys={},
+        refs={},
+        public_route_ingresses=[],
+        cfg=_cfg(),
+        registry=MagicMock(),
+        shard=(0, 4),
+    )
+    assert spec.defaultConfig["local_auth"]["shard"] == {
+        "index": 0,
+        "count": 4,
+        "hash": "blake2b-64",
+    }
+
+    # Back to one CR, which holds every key and so has nothing to pass on.
+    spec = ext_auth_reconcile_spec_diff(
+        spec,
+        keys={},
+        refs={},
+        public_route_ingresses=[],
+        cfg=_cfg(),
+        registry=MagicMock(),
+    )
+    assert "shard" not in spec.defaultConfig["local_auth"]
+
+
+@pytest.mark.asyncio
+async def test_shards_past_the_count_are_deleted(stub_reconcile_inputs):
+    reconciler = _live_reconciler(
+        shards=2,
+        live_plugins=[
+            "gpustack-llm-ext-auth",
+            "gpustack-llm-ext-auth-shard-1",
+            "gpustack-llm-ext-auth-shard-2",
+            "gpustack-llm-ext-auth-shard-3",
+            "gpustack-ai-statistics",
+        ],
+    )
+
+    await reconciler.reconcile(full=False)
+
+    assert reconciler._extensions_api.deleted == [
+        "gpustack-llm-ext-auth-shard-2",
+        "gpustack-llm-ext-auth-shard-3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_a_failed_shard_does_not_hold_back_the_others(
+    stub_reconcile_inputs, monkeypatch
+):
+    stub_reconcile_inputs["keys"] = _entries(40)
+    reconciler = _live_reconciler(shards=2)
+    await reconciler.reconcile()
+    assert reconciler._applied_public_route_ids == {42}
+
+    written = []
+
+    async def _ensure(**kwargs):
+        if kwargs["name"] == ext_auth_shard_resource_name(0):
+            raise RuntimeError("API server said no")
+        written.append(kwargs["name"])
+
+    monkeypatch.setattr(
+        "gpustack.server.gateway_auth_reconciler.ensure_wasm_plugin", _ensure
+    )
+    with pytest.raises(RuntimeError):
+        await reconciler.reconcile()
+
+    assert written == [ext_auth_shard_resource_name(1)]
+    # Some CRs hold the new rules and some the old, so none can be ruled out.
+    assert reconciler._applied_public_route_ids is None
+    assert list(reconciler._applied_shards) == [1]
@@ -1,5 +1,6 @@
 from gpustack.gateway import generic_proxy_router_spec_diff
 import re
+from decimal import Decimal
 
 import pytest
 from fastapi import HTTPException
@@ -13,12 +14,14 @@ from gpustack.gateway.utils import (
     generate_model_ingress,
     generic_proxy_router_diff_spec,
     get_instance_id_from_header,
+    hamilton_calculate_weight,
     lora_registry_name_suffix,
     model_instance_registry,
     model_instances_registry_list,
     provider_proxy_plugin_spec,
     provider_registry,
     router_header_key,
+    traffic_percentages,
 )
 from gpustack.schemas.models import ModelInstance
 from gpustack.gateway.client.extensions_higress_io_v1_api import WasmPluginSpec
@@ -696,3 +699,65 @@ def test_diff_proxies_nameless_entry_is_kept_not_crashed():
     )
     assert need_update is True
     assert result == [nameless]
+
+
+def test_hamilton_calculate_weight_whole_percentages():
+    assert hamilton_calculate_weight([(1, 3)]) == [34, 33, 33]
+    assert hamilton_calculate_weight([(3, 1), (1, 1)]) == [75, 25]
+    assert hamilton_calculate_weight([(0, 2)]) == []
+    assert sum(hamilton_calculate_weight([(1, 7)], total=1000)) == 1000
+
+
+def test_traffic_percentages_keep_small_deployments_whole():
+    assert traffic_percentages([(1, 4)]) == [25, 25, 25, 25]
+    assert [str(p) for p in traffic_percentages([(90, 1), (10, 1)])] == ["90", "10"]
+
+
+def test_traffic_percentages_are_whole_by_default():
+    percentages = traffic_percentages([(1, 150)])
+
+    assert sum(percentages) == 100
+    assert all(p == int(p) for p in percentages)
+
+
+def test_traffic_percentages_apportion_each_destination_once():
+    # Target A: weight 90 over 40 replicas on 4 workers, target B: weight 10
+    # over 3 replicas on 1 worker.
+    pairs = [(90, 40), (10, 3)]
+    percentages = traffic_percentages(pairs, destination_sizes=[10, 10, 10, 10, 3])
+
+    assert [str(p) for p in percentages] == ["23", "23", "22", "22", "10"]
+    # Summing whole per-replica percentages instead skews the split to 88/12,
+    # and unevenly between A's workers.
+    per_replica = hamilton_calculate_weight(pairs)
+    assert [sum(per_replica[i : i + 10]) for i in range(0, 40, 10)] == [28, 20, 20, 20]
+    assert sum(per_replica[40:]) == 12
+
+
+def test_traffic_percentages_give_every_replica_of_a_large_set_traffic():
+    percentages = traffic_percentages([(1, 150)], max_decimals=2)
+
+    assert sum(percentages) == 100
+    assert all(p > 0 for p in percentages)
+    assert max(percentages) - min(percentages) == Decimal("0.01")
+    # Whole percentages would starve a third of them.
+    assert hamilton_calculate_weight([(1, 150)]).count(0) == 50
+
+
+def test_traffic_percentages_follow_target_weights_over_replica_counts():
+    # Target A: weight 90 over 40 replicas, target B: weight 10 over 3.
+    percentages = traffic_percentages([(90, 40), (10, 3)], max_decimals=2)
+
+    assert sum(percentages) == 100
+    assert set(percentages[:40]) == {Decimal("2.2"), Decimal("2.3")}
+    assert set(percentages[40:]) <= {Decimal("3.3"), Decimal("3.4")}
+    assert abs(sum(percentages[:40]) - 90) <= Decimal("0.1")
+
+
+def test_traffic_percentages_max_decimals():
+    assert traffic_percentages([(1, 150)], max_decimals=0).count(0) == 50
+    # Two places already give each of 150 replicas 66 or 67 seats.
+    assert {str(p) for p in traffic_percentages([(1, 150)], max_decimals=5)} == {
+        "0.66",
+        "0.67",
+    }
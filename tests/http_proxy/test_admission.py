@@ -0,0 +1,154 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gpustack.api.exceptions import TooManyRequestsException
+from gpustack.exporter.proxy_metrics import ProxyMetricsCollector
+from gpustack.http_proxy.load_balancer import AdmissionRejected, LoadBalancer
+from gpustack.routes import openai as openai_route
+from gpustack.schemas.models import ModelInstance
+
+
+def instances(*ids):
+    return [
+        ModelInstance(id=i, name=f"qwen-{i}", model_id=1, model_name="qwen")
+        for i in ids
+    ]
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_tenants_and_keys_take_turns_for_freed_slots():
+    balancer = LoadBalancer(model_max_concurrency=1, queue_size=10)
+    running = instances(1, 2)
+    held = await balancer.get_instance(running, tenant="a", client="a1")
+
+    served = []
+
+    async def request(tenant, client):
+        instance = await balancer.get_instance(running, tenant=tenant, client=client)
+        served.append((client, instance))
+
+    # Tenant a queues up through two keys before tenant b shows up.
+    for tenant, client in [("a", "a1"), ("a", "a1"), ("a", "a2"), ("b", "b1")]:
+        asyncio.create_task(request(tenant, client))
+    await settle()
+    assert served == []
+    assert balancer.stats()[0].queue_depth == 4
+
+    for _ in range(4):
+        balancer.release(held)
+        await settle()
+        held = served[-1][1]
+
+    assert [client for client, _ in served] == ["a1", "b1", "a2", "a1"]
+    stats = balancer.stats()[0]
+    assert (stats.queue_depth, stats.in_flight, stats.waited) == (0, 1, 4)
+
+
+@pytest.mark.asyncio
+async def test_instance_limit_skips_full_instances():
+    balancer = LoadBalancer(instance_max_concurrency=2, queue_size=1)
+    running = instances(1, 2)
+
+    picked = [await balancer.get_instance(running) for _ in range(4)]
+
+    assert sorted(i.id for i in picked) == [1, 1, 2, 2]
+    waiting = asyncio.create_task(balancer.get_instance(running))
+    await settle()
+    with pytest.raises(AdmissionRejected) as e:
+        await balancer.get_instance(running)
+    assert e.value.reason == "queue_full"
+
+    balancer.release(picked[0])
+    assert (await waiting).id == picked[0].id
+
+
+@pytest.mark.asyncio
+async def test_waiter_times_out_and_gives_up_its_place():
+    balancer = LoadBalancer(model_max_concurrency=1, queue_size=5, queue_timeout=0.05)
+    running = instances(1)
+    held = await balancer.get_instance(running)
+
+    with pytest.raises(AdmissionRejected) as e:
+        await balancer.get_instance(running)
+
+    assert e.value.reason == "timeout"
+    assert e.value.retry_after == 1
+    assert balancer.stats()[0].queue_depth == 0
+    balancer.release(held)
+    assert (await balancer.get_instance(running)).id == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_passes_its_slot_on():
+    balancer = LoadBalancer(model_max_concurrency=1, queue_size=5)
+    running = instances(1)
+    held = await balancer.get_instance(running)
+    first = asyncio.create_task(balancer.get_instance(running, client="first"))
+    second = asyncio.create_task(balancer.get_instance(running, client="second"))
+    await settle()
+
+    # The slot is handed to the first waiter, which leaves before taking it.
+    balancer.release(held)
+    first.cancel()
+    await settle()
+
+    assert first.cancelled()
+    assert (await second).id == 1
+    assert balancer._reserved[1] == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_models_are_evicted_from_stats():
+    balancer = LoadBalancer(model_max_concurrency=1, stats_idle_seconds=0.05)
+    gone = await balancer.get_instance(instances(1))
+    balancer.release(gone)
+    busy = [
+        ModelInstance(id=9, name="llama-9", model_id=2, model_name="llama"),
+    ]
+    await balancer.get_instance(busy)
+    assert sorted(s.model_name for s in balancer.stats()) == ["llama", "qwen"]
+
+    await asyncio.sleep(0.06)
+
+    # Still in flight, so kept however long ago its request came in.
+    assert [s.model_name for s in balancer.stats()] == ["llama"]
+    assert 1 not in balancer._reserved and 1 not in balancer._queues
+
+
+@pytest.mark.asyncio
+async def test_saturated_model_answers_429_with_retry_after(monkeypatch):
+    balancer = LoadBalancer(model_max_concurrency=1, queue_size=0)
+    monkeypatch.setattr(openai_route, "load_balancer", balancer)
+    request = SimpleNamespace(
+        state=SimpleNamespace(api_key=SimpleNamespace(id=3, owner_principal_id=9))
+    )
+    user = SimpleNamespace(id=5)
+    running = instances(1)
+    await openai_route.acquire_instance(request, user, running)
+
+    with pytest.raises(TooManyRequestsException) as e:
+        await openai_route.acquire_instance(request, user, running)
+
+    assert e.value.status_code == 429
+    assert e.value.headers == {"Retry-After": "1"}
+
+    metrics = {m.name: m for m in ProxyMetricsCollector(balancer).collect()}
+    [rejected] = metrics["gpustack:proxy_requests_rejected"].samples
+    assert rejected.labels == {"model": "qwen", "reason": "queue_full"}
+    assert rejected.value == 1
+    [in_flight] = metrics["gpustack:proxy_requests_in_flight"].samples
+    assert in_flight.value == 1
+    wait_samples = {
+        s.name: s.value for s in metrics["gpustack:proxy_queue_wait_seconds"].samples
+    }
+    assert wait_samples == {
+        "gpustack:proxy_queue_wait_seconds_count": 0,
+        "gpustack:proxy_queue_wait_seconds_sum": 0,
+    }
@@ -0,0 +1,103 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from starlette.datastructures import Headers
+
+from gpustack.http_proxy.load_balancer import LoadBalancer
+from gpustack.http_proxy.strategies import ConsistentHashStrategy
+from gpustack.routes import openai as openai_route
+from gpustack.schemas.models import ModelInstance
+
+
+def instances(*ids):
+    return [
+        ModelInstance(id=i, name=f"qwen-{i}", model_id=1, model_name="qwen")
+        for i in ids
+    ]
+
+
+async def owners(strategy, running, keys):
+    return {key: (await strategy.select_instance(running, key)).id for key in keys}
+
+
+@pytest.mark.asyncio
+async def test_same_key_same_instance_and_spread_across_keys():
+    strategy = ConsistentHashStrategy()
+    running = instances(1, 2, 3, 4)
+    keys = [f"session-{i}" for i in range(400)]
+
+    first = await owners(strategy, running, keys)
+
+    assert await owners(strategy, running, keys) == first
+    assert min(Counter(first.values()).values()) > 50
+
+
+@pytest.mark.asyncio
+async def test_instance_leaving_moves_only_its_keys():
+    strategy = ConsistentHashStrategy()
+    keys = [f"session-{i}" for i in range(400)]
+    before = await owners(strategy, instances(1, 2, 3, 4), keys)
+
+    after = await owners(strategy, instances(1, 2, 4), keys)
+
+    moved = {key for key in keys if before[key] != after[key]}
+    assert moved == {key for key in keys if before[key] == 3}
+
+
+@pytest.mark.asyncio
+async def test_hot_key_spills_over_at_the_load_bound():
+    balancer = LoadBalancer(ConsistentHashStrategy(load_factor=1.25))
+    running = instances(1, 2, 3, 4)
+
+    picked = [await balancer.get_instance(running, "system-prompt") for _ in range(8)]
+
+    # Each instance holds at most ceil(1.25 * (in flight + 1) / 4) requests.
+    assert max(Counter(i.id for i in picked).values()) <= 3
+    assert len({i.id for i in picked}) > 1
+
+    for instance in picked:
+        balancer.release(instance)
+    assert balancer._in_flight == Counter()
+    home = await balancer.get_instance(running, "system-prompt")
+    assert home.id == picked[0].id
+
+
+@pytest.mark.asyncio
+async def test_requests_without_a_key_are_rotated():
+    strategy = ConsistentHashStrategy()
+    running = instances(1, 2, 3)
+
+    picked = [(await strategy.select_instance(running)).id for _ in range(3)]
+
+    assert sorted(picked) == [1, 2, 3]
+
+
+def test_affinity_key_sources(monkeypatch):
+    monkeypatch.setattr(openai_route.envs, "PROXY_LOAD_BALANCING", "affinity")
+    monkeypatch.setattr(
+        openai_route.envs, "PROXY_AFFINITY_KEYS", ["header:x-session-id", "prefix"]
+    )
+    monkeypatch.setattr(openai_route.envs, "PROXY_AFFINITY_PREFIX_CHARS", 24)
+    user = SimpleNamespace(id=5)
+    chat = {
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": [{"type": "text", "text": "Hi"}]},
+        ]
+    }
+
+    def key(headers, body):
+        request = SimpleNamespace(headers=Headers(headers))
+        return openai_route.affinity_key(request, user, body)
+
+    assert key({"X-Session-Id": "abc"}, chat) == "header:x-session-id=abc"
+    assert key({}, chat) == "prefix=system:You are a helpful"
+    assert key({}, {"prompt": "Once upon a time"}) == "prefix=Once upon a time"
+    assert key({}, {}) is None
+
+    monkeypatch.setattr(openai_route.envs, "PROXY_AFFINITY_KEYS", ["user"])
+    assert key({}, chat) == "user=5"
+
+    monkeypatch.setattr(openai_route.envs, "PROXY_LOAD_BALANCING", "round_robin")
+    assert key({"X-Session-Id": "abc"}, chat) is None
@@ -0,0 +1,130 @@
+"""A scoped watch stream follows rows into and out of its scope.
+
+Workers watch ``/model-instances?assigned_worker_id=<id>`` and
+``/model-files?worker_id=<id>``; the server drops everything outside the
+worker's scope before serialization. The stream remembers what it sent, so a
+row that leaves the scope (an instance rescheduled elsewhere) is retracted
+with a DELETED, and an ID-only DELETED still reaches the one stream that holds
+the row.
+"""
+
+import json
+
+import pytest
+
+from gpustack.schemas.gpu_instance_types import GPUInstanceType, GPUInstanceTypeSpec
+from gpustack.schemas.models import (
+    DistributedServers,
+    ModelInstance,
+    ModelInstanceSubordinateWorker,
+)
+from gpustack.server.bus import Event, EventType
+
+WORKER_ID = 3
+
+
+def _instance(*, worker_id=1, subordinate_worker_ids=()):
+    mi = ModelInstance(id=11, name="mi", model_id=1, worker_id=worker_id)
+    if subordinate_worker_ids:
+        mi.distributed_servers = DistributedServers(
+            subordinate_workers=[
+                ModelInstanceSubordinateWorker(worker_id=wid)
+                for wid in subordinate_worker_ids
+            ]
+        )
+    return mi
+
+
+def _assigned(data):
+    return data.get_deployment_metadata(WORKER_ID) is not None
+
+
+def _scope(event_type, data, in_scope, replaying=False):
+    event = ModelInstance._scope_event(
+        Event(type=event_type, data=data), _assigned, in_scope, replaying
+    )
+    return event.type if event is not None else None
+
+
+def test_other_workers_instances_are_dropped():
+    in_scope = set()
+    assert _scope(EventType.CREATED, _instance(worker_id=1), in_scope) is None
+    assert _scope(EventType.UPDATED, _instance(worker_id=1), in_scope) is None
+    assert in_scope == set()
+
+
+def test_main_and_subordinate_assignments_are_both_in_scope():
+    in_scope = set()
+    main = _instance(worker_id=WORKER_ID)
+    assert _scope(EventType.CREATED, main, in_scope) == EventType.CREATED
+
+    subordinate = _instance(worker_id=1, subordinate_worker_ids=(2, WORKER_ID))
+    assert _scope(EventType.UPDATED, subordinate, in_scope) == EventType.UPDATED
+    assert in_scope == {11}
+
+
+def test_leaving_the_scope_is_sent_as_deleted_once():
+    in_scope = set()
+    _scope(EventType.CREATED, _instance(worker_id=WORKER_ID), in_scope)
+
+    moved = _instance(worker_id=1)
+    assert _scope(EventType.UPDATED, moved, in_scope) == EventType.DELETED
+    # Already retracted: later updates for the row stay off this stream.
+    assert _scope(EventType.UPDATED, moved, in_scope) is None
+
+
+def test_id_only_delete_reaches_only_the_stream_that_sent_the_row():
+    holder, bystander = set(), set()
+    _scope(EventType.CREATED, _instance(worker_id=WORKER_ID), holder)
+
+    assert _scope(EventType.DELETED, {"id": 11}, holder) == EventType.DELETED
+    assert _scope(EventType.DELETED, {"id": 11}, bystander) is None
+    assert holder == set()
+
+
+def test_a_resumed_replay_retracts_rows_it_never_sent_by_id_only():
+    # The client may hold the row from its previous stream, so a replayed
+    # move away is retracted without sending the other worker's data.
+    event = ModelInstance._scope_event(
+        Event(type=EventType.UPDATED, data=_instance(worker_id=1)),
+        _assigned,
+        set(),
+        replaying=True,
+    )
+    assert event.type == EventType.DELETED
+    assert event.data == {"id": 11}
+
+
+@pytest.mark.asyncio
+async def test_a_scoped_stream_retracts_a_row_that_moves_away(monkeypatch):
+    """End to end over the real ``streaming()``."""
+
+    def _row(cluster_id):
+        row = GPUInstanceType(
+            cluster_id=cluster_id,
+            name="a10g",
+            spec=GPUInstanceTypeSpec.model_validate({"unitResources": {"ram": "1Mi"}}),
+        )
+        row.snapshot = row.compute_snapshot()
+        row.id = 7
+        return row
+
+    async def fake_subscribe(*args, **kwargs):
+        yield Event(type=EventType.CREATED, data=_row(cluster_id=1))
+        yield Event(type=EventType.UPDATED, data=_row(cluster_id=2))
+        yield Event(type=EventType.UPDATED, data=_row(cluster_id=2))
+
+    monkeypatch.setattr(GPUInstanceType, "subscribe", fake_subscribe)
+
+    frames = [
+        json.loads(frame)
+        async for frame in GPUInstanceType.streaming(
+            scope_func=lambda data: data.cluster_id == 1
+        )
+    ]
+
+    assert [f["type"] for f in frames] == [
+        EventType.CREATED.value,
+        EventType.DELETED.value,
+    ]
+    assert [f["data"]["id"] for f in frames] == [7, 7]
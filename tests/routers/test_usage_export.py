@@ -100,7 +100,7 @@ def _enrichment():
     async def factory():
         yield enrich_session
 
-    with patch.object(usage_routes, "async_session", factory):
+    with patch.object(usage_routes, "analytics_session", factory):
         yield enrich_session
 
 
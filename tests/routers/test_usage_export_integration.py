@@ -14,6 +14,7 @@ actually decide whether the export works in production:
 These run on SQLite, which is enough to exercise the statements end to end.
 """
 
+import asyncio
 import csv
 import io
 import zipfile
@@ -36,6 +37,7 @@ from gpustack.schemas.model_usage import ModelUsage
 from gpustack.schemas.principals import Principal, PrincipalType
 from gpustack.schemas.users import User
 from gpustack.server.deps import get_current_user, get_session, get_tenant_context
+from gpustack.server.export_jobs import ExportJobManager
 
 NOW = datetime(2026, 4, 1, 0, 0, 0)
 
@@ -94,7 +96,7 @@ def _usage_row(*, user_id, user_name, route_id, route_name, day, tokens):
 
 
 @pytest_asyncio.fixture
-async def app_and_engine():
+async def app_and_engine(tmp_path):
     engine = create_async_engine("sqlite+aiosqlite://")
     async with engine.begin() as conn:
         await conn.run_sync(ModelUsage.__table__.create)
@@ -154,6 +156,7 @@ async def app_and_engine():
     app = FastAPI()
     register_handlers(app)
     app.include_router(usage_routes.router, prefix="/usage")
+    app.state.export_jobs = ExportJobManager(str(tmp_path / "exports"))
 
     admin = User(id=1, name="admin", is_admin=True)
     ctx = _Ctx()
@@ -175,7 +178,7 @@ async def app_and_engine():
         async with AsyncSession(engine) as session:
             yield session
 
-    with patch.object(usage_routes, "async_session", _enrichment_session):
+    with patch.object(usage_routes, "analytics_session", _enrichment_session):
         yield app, engine
     await engine.dispose()
 
@@ -956,3 +959,75 @@ async def test_the_preview_can_read_the_tenant_off_a_breakdown_item(client):
     assert untracked.get("identity") is None
     assert untracked["label"] == "Untracked"
     assert untracked["deleted"] is False
+
+
+async def _finished_job(client, job):
+    for _ in range(200):
+        if job["state"] in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+        response = await client.get(f"/usage/breakdown/export/jobs/{job['id']}")
+        assert response.status_code == 200, response.text
+        job = response.json()
+    raise AssertionError(f"export job never finished: {job}")
+
+
+@pytest.mark.asyncio
+async def test_export_job_writes_the_same_file_and_resumes_with_range(client):
+    payload = {**RANGE, "group_by": ["date", "user"]}
+    direct = await client.post("/usage/breakdown/export", json=payload)
+
+    submitted = await client.post("/usage/breakdown/export/jobs", json=payload)
+    assert submitted.status_code == 202, submitted.text
+    job = await _finished_job(client, submitted.json())
+    assert job["state"] == "completed", job
+    assert job["rows_total"] == job["rows_written"] == 15
+    assert job["filename"] == "usage_by_date_user_2026-04-01_2026-04-03.csv"
+
+    url = f"/usage/breakdown/export/jobs/{job['id']}/download"
+    full = await client.get(url)
+    assert full.status_code == 200
+    assert full.content == direct.content
+    assert full.headers["accept-ranges"] == "bytes"
+
+    # The tail of the file, as a client resuming an interrupted download asks.
+    resumed = await client.get(url, headers={"Range": "bytes=100-"})
+    assert resumed.status_code == 206
+    assert resumed.content == full.content[100:]
+
+
+@pytest.mark.asyncio
+async def test_export_job_is_not_over_the_direct_export_limit(client, monkeypatch):
+    """The row ceiling guards a held-open request; a job does not hold one."""
+    monkeypatch.setattr(usage_routes.envs, "USAGE_EXPORT_MAX_ROWS", 4)
+    payload = {**RANGE, "group_by": ["date", "user"]}
+
+    refused = await client.post("/usage/breakdown/export", json=payload)
+    assert refused.status_code == 422
+
+    submitted = await client.post("/usage/breakdown/export/jobs", json=payload)
+    job = await _finished_job(client, submitted.json())
+    assert job["state"] == "completed"
+    assert job["rows_written"] == 15
+
+
+@pytest.mark.asyncio
+async def test_export_job_is_private_and_gone_once_deleted(client, app_and_engine):
+    app, _ = app_and_engine
+    submitted = await client.post(
+        "/usage/breakdown/export/jobs", json={**RANGE, "group_by": ["user"]}
+    )
+    job = await _finished_job(client, submitted.json())
+
+    other = User(id=2, name="bob", is_admin=True)
+    app.dependency_overrides[get_current_user] = lambda: other
+    response = await client.get(f"/usage/breakdown/export/jobs/{job['id']}")
+    assert response.status_code == 404
+
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, name="admin", is_admin=True
+    )
+    deleted = await client.delete(f"/usage/breakdown/export/jobs/{job['id']}")
+    assert deleted.status_code == 204
+    response = await client.get(f"/usage/breakdown/export/jobs/{job['id']}/download")
+    assert response.status_code == 404
@@ -668,7 +668,7 @@ async def test_get_model_routes_admin_act_as_watch_applies_grant_filter(monkeypa
     async def fake_fetch_granted_route_ids(ctx):
         return {17}
 
-    def fake_streaming(fields=None, fuzzy_fields=None, filter_func=None):
+    def fake_streaming(fields=None, fuzzy_fields=None, filter_func=None, since=None):
         captured["fields"] = fields
         captured["filter_func"] = filter_func
 
@@ -1989,3 +1989,50 @@ async def test_a_storage_row_keeps_its_own_sku_under_the_generic_endpoint(sessio
     # A real instance in the same response is still realigned off its
     # representative — the guard narrows the overwrite, it does not remove it.
     assert by_name["gpu-1"]["sku"] == "h100x2"
+
+
+@pytest.mark.asyncio
+async def test_breakdown_past_one_batch_streams_to_the_same_result(
+    session, monkeypatch
+):
+    """A result larger than one batch comes off the cursor batch by batch,
+    enriched on a connection of its own, and must read exactly like the
+    single-fetch path the usual page takes."""
+    from contextlib import asynccontextmanager
+
+    from gpustack.routes import resource_usage
+
+    async def breakdown():
+        return await _run_breakdown(
+            session,
+            user=USER,
+            ctx=CTX,
+            request=ResourceBreakdownRequest(
+                scope="self",
+                start_date=D,
+                end_date=D,
+                group_by=["date", "instance"],
+                page=-1,
+            ),
+            base_filter=MeteredUsage.meter_key == METER_INSTANCE_UPTIME,
+            metric_keys=["gpu_hours", "instance_hours"],
+        )
+
+    fetched_whole = await breakdown()
+    assert len(fetched_whole["items"]) == 2
+
+    opened = []
+
+    @asynccontextmanager
+    async def _enrichment_session():
+        async with AsyncSession(session.bind) as enrich_session:
+            opened.append(enrich_session)
+            yield enrich_session
+
+    monkeypatch.setattr(resource_usage.envs, "USAGE_EXPORT_STREAM_CHUNK_ROWS", 1)
+    monkeypatch.setattr(resource_usage, "analytics_session", _enrichment_session)
+    streamed = await breakdown()
+
+    assert streamed == fetched_whole
+    # One lookup connection for the whole stream, not one per batch.
+    assert len(opened) == 1
@@ -90,7 +90,9 @@ def _stubbed_enrichment():
     session_ctx.__aenter__ = AsyncMock(return_value=MagicMock())
     session_ctx.__aexit__ = AsyncMock(return_value=False)
     with (
-        patch("gpustack.routes.resource_usage.async_session", return_value=session_ctx),
+        patch(
+            "gpustack.routes.resource_usage.analytics_session", return_value=session_ctx
+        ),
         patch("gpustack.routes.resource_usage._enrich_items", new=AsyncMock()),
     ):
         yield
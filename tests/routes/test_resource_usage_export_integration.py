@@ -141,7 +141,7 @@ async def app_and_engine():
         async with AsyncSession(engine) as session:
             yield session
 
-    with patch.object(resource_routes, "async_session", _enrichment_session):
+    with patch.object(resource_routes, "analytics_session", _enrichment_session):
         yield app, engine
     await engine.dispose()
 
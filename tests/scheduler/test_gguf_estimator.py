@@ -0,0 +1,201 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from gpustack.scheduler import calculator
+from gpustack.scheduler.calculator import (
+    GPUOffloadEnum,
+    calculate_gguf_model_resource_claim,
+)
+from gpustack.scheduler.gguf_estimator import estimate_gguf_model
+from gpustack.schemas.models import Model, SourceEnum
+from tests.fixtures.estimates.fixtures import (
+    deepseek_r1_distill_qwen_32b_bf16_partial_offload,
+    deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_1main_1rpc,
+    deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_3_2,
+    deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_3_3,
+)
+from tests.utils.gguf import from_parser_cache, qwen2_32b, write_gguf
+
+_ESTIMATES = os.path.join(os.path.dirname(__file__), "../fixtures/estimates")
+
+
+@pytest.fixture
+def qwen_model(tmp_path):
+    path = tmp_path / "DeepSeek-R1-Distill-Qwen-32B-bf16.gguf"
+    qwen2_32b(path)
+    return Model(
+        name="qwen",
+        source=SourceEnum.LOCAL_PATH,
+        local_path=str(path),
+        backend_parameters=["--ctx-size=32768"],
+    )
+
+
+@pytest.mark.parametrize(
+    "tensor_split, rpc, expected",
+    [
+        (None, None, deepseek_r1_distill_qwen_32b_bf16_partial_offload),
+        (
+            [1, 1],
+            ["host:50020"],
+            deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_1main_1rpc,
+        ),
+        (
+            [23540, 15360, 16368],
+            ["host:50020", "host:50020"],
+            deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_3_2,
+        ),
+        (
+            [23540, 16368, 15360],
+            ["host:50020", "host:50020"],
+            deepseek_r1_distill_qwen_32b_bf16_partial_offload_split_3_3,
+        ),
+    ],
+)
+def test_estimate_places_layers_as_gguf_parser(qwen_model, tensor_split, rpc, expected):
+    expected = expected().estimate
+
+    estimate = estimate_gguf_model(
+        qwen_model, GPUOffloadEnum.Partial, tensor_split=tensor_split, rpc=rpc
+    ).estimate
+
+    assert estimate.architecture == "qwen2"
+    assert estimate.contextSize == expected.contextSize
+    assert len(estimate.items) == len(expected.items)
+    for item, want in zip(estimate.items, expected.items):
+        assert item.offloadLayers == want.offloadLayers
+        assert item.fullOffloaded == want.fullOffloaded
+        assert item.ram.handleLayers == want.ram.handleLayers
+        assert [v.handleLayers for v in item.vrams] == [
+            v.handleLayers for v in want.vrams
+        ]
+        if not item.fullOffloaded:
+            # Weights and KV cache of the offloaded layers, to the byte.
+            assert [v.uma for v in item.vrams] == [v.uma for v in want.vrams]
+        # Compute buffers are approximated, on the high side.
+        for got, ref in zip([item.ram] + item.vrams, [want.ram] + want.vrams):
+            assert ref.nonuma <= got.nonuma <= ref.nonuma * 1.1 + 1
+
+
+def test_llama_estimate_matches_gguf_parser(tmp_path):
+    """The recorded header of Meta-Llama-3.1-8B-Instruct-Q8_0, against the RAM
+    gguf-parser v0.13.10 claims for it at 8K context without offload (see
+    test_schedule_with_ngl_end_in_cpu_offload)."""
+    path = tmp_path / "Meta-Llama-3.1-8B-Instruct-Q8_0.gguf"
+    from_parser_cache(
+        path,
+        os.path.join(
+            _ESTIMATES,
+            "bartowski_Meta-Llama-3.1-8B-Instruct-GGUF-Q8_0/remote/brief/6/"
+            "6f90e42c34d7275a",
+        ),
+    )
+    model = Model(
+        name="llama",
+        source=SourceEnum.LOCAL_PATH,
+        local_path=str(path),
+        backend_parameters=["--ctx-size=8192"],
+    )
+
+    estimate = estimate_gguf_model(model, GPUOffloadEnum.Disable).estimate
+
+    assert estimate.architecture == "llama"
+    assert estimate.contextSize == 8192
+    item = estimate.items[0]
+    assert item.ram.handleLayers == 32
+    assert 9628795768 <= item.ram.nonuma <= 9628795768 * 1.1
+
+
+def test_models_without_parity_are_left_to_gguf_parser(tmp_path):
+    """DeepSeek-R1 (multi-head latent attention) from its recorded header, and
+    a sliding-window model of a covered architecture."""
+    deepseek = tmp_path / "DeepSeek-R1-Q8_0-00001-of-00015.gguf"
+    from_parser_cache(
+        deepseek,
+        os.path.join(
+            _ESTIMATES,
+            "unsloth_DeepSeek-R1-GGUF_DeepSeek-R1-Q8_0/remote/brief/c/"
+            "c0fec98eccdc9c49",
+        ),
+    )
+    windowed = tmp_path / "windowed.gguf"
+    write_gguf(
+        windowed,
+        {
+            "general.architecture": "llama",
+            "llama.block_count": 1,
+            "llama.embedding_length": 64,
+            "llama.attention.head_count": 1,
+            "llama.attention.sliding_window": 16,
+        },
+        [("blk.0.attn_q.weight", (64, 64), 0)],
+    )
+
+    for path in (deepseek, windowed):
+        model = Model(name="m", source=SourceEnum.LOCAL_PATH, local_path=str(path))
+        assert estimate_gguf_model(model) is None
+
+
+def test_full_and_disabled_offload_estimate_one_item(qwen_model):
+    full = estimate_gguf_model(qwen_model, GPUOffloadEnum.Full).estimate
+    disabled = estimate_gguf_model(qwen_model, GPUOffloadEnum.Disable).estimate
+
+    assert [i.offloadLayers for i in full.items] == [65]
+    assert full.items[0].fullOffloaded
+    assert [i.offloadLayers for i in disabled.items] == [0]
+    assert disabled.items[0].ram.handleLayers == 64
+
+
+def test_models_gguf_parser_must_estimate_are_declined(tmp_path, qwen_model):
+    mamba = tmp_path / "mamba.gguf"
+    write_gguf(
+        mamba,
+        {
+            "general.architecture": "mamba",
+            "mamba.block_count": 2,
+            "mamba.embedding_length": 64,
+            "mamba.attention.head_count": 1,
+            "mamba.ssm.conv_kernel": 4,
+        },
+        [("blk.0.ssm_in.weight", (64, 64), 0)],
+    )
+    remote = Model(
+        name="remote",
+        source=SourceEnum.HUGGING_FACE,
+        huggingface_repo_id="org/model",
+        huggingface_filename="*Q4_K_M.gguf",
+    )
+    overridden = qwen_model.model_copy(
+        update={"backend_parameters": ["-ot", "exps=CPU"]}
+    )
+
+    assert estimate_gguf_model(remote) is None
+    assert estimate_gguf_model(overridden) is None
+    assert (
+        estimate_gguf_model(
+            Model(name="mamba", source=SourceEnum.LOCAL_PATH, local_path=str(mamba))
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_gguf_claims_do_not_run_gguf_parser(qwen_model):
+    with (
+        patch.object(
+            calculator.asyncio,
+            "create_subprocess_exec",
+            side_effect=AssertionError("gguf-parser was started"),
+        ),
+        patch.object(calculator.envs, "GGUF_ESTIMATE_IN_PROCESS", True),
+    ):
+        claim = await calculate_gguf_model_resource_claim(
+            qwen_model, GPUOffloadEnum.Disable
+        )
+
+    item = claim.resource_claim_estimate.items[0]
+    assert item.offloadLayers == 0
+    assert all(v.nonuma == 0 for v in item.vrams)
+    assert claim.resource_architecture.architecture == "qwen2"
@@ -0,0 +1,100 @@
+"""Routing of reporting sessions between the primary and the analytics engine."""
+
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from gpustack.server import db
+
+
+@pytest_asyncio.fixture
+async def engines():
+    primary = create_async_engine("sqlite+aiosqlite://")
+    replica = create_async_engine("sqlite+aiosqlite://")
+    db._analytics_router.reset()
+    with (
+        patch.object(db, "engine", primary),
+        patch.object(db, "analytics_engine", replica),
+    ):
+        yield primary, replica
+    db._analytics_router.reset()
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def _resolve_bind(primary_engine):
+    """Drive the dependency the way FastAPI does and report its engine."""
+    gen = db.get_analytics_session(
+        primary=db.AsyncSession(primary_engine, expire_on_commit=False)
+    )
+    session = await anext(gen)
+    try:
+        return session.bind
+    finally:
+        await gen.aclose()
+
+
+@pytest.mark.asyncio
+async def test_without_analytics_engine_uses_primary(engines):
+    primary, _ = engines
+    with patch.object(db, "analytics_engine", None):
+        assert await _resolve_bind(primary) is primary
+        assert db.analytics_session().bind is primary
+
+
+@pytest.mark.asyncio
+async def test_caught_up_replica_serves_reports(engines):
+    primary, replica = engines
+    assert await _resolve_bind(primary) is replica
+    # The enrichment helper follows the verdict the request just got.
+    assert db.analytics_session().bind is replica
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back(engines, monkeypatch):
+    primary, _ = engines
+    monkeypatch.setattr(db.envs, "DB_ANALYTICS_MAX_STALENESS_SECONDS", 60)
+
+    async def _lag(_):
+        return 600.0
+
+    with patch.object(db, "replication_lag_seconds", _lag):
+        assert await _resolve_bind(primary) is primary
+    assert db.analytics_session().bind is primary
+
+
+@pytest.mark.asyncio
+async def test_stopped_or_unreachable_replica_falls_back(engines):
+    primary, _ = engines
+
+    async def _stopped(_):
+        return None
+
+    with patch.object(db, "replication_lag_seconds", _stopped):
+        assert await _resolve_bind(primary) is primary
+
+    db._analytics_router.reset()
+
+    async def _unreachable(_):
+        raise ConnectionRefusedError("replica down")
+
+    with patch.object(db, "replication_lag_seconds", _unreachable):
+        assert await _resolve_bind(primary) is primary
+
+
+@pytest.mark.asyncio
+async def test_verdict_is_cached_between_checks(engines):
+    primary, replica = engines
+    calls = 0
+
+    async def _lag(_):
+        nonlocal calls
+        calls += 1
+        return 0.0
+
+    with patch.object(db, "replication_lag_seconds", _lag):
+        for _ in range(5):
+            assert await _resolve_bind(primary) is replica
+    assert calls == 1
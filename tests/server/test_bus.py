@@ -3,7 +3,7 @@ import logging
 
 import pytest
 
-from gpustack.server.bus import Event, EventType, Subscriber
+from gpustack.server.bus import Event, EventBus, EventLog, EventType, Subscriber
 
 
 @pytest.mark.asyncio
@@ -285,3 +285,68 @@ async def test_unsubscribe_unwinds_putters_beyond_queue_capacity():
     assert all(t not in bus._pending_tasks for t in blocked_tasks)
     putters = getattr(subscriber.queue, "_putters", None)
     assert putters is None or len(putters) == 0
+
+
+def test_event_log_resumes_only_while_nothing_was_truncated():
+    log = EventLog(size=3)
+    events = [Event(type=EventType.CREATED, data={"id": i}, id=i) for i in range(5)]
+    for event in events:
+        log.append(event)
+
+    # Sequences 3..5 are retained; resuming after 2 misses nothing.
+    assert log.since(2) == events[2:]
+    assert log.since(5) == []
+    # After 1, event 2 is already gone.
+    assert log.since(1) is None
+    # A position this log never reached.
+    assert log.since(6) is None
+
+
+def test_routed_events_are_versioned_and_replayable():
+    bus = EventBus()
+    topic = "_test_event_log"
+    start = bus.position(topic)
+
+    first = Event(type=EventType.CREATED, data={"id": 1}, id=1)
+    second = Event(type=EventType.UPDATED, data={"id": 1}, id=1)
+    bus._route_event(first, topic)
+    bus._route_event(second, topic)
+
+    assert bus.events_since(topic, start) == [first, second]
+    assert bus.events_since(topic, first.resource_version) == [second]
+    assert bus.events_since(topic, bus.position(topic)) == []
+    assert bus.position(topic) == second.resource_version
+
+
+def test_versions_from_another_bus_never_resume():
+    # A different server, or this one before a restart.
+    other = EventBus()
+    other._route_event(Event(type=EventType.CREATED, data={"id": 1}, id=1), "t")
+
+    bus = EventBus()
+    assert bus.events_since("t", other.position("t")) is None
+    assert bus.events_since("t", "") is None
+    assert bus.events_since("t", "garbage") is None
+
+
+@pytest.mark.asyncio
+async def test_coalesced_update_keeps_the_queued_events_version():
+    """Resuming from a coalesced event must not skip events queued after it.
+
+    ``old`` (v1) takes a queue slot, ``other`` (v2) queues behind it, and
+    ``new`` (v3) coalesces into ``old``'s slot. The first delivery is ``new``
+    but stamped v1, so a client that disconnects right after it resumes from
+    v1 and still gets ``other``.
+    """
+    subscriber = Subscriber(topic="modelinstance", source="test")
+    old = Event(type=EventType.UPDATED, data={"id": 1}, id=1, resource_version="e-1")
+    other = Event(type=EventType.CREATED, data={"id": 2}, id=2, resource_version="e-2")
+    new = Event(type=EventType.UPDATED, data={"id": 1}, id=1, resource_version="e-3")
+    for event in (old, other, new):
+        await subscriber.enqueue(event)
+
+    delivered = await asyncio.wait_for(subscriber.receive(), timeout=1)
+    assert delivered.data is new.data
+    assert delivered.resource_version == "e-1"
+    # The shared event object other subscribers see is untouched.
+    assert new.resource_version == "e-3"
@@ -0,0 +1,113 @@
+"""Background export jobs: slots, failures and the sweep of expired files."""
+
+import asyncio
+import contextlib
+import os
+import time
+
+import pytest
+
+from gpustack.api.exceptions import InvalidException, NotFoundException
+from gpustack.server.export_jobs import ExportJobManager
+from gpustack.utils.export_delivery import ExportArtifact
+
+
+def _source(chunks, *, gate: asyncio.Event = None, running=None):
+    @contextlib.asynccontextmanager
+    async def source(job):
+        if running is not None:
+            running.append(job.id)
+        try:
+            if gate is not None:
+                await gate.wait()
+
+            async def body():
+                for chunk in chunks:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk
+
+            yield ExportArtifact("usage.csv", "text/csv", body())
+        finally:
+            if running is not None:
+                running.remove(job.id)
+
+    return source
+
+
+async def _settle(job):
+    await asyncio.wait_for(job.task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_jobs_past_the_concurrency_wait_for_a_slot(tmp_path):
+    manager = ExportJobManager(str(tmp_path), concurrency=1)
+    gate = asyncio.Event()
+    running = []
+    first = manager.submit(1, "csv", _source([b"a"], gate=gate, running=running))
+    second = manager.submit(1, "csv", _source([b"b"], gate=gate, running=running))
+    await asyncio.sleep(0.05)
+
+    assert running == [first.id]
+    assert (first.state, second.state) == ("running", "pending")
+
+    gate.set()
+    await _settle(first)
+    await _settle(second)
+    assert second.state == "completed"
+    with open(manager.completed_path(second), "rb") as f:
+        assert f.read() == b"b"
+
+
+@pytest.mark.asyncio
+async def test_a_failed_job_leaves_no_file_and_a_generic_error(tmp_path):
+    manager = ExportJobManager(str(tmp_path))
+    job = manager.submit(1, "csv", _source([b"header\n", RuntimeError("boom")]))
+    await _settle(job)
+
+    assert job.state == "failed"
+    assert "boom" not in job.error
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(InvalidException):
+        manager.completed_path(job)
+
+
+@pytest.mark.asyncio
+async def test_unfinished_jobs_are_capped_per_user(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "gpustack.server.export_jobs.envs.USAGE_EXPORT_JOB_MAX_ACTIVE_PER_USER", 1
+    )
+    manager = ExportJobManager(str(tmp_path))
+    gate = asyncio.Event()
+    job = manager.submit(1, "csv", _source([b"a"], gate=gate))
+
+    with pytest.raises(InvalidException):
+        manager.submit(1, "csv", _source([b"a"]))
+    # Someone else's queue is their own.
+    other = manager.submit(2, "csv", _source([b"a"]))
+
+    await manager.cancel(job.id, 1)
+    await _settle(other)
+    with pytest.raises(NotFoundException):
+        manager.get(job.id, 1)
+
+
+@pytest.mark.asyncio
+async def test_sweep_removes_expired_jobs_and_orphaned_files(tmp_path):
+    manager = ExportJobManager(str(tmp_path), ttl_seconds=60)
+    job = manager.submit(1, "csv", _source([b"a"]))
+    await _settle(job)
+    # Left behind by a previous process: one finished file, one cut short.
+    stale = time.time() - 120
+    for name in ("0123", "4567.part"):
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        os.utime(path, (stale, stale))
+
+    assert await manager.collect_expired() == 2
+    assert sorted(os.listdir(tmp_path)) == [job.id]
+
+    assert await manager.collect_expired(now=time.time() + 120) == 1
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(NotFoundException):
+        manager.get(job.id, 1)
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from gpustack.schemas.models import BackendSourceEnum
+from gpustack.server.controllers import InferenceBackendController
+from gpustack.utils import yaml_loader
+from gpustack.utils.compat_importlib import pkg_resources
+
+
+def community_rows():
+    data = yaml_loader.safe_load(
+        pkg_resources.files("gpustack.assets")
+        .joinpath("community-inference-backends.yaml")
+        .read_text()
+    )
+    return [
+        SimpleNamespace(
+            backend_name=config["backend_name"],
+            backend_source=BackendSourceEnum.COMMUNITY,
+            owner_principal_id=None,
+        )
+        for config in data
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_community_backends_are_not_upserted_again(tmp_path):
+    controller = InferenceBackendController(SimpleNamespace(data_dir=str(tmp_path)))
+    rows = community_rows()
+
+    with (
+        patch(
+            "gpustack.server.controllers.InferenceBackend.all",
+            new=AsyncMock(return_value=rows),
+        ),
+        patch.object(
+            controller, "_upsert_community_backend", new=AsyncMock()
+        ) as upsert,
+    ):
+        await controller._init_community_backends(session=None)
+        assert upsert.await_count == len(rows)
+
+        upsert.reset_mock()
+        await controller._init_community_backends(session=None)
+        assert upsert.await_count == 0
+
+        # A row gone from the database is seeded again.
+        rows.pop()
+        await controller._init_community_backends(session=None)
+        assert upsert.await_count == len(rows) + 1
@@ -10,6 +10,7 @@ from types import SimpleNamespace
 from gpustack.schemas.model_usage import ModelUsage
 from gpustack.schemas.models import Model
 from gpustack.schemas.principals import PrincipalType, platform_principal_id
+from gpustack.server import metrics_collector
 from gpustack.server.metrics_collector import (
     ModelUsageMetrics,
     _build_metric_snapshot,
@@ -555,14 +556,19 @@ async def test_create_or_update_refreshes_route_name_on_rename(monkeypatch):
 
     save_mock = AsyncMock()
     monkeypatch.setattr(ModelUsage, "save", save_mock)
+    tiers_mock = AsyncMock()
+    monkeypatch.setattr(metrics_collector, "add_to_tiers", tiers_mock)
 
-    await create_or_update_model_usage(MagicMock(), incoming, auto_commit=False)
+    session = MagicMock()
+    await create_or_update_model_usage(session, incoming, auto_commit=False)
 
     assert existing.model_route_name == "new-name"
     assert existing.prompt_token_count == 130
     assert existing.completion_token_count == 70
     assert existing.request_count == 2
     save_mock.assert_awaited_once()
+    # The tiers are keyed on the row as renamed, and grow by the increment.
+    tiers_mock.assert_awaited_once_with(session, existing, incoming)
 
 
 @pytest.mark.asyncio
@@ -607,12 +613,16 @@ async def test_create_or_update_preserves_route_name_when_incoming_is_null(
 
     save_mock = AsyncMock()
     monkeypatch.setattr(ModelUsage, "save", save_mock)
+    tiers_mock = AsyncMock()
+    monkeypatch.setattr(metrics_collector, "add_to_tiers", tiers_mock)
 
-    await create_or_update_model_usage(MagicMock(), incoming, auto_commit=False)
+    session = MagicMock()
+    await create_or_update_model_usage(session, incoming, auto_commit=False)
 
     assert existing.model_route_name == "old-name"
     assert existing.prompt_token_count == 130
     save_mock.assert_awaited_once()
+    tiers_mock.assert_awaited_once_with(session, existing, incoming)
 
 
 def _fake_model(model_id: int, name: str) -> MagicMock:
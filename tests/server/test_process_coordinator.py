@@ -0,0 +1,144 @@
+import asyncio
+import os
+import time
+
+import pytest
+import pytest_asyncio
+
+from gpustack.server import background
+from gpustack.server.background import BackgroundServicesProcess
+from gpustack.server.coordinator import Event, EventType, ProcessCoordinator
+
+
+class Row:
+    def __init__(self, id):
+        self.id = id
+
+
+def collect(coordinator, channel):
+    events = []
+    coordinator.subscribe(channel, events.append)
+    return events
+
+
+async def until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def relay():
+    coordinator = ProcessCoordinator()
+    await coordinator.start()
+    yield coordinator
+    await coordinator.stop()
+
+
+async def connect(relay, name):
+    peer = ProcessCoordinator(address=relay.address, name=name)
+    await peer.start()
+    await until(lambda: relay.last_seen(name) is not None)
+    return peer
+
+
+@pytest.mark.asyncio
+async def test_events_reach_every_process_as_ids(relay):
+    controllers = await connect(relay, "controllers")
+    collectors = await connect(relay, "collectors")
+    seen = {
+        "api": collect(relay, "model"),
+        "controllers": collect(controllers, "model"),
+        "collectors": collect(collectors, "model"),
+    }
+
+    row = Row(7)
+    await controllers.publish("model", Event(type=EventType.UPDATED, data=row))
+    await until(lambda: all(seen.values()))
+
+    # The publisher's own subscribers get the full event, the other
+    # processes the ID only, to be fetched from the database.
+    assert seen["controllers"][0].data is row
+    for name in ("api", "collectors"):
+        [event] = seen[name]
+        assert (event.type, event.id, event.data) == (EventType.UPDATED, 7, {"id": 7})
+
+    await relay.publish("model", Event(type=EventType.DELETED, data=Row(8)))
+    await until(lambda: len(seen["collectors"]) == 2)
+    assert seen["controllers"][1].data == {"id": 8}
+
+    assert relay.is_leader() is False
+    assert controllers.is_leader() is True
+    await controllers.stop()
+    await collectors.stop()
+
+
+@pytest.mark.asyncio
+async def test_peers_with_a_wrong_token_are_rejected(relay):
+    host, port, _ = relay.address
+    intruder = ProcessCoordinator(address=(host, port, "guess"), name="intruder")
+    await intruder.start()
+
+    await asyncio.wait_for(intruder.wait_disconnected(), timeout=2)
+    assert relay.last_seen("intruder") is None
+
+
+@pytest.mark.asyncio
+async def test_peers_notice_the_relay_going_away(relay):
+    peer = await connect(relay, "controllers")
+
+    await relay.stop()
+
+    await asyncio.wait_for(peer.wait_disconnected(), timeout=2)
+
+
+def exit_at_once(cfg, group, address, operator_unix_path):
+    os._exit(3)
+
+
+@pytest.mark.asyncio
+async def test_exited_background_process_is_restarted(relay, monkeypatch):
+    monkeypatch.setattr(background, "_CHECK_INTERVAL", 0.05)
+    monkeypatch.setattr(background, "_MIN_BACKOFF", 0.05)
+    process = BackgroundServicesProcess(None, "controllers", relay, target=exit_at_once)
+
+    supervisor = asyncio.create_task(process.run())
+    try:
+        await until(lambda: process.restarts >= 2, timeout=30)
+    finally:
+        supervisor.cancel()
+        await asyncio.gather(supervisor, return_exceptions=True)
+    assert process._process is None
+
+
+class _StoppingService:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def start(self):
+        raise RuntimeError("stopped")
+
+
+@pytest.mark.asyncio
+async def test_background_services_are_awaited_by_their_process(monkeypatch):
+    """A child process waits on ``_async_tasks``, and exits (to be restarted)
+    when one of them fails; the scheduler and every controller must be in it."""
+    from gpustack.server import server as server_module
+
+    started = ["Scheduler"]
+    monkeypatch.setattr(server_module, "Scheduler", _StoppingService)
+    for name in dir(server_module):
+        if name.endswith(("Controller", "Reconciler")):
+            monkeypatch.setattr(server_module, name, _StoppingService)
+            started.append(name)
+    srv = server_module.Server.__new__(server_module.Server)
+    srv._config = None
+    srv._async_tasks = []
+
+    srv._start_scheduler()
+    srv._start_controllers()
+
+    results = await asyncio.gather(*srv._async_tasks, return_exceptions=True)
+    assert len(results) == len(started)
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,268 @@
+"""Weekly / monthly usage tiers: maintenance, verification and read planning."""
+
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from gpustack.schemas.model_usage import (
+    ModelUsage,
+    ModelUsageMonthly,
+    ModelUsageWeekly,
+    OperationEnum,
+)
+from gpustack.server import usage_tiers
+from gpustack.server.usage_tiers import (
+    KEY_COLUMNS,
+    MONTHLY_TIER,
+    WEEKLY_TIER,
+    adapt_to_source,
+    add_to_tiers,
+    period_matches,
+    rebuild_period,
+    tier_key_hash,
+    tier_source_for_range,
+    verify_tiers,
+)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            SQLModel.metadata.create_all,
+            tables=[
+                ModelUsage.__table__,
+                ModelUsageWeekly.__table__,
+                ModelUsageMonthly.__table__,
+            ],
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+def _usage(day: date, *, user_id=1, access_key="ak", requests=1, **kwargs):
+    return ModelUsage(
+        model_id=1,
+        model_name="qwen3",
+        user_id=user_id,
+        user_name=f"user-{user_id}",
+        access_key=access_key,
+        operation=OperationEnum.CHAT_COMPLETION,
+        date=day,
+        prompt_token_count=10 * requests,
+        completion_token_count=5 * requests,
+        prompt_cached_token_count=0,
+        request_count=requests,
+        **kwargs,
+    )
+
+
+async def _write(session, usage: ModelUsage):
+    """What the flush does for a new daily row."""
+    session.add(usage)
+    await session.flush()
+    await add_to_tiers(session, usage, usage)
+
+
+def _postgres_session():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    return session
+
+
+@pytest.mark.asyncio
+async def test_flush_increments_keep_tiers_equal_to_daily_rows(session):
+    # Mon 2026-03-02 .. Sun 2026-03-08, plus a row the following Monday.
+    for offset in range(7):
+        await _write(session, _usage(date(2026, 3, 2) + timedelta(days=offset)))
+    await _write(session, _usage(date(2026, 3, 4), user_id=2, access_key=None))
+    await _write(session, _usage(date(2026, 3, 9)))
+    # An increment out of date order must not move ``date`` backwards.
+    await _write(session, _usage(date(2026, 3, 3), requests=4))
+    await session.commit()
+
+    weekly = (
+        await session.exec(
+            select(ModelUsageWeekly).where(
+                ModelUsageWeekly.period_start == date(2026, 3, 2),
+                ModelUsageWeekly.user_id == 1,
+            )
+        )
+    ).one()[0]
+    assert weekly.request_count == 11
+    assert weekly.date == date(2026, 3, 8)
+
+    for tier in (WEEKLY_TIER, MONTHLY_TIER):
+        for period_start in tier.periods(date(2026, 3, 1), date(2026, 3, 31)):
+            assert await period_matches(session, tier, period_start)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_flushes_upsert_a_single_tier_row(session):
+    # Two flushes inserting the same key, NULL columns included, used to both
+    # miss the UPDATE and INSERT a row each.
+    for _ in range(2):
+        await _write(session, _usage(date(2026, 3, 3), access_key=None))
+    await session.commit()
+
+    weekly = (await session.exec(select(ModelUsageWeekly))).all()
+    assert [(row[0].request_count, row[0].access_key) for row in weekly] == [(2, None)]
+
+    row = {
+        c.name: getattr(weekly[0][0], c.name)
+        for c in ModelUsageWeekly.__table__.columns
+        if c.name != "id"
+    }
+    with pytest.raises(IntegrityError):
+        await session.exec(insert(ModelUsageWeekly.__table__).values(**row))
+
+
+def test_migration_backfill_hashes_keys_like_the_flush():
+    path = next(
+        Path(usage_tiers.__file__)
+        .parent.parent.joinpath("migrations", "versions")
+        .glob("*-5e1c2b7d9a40_usage_weekly_monthly_tiers.py")
+    )
+    spec = importlib.util.spec_from_file_location("usage_tiers_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    usage = _usage(date(2026, 3, 3), api_key_is_custom=True)
+    values = {name: getattr(usage, name) for name in KEY_COLUMNS}
+    # What a raw query hands the backfill: enum names, booleans as 0 / 1.
+    raw = {**values, "operation": "CHAT_COMPLETION", "api_key_is_custom": 1}
+
+    assert migration._KEY_COLUMNS == list(KEY_COLUMNS)
+    assert migration._key_hash(raw) == tier_key_hash(values)
+
+
+@pytest.mark.asyncio
+async def test_verify_finds_and_repairs_drift(session):
+    for offset in range(10):
+        await _write(session, _usage(date(2026, 3, 2) + timedelta(days=offset)))
+    # A daily row the tiers never saw, e.g. written by an older server.
+    session.add(_usage(date(2026, 3, 3), user_id=3))
+    await session.commit()
+
+    drifted = await verify_tiers(session, date(2026, 3, 1), date(2026, 3, 31))
+    assert drifted == [("month", date(2026, 3, 1)), ("week", date(2026, 3, 2))]
+
+    repaired = await verify_tiers(
+        session, date(2026, 3, 1), date(2026, 3, 31), repair=True
+    )
+    assert repaired == drifted
+    assert await verify_tiers(session, date(2026, 3, 1), date(2026, 3, 31)) == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_period_replaces_only_that_period(session):
+    await _write(session, _usage(date(2026, 2, 27)))
+    await _write(session, _usage(date(2026, 3, 2)))
+    await session.commit()
+
+    await rebuild_period(session, MONTHLY_TIER, date(2026, 3, 1))
+    await session.commit()
+    rows = (
+        await session.exec(
+            select(ModelUsageMonthly.period_start, ModelUsageMonthly.request_count)
+        )
+    ).all()
+    assert sorted(rows) == [(date(2026, 2, 1), 1), (date(2026, 3, 1), 1)]
+
+
+def test_plan_reads_covered_periods_from_tier_and_edges_from_days():
+    source = tier_source_for_range(
+        _postgres_session(), date(2026, 1, 10), date(2026, 4, 20), None
+    )
+    assert source.tier is MONTHLY_TIER
+    assert (source.first_period, source.end_period) == (
+        date(2026, 2, 1),
+        date(2026, 4, 1),
+    )
+    assert source.edges == [
+        (date(2026, 1, 10), date(2026, 1, 31)),
+        (date(2026, 4, 1), date(2026, 4, 20)),
+    ]
+
+    # Grouped by week: only the weekly tier can keep weeks apart.
+    weekly = tier_source_for_range(
+        _postgres_session(), date(2026, 1, 10), date(2026, 4, 20), "week"
+    )
+    assert weekly.tier is WEEKLY_TIER
+    assert weekly.edges == [
+        (date(2026, 1, 10), date(2026, 1, 11)),
+        (date(2026, 4, 20), date(2026, 4, 20)),
+    ]
+
+
+def test_plan_falls_back_to_daily_rows():
+    session = _postgres_session()
+    # Daily buckets cannot come from a tier.
+    assert (
+        tier_source_for_range(session, date(2026, 1, 1), date(2026, 6, 30), "day")
+        is None
+    )
+    # No full month inside the range.
+    assert (
+        tier_source_for_range(session, date(2026, 1, 10), date(2026, 2, 20), "month")
+        is None
+    )
+    # SQLite has neither a backfill nor week / month buckets.
+    sqlite = MagicMock()
+    sqlite.get_bind.return_value.dialect.name = "sqlite"
+    assert (
+        tier_source_for_range(sqlite, date(2026, 1, 1), date(2026, 6, 30), None) is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_adapted_breakdown_matches_daily_breakdown(session, monkeypatch):
+    start, end = date(2026, 1, 20), date(2026, 4, 10)
+    day = start - timedelta(days=3)
+    while day <= end + timedelta(days=3):
+        for user_id in (1, 2):
+            await _write(
+                session,
+                _usage(
+                    day,
+                    user_id=user_id,
+                    access_key=f"ak-{day.day % 3}",
+                    requests=day.day % 4 + 1,
+                    model_route_id=day.month,
+                ),
+            )
+        day += timedelta(days=1)
+    await session.commit()
+
+    statement = (
+        select(
+            ModelUsage.user_id,
+            func.sum(ModelUsage.request_count),
+            func.sum(ModelUsage.prompt_token_count),
+            func.count(func.distinct(ModelUsage.access_key)),
+            func.count(func.distinct(ModelUsage.model_route_id)),
+            func.max(ModelUsage.date),
+        )
+        .where(ModelUsage.date >= start)
+        .where(ModelUsage.date <= end)
+        .group_by(ModelUsage.user_id)
+        .order_by(ModelUsage.user_id)
+    )
+    expected = (await session.exec(statement)).all()
+
+    monkeypatch.setattr(usage_tiers, "TIER_DIALECTS", ("sqlite",))
+    source = tier_source_for_range(session, start, end, None)
+    assert source is not None and source.tier is MONTHLY_TIER
+    actual = (await session.exec(adapt_to_source(statement, source.selectable()))).all()
+    assert actual == expected
@@ -0,0 +1,65 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from gpustack.server import worker_syncer
+from gpustack.server.worker_syncer import WorkerProber
+
+
+def workers(count):
+    return [SimpleNamespace(id=i, name=f"worker-{i}") for i in range(1, count + 1)]
+
+
+def prober(**kwargs):
+    options = dict(timeout=1, window=0, concurrency=4, shard_size=100)
+    options.update(kwargs)
+    return WorkerProber(lambda: None, lambda: None, **options)
+
+
+def test_large_fleets_are_probed_a_shard_per_round():
+    fleet = workers(1000)
+    engine = prober(shard_size=250)
+
+    rounds = [engine.due(fleet) for _ in range(4)]
+
+    # Every worker once per four rounds, in shards of about the shard size.
+    probed = Counter(w.id for shard in rounds for w in shard)
+    assert set(probed) == {w.id for w in fleet}
+    assert set(probed.values()) == {1}
+    assert all(150 < len(shard) < 350 for shard in rounds)
+    assert engine.due(fleet) == rounds[0]
+
+
+def test_small_fleets_are_probed_every_round():
+    fleet = workers(10)
+    engine = prober()
+
+    assert engine.due(fleet) == fleet
+    assert engine.due(fleet) == fleet
+
+
+@pytest.mark.asyncio
+async def test_probes_are_bounded_and_spread(monkeypatch):
+    running = 0
+    peak = 0
+    started = []
+
+    async def is_worker_reachable(worker, **kwargs):
+        nonlocal running, peak
+        started.append(asyncio.get_running_loop().time())
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return worker.id % 2 == 0
+
+    monkeypatch.setattr(worker_syncer, "is_worker_reachable", is_worker_reachable)
+    engine = prober(window=0.2, concurrency=3)
+
+    reachable = await engine.probe(workers(20))
+
+    assert reachable == {i: i % 2 == 0 for i in range(1, 21)}
+    assert peak <= 3
+    assert max(started) - min(started) > 0.05
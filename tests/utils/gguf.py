@@ -0,0 +1,116 @@
+import json
+import struct
+from typing import Any, Dict, List, Tuple
+
+# The metadata value type written for each Python type.
+_TYPES = [
+    (bool, 7, "<?"),
+    (int, 4, "<I"),
+    (float, 6, "<f"),
+]
+
+BF16 = 30
+F32 = 0
+
+
+def _string(value: str) -> bytes:
+    data = value.encode()
+    return struct.pack("<Q", len(data)) + data
+
+
+def _value(value: Any) -> bytes:
+    if isinstance(value, str):
+        return struct.pack("<I", 8) + _string(value)
+    if isinstance(value, list):
+        item = _value(value[0])[:4]
+        item_type = struct.unpack("<I", item)[0]
+        body = b"".join(_value(v)[4:] for v in value)
+        return struct.pack("<IIQ", 9, item_type, len(value)) + body
+    for py_type, gguf_type, fmt in _TYPES:
+        if isinstance(value, py_type):
+            return struct.pack("<I", gguf_type) + struct.pack(fmt, value)
+    raise TypeError(value)
+
+
+def write_gguf(
+    path,
+    metadata: Dict[str, Any],
+    tensors: List[Tuple[str, Tuple[int, ...], int]],
+    padding: int = 0,
+):
+    """Write a GGUF file with the given header and ``padding`` zero bytes of
+    tensor data; the data is never read by the header reader."""
+    out = [b"GGUF", struct.pack("<IQQ", 3, len(tensors), len(metadata))]
+    for key, value in metadata.items():
+        out.append(_string(key) + _value(value))
+    offset = 0
+    for name, dims, tensor_type in tensors:
+        out.append(_string(name))
+        out.append(struct.pack("<I", len(dims)))
+        out.append(struct.pack(f"<{len(dims)}Q", *dims))
+        out.append(struct.pack("<IQ", tensor_type, offset))
+        offset += 32
+    out.append(b"\0" * padding)
+    with open(path, "wb") as f:
+        f.write(b"".join(out))
+
+
+def from_parser_cache(path, cache_file):
+    """Write the header gguf-parser recorded in one of its remote cache files.
+
+    Array values are recorded by size only, so they are left out; no estimate
+    reads them.
+    """
+    with open(cache_file) as f:
+        recorded = json.load(f)
+    metadata = {
+        kv["key"]: kv["value"]
+        for kv in recorded["header"]["metadataKV"]
+        if kv["valueType"] != 9
+    }
+    tensors = [
+        (t["name"], tuple(t["dimensions"]), t["type"]) for t in recorded["tensorInfos"]
+    ]
+    write_gguf(path, metadata, tensors)
+
+
+def qwen2_32b(path, block_count: int = 64):
+    """Write the header of DeepSeek-R1-Distill-Qwen-32B in BF16."""
+    n_embd, n_ff, n_kv, n_vocab = 5120, 27648, 1024, 152064
+    tensors = [("token_embd.weight", (n_embd, n_vocab), BF16)]
+    for i in range(block_count):
+        tensors += [
+            (f"blk.{i}.attn_norm.weight", (n_embd,), F32),
+            (f"blk.{i}.attn_q.weight", (n_embd, n_embd), BF16),
+            (f"blk.{i}.attn_q.bias", (n_embd,), F32),
+            (f"blk.{i}.attn_k.weight", (n_embd, n_kv), BF16),
+            (f"blk.{i}.attn_k.bias", (n_kv,), F32),
+            (f"blk.{i}.attn_v.weight", (n_embd, n_kv), BF16),
+            (f"blk.{i}.attn_v.bias", (n_kv,), F32),
+            (f"blk.{i}.attn_output.weight", (n_embd, n_embd), BF16),
+            (f"blk.{i}.ffn_norm.weight", (n_embd,), F32),
+            (f"blk.{i}.ffn_gate.weight", (n_embd, n_ff), BF16),
+            (f"blk.{i}.ffn_up.weight", (n_embd, n_ff), BF16),
+            (f"blk.{i}.ffn_down.weight", (n_ff, n_embd), BF16),
+        ]
+    tensors += [
+        ("output_norm.weight", (n_embd,), F32),
+        ("output.weight", (n_embd, n_vocab), BF16),
+    ]
+    write_gguf(
+        path,
+        {
+            "general.architecture": "qwen2",
+            "general.type": "model",
+            "qwen2.block_count": block_count,
+            "qwen2.context_length": 131072,
+            "qwen2.embedding_length": n_embd,
+            "qwen2.feed_forward_length": n_ff,
+            "qwen2.attention.head_count": 40,
+            "qwen2.attention.head_count_kv": 8,
+            "qwen2.rope.freq_base": 1000000.0,
+            "tokenizer.ggml.tokens": ["a", "b", "c"],
+            "tokenizer.ggml.token_type": [1, 1, 1],
+        },
+        tensors,
+    )
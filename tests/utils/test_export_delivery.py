@@ -11,7 +11,10 @@ import zipfile
 
 import pytest
 
+from gpustack.schemas import usage as usage_schemas
+from gpustack.schemas.usage import UsageExportShape
 from gpustack.utils.export_delivery import ExportSheetPlan, split_export_response
+from gpustack.utils.export_limits import split_export_format, split_member_name
 
 
 def _rows_factory(total: int, state: dict):
@@ -117,6 +120,26 @@ async def test_split_parts_are_consecutive_slices_of_one_pass():
     assert archive.namelist()[-1].endswith("part-3-of-3.csv")
 
 
+def test_split_keeps_streaming_formats_and_turns_xlsx_into_csv():
+    assert split_export_format("xlsx") == "csv"
+    assert split_export_format("csv") == "csv"
+    assert split_export_format("parquet") == "parquet"
+    assert split_export_format("arrow") == "arrow"
+    assert (
+        split_member_name("user", 2, 3, False, prefix="usage", extension="parquet")
+        == "usage_by_user_part-2-of-3.parquet"
+    )
+
+
+def test_columnar_formats_are_refused_up_front_without_pyarrow(monkeypatch):
+    """Failing inside the writer would truncate a response already sent."""
+    monkeypatch.setattr(usage_schemas, "columnar_export_available", lambda: False)
+
+    with pytest.raises(ValueError, match="pyarrow"):
+        UsageExportShape(format="parquet", group_by=["user"])
+    assert UsageExportShape(format="csv", group_by=["user"]).format == "csv"
+
+
 class _Request:
     """Only the date range is read out of the request, for the file name."""
 
@@ -0,0 +1,63 @@
+import pytest
+
+from gpustack.utils.gguf import GGUFError, GGUFSkippedArray, read_gguf_header
+from tests.utils.gguf import BF16, qwen2_32b, write_gguf
+
+
+def test_header_is_read_without_the_tensor_data(tmp_path):
+    path = tmp_path / "model.gguf"
+    qwen2_32b(path, block_count=2)
+
+    header = read_gguf_header(str(path))
+
+    assert header.version == 3
+    assert header.architecture == "qwen2"
+    assert header.metadata["qwen2.attention.head_count_kv"] == 8
+    assert header.metadata["qwen2.rope.freq_base"] == 1000000.0
+    # Tokenizer arrays are stepped over, not decoded.
+    assert header.metadata["tokenizer.ggml.tokens"] == GGUFSkippedArray(8, 3)
+    assert len(header.tensors) == 1 + 2 * 12 + 2
+    embd = header.tensors[0]
+    assert embd.name == "token_embd.weight"
+    assert embd.dims == (5120, 152064)
+    assert embd.nbytes == 5120 * 152064 * 2
+
+
+def test_arrays_outside_the_tokenizer_are_decoded(tmp_path):
+    path = tmp_path / "model.gguf"
+    write_gguf(
+        path,
+        {
+            "general.architecture": "openelm",
+            "openelm.attention.head_count": [12, 12, 16],
+            "general.tags": ["a", "b"],
+        },
+        [("blk.0.attn_q.weight", (64, 64), BF16)],
+    )
+
+    metadata = read_gguf_header(str(path)).metadata
+
+    assert metadata["openelm.attention.head_count"] == [12, 12, 16]
+    assert metadata["general.tags"] == ["a", "b"]
+
+
+def test_header_is_cached_until_the_file_changes(tmp_path):
+    path = tmp_path / "model.gguf"
+    qwen2_32b(path, block_count=1)
+    first = read_gguf_header(str(path))
+    assert read_gguf_header(str(path)) is first
+
+    qwen2_32b(path, block_count=3)
+    assert len(read_gguf_header(str(path)).tensors) == 1 + 3 * 12 + 2
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"GGML" + b"\0" * 32, b"GGUF\x03\0\0\0" + b"\xff" * 16],
+)
+def test_invalid_files_are_rejected(tmp_path, content):
+    path = tmp_path / "model.gguf"
+    path.write_bytes(content)
+
+    with pytest.raises(GGUFError):
+        read_gguf_header(str(path))
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from gpustack.utils import hedge
+from gpustack.utils.hedge import LatencyTracker, hedged_first
+
+
+@pytest.fixture(autouse=True)
+def fresh_trackers(monkeypatch):
+    monkeypatch.setattr(hedge, "_trackers", {})
+
+
+def recorder(latencies, results=None):
+    started, cancelled = [], []
+
+    async def call(name):
+        started.append(name)
+        try:
+            await asyncio.sleep(latencies[name])
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        result = (results or {}).get(name, name)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return call, started, cancelled
+
+
+@pytest.mark.asyncio
+async def test_fast_answer_asks_only_the_initial_workers():
+    call, started, cancelled = recorder({"a": 0.2, "b": 0.01, "c": 0, "d": 0})
+
+    result = await hedged_first(["a", "b", "c", "d"], call, kind="t", initial=2)
+
+    assert (result.candidate, result.value) == ("b", "b")
+    assert started == ["a", "b"]
+    assert cancelled == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_slow_workers_are_hedged_after_the_latency_percentile():
+    hedge.latency_tracker("t").observe(0.05)
+    call, started, cancelled = recorder({"a": 5, "b": 0.01})
+
+    loop = asyncio.get_running_loop()
+    begin = loop.time()
+    result = await hedged_first(["a", "b"], call, kind="t", initial=1)
+
+    assert result.candidate == "b"
+    assert started == ["a", "b"]
+    assert cancelled == ["a"]
+    assert loop.time() - begin < 1
+
+
+@pytest.mark.asyncio
+async def test_failures_move_on_to_the_next_worker_at_once():
+    failures = []
+    call, started, _ = recorder(
+        {"a": 0, "b": 0, "c": 0},
+        results={"a": RuntimeError("boom"), "b": None},
+    )
+
+    result = await hedged_first(
+        ["a", "b", "c"],
+        call,
+        kind="t",
+        initial=1,
+        on_failure=lambda name, failure: failures.append((name, repr(failure))),
+    )
+
+    assert result.candidate == "c"
+    assert started == ["a", "b", "c"]
+    assert failures == [("a", "RuntimeError('boom')"), ("b", "None")]
+
+
+@pytest.mark.asyncio
+async def test_a_failure_does_not_wait_for_the_hedge_delay():
+    hedge.latency_tracker("t").observe(5)
+    call, started, cancelled = recorder(
+        {"a": 10, "b": 0, "c": 0.01}, results={"b": RuntimeError("boom")}
+    )
+
+    loop = asyncio.get_running_loop()
+    begin = loop.time()
+    result = await hedged_first(["a", "b", "c"], call, kind="t", initial=2)
+
+    assert result.candidate == "c"
+    assert started == ["a", "b", "c"]
+    assert cancelled == ["a"]
+    assert loop.time() - begin < 1
+
+
+@pytest.mark.asyncio
+async def test_nothing_accepted_returns_none():
+    call, started, _ = recorder({"a": 0, "b": 0}, results={"a": None, "b": None})
+
+    assert await hedged_first(["a", "b"], call, kind="t") is None
+    assert await hedged_first([], call, kind="t") is None
+    assert started == ["a", "b"]
+
+
+def test_latency_percentile():
+    tracker = LatencyTracker(window=4)
+    assert tracker.percentile(0.95) is None
+
+    for seconds in [9, 1, 2, 3, 4]:
+        tracker.observe(seconds)
+
+    # The oldest sample fell out of the window.
+    assert tracker.percentile(0.5) == 3
+    assert tracker.percentile(0.95) == 4
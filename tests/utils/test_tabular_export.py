@@ -18,9 +18,12 @@ import pytest
 from gpustack.utils import tabular_export
 
 from gpustack.utils.tabular_export import (
+    COLUMNAR_TRAILER_KEY,
     ExportStageTimer,
     build_xlsx,
+    stream_arrow,
     stream_csv,
+    stream_parquet,
     stream_zip,
     take_rows,
 )
@@ -357,3 +360,153 @@ async def test_workbook_is_assembled_off_the_event_loop():
 
     assert "close" in calls
     assert zipfile.ZipFile(io.BytesIO(payload)).testzip() is None
+
+
+@pytest.mark.asyncio
+async def test_stream_zip_can_store_members_uncompressed():
+    """Already-compressed members (Parquet) are stored, not deflated again."""
+
+    async def payload():
+        yield b"x" * 1000
+
+    body = b"".join(
+        [
+            chunk
+            async for chunk in stream_zip([("a.parquet", payload())], compress=False)
+        ]
+    )
+    archive = zipfile.ZipFile(io.BytesIO(body))
+
+    assert archive.infolist()[0].compress_type == zipfile.ZIP_STORED
+    assert archive.read("a.parquet") == b"x" * 1000
+
+
+_COLUMNAR_ROWS = [
+    [date(2026, 4, 1), "alice", 3, 0, True, None],
+    [date(2026, 4, 2), "bob", 5, 2.5, False, None],
+    [date(2026, 4, 2), "alice", 7, 1, None, None],
+]
+_COLUMNAR_COLUMNS = ["Date", "User", "Requests", "Ratio", "Deleted", "Kind"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_keeps_types_and_dictionary_encodes_dimensions():
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    with patch.object(tabular_export.envs, "USAGE_EXPORT_COLUMNAR_BATCH_ROWS", 2):
+        body = b"".join(
+            [
+                chunk
+                async for chunk in stream_parquet(
+                    _COLUMNAR_COLUMNS, _rows(_COLUMNAR_ROWS), trailer="rows=3"
+                )
+            ]
+        )
+    parquet = pq.ParquetFile(pa.BufferReader(body))
+    table = parquet.read()
+
+    assert parquet.metadata.num_row_groups == 2
+    assert table.schema.field("Date").type == pa.date32()
+    assert table.schema.field("Requests").type == pa.float64()
+    assert table.schema.field("Ratio").type == pa.float64()
+    assert table.schema.field("Deleted").type == pa.bool_()
+    assert table.column("User").to_pylist() == ["alice", "bob", "alice"]
+    assert table.column("Kind").to_pylist() == [None, None, None]
+    assert table.schema.metadata[COLUMNAR_TRAILER_KEY] == b"rows=3"
+    user_column = parquet.metadata.row_group(0).column(1)
+    assert "PLAIN_DICTIONARY" in user_column.encodings or (
+        "RLE_DICTIONARY" in user_column.encodings
+    )
+
+
+@pytest.mark.asyncio
+async def test_arrow_stream_round_trips_with_categorical_dimensions():
+    pa = pytest.importorskip("pyarrow")
+
+    with patch.object(tabular_export.envs, "USAGE_EXPORT_COLUMNAR_BATCH_ROWS", 2):
+        body = b"".join(
+            [
+                chunk
+                async for chunk in stream_arrow(
+                    _COLUMNAR_COLUMNS, _rows(_COLUMNAR_ROWS), trailer="rows=3"
+                )
+            ]
+        )
+    table = pa.ipc.open_stream(body).read_all()
+
+    assert pa.types.is_dictionary(table.schema.field("User").type)
+    assert table.column("User").to_pylist() == ["alice", "bob", "alice"]
+    assert table.column("Requests").to_pylist() == [3, 5, 7]
+    assert table.schema.metadata[COLUMNAR_TRAILER_KEY] == b"rows=3"
+
+
+@pytest.mark.asyncio
+async def test_a_column_of_ints_keeps_later_fractions():
+    """The type is fixed by the first batch, and a cost that is ``0`` on every
+    row of it must not turn a later ``1.5`` into ``1``."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [["a", 0], ["b", 2], ["c", 1.5], ["d", None]]
+
+    with patch.object(tabular_export.envs, "USAGE_EXPORT_COLUMNAR_BATCH_ROWS", 2):
+        parquet = b"".join(
+            [chunk async for chunk in stream_parquet(["Name", "Cost"], _rows(rows))]
+        )
+        arrow = b"".join(
+            [chunk async for chunk in stream_arrow(["Name", "Cost"], _rows(rows))]
+        )
+
+    for table in (
+        pq.read_table(pa.BufferReader(parquet)),
+        pa.ipc.open_stream(arrow).read_all(),
+    ):
+        assert table.schema.field("Cost").type == pa.float64()
+        assert table.column("Cost").to_pylist() == [0, 2, 1.5, None]
+
+
+@pytest.mark.asyncio
+async def test_columnar_export_of_no_rows_is_still_a_valid_file():
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    body = b"".join([chunk async for chunk in stream_parquet(["A", "B"], _rows([]))])
+
+    table = pq.read_table(pa.BufferReader(body))
+    assert table.num_rows == 0
+    assert table.column_names == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_a_value_that_no_longer_fits_the_column_type_is_written_as_null():
+    """Types are sampled from the first batch; a later batch that disagrees
+    must not abort the export half-way through."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [
+        [1, True, date(2026, 8, 1)],
+        [2, False, date(2026, 8, 2)],
+        ["n/a", "yes", "soon"],
+        ["3.5", None, date(2026, 8, 4)],
+    ]
+    columns = ["Cost", "Flag", "Day"]
+
+    with patch.object(tabular_export.envs, "USAGE_EXPORT_COLUMNAR_BATCH_ROWS", 2):
+        parquet = b"".join(
+            [chunk async for chunk in stream_parquet(columns, _rows(rows))]
+        )
+        arrow = b"".join([chunk async for chunk in stream_arrow(columns, _rows(rows))])
+
+    for table in (
+        pq.read_table(pa.BufferReader(parquet)),
+        pa.ipc.open_stream(arrow).read_all(),
+    ):
+        assert table.num_rows == 4
+        assert table.column("Cost").to_pylist() == [1, 2, None, 3.5]
+        assert table.column("Flag").to_pylist() == [True, False, None, None]
+        assert table.column("Day").to_pylist() == [
+            date(2026, 8, 1),
+            date(2026, 8, 2),
+            None,
+            date(2026, 8, 4),
+        ]
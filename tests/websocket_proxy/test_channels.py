@@ -0,0 +1,103 @@
+"""
+Tests for striping tunnel sessions over several websocket channels.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from gpustack.websocket_proxy.connection_manager import ConnectionManager
+from gpustack.websocket_proxy.message import (
+    BaseClientInfo,
+    ConnectRequestMessage,
+    ConnectResponseMessage,
+    RegisteredClientInfo,
+    parse_message,
+)
+
+
+class FakeWebSocket:
+    """Answers every CONNECT_REQUEST successfully through the manager"""
+
+    def __init__(self, manager_getter):
+        self.sent = []
+        self._manager_getter = manager_getter
+
+    async def send_bytes(self, data: bytes) -> None:
+        msg = parse_message(data)
+        self.sent.append(msg)
+        if isinstance(msg, ConnectRequestMessage):
+            response = ConnectResponseMessage(session_id=msg.session_id, success=True)
+            asyncio.get_running_loop().call_soon(
+                asyncio.ensure_future, self._manager_getter().dispatch(response)
+            )
+
+    def connect_requests(self):
+        return [m for m in self.sent if isinstance(m, ConnectRequestMessage)]
+
+
+def _striped_manager(channels: int):
+    manager = None
+    websockets = [FakeWebSocket(lambda: manager) for _ in range(channels)]
+    manager = ConnectionManager(websockets[0])
+    for index, websocket in enumerate(websockets[1:], start=1):
+        manager.add_channel(index, websocket)
+    return manager, websockets
+
+
+class TestChannelStriping:
+    @pytest.mark.asyncio
+    async def test_sessions_go_to_the_least_loaded_channel(self):
+        manager, websockets = _striped_manager(3)
+
+        for _ in range(6):
+            await manager.connect("tcp://127.0.0.1:80")
+
+        assert [len(ws.connect_requests()) for ws in websockets] == [2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_a_dropped_channel_ends_only_its_sessions(self):
+        manager, websockets = _striped_manager(2)
+        first = await manager.connect("tcp://127.0.0.1:80")
+        second = await manager.connect("tcp://127.0.0.1:80")
+        dropped = first.websocket
+
+        channels_left = await manager.remove_channel(websockets.index(dropped), dropped)
+
+        assert channels_left
+
+        assert await first.read() == b""
+        assert list(manager.connections()) == [second.session_id]
+
+        # New sessions fail over to the surviving channel
+        third = await manager.connect("tcp://127.0.0.1:80")
+        assert third.websocket is second.websocket
+
+    @pytest.mark.asyncio
+    async def test_a_replaced_channel_is_not_removed_by_its_stale_socket(self):
+        manager, (old, _) = _striped_manager(2)
+        new = FakeWebSocket(lambda: manager)
+        manager.add_channel(0, new)
+
+        await manager.remove_channel(0, old)
+
+        assert manager.channels()[0] is new
+
+    @pytest.mark.asyncio
+    async def test_no_channel_left_fails_instead_of_connecting_directly(self):
+        manager, (websocket,) = _striped_manager(1)
+        assert not await manager.remove_channel(0, websocket)
+
+        with pytest.raises(ConnectionError):
+            await manager.connect("tcp://127.0.0.1:80")
+
+
+def test_channel_index_travels_in_the_handshake():
+    client = BaseClientInfo(
+        client_id=uuid.uuid4(), cidrs=["10.0.0.1/32"], tunnel_channel=2
+    )
+    assert RegisteredClientInfo.from_headers(client.to_headers()).tunnel_channel == 2
+
+    client.tunnel_channel = None
+    assert RegisteredClientInfo.from_headers(client.to_headers()).tunnel_channel is None
@@ -0,0 +1,124 @@
+"""
+Tests for per-session credit flow control in TunnelConnection.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from gpustack.websocket_proxy.connection import BufferStats, TunnelConnection
+from gpustack.websocket_proxy.message import (
+    DataMessage,
+    WindowUpdateMessage,
+    parse_message,
+)
+
+
+class FakeWebSocket:
+    """Records every message sent through it"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(parse_message(data))
+
+    def of_type(self, cls):
+        return [m for m in self.sent if isinstance(m, cls)]
+
+
+def _connection(websocket, **kwargs) -> TunnelConnection:
+    connection = TunnelConnection(uuid.uuid4(), websocket, **kwargs)
+    connection.set_connected()
+    return connection
+
+
+class TestSendWindow:
+    @pytest.mark.asyncio
+    async def test_write_waits_for_credit(self):
+        ws = FakeWebSocket()
+        stats = BufferStats()
+        connection = _connection(ws, send_window=4, connection_stats=stats)
+
+        writer = asyncio.create_task(connection.write(b"0123456789"))
+        await asyncio.sleep(0)
+
+        # Only the first window's worth went out; the rest waits for credit
+        assert [m.data for m in ws.of_type(DataMessage)] == [b"0123"]
+        assert connection.send_window == 0
+        assert stats.blocked_writers == 1
+
+        connection.grant_credit(6)
+        await writer
+
+        assert b"".join(m.data for m in ws.of_type(DataMessage)) == b"0123456789"
+        assert stats.blocked_writers == 0
+        assert stats.credit_stalls == 1
+        assert stats.bytes_sent == 10
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_a_writer_waiting_for_credit(self):
+        connection = _connection(FakeWebSocket(), send_window=0)
+
+        writer = asyncio.create_task(connection.write(b"data"))
+        await asyncio.sleep(0)
+        await connection.close()
+
+        with pytest.raises(ConnectionResetError):
+            await writer
+
+    @pytest.mark.asyncio
+    async def test_without_flow_control_writes_are_not_split(self):
+        ws = FakeWebSocket()
+        connection = _connection(ws)
+
+        await connection.write(b"x" * 100)
+
+        assert connection.send_window is None
+        assert len(ws.of_type(DataMessage)) == 1
+
+
+class TestReceiveWindow:
+    @pytest.mark.asyncio
+    async def test_credit_is_returned_as_the_consumer_reads(self):
+        ws = FakeWebSocket()
+        stats = BufferStats()
+        connection = _connection(
+            ws, send_window=8, recv_window=8, connection_stats=stats
+        )
+
+        await connection.handle_data(b"abc")
+        await connection.handle_data(b"defgh")
+        assert stats.buffered_bytes == 8
+        assert stats.peak_buffered_bytes == 8
+
+        assert await connection.read() == b"abc"
+        # Below half the window: credit is held back to batch updates
+        assert ws.of_type(WindowUpdateMessage) == []
+
+        assert await connection.read() == b"defgh"
+        assert [m.increment for m in ws.of_type(WindowUpdateMessage)] == [8]
+        assert stats.buffered_bytes == 0
+        assert connection.buffer_stats.bytes_received == 8
+
+    @pytest.mark.asyncio
+    async def test_peer_overrunning_the_window_closes_the_session(self):
+        connection = _connection(FakeWebSocket(), send_window=8, recv_window=4)
+
+        await connection.handle_data(b"too much")
+
+        assert await connection.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_legacy_peer_is_pushed_back_at_the_buffer_limit(self):
+        connection = _connection(FakeWebSocket(), buffer_limit=4)
+
+        await connection.handle_data(b"1234")
+        blocked = asyncio.create_task(connection.handle_data(b"5678"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        assert await connection.read() == b"1234"
+        await blocked
+        assert await connection.read() == b"5678"
@@ -1,3 +1,4 @@
+import os
 import uuid
 import pytest
 import json
@@ -8,6 +9,9 @@ from gpustack.websocket_proxy.message import (
     DataMessage,
     DisconnectMessage,
     HeartbeatMessage,
+    WindowUpdateMessage,
+    RegisteredClientInfo,
+    BaseClientInfo,
     ListClientsMessage,
     ListClientsResponseMessage,
     ClientInfo,
@@ -17,9 +21,15 @@ from gpustack.websocket_proxy.message import (
     # Functions
     parse_message,
     message_to_json,
+    AdaptiveCompressor,
+    codec_from_name,
+    negotiate_codec,
+    supported_codecs,
     # Constants
     DATA_COMPRESSION_NONE,
     DATA_COMPRESSION_GZIP,
+    DATA_COMPRESSION_DEFLATE,
+    DATA_COMPRESSION_ZSTD,
     PROTOCOL_VERSION,
 )
 
@@ -109,6 +119,83 @@ class TestDataMessage:
         assert parsed.compression == DATA_COMPRESSION_GZIP
 
 
+class TestDataMessageBuffers:
+    def test_memoryview_data_packs_like_bytes(self):
+        session_id = uuid.uuid4()
+        buffer = b"header" + b"payload" * 100
+        view = memoryview(buffer)[6:]
+
+        packed = DataMessage(session_id=session_id, data=view).pack()
+
+        assert packed == DataMessage(session_id=session_id, data=buffer[6:]).pack()
+        parsed = parse_message(packed)
+        assert isinstance(parsed.data, bytes)
+        assert parsed.data == buffer[6:]
+
+
+class TestAdaptiveCompression:
+    def test_codecs_roundtrip(self):
+        test_data = b"data: {\"choices\": []}\n\n" * 200
+        for name in supported_codecs():
+            compressor = AdaptiveCompressor(codec_from_name(name))
+            msg = compressor.message(uuid.uuid4(), test_data)
+            assert msg.compression != DATA_COMPRESSION_NONE
+
+            parsed = parse_message(msg.pack())
+            assert parsed.data == test_data
+            assert parsed.compression == msg.compression
+
+    def test_small_frames_are_sent_raw(self):
+        compressor = AdaptiveCompressor(DATA_COMPRESSION_DEFLATE, min_size=1024)
+        msg = compressor.message(uuid.uuid4(), b"x" * 1023)
+        assert msg.compression == DATA_COMPRESSION_NONE
+
+    def test_incompressible_frames_back_off(self):
+        compressor = AdaptiveCompressor(DATA_COMPRESSION_DEFLATE, backoff=2)
+        noise = os.urandom(4096)
+        text = b"a" * 4096
+
+        sent = [
+            compressor.message(uuid.uuid4(), data).compression
+            for data in (noise, text, text, text)
+        ]
+
+        # The two frames after the noise are not even tried
+        assert sent == [
+            DATA_COMPRESSION_NONE,
+            DATA_COMPRESSION_NONE,
+            DATA_COMPRESSION_NONE,
+            DATA_COMPRESSION_DEFLATE,
+        ]
+
+    def test_negotiation_prefers_our_order(self):
+        assert negotiate_codec("deflate") == "deflate"
+        assert negotiate_codec(",".join(reversed(supported_codecs()))) == (
+            supported_codecs()[0]
+        )
+        assert negotiate_codec("brotli") is None
+        assert negotiate_codec(None) is None
+
+    def test_zstd_roundtrip(self):
+        zstandard = pytest.importorskip("zstandard")
+        test_data = b"data: {\"choices\": []}\n\n" * 200
+
+        compressor = AdaptiveCompressor(codec_from_name("zstd"))
+        msg = compressor.message(uuid.uuid4(), test_data)
+        assert msg.compression == DATA_COMPRESSION_ZSTD
+        assert zstandard.ZstdDecompressor().decompress(msg.compressed) == test_data
+
+        parsed = parse_message(msg.pack())
+        assert parsed.compression == DATA_COMPRESSION_ZSTD
+        assert parsed.data == test_data
+
+    def test_zstd_is_preferred_when_installed(self):
+        pytest.importorskip("zstandard")
+        assert supported_codecs() == ["zstd", "deflate"]
+        assert negotiate_codec("deflate, zstd") == "zstd"
+        assert negotiate_codec("gzip,deflate") == "deflate"
+
+
 class TestDisconnectMessage:
     def test_normal_disconnect(self):
         session_id = uuid.uuid4()
@@ -130,6 +217,32 @@ class TestDisconnectMessage:
         assert parsed.error == "Server closed"
 
 
+class TestWindowUpdateMessage:
+    def test_pack_and_parse(self):
+        session_id = uuid.uuid4()
+        msg = WindowUpdateMessage(session_id=session_id, increment=512 * 1024)
+
+        data = msg.pack()
+        parsed = parse_message(data)
+
+        assert isinstance(parsed, WindowUpdateMessage)
+        assert parsed.session_id == session_id
+        assert parsed.increment == 512 * 1024
+
+    def test_window_is_negotiated_through_headers(self):
+        client = BaseClientInfo(
+            client_id=uuid.uuid4(), cidrs=["10.0.0.1/32"], tunnel_window=65536
+        )
+        registered = RegisteredClientInfo.from_headers(client.to_headers())
+        assert registered.tunnel_window == 65536
+
+        # Clients that predate flow control advertise nothing
+        client.tunnel_window = None
+        assert "x-tunnel-window" not in client.to_headers()
+        registered = RegisteredClientInfo.from_headers(client.to_headers())
+        assert registered.tunnel_window is None
+
+
 class TestHeartbeatMessage:
     def test_pack_and_parse(self):
         import time
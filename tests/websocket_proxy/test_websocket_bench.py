@@ -19,6 +19,7 @@ except ImportError:
 from gpustack.websocket_proxy.proxy_server import HTTPSProxyServer
 from gpustack.websocket_proxy.message_server import MessageServerHandler, router
 from gpustack.websocket_proxy.message_client import MessageClient
+from gpustack.websocket_proxy.connection import AsyncIOConnection, IOConnection, relay
 
 
 def get_free_port(host: str) -> int:
@@ -754,6 +755,16 @@ class TestProxyThroughput:
             request_size=4096, response_size=4096, num_requests=50, concurrency=5
         )
 
+    @pytest.mark.asyncio
+    async def test_large_payload_throughput(self):
+        """Test throughput with 4MB payload, the bulk transfer case."""
+        await self._test_throughput(
+            request_size=512,
+            response_size=4 * 1024 * 1024,
+            num_requests=8,
+            concurrency=2,
+        )
+
     async def _test_throughput(
         self, request_size, response_size, num_requests, concurrency
     ):
@@ -822,11 +833,12 @@ class TestProxyThroughput:
             proxy=f"http://{proxy_host}:{proxy_port}", connector=connector
         ) as session:
             start = time.time()
+            cpu_start = time.process_time()
 
             async def make_request():
                 req_start = time.time()
                 async with session.post(
-                    url, data=data, timeout=aiohttp.ClientTimeout(total=10)
+                    url, data=data, timeout=aiohttp.ClientTimeout(total=30)
                 ) as resp:
                     received = await resp.read()
                     assert (
@@ -845,6 +857,9 @@ class TestProxyThroughput:
                     print(f"[Test] Progress: {done}/{num_requests}")
 
         elapsed = time.time() - start
+        # Server, client and target all run in this process, so this is the
+        # whole tunnel's CPU cost including compression on both ends
+        cpu_elapsed = time.process_time() - cpu_start
 
         # Cleanup
         client_task.cancel()
@@ -874,8 +889,11 @@ class TestProxyThroughput:
         throughput_bps = total_bytes / elapsed
         throughput_mbps = throughput_bps / (1024 * 1024)
 
+        cpu_per_gb = cpu_elapsed / (total_bytes / (1024 * 1024 * 1024))
+
         print(
-            f"\n[Test] Throughput: {throughput_mbps:.2f} MB/s ({throughput_bps / 1024:.0f} KB/s)"
+            f"\n[Test] Throughput: {throughput_mbps:.2f} MB/s ({throughput_bps / 1024:.0f} KB/s), "
+            f"CPU: {cpu_per_gb:.1f} s/GB"
         )
 
         # Throughput targets
@@ -997,5 +1015,67 @@ class TestProxyLatency:
         assert p95_latency < 1000, f"P95 latency too high: {p95_latency:.2f}ms"
 
 
+class _CountingWriter(IOConnection):
+    """Sink that only counts the bytes and writes relayed to it"""
+
+    def __init__(self):
+        self.bytes = 0
+        self.writes = 0
+
+    async def read(self, n=-1, timeout=None) -> bytes:
+        return b""
+
+    async def write(self, data) -> None:
+        self.bytes += len(data)
+        self.writes += 1
+
+    async def close(self) -> None:
+        pass
+
+
+class TestRelayThroughput:
+    """Compare fixed 8 KiB reads with adaptive read sizes for a large response."""
+
+    @pytest.mark.asyncio
+    async def test_large_response_relay(self):
+        fixed = await self._relay_response(64 * 1024 * 1024, max_read_size=8192)
+        adaptive = await self._relay_response(64 * 1024 * 1024)
+
+        for label, (mbps, writes) in (("fixed 8 KiB", fixed), ("adaptive", adaptive)):
+            print(f"\n[Test] Relay {label}: {mbps:.0f} MB/s in {writes} writes")
+
+        # Fewer, larger frames is the point; throughput follows on real links
+        assert adaptive[1] < fixed[1]
+
+    async def _relay_response(self, size, **relay_kwargs):
+        chunk = b"X" * (1024 * 1024)
+
+        async def handle(reader, writer):
+            for _ in range(size // len(chunk)):
+                writer.write(chunk)
+                await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        sink = _CountingWriter()
+
+        start = time.time()
+        await relay(
+            AsyncIOConnection(reader=reader, writer=writer),
+            sink,
+            "bench",
+            **relay_kwargs,
+        )
+        elapsed = time.time() - start
+
+        server.close()
+        await server.wait_closed()
+        assert sink.bytes == size
+        return size / elapsed / (1024 * 1024), sink.writes
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
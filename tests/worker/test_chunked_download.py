@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from huggingface_hub._local_folder import read_download_metadata
+
+from gpustack.worker import downloaders
+from gpustack.worker.chunked_download import (
+    ChunkedDownload,
+    ChunkVerificationError,
+    RangeNotSupportedError,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        data = self.server.data
+        range_header = self.headers.get("Range")
+        self.server.ranges.append(range_header)
+        if range_header is None or not self.server.serve_ranges:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        start, end = range_header.removeprefix("bytes=").split("-")
+        start, end = int(start), int(end)
+        body = data[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.data = os.urandom(10 * CHUNK_SIZE + 123)
+    httpd.ranges = []
+    httpd.serve_ranges = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _download(server, tmp_path, **kwargs):
+    kwargs.setdefault("sha256", hashlib.sha256(server.data).hexdigest())
+    return ChunkedDownload(
+        url=f"http://127.0.0.1:{server.server_address[1]}/model.safetensors",
+        file_path=tmp_path / "model.safetensors",
+        incomplete_path=tmp_path / "model.safetensors.incomplete",
+        size=len(server.data),
+        etag="etag-1",
+        chunk_size=CHUNK_SIZE,
+        max_workers=4,
+        **kwargs,
+    )
+
+
+def test_chunks_are_fetched_and_assembled(server, tmp_path):
+    progress = []
+    download = _download(
+        server, tmp_path, progress=lambda n, written, size: progress.append(n)
+    )
+
+    path = download.run()
+
+    assert path.read_bytes() == server.data
+    assert len(server.ranges) == len(download.chunks()) == 11
+    assert sum(progress) == len(server.data)
+    assert not (tmp_path / "model.safetensors.incomplete").exists()
+    assert not (tmp_path / "model.safetensors.incomplete.state").exists()
+
+
+def test_a_restarted_download_resumes_from_the_saved_state(server, tmp_path):
+    data = server.data
+    incomplete = tmp_path / "model.safetensors.incomplete"
+    # A previous run finished the first chunk and half of the second.
+    done = [CHUNK_SIZE, CHUNK_SIZE // 2] + [0] * 9
+    with open(incomplete, "wb") as f:
+        f.truncate(len(data))
+        f.write(data[: CHUNK_SIZE + CHUNK_SIZE // 2])
+    (tmp_path / "model.safetensors.incomplete.state").write_text(
+        json.dumps(
+            {
+                "etag": "etag-1",
+                "size": len(data),
+                "chunk_size": CHUNK_SIZE,
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "done": done,
+            }
+        )
+    )
+    progress = []
+
+    path = _download(
+        server, tmp_path, progress=lambda n, written, size: progress.append(n)
+    ).run()
+
+    assert path.read_bytes() == data
+    assert f"bytes=0-{CHUNK_SIZE - 1}" not in server.ranges
+    assert f"bytes={CHUNK_SIZE + CHUNK_SIZE // 2}-{2 * CHUNK_SIZE - 1}" in (
+        server.ranges
+    )
+    # The resumed bytes are reported once, up front.
+    assert progress[0] == CHUNK_SIZE + CHUNK_SIZE // 2
+    assert sum(progress) == len(data)
+
+
+def test_state_of_another_file_is_not_resumed(server, tmp_path):
+    incomplete = tmp_path / "model.safetensors.incomplete"
+    incomplete.write_bytes(b"\0" * len(server.data))
+    (tmp_path / "model.safetensors.incomplete.state").write_text(
+        json.dumps(
+            {
+                "etag": "etag-0",
+                "size": len(server.data),
+                "chunk_size": CHUNK_SIZE,
+                "sha256": None,
+                "done": [CHUNK_SIZE] * 10 + [123],
+            }
+        )
+    )
+
+    path = _download(server, tmp_path).run()
+
+    assert path.read_bytes() == server.data
+    assert len(server.ranges) == 11
+
+
+def test_a_checksum_mismatch_discards_the_download(server, tmp_path):
+    download = _download(server, tmp_path, sha256="0" * 64)
+
+    with pytest.raises(ChunkVerificationError):
+        download.run()
+
+    assert not (tmp_path / "model.safetensors").exists()
+    assert not (tmp_path / "model.safetensors.incomplete").exists()
+    assert not (tmp_path / "model.safetensors.incomplete.state").exists()
+
+
+def test_a_server_ignoring_ranges_is_reported(server, tmp_path):
+    server.serve_ranges = False
+
+    with pytest.raises(RangeNotSupportedError):
+        _download(server, tmp_path).run()
+
+    assert not (tmp_path / "model.safetensors").exists()
+
+
+def test_chunked_download_throughput(server, tmp_path):
+    server.data = os.urandom(64 * CHUNK_SIZE)
+    download = _download(server, tmp_path, sha256=None)
+
+    start = time.perf_counter()
+    download.run()
+    elapsed = time.perf_counter() - start
+
+    mib = len(server.data) / (1024 * 1024)
+    print(
+        f"\nchunked download: {mib:.0f} MiB in {elapsed:.3f}s "
+        f"({mib / elapsed:.1f} MiB/s)"
+    )
+    assert (tmp_path / "model.safetensors").stat().st_size == len(server.data)
+
+
+def _hub_metadata(server, monkeypatch, size):
+    from huggingface_hub.file_download import HfFileMetadata
+
+    metadata = HfFileMetadata(
+        commit_hash="c" * 40,
+        etag=hashlib.sha256(server.data).hexdigest(),
+        location=f"http://127.0.0.1:{server.server_address[1]}/model.safetensors",
+        size=size,
+        xet_file_data=None,
+    )
+    monkeypatch.setattr(
+        downloaders, "get_hf_file_metadata", lambda *args, **kwargs: metadata
+    )
+    monkeypatch.setattr(downloaders.envs, "MODEL_DOWNLOAD_CHUNK_SIZE", CHUNK_SIZE)
+    return metadata
+
+
+def test_hf_files_download_in_chunks_where_hf_hub_download_would(
+    server, tmp_path, monkeypatch
+):
+    metadata = _hub_metadata(server, monkeypatch, len(server.data))
+    progress = []
+
+    path = downloaders.HfDownloader._download_file_in_chunks(
+        "org/model",
+        "model.safetensors",
+        None,
+        tmp_path,
+        lambda filename, n, written, size: progress.append((filename, n)),
+    )
+
+    assert path == str(tmp_path / "model.safetensors")
+    assert (tmp_path / "model.safetensors").read_bytes() == server.data
+    assert progress[0][0] == "model.safetensors"
+    local = read_download_metadata(tmp_path, "model.safetensors")
+    assert local.etag == metadata.etag
+
+    # Already there: nothing is fetched again.
+    server.ranges.clear()
+    downloaders.HfDownloader._download_file_in_chunks(
+        "org/model", "model.safetensors", None, tmp_path
+    )
+    assert server.ranges == []
+
+
+def test_small_hf_files_are_left_to_hf_hub_download(server, tmp_path, monkeypatch):
+    _hub_metadata(server, monkeypatch, CHUNK_SIZE)
+
+    assert (
+        downloaders.HfDownloader._download_file_in_chunks(
+            "org/model", "model.safetensors", None, tmp_path
+        )
+        is None
+    )
+    assert server.ranges == []
@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gpustack.worker import inference_health
+from gpustack.worker.exporter import MetricExporter
+from gpustack.worker.inference_health import (
+    InferenceHealthProber,
+    InferenceHealthStats,
+)
+
+CONFIG = {"enabled": True, "interval": 60, "timeout": 5, "threshold": 3}
+
+
+def _instance(id_: int):
+    return SimpleNamespace(id=id_, name=f"mi-{id_}")
+
+
+def _serve_manager(targets):
+    manager = MagicMock()
+    manager.inference_health_targets.return_value = targets
+    manager.had_recent_successful_inference.return_value = False
+    manager.record_inference_health.side_effect = lambda mi, healthy, _: (
+        0 if healthy else 1
+    )
+    return manager
+
+
+async def _scheduled(prober, now):
+    # The first sighting only schedules; the second, well past any jitter, runs.
+    await prober.schedule(now=now)
+    return await prober.schedule(now=now + 3600)
+
+
+@pytest.mark.asyncio
+async def test_a_hung_engine_does_not_hold_up_the_other_checks():
+    hung, fine = _instance(1), _instance(2)
+    model = SimpleNamespace(name="qwen3")
+    manager = _serve_manager([(hung, model, CONFIG), (fine, model, CONFIG)])
+    stats = InferenceHealthStats()
+    release = asyncio.Event()
+
+    async def fake_ready(session, mi, model, timeout):
+        if mi is hung:
+            await release.wait()
+            return False
+        return True
+
+    prober = InferenceHealthProber(manager, stats, concurrency=2)
+    with patch.object(inference_health, "is_inference_ready", fake_ready):
+        tasks = await _scheduled(prober, 1000)
+        assert len(tasks) == 2
+        done, pending = await asyncio.wait(tasks, timeout=1)
+
+        assert len(done) == 1 and len(pending) == 1
+        assert [(h.model_instance_id, h.healthy) for h in stats.snapshot()] == [
+            (2, True)
+        ]
+        # A later round checks the healthy one again but does not stack a
+        # second check on the one still in flight.
+        again = await prober.schedule(now=1000 + 7200)
+        assert len(again) == 1
+        await asyncio.wait(again)
+
+        release.set()
+        await asyncio.wait(pending)
+
+    manager.record_inference_health.assert_any_call(hung, False, 3)
+    failed = {h.model_instance_id: h for h in stats.snapshot()}[1]
+    assert (failed.healthy, failed.consecutive_failures, failed.failures_total) == (
+        False,
+        1,
+        1,
+    )
+    assert {h.model_instance_id: h for h in stats.snapshot()}[2].checks_total == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_traffic_skips_the_check_and_gone_instances_are_forgotten():
+    mi = _instance(1)
+    manager = _serve_manager([(mi, SimpleNamespace(name="qwen3"), CONFIG)])
+    manager.had_recent_successful_inference.return_value = True
+    stats = InferenceHealthStats()
+    prober = InferenceHealthProber(manager, stats)
+
+    assert await _scheduled(prober, 1000) == []
+    manager.record_inference_health.assert_not_called()
+
+    stats.record(mi, SimpleNamespace(name="qwen3"), True, 0.1, 0)
+    manager.inference_health_targets.return_value = []
+    await prober.schedule(now=5000)
+    assert stats.snapshot() == []
+
+
+def test_exporter_publishes_inference_health():
+    stats = InferenceHealthStats()
+    stats.record(_instance(1), SimpleNamespace(name="qwen3"), False, 5.0, 2)
+    exporter = MetricExporter(
+        cfg=SimpleNamespace(worker_metrics_port=0),
+        collector=MagicMock(),
+        worker_name_getter=lambda: "w1",
+        worker_ip_getter=lambda: "10.0.0.1",
+        worker_id_getter=lambda: 7,
+        inference_health=stats,
+    )
+
+    samples = {
+        sample.name: sample
+        for family in exporter.collect_inference_health_metrics()
+        for sample in family.samples
+    }
+    duration = samples[
+        "gpustack:worker_model_instance_inference_health_check_duration_seconds"
+    ]
+    assert duration.value == 5.0
+    assert duration.labels["model_instance_name"] == "mi-1"
+    assert samples["gpustack:worker_model_instance_inference_healthy"].value == 0
+    assert (
+        samples[
+            "gpustack:worker_model_instance_inference_health_check_failures_total"
+        ].value
+        == 1
+    )
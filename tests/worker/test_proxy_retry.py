@@ -0,0 +1,83 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from gpustack.api.auth import worker_auth
+from gpustack.api.exceptions import register_handlers
+from gpustack.routes.worker import proxy
+from gpustack.worker.upstream_pool import UpstreamPool
+
+
+@asynccontextmanager
+async def _dropping_engine():
+    """An engine that reads the first request, then drops the connection
+    without answering. Later requests get a 200. Yields the bound port and
+    the list of requests it received."""
+    received = []
+
+    async def handler(request):
+        received.append((request.method, await request.read()))
+        if len(received) == 1:
+            request.transport.abort()
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield runner.addresses[0][1], received
+    finally:
+        await runner.cleanup()
+
+
+@asynccontextmanager
+async def _worker_client(port: int):
+    app = FastAPI()
+    register_handlers(app)
+    app.include_router(proxy.router)
+    app.dependency_overrides[worker_auth] = lambda: None
+    app.state.worker_ip_getter = proxy.localhost_fallback
+    app.state.upstream_pool = UpstreamPool()
+
+    @app.middleware("http")
+    async def target(request: Request, call_next):
+        request.state.x_target_port = str(port)
+        return await call_next(request)
+
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://worker") as c:
+            yield c
+    finally:
+        await app.state.upstream_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_a_dropped_post_is_not_sent_again():
+    """The engine may already be running the inference, so a second POST
+    would run it twice."""
+    async with _dropping_engine() as (port, received):
+        async with _worker_client(port) as client:
+            resp = await client.post(
+                "/proxy/v1/chat/completions", content=b'{"model": "m"}'
+            )
+
+    assert resp.status_code == 503
+    assert received == [("POST", b'{"model": "m"}')]
+
+
+@pytest.mark.asyncio
+async def test_a_dropped_get_is_sent_again():
+    async with _dropping_engine() as (port, received):
+        async with _worker_client(port) as client:
+            resp = await client.get("/proxy/v1/models")
+
+    assert resp.status_code == 200
+    assert resp.text == "ok"
+    assert [method for method, _ in received] == ["GET", "GET"]
@@ -0,0 +1,156 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from gpustack.worker import runtime_metrics_aggregator
+from gpustack.worker.runtime_metrics_aggregator import (
+    RUNTIME_METRICS_STALE,
+    RuntimeMetricsAggregator,
+    build_raw_metrics,
+)
+from gpustack.worker.runtime_metrics_client import Scrape, parse_metric_families
+
+EXPOSITION = """\
+# HELP vllm:num_requests_running Number of requests in model execution batches.
+# TYPE vllm:num_requests_running gauge
+vllm:num_requests_running{model_name="qwen"} 3.0
+# HELP vllm:prompt_tokens_total Number of prefill tokens processed.
+# TYPE vllm:prompt_tokens_total counter
+vllm:prompt_tokens_total{model_name="qwen"} 120.0
+# HELP vllm:prompt_tokens_created Number of prefill tokens processed.
+# TYPE vllm:prompt_tokens_created gauge
+vllm:prompt_tokens_created{model_name="qwen"} 1.7e+09
+# HELP vllm:iteration_tokens_total Histogram of tokens per engine_step.
+# TYPE vllm:iteration_tokens_total histogram
+vllm:iteration_tokens_total_bucket{le="1.0",model_name="qwen"} 0.0
+vllm:iteration_tokens_total_bucket{le="+Inf",model_name="qwen"} 4.0
+vllm:iteration_tokens_total_count{model_name="qwen"} 4.0
+vllm:iteration_tokens_total_sum{model_name="qwen"} 80.0
+# HELP python_gc_objects_collected_total Objects collected during gc
+# TYPE python_gc_objects_collected_total counter
+python_gc_objects_collected_total{generation="0"} 1200.0
+"""
+
+CONFIG = {
+    "gpustack_metrics": {
+        "gpustack:num_requests_running": {"type": "Gauge", "description": "running"},
+        "gpustack:prompt_tokens": {"type": "Counter", "description": "prompt"},
+    },
+    "runtime_mapping": {
+        "vLLM": {
+            "*": {
+                "vllm:num_requests_running": "gpustack:num_requests_running",
+                "vllm:prompt_tokens": "gpustack:prompt_tokens",
+            }
+        }
+    },
+}
+
+ENDPOINT = "10.0.0.1:8000"
+
+
+def test_only_the_wanted_families_are_parsed():
+    families = parse_metric_families(
+        EXPOSITION.splitlines(),
+        {"vllm:num_requests_running", "vllm:prompt_tokens"},
+    )
+
+    assert "vllm:iteration_tokens_total" not in families
+    assert "python_gc_objects_collected" not in families
+    # What is kept parses exactly as in a full parse, down to the counter's
+    # _created gauge, which the text format exposes as a family of its own.
+    full = parse_metric_families(EXPOSITION.splitlines())
+    assert families == {name: full[name] for name in families}
+    assert families["vllm:num_requests_running"].samples[0].value == 3.0
+    assert families["vllm:prompt_tokens"].samples[0].value == 120.0
+
+
+def test_without_a_filter_everything_is_parsed():
+    families = parse_metric_families(EXPOSITION.splitlines())
+
+    assert "vllm:iteration_tokens_total" in families
+    assert "python_gc_objects_collected" in families
+
+
+def _aggregator(cache):
+    mi = SimpleNamespace(
+        id=1,
+        name="qwen-1",
+        worker_id=7,
+        worker_name="w1",
+        backend="vLLM",
+        api_detected_backend_version="0.11.0",
+    )
+    model = SimpleNamespace(id=3, name="qwen", backend="vLLM")
+    aggregator = RuntimeMetricsAggregator(
+        cache=cache, worker_id_getter=lambda: 7, max_staleness=30
+    )
+    aggregator._get_metrics_config = lambda: CONFIG
+    aggregator._find_active_model_endpoints = lambda worker_id, config: (
+        {ENDPOINT},
+        {ENDPOINT: mi},
+        {1: model},
+    )
+    return aggregator
+
+
+def _scrape(at):
+    return Scrape(
+        metrics=parse_metric_families(
+            EXPOSITION.splitlines(), {"vllm:num_requests_running"}
+        ),
+        text=EXPOSITION,
+        scraped_at=at,
+    )
+
+
+def _clock(monkeypatch, now):
+    monkeypatch.setattr(
+        runtime_metrics_aggregator, "time", SimpleNamespace(monotonic=lambda: now)
+    )
+
+
+def _stale_value(cache):
+    return cache["unified"][RUNTIME_METRICS_STALE].samples[0].value
+
+
+@pytest.mark.asyncio
+async def test_a_failed_scrape_serves_the_last_result_marked_stale(monkeypatch):
+    cache = {}
+    aggregator = _aggregator(cache)
+    fetch = AsyncMock(return_value={ENDPOINT: _scrape(at=100)})
+    aggregator._metrics_client.fetch_metrics_from_endpoints = fetch
+
+    _clock(monkeypatch, 100)
+    await aggregator.aggregate()
+    assert _stale_value(cache) == 0
+
+    fetch.return_value = {ENDPOINT: None}
+    _clock(monkeypatch, 110)
+    await aggregator.aggregate()
+    running = cache["unified"]["gpustack:num_requests_running"]
+    assert [s.value for s in running.samples] == [3.0]
+    assert _stale_value(cache) == 1
+
+    # Past the staleness limit the instance's series are dropped.
+    _clock(monkeypatch, 200)
+    await aggregator.aggregate()
+    assert "gpustack:num_requests_running" not in cache["unified"]
+    assert cache["unified"][RUNTIME_METRICS_STALE].samples == []
+
+
+@pytest.mark.asyncio
+async def test_raw_metrics_are_parsed_from_the_kept_text():
+    cache = {}
+    aggregator = _aggregator(cache)
+    aggregator._metrics_client.fetch_metrics_from_endpoints = AsyncMock(
+        return_value={ENDPOINT: _scrape(at=100)}
+    )
+
+    await aggregator.aggregate()
+
+    raw = build_raw_metrics(cache["raw"])
+    assert "python_gc_objects_collected" in raw
+    sample = raw["vllm:num_requests_running"].samples[0]
+    assert sample.labels["model_instance_name"] == "qwen-1"
@@ -1047,3 +1047,35 @@ def test_sync_vgpu_allocation_steady_state_skips_worker_fetch():
         manager.sync_model_instances_state()
 
     clientset.workers.get.assert_not_called()
+
+
+def test_inference_health_failures_mark_error_at_the_threshold():
+    manager, _ = _build_serve_manager()
+    manager._update_model_instance = MagicMock()
+    mi = new_model_instance(
+        1, "mi", 1, worker_id=1, state=ModelInstanceStateEnum.RUNNING
+    )
+
+    assert manager.record_inference_health(mi, False, 2) == 1
+    manager._update_model_instance.assert_not_called()
+    assert manager.record_inference_health(mi, False, 2) == 2
+    manager._update_model_instance.assert_called_once_with(
+        1, state=ModelInstanceStateEnum.ERROR, state_message=ANY
+    )
+    # The count starts over after the ERROR, and a success clears it.
+    assert manager.record_inference_health(mi, False, 2) == 1
+    assert manager.record_inference_health(mi, True, 2) == 0
+    assert manager._inference_health_check_failures == {}
+
+
+def test_recent_traffic_counts_as_a_passed_inference_health_check():
+    manager, _ = _build_serve_manager()
+    mi = new_model_instance(
+        1, "mi", 1, worker_id=1, state=ModelInstanceStateEnum.RUNNING
+    )
+    manager._inference_health_check_failures[1] = 1
+
+    assert not manager.had_recent_successful_inference(mi, 60, 1000.0)
+    manager._last_successful_inference[1] = 990.0
+    assert manager.had_recent_successful_inference(mi, 60, 1000.0)
+    assert manager._inference_health_check_failures == {}
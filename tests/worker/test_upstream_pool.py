@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from gpustack.worker import upstream_pool
+from gpustack.worker.exporter import MetricExporter
+from gpustack.worker.upstream_pool import UpstreamStats
+
+
+def _by_port(stats):
+    return {load.port: load for load in stats.snapshot()}
+
+
+def test_in_flight_counts_follow_requests_per_port():
+    stats = UpstreamStats()
+    stats.begin(8000, 1)
+    stats.begin(8000, 1)
+    stats.begin(8001, 2)
+    stats.end(8000)
+    stats.end(8001, failed=True)
+
+    loads = _by_port(stats)
+    assert (loads[8000].in_flight, loads[8000].requests_total) == (1, 2)
+    assert (loads[8001].in_flight, loads[8001].errors_total) == (0, 1)
+    assert loads[8001].model_instance_id == 2
+
+
+def test_latency_is_a_moving_average(monkeypatch):
+    clock = iter([0.0, 1.0, 10.0, 13.0])
+    monkeypatch.setattr(
+        upstream_pool, "time", SimpleNamespace(monotonic=lambda: next(clock))
+    )
+    stats = UpstreamStats()
+
+    stats.responded(8000, stats.begin(8000, 1))
+    assert _by_port(stats)[8000].latency_seconds == 1.0
+
+    stats.responded(8000, stats.begin(8000, 1))
+    # One sample of 3s moves a 1s average a fifth of the way towards it.
+    assert _by_port(stats)[8000].latency_seconds == pytest.approx(1.4)
+
+
+def test_a_port_taken_over_by_another_instance_starts_afresh():
+    stats = UpstreamStats()
+    stats.begin(8000, 1)
+    stats.end(8000, failed=True)
+    stats.begin(8000, 1)
+
+    stats.begin(8000, 2)
+
+    load = _by_port(stats)[8000]
+    assert load.model_instance_id == 2
+    assert (load.requests_total, load.errors_total) == (1, 0)
+    # The old instance's request still in flight is not forgotten.
+    assert load.in_flight == 2
+
+
+def test_exporter_publishes_proxy_load():
+    stats = UpstreamStats()
+    stats.begin(8000, 1)
+    exporter = MetricExporter(
+        cfg=SimpleNamespace(worker_metrics_port=0),
+        collector=MagicMock(),
+        worker_name_getter=lambda: "w1",
+        worker_ip_getter=lambda: "10.0.0.1",
+        worker_id_getter=lambda: 7,
+        upstream=stats,
+    )
+
+    samples = {
+        sample.name: sample
+        for family in exporter.collect_proxy_upstream_metrics()
+        for sample in family.samples
+    }
+    in_flight = samples["gpustack:worker_model_instance_proxy_requests_in_flight"]
+    assert in_flight.value == 1
+    assert in_flight.labels["model_instance_id"] == "1"
+    assert samples["gpustack:worker_model_instance_proxy_requests_total"].value == 1
+    # No response yet, so no latency to report.
+    assert "gpustack:worker_model_instance_proxy_latency_seconds" not in samples